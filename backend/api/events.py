@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 
-from backend.schemas.event import EventDetail, EventListItem, PaginatedEventsResponse
+from backend.schemas.event import (
+    EventDetail,
+    EventFacets,
+    EventListItem,
+    PaginatedEventsResponse,
+)
+from backend.services.cache_policy import VOLATILE, apply_cache_headers, event_policy
 from backend.services.event_service import EventService, get_event_service
 
 router = APIRouter()
@@ -13,6 +19,7 @@ class EventFilterOptions(BaseModel):
     years: list[int]
     locations: list[str]
     event_types: list[str]
+    facets: EventFacets | None = None
 
 
 @router.get("", response_model=PaginatedEventsResponse)
@@ -29,9 +36,11 @@ async def list_events(
 
 @router.get("/upcoming", response_model=list[EventListItem])
 async def list_upcoming_events(
+    response: Response,
     service: EventService = Depends(get_event_service),
 ) -> list[EventListItem]:
     """List all upcoming UFC events."""
+    apply_cache_headers(response, VOLATILE)
     return await service.list_upcoming_events()
 
 
@@ -72,13 +81,24 @@ async def search_events(
 
 @router.get("/filters/options", response_model=EventFilterOptions)
 async def get_filter_options(
+    q: str | None = Query(None, description="Condition counts on a name or location search"),
+    year: int | None = Query(None, description="Condition counts on a year"),
+    location: str | None = Query(None, description="Condition counts on a location"),
+    event_type: str | None = Query(None, description="Condition counts on an event type"),
+    status: str | None = Query(None, description="Condition counts on a status"),
     service: EventService = Depends(get_event_service),
 ) -> EventFilterOptions:
-    """Get available filter options (unique years, locations, event types)."""
-    years, locations = await service.get_filter_options()
+    """Get available filter options (unique years, locations, event types).
+
+    ``facets`` carries event counts per option; each facet is conditioned on
+    every supplied filter except its own, so sibling options stay selectable.
+    """
+    facets = await service.get_filter_facets(
+        q=q, year=year, location=location, event_type=event_type, status=status
+    )
     return EventFilterOptions(
-        years=years,
-        locations=locations,
+        years=[int(facet.value) for facet in facets.years],
+        locations=sorted(str(facet.value) for facet in facets.locations),
         event_types=[
             "ppv",
             "fight_night",
@@ -88,16 +108,19 @@ async def get_filter_options(
             "contender_series",
             "other",
         ],
+        facets=facets,
     )
 
 
 @router.get("/{event_id}", response_model=EventDetail)
 async def get_event(
     event_id: str,
+    response: Response,
     service: EventService = Depends(get_event_service),
 ) -> EventDetail:
     """Get detailed information about a specific event, including fight card."""
     event = await service.get_event(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
+    apply_cache_headers(response, event_policy(event.status, event.date))
     return event
@@ -1,15 +1,44 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
-from backend.schemas.fight_graph import FightGraphResponse
+from backend.schemas.fight_graph import (
+    FightGraphCentralityResponse,
+    FightGraphCommunitiesResponse,
+    FightGraphPathResponse,
+    FightGraphResponse,
+)
+from backend.services.fight_graph_analytics import (
+    CentralityMetric,
+    FightGraphAnalyticsService,
+    get_fight_graph_analytics_service,
+)
 from backend.services.fight_graph_service import (
     FightGraphService,
     get_fight_graph_service,
+    stream_fight_graph_ndjson,
 )
 
 router = APIRouter()
 
+# Buffered responses are assembled in memory, so they keep the historical cap.
+# Streamed responses emit records as they are produced and may request more.
+_MAX_BUFFERED_GRAPH_LIMIT = 500
+_MAX_STREAMED_GRAPH_LIMIT = 5000
 
-@router.get("/graph", response_model=FightGraphResponse)
+
+@router.get(
+    "/graph",
+    response_model=FightGraphResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": (
+                "JSON graph payload, or newline-delimited node/link/metadata records "
+                "when stream=true."
+            ),
+        }
+    },
+)
 async def get_fight_graph(
     division: str | None = Query(
         default=None,
@@ -30,15 +59,25 @@ async def get_fight_graph(
     limit: int = Query(
         default=200,
         ge=1,
-        le=500,
-        description="Maximum number of fighters to include in the graph payload.",
+        le=_MAX_STREAMED_GRAPH_LIMIT,
+        description=(
+            "Maximum number of fighters to include in the graph payload "
+            f"(up to {_MAX_BUFFERED_GRAPH_LIMIT} unless stream=true)."
+        ),
     ),
     include_upcoming: bool = Query(
         default=False,
         description="Include bouts marked as upcoming (result='Next').",
     ),
+    stream: bool = Query(
+        default=False,
+        description=(
+            "Stream the graph as NDJSON: one record per node, then per link, "
+            "then a final metadata record."
+        ),
+    ),
     service: FightGraphService = Depends(get_fight_graph_service),
-) -> FightGraphResponse:
+) -> FightGraphResponse | StreamingResponse:
     """Return a graph-friendly representation of fighters and their shared bouts."""
 
     # Validated metadata now includes pre-computed insights for UI panels, so
@@ -50,6 +89,27 @@ async def get_fight_graph(
             detail="start_year must be less than or equal to end_year",
         )
 
+    if stream:
+        return StreamingResponse(
+            stream_fight_graph_ndjson(
+                division=division,
+                start_year=start_year,
+                end_year=end_year,
+                limit=limit,
+                include_upcoming=include_upcoming,
+            ),
+            media_type="application/x-ndjson",
+        )
+
+    if limit > _MAX_BUFFERED_GRAPH_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"limit above {_MAX_BUFFERED_GRAPH_LIMIT} requires stream=true "
+                "to avoid buffering the full graph"
+            ),
+        )
+
     return await service.get_fight_graph(
         division=division,
         start_year=start_year,
@@ -57,3 +117,49 @@ async def get_fight_graph(
         limit=limit,
         include_upcoming=include_upcoming,
     )
+
+
+@router.get("/analytics/centrality", response_model=FightGraphCentralityResponse)
+async def get_fight_graph_centrality(
+    metric: CentralityMetric = Query(
+        default="betweenness",
+        description="Centrality measure used to rank fighters.",
+    ),
+    division: str | None = Query(
+        default=None,
+        description="Only rank fighters from this division (scores stay roster-wide).",
+    ),
+    limit: int = Query(default=25, ge=1, le=200),
+    service: FightGraphAnalyticsService = Depends(get_fight_graph_analytics_service),
+) -> FightGraphCentralityResponse:
+    """Return the most central fighters in the all-time opponent network."""
+
+    return await service.get_centrality(metric=metric, division=division, limit=limit)
+
+
+@router.get("/analytics/communities", response_model=FightGraphCommunitiesResponse)
+async def get_fight_graph_communities(
+    min_size: int = Query(default=3, ge=1, description="Smallest community to report."),
+    limit: int = Query(default=20, ge=1, le=100),
+    service: FightGraphAnalyticsService = Depends(get_fight_graph_analytics_service),
+) -> FightGraphCommunitiesResponse:
+    """Return clusters of fighters who mostly fought each other."""
+
+    return await service.get_communities(min_size=min_size, limit=limit)
+
+
+@router.get("/analytics/path", response_model=FightGraphPathResponse)
+async def get_fight_graph_path(
+    source: str = Query(..., description="Fighter identifier to start from."),
+    target: str = Query(..., description="Fighter identifier to reach."),
+    service: FightGraphAnalyticsService = Depends(get_fight_graph_analytics_service),
+) -> FightGraphPathResponse:
+    """Return the shortest chain of opponents linking two fighters."""
+
+    try:
+        return await service.get_shortest_path(source, target)
+    except KeyError as exc:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Fighter {exc.args[0]} has no completed bouts in the fight graph",
+        ) from exc
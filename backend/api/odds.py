@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from backend.schemas.odds import (
     FighterOddsChartResponse,
@@ -10,14 +10,19 @@ from backend.schemas.odds import (
     FightOddsDetailResponse,
     OddsQualityStatsResponse,
 )
+from backend.services.cache_policy import apply_cache_headers, fight_policy
 from backend.services.dependencies import get_odds_query_service
+from backend.services.odds_downsampling import MIN_POINTS
 from backend.services.odds_query_service import (
+    InvalidOddsCursorError,
     InvalidQualityTierError,
     OddsQueryService,
 )
 
 router = APIRouter()
 
+MAX_SERIES_POINTS = 2000
+
 
 @router.get(
     "/fighter/{fighter_id}",
@@ -36,13 +41,17 @@ async def get_fighter_odds_history(
         None,
         description="Minimum quality tier (excellent, good, usable, poor, no_data).",
     ),
+    cursor: str | None = Query(
+        None,
+        description="Opaque cursor from a previous page's next_cursor.",
+    ),
     service: OddsQueryService = Depends(get_odds_query_service),
 ) -> FighterOddsHistoryResponse:
     try:
         response = await service.get_fighter_odds_history(
-            fighter_id, limit=limit, min_quality=quality_min
+            fighter_id, limit=limit, min_quality=quality_min, cursor=cursor
         )
-    except InvalidQualityTierError as exc:
+    except (InvalidQualityTierError, InvalidOddsCursorError) as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     if response is None:
@@ -63,9 +72,17 @@ async def get_fighter_odds_chart(
         le=100,
         description="Maximum number of fights to include in the chart payload.",
     ),
+    max_points: int | None = Query(
+        None,
+        ge=MIN_POINTS,
+        le=MAX_SERIES_POINTS,
+        description="Downsample each fight's odds series to at most this many points (LTTB).",
+    ),
     service: OddsQueryService = Depends(get_odds_query_service),
 ) -> FighterOddsChartResponse:
-    response = await service.get_fighter_odds_chart(fighter_id, limit=limit)
+    response = await service.get_fighter_odds_chart(
+        fighter_id, limit=limit, max_points=max_points
+    )
     if response is None:
         raise HTTPException(status_code=404, detail="Fighter not found")
     return response
@@ -78,12 +95,20 @@ async def get_fighter_odds_chart(
 )
 async def get_fight_odds_detail(
     odds_id: str,
+    response: Response,
+    max_points: int | None = Query(
+        None,
+        ge=MIN_POINTS,
+        le=MAX_SERIES_POINTS,
+        description="Downsample the odds series to at most this many points (LTTB).",
+    ),
     service: OddsQueryService = Depends(get_odds_query_service),
 ) -> FightOddsDetailResponse:
-    response = await service.get_fight_odds_detail(odds_id)
-    if response is None:
+    detail = await service.get_fight_odds_detail(odds_id, max_points=max_points)
+    if detail is None:
         raise HTTPException(status_code=404, detail="Odds record not found")
-    return response
+    apply_cache_headers(response, fight_policy(detail.event_date))
+    return detail
 
 
 @router.get(
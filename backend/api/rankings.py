@@ -1,6 +1,6 @@
 """API endpoints for fighter rankings."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,8 +11,10 @@ from backend.schemas.ranking import (
     CurrentRankingsResponse,
     DivisionListResponse,
     PeakRankingResponse,
+    RankingHistoryResolution,
     RankingHistoryResponse,
 )
+from backend.services.cache_policy import VOLATILE, apply_cache_headers
 from backend.services.ranking_service import RankingService, get_ranking_service
 
 router = APIRouter()
@@ -28,6 +30,7 @@ async def _get_fighter_name(session: AsyncSession, fighter_id: str) -> str | Non
 @router.get("/", response_model=AllRankingsResponse)
 @router.get("", response_model=AllRankingsResponse, include_in_schema=False)
 async def get_all_rankings(
+    response: Response,
     source: str = Query(
         "ufc",
         description="Ranking source: 'ufc', 'fightmatrix', or 'tapology'",
@@ -47,6 +50,7 @@ async def get_all_rankings(
     Returns:
         All rankings organized by division
     """
+    apply_cache_headers(response, VOLATILE)
     return await service.get_all_rankings(source)
 
 
@@ -74,6 +78,7 @@ async def get_divisions(
 @router.get("/{division}", response_model=CurrentRankingsResponse)
 async def get_division_rankings(
     division: str,
+    response: Response,
     source: str = Query(
         "ufc",
         description="Ranking source",
@@ -93,15 +98,16 @@ async def get_division_rankings(
     Returns:
         Division rankings with fighter details
     """
-    response = await service.get_current_rankings(division, source)
+    rankings = await service.get_current_rankings(division, source)
 
-    if not response.rankings:
+    if not rankings.rankings:
         raise HTTPException(
             status_code=404,
             detail=f"No rankings found for division '{division}' from source '{source}'",
         )
 
-    return response
+    apply_cache_headers(response, VOLATILE)
+    return rankings
 
 
 @router.get("/fighter/{fighter_id}/history", response_model=RankingHistoryResponse)
@@ -118,18 +124,27 @@ async def get_fighter_ranking_history(
         le=100,
         description="Optional limit on number of historical snapshots",
     ),
+    resolution: RankingHistoryResolution = Query(
+        "snapshot",
+        description=(
+            "'snapshot' for every snapshot, 'change' for one point per rank change, "
+            "or 'month'/'quarter'/'year' for one point per interval"
+        ),
+    ),
     service: RankingService = Depends(get_ranking_service),
     session: AsyncSession = Depends(get_db),
 ) -> RankingHistoryResponse:
     """Get historical ranking progression for a fighter.
 
     Returns a timeline of the fighter's ranking snapshots ordered by date
-    (most recent first).
+    (most recent first), or a columnar series downsampled server-side from
+    run-length encoded rank changes when ``resolution`` is not ``snapshot``.
 
     Args:
         fighter_id: Fighter's UUID
         source: Ranking source
         limit: Optional limit on number of records
+        resolution: History granularity
         service: Ranking service dependency
         session: Database session
 
@@ -141,9 +156,11 @@ async def get_fighter_ranking_history(
     if not fighter_name:
         raise HTTPException(status_code=404, detail="Fighter not found")
 
-    response = await service.get_fighter_ranking_history(fighter_id, fighter_name, source, limit)
+    response = await service.get_fighter_ranking_history(
+        fighter_id, fighter_name, source, limit, resolution
+    )
 
-    if not response.history:
+    if not response.total_snapshots:
         raise HTTPException(
             status_code=404,
             detail=f"No ranking history found for fighter '{fighter_name}' from source '{source}'",
@@ -31,6 +31,9 @@ _LIST_PREFIX = "fighters:list"
 _SEARCH_PREFIX = "fighters:search"
 _COMPARISON_PREFIX = "fighters:compare"
 _GRAPH_PREFIX = "fighters:graph"
+_STATS_PREFIX = "stats"
+_ODDS_PREFIX = "odds"
+_EVENT_DETAIL_PREFIX = "events:detail"
 _FAVORITE_LIST_PREFIX = "favorites:list"
 _FAVORITE_COLLECTION_PREFIX = "favorites:collection"
 _FAVORITE_STATS_PREFIX = "favorites:stats"
@@ -291,6 +294,18 @@ async def invalidate_fighter(cache: CacheClient, fighter_id: str) -> None:
 async def invalidate_collections(cache: CacheClient) -> None:
     await cache.delete_pattern(f"{_LIST_PREFIX}:*")
     await cache.delete_pattern(f"{_SEARCH_PREFIX}:*")
+    await cache.delete_pattern(f"{_GRAPH_PREFIX}:*")
+    await cache.delete_pattern(f"{_STATS_PREFIX}:*")
+
+
+async def invalidate_event_details(cache: CacheClient) -> None:
+    """Drop cached event details, whose fight cards embed fighter names."""
+    await cache.delete_pattern(f"{_EVENT_DETAIL_PREFIX}:*")
+
+
+async def invalidate_odds(cache: CacheClient) -> None:
+    """Drop cached odds payloads, including long-lived ones for past bouts."""
+    await cache.delete_pattern(f"{_ODDS_PREFIX}:*")
 
 
 __all__ = [
@@ -301,7 +316,9 @@ __all__ = [
     "detail_key",
     "get_cache_client",
     "invalidate_collections",
+    "invalidate_event_details",
     "invalidate_fighter",
+    "invalidate_odds",
     "list_key",
     "search_key",
 ]
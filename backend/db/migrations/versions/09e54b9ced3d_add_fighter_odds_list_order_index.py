@@ -0,0 +1,61 @@
+"""add fighter odds list order index and quality rank
+
+Revision ID: 09e54b9ced3d
+Revises: 93782b3c7fa1
+Create Date: 2025-12-02 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "09e54b9ced3d"
+down_revision: Union[str, None] = "93782b3c7fa1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_QUALITY_RANK_SQL = (
+    "CASE data_quality_tier WHEN 'excellent' THEN 0 WHEN 'good' THEN 1 "
+    "WHEN 'usable' THEN 2 WHEN 'poor' THEN 3 WHEN 'no_data' THEN 4 END"
+)
+
+
+def upgrade() -> None:
+    # Stored generated column: filled for existing rows here and kept current
+    # by PostgreSQL on every later write.
+    op.add_column(
+        "fighter_odds",
+        sa.Column(
+            "quality_rank",
+            sa.SmallInteger(),
+            sa.Computed(_QUALITY_RANK_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_fighter_odds_list_order",
+        "fighter_odds",
+        [
+            "fighter_id",
+            sa.text("event_date DESC NULLS LAST"),
+            sa.text("scraped_at DESC"),
+            sa.text("id DESC"),
+        ],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fighter_odds_fighter_quality_rank",
+        "fighter_odds",
+        ["fighter_id", "quality_rank"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fighter_odds_fighter_quality_rank", table_name="fighter_odds")
+    op.drop_index("ix_fighter_odds_list_order", table_name="fighter_odds")
+    op.drop_column("fighter_odds", "quality_rank")
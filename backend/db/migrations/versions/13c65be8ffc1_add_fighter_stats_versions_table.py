@@ -0,0 +1,42 @@
+"""add fighter stats versions table
+
+Revision ID: 13c65be8ffc1
+Revises: 48e82e9ee60e
+Create Date: 2025-12-04 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "13c65be8ffc1"
+down_revision: Union[str, None] = "48e82e9ee60e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Starts empty: leaderboard indexes build in full on first use, and only
+    # writes made after this migration need to be re-slotted incrementally.
+    op.create_table(
+        "fighter_stats_versions",
+        sa.Column("fighter_id", sa.String(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["fighter_id"], ["fighters.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("fighter_id"),
+    )
+    op.create_index(
+        "ix_fighter_stats_versions_version",
+        "fighter_stats_versions",
+        ["version"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fighter_stats_versions_version", table_name="fighter_stats_versions")
+    op.drop_table("fighter_stats_versions")
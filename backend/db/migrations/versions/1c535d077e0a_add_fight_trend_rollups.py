@@ -0,0 +1,139 @@
+"""add fight trend rollups table
+
+Revision ID: 1c535d077e0a
+Revises: 62107e73a530
+Create Date: 2025-11-23 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "1c535d077e0a"
+down_revision: Union[str, None] = "62107e73a530"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNTERS = (
+    "fight_count",
+    "duration_count",
+    "duration_total_seconds",
+    "win_count",
+    "finish_win_count",
+    "ko_tko_win_count",
+    "submission_win_count",
+    "decision_win_count",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fight_trend_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("division", sa.String(), nullable=True),
+        sa.Column("bucket_kind", sa.String(length=8), nullable=False),
+        sa.Column("bucket_start", sa.Date(), nullable=False),
+        *[
+            sa.Column(
+                counter,
+                sa.BigInteger() if counter == "duration_total_seconds" else sa.Integer(),
+                nullable=False,
+            )
+            for counter in _COUNTERS
+        ],
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_fight_trend_rollups_bucket",
+        "fight_trend_rollups",
+        ["bucket_kind", "bucket_start", "division"],
+        unique=False,
+    )
+
+    # Backfill from existing fights; loaders keep the table current afterwards.
+    op.execute(
+        """
+        WITH classified AS (
+            SELECT
+                fighters.division,
+                fights.event_date,
+                fights.duration_seconds,
+                lower(trim(fights.result)) IN ('w', 'win') AS is_win,
+                lower(coalesce(fights.method, '')) AS method
+            FROM fights
+            JOIN fighters ON fighters.id = fights.fighter_id
+            WHERE fights.event_date IS NOT NULL
+        )
+        INSERT INTO fight_trend_rollups (
+            division,
+            bucket_kind,
+            bucket_start,
+            fight_count,
+            duration_count,
+            duration_total_seconds,
+            win_count,
+            finish_win_count,
+            ko_tko_win_count,
+            submission_win_count,
+            decision_win_count
+        )
+        SELECT
+            division,
+            'day',
+            event_date,
+            count(*),
+            count(duration_seconds),
+            coalesce(sum(duration_seconds), 0),
+            count(*) FILTER (WHERE is_win),
+            count(*) FILTER (
+                WHERE is_win
+                AND (method LIKE '%ko%' OR method LIKE '%sub%' OR method LIKE '%dq%')
+            ),
+            count(*) FILTER (WHERE is_win AND method LIKE '%ko%'),
+            count(*) FILTER (WHERE is_win AND method LIKE '%sub%'),
+            count(*) FILTER (WHERE is_win AND method LIKE '%dec%')
+        FROM classified
+        GROUP BY division, event_date
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO fight_trend_rollups (
+            division,
+            bucket_kind,
+            bucket_start,
+            fight_count,
+            duration_count,
+            duration_total_seconds,
+            win_count,
+            finish_win_count,
+            ko_tko_win_count,
+            submission_win_count,
+            decision_win_count
+        )
+        SELECT
+            division,
+            'month',
+            CAST(date_trunc('month', bucket_start) AS DATE),
+            sum(fight_count),
+            sum(duration_count),
+            sum(duration_total_seconds),
+            sum(win_count),
+            sum(finish_win_count),
+            sum(ko_tko_win_count),
+            sum(submission_win_count),
+            sum(decision_win_count)
+        FROM fight_trend_rollups
+        WHERE bucket_kind = 'day'
+        GROUP BY division, CAST(date_trunc('month', bucket_start) AS DATE)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fight_trend_rollups_bucket", table_name="fight_trend_rollups")
+    op.drop_table("fight_trend_rollups")
@@ -0,0 +1,55 @@
+"""add event facet cells table
+
+Revision ID: 42ba7ae53a8b
+Revises: f8e8e1e4a369
+Create Date: 2025-11-28 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "42ba7ae53a8b"
+down_revision: Union[str, None] = "f8e8e1e4a369"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_facet_cells",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("event_type", sa.String(length=32), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Backfill from current events; event loaders rebuild it afterwards.
+    op.execute(
+        """
+        INSERT INTO event_facet_cells (
+            year, location, event_type, status, event_count, computed_at
+        )
+        SELECT
+            CAST(extract(year FROM date) AS INTEGER),
+            location,
+            event_type,
+            status,
+            count(*),
+            now()
+        FROM events
+        GROUP BY CAST(extract(year FROM date) AS INTEGER), location, event_type, status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_facet_cells")
@@ -0,0 +1,65 @@
+"""add fighter odds stats table
+
+Revision ID: 48e82e9ee60e
+Revises: 09e54b9ced3d
+Create Date: 2025-12-03 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "48e82e9ee60e"
+down_revision: Union[str, None] = "09e54b9ced3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fighter_odds_stats",
+        sa.Column("counter", sa.String(), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("counter"),
+    )
+
+    # Seed every counter, including empty tiers, so later loads only apply deltas.
+    op.execute(
+        """
+        WITH tiers(tier) AS (
+            VALUES ('excellent'), ('good'), ('usable'), ('poor'), ('no_data')
+        ),
+        totals AS (
+            SELECT
+                count(*) AS total_records,
+                count(DISTINCT fighter_id) AS fighters_with_odds,
+                coalesce(sum(num_odds_points), 0) AS total_odds_points
+            FROM fighter_odds
+        )
+        INSERT INTO fighter_odds_stats (counter, value, updated_at)
+        SELECT 'total_records', total_records, now() FROM totals
+        UNION ALL
+        SELECT 'fighters_with_odds', fighters_with_odds, now() FROM totals
+        UNION ALL
+        SELECT 'total_odds_points', total_odds_points, now() FROM totals
+        UNION ALL
+        SELECT
+            'records:' || tiers.tier,
+            (
+                SELECT count(*)
+                FROM fighter_odds
+                WHERE coalesce(data_quality_tier, 'no_data') = tiers.tier
+            ),
+            now()
+        FROM tiers
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fighter_odds_stats")
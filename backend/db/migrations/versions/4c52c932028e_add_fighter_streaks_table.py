@@ -0,0 +1,105 @@
+"""add fighter streaks table
+
+Revision ID: 4c52c932028e
+Revises: d969f6967695
+Create Date: 2025-11-25 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "4c52c932028e"
+down_revision: Union[str, None] = "d969f6967695"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fighter_streaks",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("fighter_id", sa.String(), nullable=False),
+        sa.Column("streak_type", sa.String(length=8), nullable=False),
+        sa.Column("length", sa.Integer(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("start_position", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["fighter_id"], ["fighters.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_fighter_streaks_type_length",
+        "fighter_streaks",
+        ["streak_type", "length", "end_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fighter_streaks_type_end_date",
+        "fighter_streaks",
+        ["streak_type", "end_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fighter_streaks_fighter_start",
+        "fighter_streaks",
+        ["fighter_id", "start_date"],
+        unique=False,
+    )
+
+    # Backfill with a gaps-and-islands pass; loaders rebuild runs per fighter afterwards.
+    op.execute(
+        """
+        WITH outcomes AS (
+            SELECT
+                fighter_id,
+                event_date,
+                CASE
+                    WHEN lower(trim(result)) IN ('w', 'win') THEN 'win'
+                    WHEN lower(trim(result)) IN ('l', 'loss') THEN 'loss'
+                    ELSE 'other'
+                END AS category,
+                row_number() OVER (
+                    PARTITION BY fighter_id ORDER BY event_date, id
+                ) - 1 AS position,
+                id
+            FROM fights
+            WHERE event_date IS NOT NULL
+        ),
+        islands AS (
+            SELECT
+                fighter_id,
+                event_date,
+                category,
+                position,
+                position - row_number() OVER (
+                    PARTITION BY fighter_id, category ORDER BY event_date, id
+                ) AS island
+            FROM outcomes
+        )
+        INSERT INTO fighter_streaks (
+            fighter_id, streak_type, length, start_date, end_date, start_position
+        )
+        SELECT
+            fighter_id,
+            category,
+            count(*),
+            min(event_date),
+            max(event_date),
+            min(position)
+        FROM islands
+        WHERE category IN ('win', 'loss')
+        GROUP BY fighter_id, category, island
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fighter_streaks_fighter_start", table_name="fighter_streaks")
+    op.drop_index("ix_fighter_streaks_type_end_date", table_name="fighter_streaks")
+    op.drop_index("ix_fighter_streaks_type_length", table_name="fighter_streaks")
+    op.drop_table("fighter_streaks")
@@ -0,0 +1,35 @@
+"""add stats summary snapshot table
+
+Revision ID: 58ca39ed3c80
+Revises: 73afc4141673
+Create Date: 2025-11-21 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "58ca39ed3c80"
+down_revision: Union[str, None] = "73afc4141673"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Starts empty; the summary endpoint computes live until the next loader
+    # run populates it.
+    op.create_table(
+        "stats_summary_snapshot",
+        sa.Column("metric_id", sa.String(), nullable=False),
+        sa.Column("value", sa.Float(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("metric_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stats_summary_snapshot")
@@ -0,0 +1,51 @@
+"""add stored fight duration_seconds column
+
+Revision ID: 62107e73a530
+Revises: 58ca39ed3c80
+Create Date: 2025-11-22 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "62107e73a530"
+down_revision: Union[str, None] = "58ca39ed3c80"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DURATION_SQL = (
+    r"CASE WHEN round IS NOT NULL AND time ~ '^\s*[0-9]{1,3}:[0-9]{1,2}\s*$' "
+    "THEN GREATEST(round - 1, 0) * 300 "
+    "+ CAST(split_part(time, ':', 1) AS INTEGER) * 60 "
+    "+ CAST(split_part(time, ':', 2) AS INTEGER) END"
+)
+
+
+def upgrade() -> None:
+    # A stored generated column is filled for existing rows when it is added and
+    # kept current by PostgreSQL for every later insert or update.
+    op.add_column(
+        "fights",
+        sa.Column(
+            "duration_seconds",
+            sa.Integer(),
+            sa.Computed(_DURATION_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_fights_event_date_duration",
+        "fights",
+        ["event_date", "duration_seconds"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fights_event_date_duration", table_name="fights")
+    op.drop_column("fights", "duration_seconds")
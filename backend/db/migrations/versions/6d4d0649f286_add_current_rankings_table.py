@@ -0,0 +1,71 @@
+"""add current rankings table
+
+Revision ID: 6d4d0649f286
+Revises: 4c52c932028e
+Create Date: 2025-11-26 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "6d4d0649f286"
+down_revision: Union[str, None] = "4c52c932028e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "current_rankings",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("ranking_id", sa.String(), nullable=False),
+        sa.Column("fighter_id", sa.String(), nullable=False),
+        sa.Column("division", sa.String(length=50), nullable=False),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=True),
+        sa.Column("previous_rank", sa.Integer(), nullable=True),
+        sa.Column("is_interim", sa.Boolean(), nullable=False),
+        sa.Column("rank_date", sa.Date(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["fighter_id"], ["fighters.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["ranking_id"], ["fighter_rankings.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_current_rankings_source_division_rank",
+        "current_rankings",
+        ["source", "division", "rank"],
+        unique=False,
+    )
+
+    # Backfill from existing snapshots; ranking importers refresh it afterwards.
+    op.execute(
+        """
+        INSERT INTO current_rankings (
+            ranking_id, fighter_id, division, source, rank, previous_rank,
+            is_interim, rank_date, refreshed_at
+        )
+        SELECT
+            r.id, r.fighter_id, r.division, r.source, r.rank, r.previous_rank,
+            r.is_interim, r.rank_date, now()
+        FROM fighter_rankings AS r
+        JOIN (
+            SELECT division, source, max(rank_date) AS rank_date
+            FROM fighter_rankings
+            GROUP BY division, source
+        ) AS latest
+            ON latest.division = r.division
+            AND latest.source = r.source
+            AND latest.rank_date = r.rank_date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_current_rankings_source_division_rank", table_name="current_rankings")
+    op.drop_table("current_rankings")
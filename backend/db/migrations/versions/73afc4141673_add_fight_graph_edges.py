@@ -0,0 +1,106 @@
+"""add fight graph edges adjacency table
+
+Revision ID: 73afc4141673
+Revises: c88abbcd9d1f
+Create Date: 2025-11-20 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "73afc4141673"
+down_revision: Union[str, None] = "c88abbcd9d1f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_RESULT_CASE = """
+    CASE
+        WHEN lower(trim(result)) IN ('win', 'w') THEN 'win'
+        WHEN lower(trim(result)) IN ('loss', 'l') THEN 'loss'
+        WHEN lower(trim(result)) LIKE 'draw%' THEN 'draw'
+        WHEN lower(trim(result)) IN ('nc', 'no contest') THEN 'nc'
+        WHEN lower(trim(result)) = 'next' THEN 'upcoming'
+        ELSE 'other'
+    END
+"""
+
+_CATEGORIES = ("win", "loss", "draw", "nc", "upcoming", "other")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fight_graph_edges",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("fighter_a_id", sa.String(), nullable=False),
+        sa.Column("fighter_b_id", sa.String(), nullable=False),
+        sa.Column("event_year", sa.Integer(), nullable=True),
+        sa.Column("is_upcoming", sa.Boolean(), nullable=False),
+        sa.Column("fights", sa.Integer(), nullable=False),
+        sa.Column("first_event_date", sa.Date(), nullable=True),
+        sa.Column("first_event_name", sa.String(), nullable=True),
+        sa.Column("last_event_date", sa.Date(), nullable=True),
+        sa.Column("last_event_name", sa.String(), nullable=True),
+        *[
+            sa.Column(f"{side}_{category}", sa.Integer(), nullable=False)
+            for side in ("a", "b")
+            for category in _CATEGORIES
+        ],
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_fight_graph_edges_pair",
+        "fight_graph_edges",
+        ["fighter_a_id", "fighter_b_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fight_graph_edges_fighter_b",
+        "fight_graph_edges",
+        ["fighter_b_id"],
+        unique=False,
+    )
+
+    side_columns = ", ".join(
+        f"{side}_{category}" for side in ("a", "b") for category in _CATEGORIES
+    )
+    side_counts = ", ".join(
+        f"count(*) FILTER (WHERE fighter_id = {'least' if side == 'a' else 'greatest'}"
+        f"(fighter_id, opponent_id) AND {_RESULT_CASE} = '{category}')"
+        for side in ("a", "b")
+        for category in _CATEGORIES
+    )
+    # Backfill from existing fights; loaders keep the table current afterwards.
+    op.execute(
+        f"""
+        INSERT INTO fight_graph_edges (
+            fighter_a_id, fighter_b_id, event_year, is_upcoming, fights,
+            first_event_date, first_event_name, last_event_date, last_event_name,
+            {side_columns}
+        )
+        SELECT
+            least(fighter_id, opponent_id),
+            greatest(fighter_id, opponent_id),
+            CAST(EXTRACT(year FROM event_date) AS INTEGER),
+            lower(result) = 'next',
+            count(*),
+            min(event_date),
+            (array_agg(event_name ORDER BY event_date ASC NULLS LAST))[1],
+            max(event_date),
+            (array_agg(event_name ORDER BY event_date DESC NULLS LAST))[1],
+            {side_counts}
+        FROM fights
+        WHERE opponent_id IS NOT NULL AND fighter_id <> opponent_id
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fight_graph_edges_fighter_b", table_name="fight_graph_edges")
+    op.drop_index("ix_fight_graph_edges_pair", table_name="fight_graph_edges")
+    op.drop_table("fight_graph_edges")
@@ -0,0 +1,41 @@
+"""add fighter odds analytics table
+
+Revision ID: 93782b3c7fa1
+Revises: b74ed57599eb
+Create Date: 2025-12-01 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "93782b3c7fa1"
+down_revision: Union[str, None] = "b74ed57599eb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled by ``scripts/load_bfo_fighter_odds.py --analytics-only``; until then
+    # fight detail reads compute analytics on demand.
+    op.create_table(
+        "fighter_odds_analytics",
+        sa.Column("odds_id", sa.String(), nullable=False),
+        sa.Column("opening_probability", sa.Float(), nullable=True),
+        sa.Column("closing_probability", sa.Float(), nullable=True),
+        sa.Column("fair_closing_probability", sa.Float(), nullable=True),
+        sa.Column("probability_movement", sa.Float(), nullable=True),
+        sa.Column("volatility", sa.Float(), nullable=True),
+        sa.Column("steam_moves", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["odds_id"], ["fighter_odds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("odds_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fighter_odds_analytics")
@@ -0,0 +1,91 @@
+"""add event card bouts table
+
+Revision ID: 94ad5009c600
+Revises: 42ba7ae53a8b
+Create Date: 2025-11-29 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "94ad5009c600"
+down_revision: Union[str, None] = "42ba7ae53a8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("fights", sa.Column("card_position", sa.Integer(), nullable=True))
+    op.create_table(
+        "event_card_bouts",
+        sa.Column("event_id", sa.String(), nullable=False),
+        sa.Column("card_position", sa.Integer(), nullable=False),
+        sa.Column("fight_id", sa.String(), nullable=False),
+        sa.Column("fighter_1_id", sa.String(), nullable=True),
+        sa.Column("fighter_1_name", sa.String(), nullable=False),
+        sa.Column("fighter_2_id", sa.String(), nullable=True),
+        sa.Column("fighter_2_name", sa.String(), nullable=False),
+        sa.Column("weight_class", sa.String(), nullable=True),
+        sa.Column("result", sa.String(), nullable=True),
+        sa.Column("method", sa.String(), nullable=True),
+        sa.Column("round", sa.Integer(), nullable=True),
+        sa.Column("time", sa.String(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "card_position"),
+    )
+
+    # Card positions were never stored, so the backfill orders bouts by fight
+    # id; the event detail loader restores scraped card order on its next run.
+    op.execute(
+        """
+        WITH bouts AS (
+            SELECT DISTINCT ON (
+                event_id,
+                least(fighter_id, coalesce(opponent_id, opponent_name)),
+                greatest(fighter_id, coalesce(opponent_id, opponent_name))
+            )
+                *
+            FROM fights
+            WHERE event_id IS NOT NULL
+            ORDER BY
+                event_id,
+                least(fighter_id, coalesce(opponent_id, opponent_name)),
+                greatest(fighter_id, coalesce(opponent_id, opponent_name)),
+                id LIKE '%-opp',
+                id
+        )
+        INSERT INTO event_card_bouts (
+            event_id, card_position, fight_id, fighter_1_id, fighter_1_name,
+            fighter_2_id, fighter_2_name, weight_class, result, method, round, time,
+            refreshed_at
+        )
+        SELECT
+            bouts.event_id,
+            row_number() OVER (PARTITION BY bouts.event_id ORDER BY bouts.id) - 1,
+            bouts.id,
+            bouts.fighter_id,
+            coalesce(fighter_1.name, 'Unknown'),
+            bouts.opponent_id,
+            coalesce(fighter_2.name, bouts.opponent_name),
+            bouts.weight_class,
+            bouts.result,
+            bouts.method,
+            bouts.round,
+            bouts.time,
+            now()
+        FROM bouts
+        LEFT JOIN fighters AS fighter_1 ON fighter_1.id = bouts.fighter_id
+        LEFT JOIN fighters AS fighter_2 ON fighter_2.id = bouts.opponent_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_card_bouts")
+    op.drop_column("fights", "card_position")
@@ -0,0 +1,70 @@
+"""add fighter ranking rollups
+
+Revision ID: 9d4b58770f98
+Revises: 6d4d0649f286
+Create Date: 2025-11-26 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4b58770f98"
+down_revision: Union[str, None] = "6d4d0649f286"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fighter_ranking_rollups",
+        sa.Column("fighter_id", sa.String(), nullable=False),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("current_rank", sa.Integer(), nullable=True),
+        sa.Column("current_rank_date", sa.Date(), nullable=False),
+        sa.Column("current_rank_division", sa.String(length=50), nullable=False),
+        sa.Column("peak_ranking_id", sa.String(), nullable=True),
+        sa.Column("peak_rank", sa.Integer(), nullable=True),
+        sa.Column("peak_rank_date", sa.Date(), nullable=True),
+        sa.Column("peak_rank_division", sa.String(length=50), nullable=True),
+        sa.Column("peak_is_interim", sa.Boolean(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["fighter_id"], ["fighters.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("fighter_id", "source"),
+    )
+
+    # Backfill from existing snapshots; ranking importers refresh it afterwards.
+    op.execute(
+        """
+        INSERT INTO fighter_ranking_rollups (
+            fighter_id, source, current_rank, current_rank_date, current_rank_division,
+            peak_ranking_id, peak_rank, peak_rank_date, peak_rank_division,
+            peak_is_interim, refreshed_at
+        )
+        SELECT
+            cur.fighter_id, cur.source, cur.rank, cur.rank_date, cur.division,
+            peak.id, peak.rank, peak.rank_date, peak.division, peak.is_interim, now()
+        FROM (
+            SELECT DISTINCT ON (fighter_id, source)
+                fighter_id, source, rank, rank_date, division
+            FROM fighter_rankings
+            ORDER BY fighter_id, source, rank_date DESC, rank ASC NULLS LAST, division
+        ) AS cur
+        LEFT JOIN (
+            SELECT DISTINCT ON (fighter_id, source)
+                fighter_id, source, id, rank, rank_date, division, is_interim
+            FROM fighter_rankings
+            WHERE rank IS NOT NULL
+            ORDER BY fighter_id, source, rank ASC, rank_date DESC, division
+        ) AS peak
+            ON peak.fighter_id = cur.fighter_id AND peak.source = cur.source
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fighter_ranking_rollups")
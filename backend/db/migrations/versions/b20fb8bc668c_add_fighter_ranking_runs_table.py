@@ -0,0 +1,92 @@
+"""add fighter ranking runs table
+
+Revision ID: b20fb8bc668c
+Revises: 9d4b58770f98
+Create Date: 2025-11-27 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b20fb8bc668c"
+down_revision: Union[str, None] = "9d4b58770f98"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fighter_ranking_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("fighter_id", sa.String(), nullable=False),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("division", sa.String(length=50), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=True),
+        sa.Column("is_interim", sa.Boolean(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("snapshot_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["fighter_id"], ["fighters.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_fighter_ranking_runs_fighter_source_start",
+        "fighter_ranking_runs",
+        ["fighter_id", "source", "start_date"],
+        unique=False,
+    )
+
+    # Backfill with a gaps-and-islands pass; ranking importers rebuild it afterwards.
+    op.execute(
+        """
+        WITH issues AS (
+            SELECT
+                source,
+                division,
+                rank_date,
+                row_number() OVER (PARTITION BY source, division ORDER BY rank_date)
+                    AS issue_number
+            FROM fighter_rankings
+            GROUP BY source, division, rank_date
+        ),
+        islands AS (
+            SELECT
+                r.fighter_id,
+                r.source,
+                r.division,
+                r.rank,
+                r.is_interim,
+                r.rank_date,
+                i.issue_number - row_number() OVER (
+                    PARTITION BY r.fighter_id, r.source, r.division, r.rank, r.is_interim
+                    ORDER BY r.rank_date
+                ) AS island
+            FROM fighter_rankings AS r
+            JOIN issues AS i
+                ON i.source = r.source
+                AND i.division = r.division
+                AND i.rank_date = r.rank_date
+        )
+        INSERT INTO fighter_ranking_runs (
+            fighter_id, source, division, rank, is_interim,
+            start_date, end_date, snapshot_count
+        )
+        SELECT
+            fighter_id, source, division, rank, is_interim,
+            min(rank_date), max(rank_date), count(*)
+        FROM islands
+        GROUP BY fighter_id, source, division, rank, is_interim, island
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_fighter_ranking_runs_fighter_source_start", table_name="fighter_ranking_runs"
+    )
+    op.drop_table("fighter_ranking_runs")
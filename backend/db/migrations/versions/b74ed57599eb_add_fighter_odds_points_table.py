@@ -0,0 +1,70 @@
+"""add fighter odds points table
+
+Revision ID: b74ed57599eb
+Revises: 94ad5009c600
+Create Date: 2025-11-30 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b74ed57599eb"
+down_revision: Union[str, None] = "94ad5009c600"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fighter_odds_points",
+        sa.Column("odds_id", sa.String(), nullable=False),
+        sa.Column("timestamp_ms", sa.BigInteger(), nullable=False),
+        sa.Column("odds", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["odds_id"], ["fighter_odds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("odds_id", "timestamp_ms"),
+    )
+
+    # Backfill from the JSON histories with the same rules as
+    # parse_odds_points: skip non-numeric odds, fall back to the ISO timestamp
+    # when timestamp_ms is missing, and keep the last sample per timestamp.
+    op.execute(
+        r"""
+        WITH samples AS (
+            SELECT
+                fighter_odds.id AS odds_id,
+                sample.ordinality,
+                sample.value ->> 'odds' AS odds,
+                CASE
+                    WHEN sample.value ->> 'timestamp_ms' ~ '^-?\d+$'
+                        THEN (sample.value ->> 'timestamp_ms')::bigint
+                    WHEN sample.value ->> 'timestamp' ~ '^\d{4}-\d{2}-\d{2}'
+                        THEN floor(
+                            extract(epoch FROM (sample.value ->> 'timestamp')::timestamptz) * 1000
+                        )::bigint
+                END AS timestamp_ms
+            FROM fighter_odds
+            CROSS JOIN LATERAL json_array_elements(
+                CASE
+                    WHEN json_typeof(fighter_odds.mean_odds_history) = 'array'
+                        THEN fighter_odds.mean_odds_history
+                    ELSE '[]'::json
+                END
+            ) WITH ORDINALITY AS sample(value, ordinality)
+        )
+        INSERT INTO fighter_odds_points (odds_id, timestamp_ms, odds)
+        SELECT DISTINCT ON (odds_id, timestamp_ms) odds_id, timestamp_ms, odds::double precision
+        FROM samples
+        WHERE timestamp_ms IS NOT NULL
+          AND odds ~ '^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$'
+        ORDER BY odds_id, timestamp_ms, ordinality DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fighter_odds_points")
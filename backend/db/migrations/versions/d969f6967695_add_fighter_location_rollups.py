@@ -0,0 +1,159 @@
+"""add fighter location rollups table
+
+Revision ID: d969f6967695
+Revises: 1c535d077e0a
+Create Date: 2025-11-24 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d969f6967695"
+down_revision: Union[str, None] = "1c535d077e0a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fighter_location_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("dimension", sa.String(length=32), nullable=False),
+        sa.Column("label", sa.String(), nullable=False),
+        sa.Column("country", sa.String(), nullable=True),
+        sa.Column("city", sa.String(), nullable=True),
+        sa.Column("fighter_count", sa.Integer(), nullable=False),
+        sa.Column("notable_fighter_refs", sa.JSON(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_fighter_location_rollups_dimension_country",
+        "fighter_location_rollups",
+        ["dimension", "country"],
+        unique=False,
+    )
+
+    # Backfill from the current roster; geography scripts refresh it afterwards.
+    op.execute(
+        """
+        INSERT INTO fighter_location_rollups (
+            dimension, label, country, city, fighter_count, notable_fighter_refs, computed_at
+        )
+        SELECT 'birthplace_country', birthplace_country, birthplace_country,
+            NULL, count(*), NULL::json, now()
+        FROM fighters
+        WHERE birthplace_country IS NOT NULL
+        GROUP BY birthplace_country
+        UNION ALL
+        SELECT 'training_country', training_country, training_country,
+            NULL, count(*), NULL::json, now()
+        FROM fighters
+        WHERE training_country IS NOT NULL
+        GROUP BY training_country
+        UNION ALL
+        SELECT 'nationality', nationality, nationality, NULL, count(*), NULL::json, now()
+        FROM fighters
+        WHERE nationality IS NOT NULL
+        GROUP BY nationality
+        UNION ALL
+        SELECT 'birthplace_city', birthplace_city, birthplace_country,
+            NULL, count(*), NULL::json, now()
+        FROM fighters
+        WHERE birthplace_city IS NOT NULL
+        GROUP BY birthplace_city, birthplace_country
+        UNION ALL
+        SELECT 'training_city', training_city, training_country, NULL, count(*), NULL::json, now()
+        FROM fighters
+        WHERE training_city IS NOT NULL
+        GROUP BY training_city, training_country
+        """
+    )
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT
+                training_gym,
+                id,
+                name,
+                row_number() OVER (
+                    PARTITION BY training_gym
+                    ORDER BY last_fight_date DESC NULLS LAST, id
+                ) AS rn
+            FROM fighters
+            WHERE training_gym IS NOT NULL
+        ),
+        notable AS (
+            SELECT
+                training_gym,
+                json_agg(
+                    json_build_object('fighter_id', id, 'fighter_name', name) ORDER BY rn
+                ) AS refs
+            FROM ranked
+            WHERE rn <= 2
+            GROUP BY training_gym
+        ),
+        gyms AS (
+            SELECT training_gym, training_city, training_country, count(*) AS fighter_count
+            FROM fighters
+            WHERE training_gym IS NOT NULL
+            GROUP BY training_gym, training_city, training_country
+        )
+        INSERT INTO fighter_location_rollups (
+            dimension, label, country, city, fighter_count, notable_fighter_refs, computed_at
+        )
+        SELECT
+            'training_gym',
+            gyms.training_gym,
+            gyms.training_country,
+            gyms.training_city,
+            gyms.fighter_count,
+            notable.refs,
+            now()
+        FROM gyms
+        LEFT JOIN notable ON notable.training_gym = gyms.training_gym
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO fighter_location_rollups (
+            dimension, label, country, city, fighter_count, notable_fighter_refs, computed_at
+        )
+        SELECT 'coverage', counters.label, NULL, NULL, counters.fighter_count, NULL, now()
+        FROM (
+            SELECT
+                count(*) AS total_fighters,
+                count(*) FILTER (WHERE birthplace IS NOT NULL) AS with_birthplace,
+                count(*) FILTER (WHERE training_gym IS NOT NULL) AS with_training_gym,
+                count(*) FILTER (WHERE nationality IS NOT NULL) AS with_nationality,
+                count(*) FILTER (WHERE fighting_out_of IS NOT NULL) AS with_fighting_out_of,
+                count(*) FILTER (WHERE ufc_com_slug IS NOT NULL) AS with_ufc_com_slug,
+                count(*) FILTER (WHERE needs_manual_review IS TRUE) AS needs_manual_review,
+                count(*) FILTER (WHERE ufc_com_scraped_at IS NULL) AS never_scraped
+            FROM fighters
+        ) AS roster
+        CROSS JOIN LATERAL (
+            VALUES
+                ('total_fighters', roster.total_fighters),
+                ('with_birthplace', roster.with_birthplace),
+                ('with_training_gym', roster.with_training_gym),
+                ('with_nationality', roster.with_nationality),
+                ('with_fighting_out_of', roster.with_fighting_out_of),
+                ('with_ufc_com_slug', roster.with_ufc_com_slug),
+                ('needs_manual_review', roster.needs_manual_review),
+                ('never_scraped', roster.never_scraped)
+        ) AS counters(label, fighter_count)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_fighter_location_rollups_dimension_country", table_name="fighter_location_rollups"
+    )
+    op.drop_table("fighter_location_rollups")
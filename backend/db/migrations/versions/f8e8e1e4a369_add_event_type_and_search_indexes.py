@@ -0,0 +1,64 @@
+"""add event type column and event search indexes
+
+Revision ID: f8e8e1e4a369
+Revises: b20fb8bc668c
+Create Date: 2025-11-27 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f8e8e1e4a369"
+down_revision: Union[str, None] = "b20fb8bc668c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors backend.utils.event_utils.detect_event_type; the ORM keeps it current afterwards.
+_BACKFILL_EVENT_TYPE = r"""
+    UPDATE events SET event_type = CASE
+        WHEN lower(name) ~ '^ufc\s+\d+:' THEN 'ppv'
+        WHEN lower(name) LIKE '%fight night%' THEN 'fight_night'
+        WHEN lower(name) LIKE '%espn%' THEN 'ufc_on_espn'
+        WHEN lower(name) LIKE '%abc%' THEN 'ufc_on_abc'
+        WHEN lower(name) LIKE '%tuf%' AND lower(name) LIKE '%finale%' THEN 'tuf_finale'
+        WHEN lower(name) LIKE '%contender series%' OR lower(name) LIKE '%dwcs%'
+            THEN 'contender_series'
+        ELSE 'other'
+    END
+"""
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("event_type", sa.String(length=32), nullable=True))
+    op.execute(_BACKFILL_EVENT_TYPE)
+    op.alter_column("events", "event_type", nullable=False)
+    op.create_index("ix_events_event_type_date", "events", ["event_type", "date"], unique=False)
+
+    # Trigram indexes let ILIKE search on name/location use an index; skip them
+    # where the server does not ship pg_trgm rather than failing the migration.
+    bind = op.get_bind()
+    has_trgm = bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not has_trgm:
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_name_trgm ON events USING gin (name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_events_location_trgm "
+        "ON events USING gin (location gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_events_location_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_events_name_trgm")
+    op.drop_index("ix_events_event_type_date", table_name="events")
+    op.drop_column("events", "event_type")
@@ -8,15 +8,16 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     LargeBinary,
     String,
     Table,
-    Index,
     UniqueConstraint,
     text,
 )
@@ -28,6 +29,8 @@ from sqlalchemy.orm import (
     validates,
 )
 
+from backend.utils.event_utils import detect_event_type
+
 
 class Base(DeclarativeBase):
     pass
@@ -35,6 +38,7 @@ class Base(DeclarativeBase):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (Index("ix_events_event_type_date", "event_type", "date"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -43,6 +47,11 @@ class Event(Base):
     status: Mapped[str] = mapped_column(
         String, nullable=False, index=True
     )  # 'upcoming' or 'completed'
+    event_type: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        doc="EventType value derived from ``name``; kept in sync by ``sync_event_type``",
+    )
 
     # Enhanced metadata (from Tapology or other sources)
     venue: Mapped[str | None]
@@ -57,6 +66,12 @@ class Event(Base):
     # Relationships
     fights: Mapped[list[Fight]] = relationship("Fight", back_populates="event")
 
+    @validates("name")
+    def sync_event_type(self, key: str, value: str) -> str:
+        """Classify the event whenever its name is assigned so filters stay indexable."""
+        self.event_type = detect_event_type(value).value
+        return value
+
 
 class Fighter(Base):
     __tablename__ = "fighters"
@@ -276,8 +291,22 @@ class Fighter(Base):
         return value
 
 
+# Elapsed seconds for a bout: completed five-minute rounds plus the ``MM:SS``
+# clock of the final round.  Malformed clocks yield NULL instead of failing the
+# write, mirroring ``_parse_fight_duration_seconds`` in the scraped-data loader.
+FIGHT_DURATION_SECONDS_SQL = (
+    r"CASE WHEN round IS NOT NULL AND time ~ '^\s*[0-9]{1,3}:[0-9]{1,2}\s*$' "
+    "THEN GREATEST(round - 1, 0) * 300 "
+    "+ CAST(split_part(time, ':', 1) AS INTEGER) * 60 "
+    "+ CAST(split_part(time, ':', 2) AS INTEGER) END"
+)
+
+
 class Fight(Base):
     __tablename__ = "fights"
+    __table_args__ = (
+        Index("ix_fights_event_date_duration", "event_date", "duration_seconds"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     fighter_id: Mapped[str] = mapped_column(
@@ -310,6 +339,12 @@ class Fight(Base):
     method: Mapped[str | None]
     round: Mapped[int | None]
     time: Mapped[str | None]
+    duration_seconds: Mapped[int | None] = mapped_column(
+        Integer,
+        Computed(FIGHT_DURATION_SECONDS_SQL, persisted=True),
+        nullable=True,
+        doc="Elapsed fight time derived from round and time by PostgreSQL on write.",
+    )
     fight_card_url: Mapped[str | None]
     stats: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
     weight_class: Mapped[str | None] = mapped_column(
@@ -317,6 +352,11 @@ class Fight(Base):
         nullable=True,
         doc="Recorded weight class label for the bout (e.g., Lightweight).",
     )
+    card_position: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        doc="Zero-based position on the event's fight card, main event first.",
+    )
 
     # Sherdog-specific fields for multi-promotion support
     opponent_sherdog_id: Mapped[int | None] = mapped_column(
@@ -446,17 +486,50 @@ fighter_stats = Table(
 )
 
 # Imported late to avoid circular dependency with favorites module and odds extension.
+from .events import EventCardBout, EventFacetCell  # noqa: E402
 from .favorites import FavoriteCollection, FavoriteEntry  # noqa: E402
-from .odds import FighterOdds  # noqa: E402
+from .fight_graph import FightGraphEdge  # noqa: E402
+from .locations import FighterLocationRollup  # noqa: E402
+from .odds import (  # noqa: E402
+    FighterOdds,
+    FighterOddsAnalytics,
+    FighterOddsPoint,
+    FighterOddsStat,
+)
+from .rankings import (  # noqa: E402
+    CurrentRanking,
+    FighterRankingRollup,
+    FighterRankingRun,
+)
+from .stats import (  # noqa: E402
+    FighterStatsVersion,
+    FighterStreak,
+    FightTrendRollup,
+    StatsSummarySnapshot,
+)
 
 __all__ = [
     "Base",
+    "CurrentRanking",
     "Event",
+    "EventCardBout",
+    "EventFacetCell",
     "Fight",
     "Fighter",
     "FighterRanking",
+    "FighterRankingRollup",
+    "FighterRankingRun",
     "FavoriteCollection",
     "FavoriteEntry",
+    "FighterLocationRollup",
     "FighterOdds",
+    "FighterOddsAnalytics",
+    "FighterOddsPoint",
+    "FighterOddsStat",
+    "FighterStatsVersion",
+    "FighterStreak",
+    "FightGraphEdge",
+    "FightTrendRollup",
+    "StatsSummarySnapshot",
     "fighter_stats",
 ]
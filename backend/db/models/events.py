@@ -0,0 +1,63 @@
+"""SQLAlchemy models for precomputed event views."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import Base
+
+
+class EventFacetCell(Base):
+    """Number of events sharing one (year, location, event type, status) combination.
+
+    The cells are the finest grain of every filter on ``/events/search/``, so
+    facet counts under any combination of those filters are sums over cells.
+    Event loaders rebuild the table after writing events; ``computed_at``
+    doubles as the data version for cached facet responses.
+    """
+
+    __tablename__ = "event_facet_cells"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    location: Mapped[str | None] = mapped_column(String, nullable=True)
+    event_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class EventCardBout(Base):
+    """One bout of an event's fight card with both fighters resolved.
+
+    ``fights`` can hold a row per perspective of the same bout (the event
+    loader's canonical row, its mirrored upcoming row and fighter-history
+    rows); the card keeps a single row per fighter pairing, ordered by the
+    scraped card position.  The event detail loader rebuilds the cards of the
+    events it writes.  Fighter names are stored as of that rebuild; readers
+    prefer the current name from ``fighters``.
+    """
+
+    __tablename__ = "event_card_bouts"
+
+    event_id: Mapped[str] = mapped_column(
+        ForeignKey("events.id", ondelete="CASCADE"), primary_key=True
+    )
+    card_position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    fight_id: Mapped[str] = mapped_column(String, nullable=False)
+    fighter_1_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    fighter_1_name: Mapped[str] = mapped_column(String, nullable=False)
+    fighter_2_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    fighter_2_name: Mapped[str] = mapped_column(String, nullable=False)
+    weight_class: Mapped[str | None] = mapped_column(String, nullable=True)
+    result: Mapped[str | None] = mapped_column(String, nullable=True)
+    method: Mapped[str | None] = mapped_column(String, nullable=True)
+    round: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    time: Mapped[str | None] = mapped_column(String, nullable=True)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+__all__ = ["EventCardBout", "EventFacetCell"]
@@ -0,0 +1,66 @@
+"""SQLAlchemy model for the precomputed fight graph adjacency index."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Boolean, Date, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import Base
+
+
+class FightGraphEdge(Base):
+    """Aggregated bouts between a canonical fighter pair within one event year.
+
+    Each row covers ``(fighter_a_id, fighter_b_id, event_year, is_upcoming)``
+    where ``fighter_a_id`` sorts before ``fighter_b_id``.  Bucketing by year and
+    upcoming status keeps the graph filters exact while still letting a request
+    read a handful of pre-aggregated rows per link instead of every ``fights``
+    row.  Counts mirror the ``fights`` table, so a bout recorded from both
+    fighters' perspectives contributes two fights, one to each side's results.
+    """
+
+    __tablename__ = "fight_graph_edges"
+    __table_args__ = (
+        Index("ix_fight_graph_edges_pair", "fighter_a_id", "fighter_b_id"),
+        Index("ix_fight_graph_edges_fighter_b", "fighter_b_id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    fighter_a_id: Mapped[str] = mapped_column(
+        String, nullable=False, doc="Lexicographically smaller fighter identifier."
+    )
+    fighter_b_id: Mapped[str] = mapped_column(
+        String, nullable=False, doc="Lexicographically larger fighter identifier."
+    )
+    event_year: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, doc="Calendar year of the bouts (NULL when undated)."
+    )
+    is_upcoming: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, doc="Whether the bucket holds scheduled ('next') bouts."
+    )
+    fights: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    first_event_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    first_event_name: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_event_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    last_event_name: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    a_win: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    a_loss: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    a_draw: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    a_nc: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    a_upcoming: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    a_other: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    b_win: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    b_loss: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    b_draw: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    b_nc: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    b_upcoming: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    b_other: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+RESULT_CATEGORIES: tuple[str, ...] = ("win", "loss", "draw", "nc", "upcoming", "other")
+"""Result buckets tracked per side, matching ``_empty_breakdown`` keys."""
+
+__all__ = ["FightGraphEdge", "RESULT_CATEGORIES"]
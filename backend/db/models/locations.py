@@ -0,0 +1,42 @@
+"""SQLAlchemy model for precomputed fighter location aggregates."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import Base
+
+
+class FighterLocationRollup(Base):
+    """Fighter counts for one location bucket as of the last geography refresh.
+
+    ``dimension`` names the grouping: ``birthplace_country``,
+    ``training_country`` and ``nationality`` rows hold one country in ``label``;
+    ``birthplace_city`` and ``training_city`` rows hold a city scoped by
+    ``country``; ``training_gym`` rows hold a gym with its ``city``, ``country``
+    and most recently active fighters.  ``coverage`` rows carry roster-wide
+    completeness counters such as ``total_fighters`` keyed by ``label``.
+    """
+
+    __tablename__ = "fighter_location_rollups"
+    __table_args__ = (
+        Index("ix_fighter_location_rollups_dimension_country", "dimension", "country"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    dimension: Mapped[str] = mapped_column(String(32), nullable=False)
+    label: Mapped[str] = mapped_column(String, nullable=False)
+    country: Mapped[str | None] = mapped_column(String, nullable=True)
+    city: Mapped[str | None] = mapped_column(String, nullable=True)
+    fighter_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    notable_fighter_refs: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSON, nullable=True
+    )
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+__all__ = ["FighterLocationRollup"]
@@ -7,15 +7,20 @@ from typing import Any
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     CheckConstraint,
+    Computed,
     Date,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +28,14 @@ from . import Base
 
 QUALITY_CHOICES = ("excellent", "good", "usable", "poor", "no_data")
 
+# Position of the tier in ``QUALITY_CHOICES`` (0 = best), so "at least tier X"
+# filters become an indexable range comparison.  Unknown or NULL tiers yield NULL.
+QUALITY_RANK_SQL = (
+    "CASE data_quality_tier "
+    + " ".join(f"WHEN '{tier}' THEN {rank}" for rank, tier in enumerate(QUALITY_CHOICES))
+    + " END"
+)
+
 
 class FighterOdds(Base):
     """Represents aggregated time-series betting odds for a fighter's bout."""
@@ -43,10 +56,15 @@ class FighterOdds(Base):
         Index("ix_fighter_odds_event_date", "event_date"),
         Index("ix_fighter_odds_quality", "data_quality_tier"),
         Index("ix_fighter_odds_fighter_opponent", "fighter_id", "opponent_name"),
-        # [*TO-DO*] - Add composite index for list_fighter_odds query performance:
-        # Index('ix_fighter_odds_list_order', 'fighter_id',
-        #       event_date.desc().nullslast(), scraped_at.desc())
-        # This will optimize ORDER BY queries at scale (>100 fights per fighter)
+        # Serves list_fighter_odds' ORDER BY and keyset cursor without a sort.
+        Index(
+            "ix_fighter_odds_list_order",
+            "fighter_id",
+            text("event_date DESC NULLS LAST"),
+            text("scraped_at DESC"),
+            text("id DESC"),
+        ),
+        Index("ix_fighter_odds_fighter_quality_rank", "fighter_id", "quality_rank"),
     )
 
     id: Mapped[str] = mapped_column(
@@ -70,7 +88,10 @@ class FighterOdds(Base):
         JSON,
         nullable=False,
         default=list,
-        comment="Array of {timestamp_ms, timestamp, odds} time-series points.",
+        comment=(
+            "Array of {timestamp_ms, timestamp, odds} time-series points as scraped; "
+            "reads use fighter_odds_points."
+        ),
     )
     num_odds_points: Mapped[int] = mapped_column(
         Integer,
@@ -83,6 +104,12 @@ class FighterOdds(Base):
         nullable=True,
         comment="Quality tier derived from num_odds_points.",
     )
+    quality_rank: Mapped[int | None] = mapped_column(
+        SmallInteger,
+        Computed(QUALITY_RANK_SQL, persisted=True),
+        nullable=True,
+        doc="Tier position in QUALITY_CHOICES, maintained by PostgreSQL on write.",
+    )
     is_duplicate: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
@@ -100,4 +127,65 @@ class FighterOdds(Base):
     fighter: Mapped["Fighter"] = relationship("Fighter")
 
 
-__all__ = ["FighterOdds", "QUALITY_CHOICES"]
+class FighterOddsPoint(Base):
+    """One parsed sample of a bout's mean odds series.
+
+    The primary key keeps each series clustered and sorted by time, so chart
+    reads are a range scan with no per-point parsing.  The odds loader
+    rewrites a bout's points whenever it upserts the bout.
+    """
+
+    __tablename__ = "fighter_odds_points"
+
+    odds_id: Mapped[str] = mapped_column(
+        ForeignKey("fighter_odds.id", ondelete="CASCADE"), primary_key=True
+    )
+    timestamp_ms: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    odds: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class FighterOddsAnalytics(Base):
+    """Implied-probability and line-movement summary for one odds record.
+
+    Computed in bulk by the odds loader (see ``backend.services.odds_analytics``);
+    probabilities are in ``[0, 1]`` and movements in probability points.
+    """
+
+    __tablename__ = "fighter_odds_analytics"
+
+    odds_id: Mapped[str] = mapped_column(
+        ForeignKey("fighter_odds.id", ondelete="CASCADE"), primary_key=True
+    )
+    opening_probability: Mapped[float | None] = mapped_column(Float, nullable=True)
+    closing_probability: Mapped[float | None] = mapped_column(Float, nullable=True)
+    fair_closing_probability: Mapped[float | None] = mapped_column(Float, nullable=True)
+    probability_movement: Mapped[float | None] = mapped_column(Float, nullable=True)
+    volatility: Mapped[float | None] = mapped_column(Float, nullable=True)
+    steam_moves: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class FighterOddsStat(Base):
+    """One running counter behind ``/odds/stats/quality``.
+
+    The odds loader adds each upsert batch's net change to these rows in the
+    batch's own transaction, so quality stats never aggregate ``fighter_odds``.
+    Counters: ``total_records``, ``fighters_with_odds``, ``total_odds_points``
+    and ``records:<tier>`` per quality tier (a NULL tier counts as ``no_data``).
+    """
+
+    __tablename__ = "fighter_odds_stats"
+
+    counter: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+__all__ = [
+    "FighterOdds",
+    "FighterOddsAnalytics",
+    "FighterOddsPoint",
+    "FighterOddsStat",
+    "QUALITY_CHOICES",
+    "QUALITY_RANK_SQL",
+]
@@ -0,0 +1,97 @@
+"""SQLAlchemy models for precomputed fighter ranking views."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import Base
+
+
+class CurrentRanking(Base):
+    """A ranking row from the latest snapshot of its division and source.
+
+    Rows mirror ``fighter_rankings`` entries whose ``rank_date`` is the most
+    recent one for the (division, source) pair.  Ranking importers rebuild a
+    source's rows after writing new snapshots and stamp them with
+    ``refreshed_at``, which doubles as the data version for cached responses.
+    """
+
+    __tablename__ = "current_rankings"
+    __table_args__ = (
+        Index("ix_current_rankings_source_division_rank", "source", "division", "rank"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    ranking_id: Mapped[str] = mapped_column(
+        ForeignKey("fighter_rankings.id", ondelete="CASCADE"), nullable=False
+    )
+    fighter_id: Mapped[str] = mapped_column(
+        ForeignKey("fighters.id", ondelete="CASCADE"), nullable=False
+    )
+    division: Mapped[str] = mapped_column(String(50), nullable=False)
+    source: Mapped[str] = mapped_column(String(50), nullable=False)
+    rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    previous_rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    is_interim: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    rank_date: Mapped[date] = mapped_column(Date, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class FighterRankingRollup(Base):
+    """Current and peak ranking for one fighter from one ranking source.
+
+    The current columns describe the fighter's most recent snapshot (``rank``
+    is null when listed as not ranked); the peak columns describe the best
+    numbered rank ever held, preferring the latest snapshot on ties, and stay
+    null when the fighter never held one.  Ranking importers rebuild a
+    source's rows after writing new snapshots.
+    """
+
+    __tablename__ = "fighter_ranking_rollups"
+
+    fighter_id: Mapped[str] = mapped_column(
+        ForeignKey("fighters.id", ondelete="CASCADE"), primary_key=True
+    )
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    current_rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    current_rank_date: Mapped[date] = mapped_column(Date, nullable=False)
+    current_rank_division: Mapped[str] = mapped_column(String(50), nullable=False)
+    peak_ranking_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    peak_rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    peak_rank_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    peak_rank_division: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    peak_is_interim: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class FighterRankingRun(Base):
+    """A stretch of consecutive ranking issues at one rank in one division.
+
+    Runs are a run-length encoding of ``fighter_rankings``: a new run starts
+    whenever the fighter's rank or interim flag in the division changes, or
+    when the fighter is missing from an issue the source published for that
+    division.  ``snapshot_count`` is the number of issues the run spans.
+    """
+
+    __tablename__ = "fighter_ranking_runs"
+    __table_args__ = (
+        Index("ix_fighter_ranking_runs_fighter_source_start", "fighter_id", "source", "start_date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    fighter_id: Mapped[str] = mapped_column(
+        ForeignKey("fighters.id", ondelete="CASCADE"), nullable=False
+    )
+    source: Mapped[str] = mapped_column(String(50), nullable=False)
+    division: Mapped[str] = mapped_column(String(50), nullable=False)
+    rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    is_interim: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    snapshot_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+__all__ = ["CurrentRanking", "FighterRankingRollup", "FighterRankingRun"]
@@ -0,0 +1,115 @@
+"""SQLAlchemy models for precomputed stats dashboard snapshots."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from . import Base
+
+
+class StatsSummarySnapshot(Base):
+    """One KPI shown on ``/stats/summary`` as of the last loader run."""
+
+    __tablename__ = "stats_summary_snapshot"
+
+    metric_id: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[float] = mapped_column(Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class FightTrendRollup(Base):
+    """Additive fight aggregates for one division and time bucket.
+
+    ``bucket_kind`` is ``"day"`` (one row per event date) or ``"month"``.
+    Month rows let long ranges be answered from a handful of rows while day rows
+    cover the partial months at either edge of an arbitrary date range.  Like
+    the live trend queries, counts follow the ``fights`` table, so a bout
+    contributes one row per recorded fighter under that fighter's division.
+    """
+
+    __tablename__ = "fight_trend_rollups"
+    __table_args__ = (
+        Index("ix_fight_trend_rollups_bucket", "bucket_kind", "bucket_start", "division"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    division: Mapped[str | None] = mapped_column(String, nullable=True)
+    bucket_kind: Mapped[str] = mapped_column(String(8), nullable=False)
+    bucket_start: Mapped[date] = mapped_column(Date, nullable=False)
+    fight_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_total_seconds: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    win_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    finish_win_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ko_tko_win_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    submission_win_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    decision_win_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class FighterStreak(Base):
+    """One maximal run of consecutive wins or losses in a fighter's history.
+
+    Runs follow the fighter's dated bouts in chronological order; any other
+    recorded result (draw, no contest, upcoming) ends the current run.
+    ``start_position`` is the zero-based index of the run's first bout among
+    the fighter's dated bouts with a recorded result.  Loaders rebuild a
+    fighter's runs whenever that fighter's bouts are rewritten.
+    """
+
+    __tablename__ = "fighter_streaks"
+    __table_args__ = (
+        Index("ix_fighter_streaks_type_length", "streak_type", "length", "end_date"),
+        Index("ix_fighter_streaks_type_end_date", "streak_type", "end_date"),
+        Index("ix_fighter_streaks_fighter_start", "fighter_id", "start_date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    fighter_id: Mapped[str] = mapped_column(
+        ForeignKey("fighters.id", ondelete="CASCADE"), nullable=False
+    )
+    streak_type: Mapped[str] = mapped_column(String(8), nullable=False)
+    length: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    start_position: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class FighterStatsVersion(Base):
+    """Data version at which a fighter's ``fighter_stats`` rows were last written.
+
+    Writers assign ``max(version) + 1`` while holding a transaction-scoped
+    advisory lock, so versions become visible in commit order and readers can
+    watermark on ``max(version)`` without missing a slower concurrent write.
+    """
+
+    __tablename__ = "fighter_stats_versions"
+    __table_args__ = (Index("ix_fighter_stats_versions_version", "version"),)
+
+    fighter_id: Mapped[str] = mapped_column(
+        ForeignKey("fighters.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+TREND_ROLLUP_COUNTERS: tuple[str, ...] = (
+    "fight_count",
+    "duration_count",
+    "duration_total_seconds",
+    "win_count",
+    "finish_win_count",
+    "ko_tko_win_count",
+    "submission_win_count",
+    "decision_win_count",
+)
+"""Additive columns that month rows sum from their day rows."""
+
+__all__ = [
+    "FighterStatsVersion",
+    "FighterStreak",
+    "FightTrendRollup",
+    "StatsSummarySnapshot",
+    "TREND_ROLLUP_COUNTERS",
+]
@@ -3,14 +3,113 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-
-from sqlalchemy import desc, func, select
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    cast,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    nulls_last,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased
 
-from backend.db.models import Event, Fighter
+from backend.db.models import Event, EventCardBout, EventFacetCell, Fight, Fighter
 from backend.schemas.event import EventDetail, EventFight, EventListItem
-from backend.utils.event_utils import detect_event_type
+
+
+@dataclass(frozen=True, slots=True)
+class EventFacetCellCount:
+    """Event count for one (year, location, event type, status) combination."""
+
+    year: int
+    location: str | None
+    event_type: str
+    status: str
+    event_count: int
+
+
+_EVENT_CARD_COLUMNS = (
+    "event_id",
+    "card_position",
+    "fight_id",
+    "fighter_1_id",
+    "fighter_1_name",
+    "fighter_2_id",
+    "fighter_2_name",
+    "weight_class",
+    "result",
+    "method",
+    "round",
+    "time",
+)
+
+
+def _event_card_query(event_ids: list[str] | None) -> Select[Any]:
+    """Select one row per bout of each event's card, in card order.
+
+    Rows describing the same fighter pairing from either corner collapse to
+    one, preferring the event loader's positioned row over its mirrored
+    ``-opp`` copy and over fighter-history rows.
+    """
+
+    opponent_key = func.coalesce(Fight.opponent_id, Fight.opponent_name)
+    low_key = func.least(Fight.fighter_id, opponent_key)
+    high_key = func.greatest(Fight.fighter_id, opponent_key)
+    bouts = (
+        select(Fight)
+        .where(Fight.event_id.is_not(None))
+        .distinct(Fight.event_id, low_key, high_key)
+        .order_by(
+            Fight.event_id,
+            low_key,
+            high_key,
+            nulls_last(Fight.card_position),
+            Fight.id.like("%-opp"),
+            Fight.id,
+        )
+    )
+    if event_ids is not None:
+        bouts = bouts.where(Fight.event_id.in_(event_ids))
+    bout = aliased(Fight, bouts.subquery())
+
+    fighter_1 = aliased(Fighter)
+    fighter_2 = aliased(Fighter)
+    card_position = (
+        func.row_number().over(
+            partition_by=bout.event_id,
+            order_by=(nulls_last(bout.card_position), bout.id),
+        )
+        - 1
+    )
+    return (
+        select(
+            bout.event_id.label("event_id"),
+            card_position.label("card_position"),
+            bout.id.label("fight_id"),
+            bout.fighter_id.label("fighter_1_id"),
+            func.coalesce(fighter_1.name, literal("Unknown")).label("fighter_1_name"),
+            bout.opponent_id.label("fighter_2_id"),
+            func.coalesce(fighter_2.name, bout.opponent_name).label("fighter_2_name"),
+            bout.weight_class.label("weight_class"),
+            bout.result.label("result"),
+            bout.method.label("method"),
+            bout.round.label("round"),
+            bout.time.label("time"),
+        )
+        .outerjoin(fighter_1, fighter_1.id == bout.fighter_id)
+        .outerjoin(fighter_2, fighter_2.id == bout.opponent_id)
+        .order_by(bout.event_id, card_position)
+    )
 
 
 class PostgreSQLEventRepository:
@@ -50,63 +149,68 @@ class PostgreSQLEventRepository:
                 status=event.status,
                 venue=event.venue,
                 broadcast=event.broadcast,
-                event_type=detect_event_type(event.name).value,
+                event_type=event.event_type,
             )
             for event in events
         ]
 
     async def get_event(self, event_id: str) -> EventDetail | None:
         """Get detailed event information by ID, including fight card."""
-        # Query event with fights relationship loaded
-        query = select(Event).where(Event.id == event_id).options(selectinload(Event.fights))
-        result = await self._session.execute(query)
-        event = result.scalar_one_or_none()
-
-        if event is None:
+        # Names are resolved against ``fighters`` at read time so renames and
+        # fighters loaded after the card was built show up without a rebuild;
+        # the stored names only cover fighters missing from the table.
+        fighter_1 = aliased(Fighter)
+        fighter_2 = aliased(Fighter)
+        card_columns = [
+            EventCardBout.fight_id,
+            EventCardBout.fighter_1_id,
+            func.coalesce(fighter_1.name, EventCardBout.fighter_1_name).label(
+                "fighter_1_name"
+            ),
+            EventCardBout.fighter_2_id,
+            func.coalesce(fighter_2.name, EventCardBout.fighter_2_name).label(
+                "fighter_2_name"
+            ),
+            EventCardBout.weight_class,
+            EventCardBout.result,
+            EventCardBout.method,
+            EventCardBout.round,
+            EventCardBout.time,
+        ]
+        query = (
+            select(Event, *card_columns)
+            .outerjoin(EventCardBout, EventCardBout.event_id == Event.id)
+            .outerjoin(fighter_1, fighter_1.id == EventCardBout.fighter_1_id)
+            .outerjoin(fighter_2, fighter_2.id == EventCardBout.fighter_2_id)
+            .where(Event.id == event_id)
+            .order_by(EventCardBout.card_position)
+        )
+        rows = (await self._session.execute(query)).all()
+        if not rows:
             return None
 
-        # Build fight card from fights linked to this event
-        fight_card: list[EventFight] = []
-
-        # Aggregate fighter identifiers to avoid N+1 lookups.
-        fighter_ids: set[str] = {fight.fighter_id for fight in event.fights if fight.fighter_id}
-        fighter_ids.update(
-            opponent_id
-            for opponent_id in (fight.opponent_id for fight in event.fights)
-            if opponent_id
-        )
-        fighter_lookup: dict[str, str] = {}
-        if fighter_ids:
-            fighter_rows = await self._session.execute(
-                select(Fighter.id, Fighter.name).where(Fighter.id.in_(fighter_ids))
-            )
-            fighter_lookup = {row.id: row.name for row in fighter_rows.all()}
-
-        for fight in event.fights:
-            fighter_1_id = fight.fighter_id
-            fighter_2_id = fight.opponent_id
-
-            fighter_1_name = fighter_lookup.get(fighter_1_id, "Unknown")
-
-            fighter_2_name = fight.opponent_name
-            if fighter_2_id:
-                fighter_2_name = fighter_lookup.get(fighter_2_id, fighter_2_name)
-
-            fight_card.append(
-                EventFight(
-                    fight_id=fight.id,
-                    fighter_1_id=fighter_1_id,
-                    fighter_1_name=fighter_1_name,
-                    fighter_2_id=fighter_2_id,
-                    fighter_2_name=fighter_2_name,
-                    # Propagate stored weight class for downstream context.
-                    weight_class=fight.weight_class,
-                    result=fight.result,
-                    method=fight.method,
-                    round=fight.round,
-                    time=fight.time,
-                )
+        event = rows[0].Event
+        bouts: list[Any] = [row for row in rows if row.fight_id is not None]
+        if not bouts:
+            # Cards are only published by the event detail loader; resolve
+            # events it has not processed (or with no bouts) live.
+            bouts = list((await self._session.execute(_event_card_query([event.id]))).all())
+
+        fight_card = [
+            EventFight(
+                fight_id=bout.fight_id,
+                fighter_1_id=bout.fighter_1_id,
+                fighter_1_name=bout.fighter_1_name,
+                fighter_2_id=bout.fighter_2_id,
+                fighter_2_name=bout.fighter_2_name,
+                weight_class=bout.weight_class,
+                result=bout.result,
+                method=bout.method,
+                round=bout.round,
+                time=bout.time,
             )
+            for bout in bouts
+        ]
 
         return EventDetail(
             event_id=event.id,
@@ -116,7 +220,7 @@ class PostgreSQLEventRepository:
             status=event.status,
             venue=event.venue,
             broadcast=event.broadcast,
-            event_type=detect_event_type(event.name).value,
+            event_type=event.event_type,
             promotion=event.promotion,
             ufcstats_url=event.ufcstats_url,
             tapology_url=event.tapology_url,
@@ -170,83 +274,172 @@ class PostgreSQLEventRepository:
         Returns:
             List of matching events
         """
-        query = select(Event).order_by(desc(Event.date), Event.id)
+        query = (
+            select(Event)
+            .where(
+                *self._search_filters(
+                    q=q, year=year, location=location, event_type=event_type, status=status
+                )
+            )
+            .order_by(desc(Event.date), Event.id)
+        )
+        if offset is not None:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await self._session.execute(query)
+        return [
+            EventListItem(
+                event_id=event.id,
+                name=event.name,
+                date=event.date,
+                location=event.location,
+                status=event.status,
+                venue=event.venue,
+                broadcast=event.broadcast,
+                event_type=event.event_type,
+            )
+            for event in result.scalars().all()
+        ]
+
+    async def count_search_events(
+        self,
+        *,
+        q: str | None = None,
+        year: int | None = None,
+        location: str | None = None,
+        event_type: str | None = None,
+        status: str | None = None,
+    ) -> int:
+        """Count events matching the same filters as :meth:`search_events`."""
+        query = (
+            select(func.count())
+            .select_from(Event)
+            .where(
+                *self._search_filters(
+                    q=q, year=year, location=location, event_type=event_type, status=status
+                )
+            )
+        )
+        result = await self._session.execute(query)
+        return result.scalar_one()
+
+    def _search_filters(
+        self,
+        *,
+        q: str | None,
+        year: int | None,
+        location: str | None,
+        event_type: str | None,
+        status: str | None,
+    ) -> list[ColumnElement[bool]]:
+        """Build index-friendly predicates shared by search and count queries.
+
+        ``ILIKE`` patterns are served by the ``pg_trgm`` GIN indexes on name
+        and location when the extension is installed; the year becomes a date
+        range so the ``date`` index applies.
+        """
+        filters: list[ColumnElement[bool]] = []
 
         # Text search in name and location
         if q:
             search_pattern = f"%{q}%"
-            query = query.where(
-                Event.name.ilike(search_pattern) | Event.location.ilike(search_pattern)
-            )
+            filters.append(Event.name.ilike(search_pattern) | Event.location.ilike(search_pattern))
 
         # Year filter
         if year:
-            query = query.where(func.extract("year", Event.date) == year)
+            filters.append(Event.date >= date(year, 1, 1))
+            filters.append(Event.date < date(year + 1, 1, 1))
 
         # Location filter
         if location:
-            query = query.where(Event.location.ilike(f"%{location}%"))
+            filters.append(Event.location.ilike(f"%{location}%"))
+
+        if event_type:
+            filters.append(Event.event_type == event_type)
 
         # Status filter
         if status:
-            query = query.where(Event.status == status)
+            filters.append(Event.status == status)
 
-        apply_manual_pagination = event_type is not None
+        return filters
 
-        # ``detect_event_type`` performs in-memory classification. When an
-        # event_type filter is supplied we must load all matching rows prior to
-        # the post-processing step to ensure pagination remains accurate.
-        if not apply_manual_pagination:
-            if offset is not None:
-                query = query.offset(offset)
-            if limit is not None:
-                query = query.limit(limit)
+    async def get_event_facet_version(self) -> datetime | None:
+        """Return when ``event_facet_cells`` was last rebuilt, if ever."""
+        result = await self._session.execute(select(func.max(EventFacetCell.computed_at)))
+        return result.scalar_one_or_none()
 
-        result = await self._session.execute(query)
-        events = result.scalars().all()
+    async def get_event_facet_cells(self, *, q: str | None = None) -> list[EventFacetCellCount]:
+        """Return per-combination event counts for facet computation.
 
-        # Build event list with event type detection
-        event_list = [
-            EventListItem(
-                event_id=event.id,
-                name=event.name,
-                date=event.date,
-                location=event.location,
-                status=event.status,
-                venue=event.venue,
-                broadcast=event.broadcast,
-                event_type=detect_event_type(event.name).value,
+        Counts come from the precomputed cells unless a text query narrows the
+        events (cells cannot be pre-aggregated per query) or the cells have
+        not been built yet, in which case events are grouped directly.
+        """
+        if not q:
+            result = await self._session.execute(
+                select(
+                    EventFacetCell.year,
+                    EventFacetCell.location,
+                    EventFacetCell.event_type,
+                    EventFacetCell.status,
+                    EventFacetCell.event_count,
+                )
             )
-            for event in events
-        ]
+            rows = result.all()
+            if rows:
+                return [EventFacetCellCount(*row) for row in rows]
 
-        # Filter by event_type after detection (since it's not in DB)
-        if event_type:
-            event_list = [event for event in event_list if event.event_type == event_type]
-
-        if not apply_manual_pagination:
-            return event_list
-
-        start_index: int = 0 if offset is None else offset
-        end_index: int | None = None if limit is None else start_index + limit
-        return event_list[start_index:end_index]
-
-    async def get_unique_years(self) -> list[int]:
-        """Get list of unique years from all events."""
-        query = select(func.extract("year", Event.date).distinct()).order_by(
-            desc(func.extract("year", Event.date))
+        query = self._facet_cells_query().where(
+            *self._search_filters(q=q, year=None, location=None, event_type=None, status=None)
         )
         result = await self._session.execute(query)
-        years = result.scalars().all()
-        return [int(year) for year in years if year is not None]
+        return [EventFacetCellCount(*row) for row in result.all()]
+
+    async def refresh_event_facets(self) -> None:
+        """Rebuild ``event_facet_cells`` from ``events`` in the caller's transaction."""
+        facet_cells = self._facet_cells_query().subquery()
+        await self._session.execute(delete(EventFacetCell))
+        await self._session.execute(
+            insert(EventFacetCell).from_select(
+                [
+                    EventFacetCell.year,
+                    EventFacetCell.location,
+                    EventFacetCell.event_type,
+                    EventFacetCell.status,
+                    EventFacetCell.event_count,
+                    EventFacetCell.computed_at,
+                ],
+                select(facet_cells, func.now()),
+            )
+        )
 
-    async def get_unique_locations(self) -> list[str]:
-        """Get list of unique locations from all events."""
-        query = (
-            select(Event.location.distinct())
-            .where(Event.location.isnot(None))
-            .order_by(Event.location)
+    async def refresh_event_cards(self, event_ids: Iterable[str] | None = None) -> None:
+        """Rebuild ``event_card_bouts`` for ``event_ids`` (every event when omitted)."""
+        ids = None if event_ids is None else list(event_ids)
+        if ids is not None and not ids:
+            return
+
+        clear = delete(EventCardBout)
+        if ids is not None:
+            clear = clear.where(EventCardBout.event_id.in_(ids))
+        card = _event_card_query(ids).subquery()
+        await self._session.execute(clear)
+        await self._session.execute(
+            insert(EventCardBout).from_select(
+                [*_EVENT_CARD_COLUMNS, "refreshed_at"],
+                select(*(card.c[name] for name in _EVENT_CARD_COLUMNS), func.now()),
+            )
         )
-        result = await self._session.execute(query)
-        locations = result.scalars().all()
-        return list(locations)
+
+    def _facet_cells_query(self) -> Select[tuple[int, str | None, str, str, int]]:
+        """Group events by every facet dimension."""
+        year = cast(func.extract("year", Event.date), Integer)
+        return select(
+            year.label("year"),
+            Event.location,
+            Event.event_type,
+            Event.status,
+            func.count().label("event_count"),
+        ).group_by(year, Event.location, Event.event_type, Event.status)
@@ -4,22 +4,22 @@ This repository handles:
 - Building fight relationship graphs for visualization
 - Aggregating fighter connections through fights
 - Link deduplication and metadata
+- Maintaining the ``fight_graph_edges`` adjacency index the graph reads from
 - Optimized for graph/network analysis workloads
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable
 from datetime import date
 from typing import Any
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import Integer, and_, case, cast, delete, desc, extract, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
 
-from backend.db.models import Fight, Fighter
-from backend.db.repositories.base import (
-    BaseRepository,
-    _empty_breakdown,
-    _normalize_result_category,
-)
+from backend.db.models import Fight, Fighter, FightGraphEdge
+from backend.db.models.fight_graph import RESULT_CATEGORIES
+from backend.db.repositories.base import BaseRepository
 from backend.schemas.fight_graph import (
     FightGraphLink,
     FightGraphNode,
@@ -28,6 +28,39 @@ from backend.schemas.fight_graph import (
 from backend.services.image_resolver import resolve_fighter_image_cropped
 
 
+def fight_graph_metadata(
+    *,
+    division: str | None,
+    start_year: int | None,
+    end_year: int | None,
+    limit: int | None,
+    include_upcoming: bool,
+    node_count: int,
+    link_count: int,
+    earliest_event: date | None = None,
+    latest_event: date | None = None,
+) -> dict[str, Any]:
+    """Return the metadata block shared by buffered and streamed graph payloads."""
+
+    metadata: dict[str, Any] = {
+        "filters": {
+            "division": division,
+            "start_year": start_year,
+            "end_year": end_year,
+            "include_upcoming": include_upcoming,
+        },
+        "node_count": node_count,
+        "link_count": link_count,
+        "limit": limit,
+    }
+    if earliest_event is not None or latest_event is not None:
+        metadata["event_window"] = {
+            "start": earliest_event,
+            "end": latest_event,
+        }
+    return metadata
+
+
 class FightGraphRepository(BaseRepository):
     """Repository for fight relationship graph operations."""
 
@@ -45,6 +78,61 @@ class FightGraphRepository(BaseRepository):
         if limit is not None and limit <= 0:
             return FightGraphResponse()
 
+        nodes = await self.get_fight_graph_nodes(
+            division=division,
+            start_year=start_year,
+            end_year=end_year,
+            limit=limit,
+            include_upcoming=include_upcoming,
+        )
+
+        links: list[FightGraphLink] = []
+        earliest_event: date | None = None
+        latest_event: date | None = None
+        async for link in self.iter_fight_graph_links(
+            [node.fighter_id for node in nodes],
+            start_year=start_year,
+            end_year=end_year,
+            include_upcoming=include_upcoming,
+        ):
+            links.append(link)
+            if link.first_event_date is not None and (
+                earliest_event is None or link.first_event_date < earliest_event
+            ):
+                earliest_event = link.first_event_date
+            if link.last_event_date is not None and (
+                latest_event is None or link.last_event_date > latest_event
+            ):
+                latest_event = link.last_event_date
+
+        metadata = fight_graph_metadata(
+            division=division,
+            start_year=start_year,
+            end_year=end_year,
+            limit=limit,
+            include_upcoming=include_upcoming,
+            node_count=len(nodes),
+            link_count=len(links),
+            earliest_event=earliest_event,
+            latest_event=latest_event,
+        )
+        return FightGraphResponse(nodes=nodes, links=links, metadata=metadata)
+
+    async def get_fight_graph_nodes(
+        self,
+        *,
+        division: str | None = None,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        limit: int | None = 200,
+        include_upcoming: bool = False,
+    ) -> list[FightGraphNode]:
+        """Return the busiest fighters matching the filters, in graph priority order.
+
+        Falls back to an alphabetical roster slice when no bouts match so the
+        client still has nodes to render.
+        """
+
         fight_filters: list[Any] = []
         if start_year is not None:
             fight_filters.append(Fight.event_date >= date(start_year, 1, 1))
@@ -93,8 +181,7 @@ class FightGraphRepository(BaseRepository):
             if limit is not None:
                 fallback_query = fallback_query.limit(limit)
             fallback_result = await self._session.execute(fallback_query)
-            fallback_fighters = fallback_result.all()
-            nodes = [
+            return [
                 FightGraphNode(
                     fighter_id=row.id,
                     name=row.name,
@@ -106,20 +193,8 @@ class FightGraphRepository(BaseRepository):
                     total_fights=0,
                     latest_event_date=None,
                 )
-                for row in fallback_fighters
+                for row in fallback_result.all()
             ]
-            metadata = {
-                "filters": {
-                    "division": division,
-                    "start_year": start_year,
-                    "end_year": end_year,
-                    "include_upcoming": include_upcoming,
-                },
-                "node_count": len(nodes),
-                "link_count": 0,
-                "limit": limit,
-            }
-            return FightGraphResponse(nodes=nodes, links=[], metadata=metadata)
 
         fighters_query = select(
             Fighter.id,
@@ -153,113 +228,208 @@ class FightGraphRepository(BaseRepository):
                     latest_event_date=latest_map.get(fighter_row.id),
                 )
             )
+        return nodes
+
+    async def iter_fight_graph_links(
+        self,
+        fighter_ids: Iterable[str],
+        *,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        include_upcoming: bool = False,
+    ) -> AsyncIterator[FightGraphLink]:
+        """Yield links between ``fighter_ids`` ordered by fight count (busiest first).
 
-        id_set = set(id_order)
-        edges_filters = list(fight_filters)
+        Rows are read through a server-side cursor so callers that stream the
+        links onward never hold the full edge list in memory.
+        """
 
-        edges_query = select(Fight).where(
-            Fight.fighter_id.in_(id_set),
-            Fight.opponent_id.is_not(None),
-            Fight.opponent_id.in_(id_set),
+        id_set = set(fighter_ids)
+        if not id_set:
+            return
+
+        edge_filters: list[Any] = [
+            FightGraphEdge.fighter_a_id.in_(id_set),
+            FightGraphEdge.fighter_b_id.in_(id_set),
+        ]
+        if start_year is not None:
+            edge_filters.append(FightGraphEdge.event_year >= start_year)
+        if end_year is not None:
+            edge_filters.append(FightGraphEdge.event_year <= end_year)
+        if not include_upcoming:
+            edge_filters.append(FightGraphEdge.is_upcoming.is_(False))
+
+        # One row per link: year buckets are folded in SQL and only the columns
+        # the response needs are projected.  Undated buckets sort last so they
+        # only supply event names when a pair has no dated bout.
+        pair_columns = (FightGraphEdge.fighter_a_id, FightGraphEdge.fighter_b_id)
+        breakdown_columns = [
+            func.sum(getattr(FightGraphEdge, f"{side}_{category}")).label(f"{side}_{category}")
+            for side in ("a", "b")
+            for category in RESULT_CATEGORIES
+        ]
+        fights_expr = func.sum(FightGraphEdge.fights).label("fights")
+        links_query = (
+            select(
+                *pair_columns,
+                fights_expr,
+                func.min(FightGraphEdge.first_event_date).label("first_event_date"),
+                array_agg(
+                    aggregate_order_by(
+                        FightGraphEdge.first_event_name,
+                        FightGraphEdge.first_event_date.asc().nullslast(),
+                    )
+                )[1].label("first_event_name"),
+                func.max(FightGraphEdge.last_event_date).label("last_event_date"),
+                array_agg(
+                    aggregate_order_by(
+                        FightGraphEdge.last_event_name,
+                        FightGraphEdge.last_event_date.desc().nullslast(),
+                    )
+                )[1].label("last_event_name"),
+                *breakdown_columns,
+            )
+            .where(*edge_filters)
+            .group_by(*pair_columns)
+            .order_by(desc(fights_expr), *pair_columns)
         )
-        if edges_filters:
-            edges_query = edges_query.where(*edges_filters)
+        links_result = await self._session.stream(links_query)
+        async for row in links_result:
+            mapping = row._mapping
+            yield FightGraphLink(
+                source=row.fighter_a_id,
+                target=row.fighter_b_id,
+                fights=int(row.fights),
+                first_event_name=row.first_event_name,
+                first_event_date=row.first_event_date,
+                last_event_name=row.last_event_name,
+                last_event_date=row.last_event_date,
+                result_breakdown={
+                    fighter_id: {
+                        category: int(mapping[f"{side}_{category}"])
+                        for category in RESULT_CATEGORIES
+                    }
+                    for side, fighter_id in (
+                        ("a", row.fighter_a_id),
+                        ("b", row.fighter_b_id),
+                    )
+                },
+            )
 
-        edges_result = await self._session.execute(edges_query)
-        fights = edges_result.scalars().all()
+    async def get_fight_graph_version(self) -> tuple[int, int]:
+        """Return a cheap fingerprint of ``fight_graph_edges`` (max id, row count).
 
-        link_accumulator: dict[tuple[str, str], dict[str, Any]] = {}
-        earliest_event: date | None = None
-        latest_event: date | None = None
-        for fight in fights:
-            opponent_id = fight.opponent_id
-            if opponent_id is None:
-                continue
+        ``refresh_edges`` deletes and re-inserts rows, so any loader write moves
+        the maximum identifier and callers can cache derived structures per
+        version.
+        """
 
-            pair = tuple(sorted((fight.fighter_id, opponent_id)))
-            if pair[0] == pair[1]:
-                continue
+        result = await self._session.execute(
+            select(func.coalesce(func.max(FightGraphEdge.id), 0), func.count(FightGraphEdge.id))
+        )
+        max_id, row_count = result.one()
+        return int(max_id), int(row_count)
 
-            entry = link_accumulator.setdefault(
-                pair,
-                {
-                    "fights": 0,
-                    "first_event_name": None,
-                    "first_event_date": None,
-                    "last_event_name": None,
-                    "last_event_date": None,
-                    "result_breakdown": {
-                        pair[0]: _empty_breakdown(),
-                        pair[1]: _empty_breakdown(),
-                    },
-                },
+    async def get_fight_graph_adjacency(
+        self,
+    ) -> tuple[list[tuple[str, str, int]], list[tuple[str, str, str | None]]]:
+        """Return completed-bout pairs with fight counts plus the fighters they touch.
+
+        Edges are ``(fighter_a_id, fighter_b_id, fights)`` across all years;
+        fighters are ``(id, name, division)`` for every endpoint on the roster.
+        """
+
+        pair_columns = (FightGraphEdge.fighter_a_id, FightGraphEdge.fighter_b_id)
+        edges_result = await self._session.execute(
+            select(*pair_columns, func.sum(FightGraphEdge.fights))
+            .where(FightGraphEdge.is_upcoming.is_(False))
+            .group_by(*pair_columns)
+        )
+        edges = [(a, b, int(fights)) for a, b, fights in edges_result.all()]
+
+        endpoint_ids = (
+            select(FightGraphEdge.fighter_a_id.label("fighter_id"))
+            .where(FightGraphEdge.is_upcoming.is_(False))
+            .union(
+                select(FightGraphEdge.fighter_b_id).where(FightGraphEdge.is_upcoming.is_(False))
+            )
+        )
+        fighters_result = await self._session.execute(
+            select(Fighter.id, Fighter.name, Fighter.division).where(
+                Fighter.id.in_(select(endpoint_ids.subquery().c.fighter_id))
             )
+        )
+        fighters = [(row.id, row.name, row.division) for row in fighters_result.all()]
+        return edges, fighters
+
+    async def refresh_edges(self, fighter_ids: Iterable[str] | None = None) -> None:
+        """Rebuild ``fight_graph_edges`` rows for pairs touching ``fighter_ids``.
+
+        Loaders call this after writing fights.  Passing ``None`` rebuilds the
+        whole adjacency index, which is what the bulk event loader and the
+        backfill migration do.
+        """
+
+        fighter_a = func.least(Fight.fighter_id, Fight.opponent_id)
+        fighter_b = func.greatest(Fight.fighter_id, Fight.opponent_id)
+        event_year = cast(extract("year", Fight.event_date), Integer)
+        is_upcoming = func.lower(Fight.result) == "next"
+
+        normalized_result = func.lower(func.trim(Fight.result))
+        result_category = case(
+            (normalized_result.in_(("win", "w")), "win"),
+            (normalized_result.in_(("loss", "l")), "loss"),
+            (normalized_result.like("draw%"), "draw"),
+            (normalized_result.in_(("nc", "no contest")), "nc"),
+            (normalized_result == "next", "upcoming"),
+            else_="other",
+        )
+
+        side_counts = []
+        for side, side_expr in (("a", fighter_a), ("b", fighter_b)):
+            for category in RESULT_CATEGORIES:
+                side_counts.append(
+                    func.count()
+                    .filter(and_(Fight.fighter_id == side_expr, result_category == category))
+                    .label(f"{side}_{category}")
+                )
 
-            entry["fights"] += 1
-
-            result_map = entry["result_breakdown"]
-            if fight.fighter_id not in result_map:
-                result_map[fight.fighter_id] = _empty_breakdown()
-
-            normalized_result = _normalize_result_category(fight.result)
-            if normalized_result not in result_map[fight.fighter_id]:
-                result_map[fight.fighter_id][normalized_result] = 0
-            result_map[fight.fighter_id][normalized_result] += 1
-
-            other_id = pair[0] if fight.fighter_id == pair[1] else pair[1]
-            if other_id not in result_map:
-                result_map[other_id] = _empty_breakdown()
-
-            if fight.event_date is not None:
-                if earliest_event is None or fight.event_date < earliest_event:
-                    earliest_event = fight.event_date
-                if latest_event is None or fight.event_date > latest_event:
-                    latest_event = fight.event_date
-
-                last_date = entry["last_event_date"]
-                if last_date is None or fight.event_date > last_date:
-                    entry["last_event_date"] = fight.event_date
-                    entry["last_event_name"] = fight.event_name
-                first_date = entry["first_event_date"]
-                if first_date is None or fight.event_date < first_date:
-                    entry["first_event_date"] = fight.event_date
-                    entry["first_event_name"] = fight.event_name
-            elif entry["last_event_name"] is None:
-                entry["last_event_name"] = fight.event_name
-                if entry["first_event_name"] is None:
-                    entry["first_event_name"] = fight.event_name
-
-        links = [
-            FightGraphLink(
-                source=pair[0],
-                target=pair[1],
-                fights=data["fights"],
-                first_event_name=data["first_event_name"],
-                first_event_date=data["first_event_date"],
-                last_event_name=data["last_event_name"],
-                last_event_date=data["last_event_date"],
-                result_breakdown=data["result_breakdown"],
+        source = (
+            select(
+                fighter_a.label("fighter_a_id"),
+                fighter_b.label("fighter_b_id"),
+                event_year.label("event_year"),
+                is_upcoming.label("is_upcoming"),
+                func.count().label("fights"),
+                func.min(Fight.event_date).label("first_event_date"),
+                array_agg(
+                    aggregate_order_by(Fight.event_name, Fight.event_date.asc().nullslast())
+                )[1].label("first_event_name"),
+                func.max(Fight.event_date).label("last_event_date"),
+                array_agg(
+                    aggregate_order_by(Fight.event_name, Fight.event_date.desc().nullslast())
+                )[1].label("last_event_name"),
+                *side_counts,
             )
-            for pair, data in link_accumulator.items()
-        ]
-        links.sort(key=lambda link: link.fights, reverse=True)
-
-        metadata = {
-            "filters": {
-                "division": division,
-                "start_year": start_year,
-                "end_year": end_year,
-                "include_upcoming": include_upcoming,
-            },
-            "node_count": len(nodes),
-            "link_count": len(links),
-            "limit": limit,
-        }
+            .where(Fight.opponent_id.is_not(None), Fight.fighter_id != Fight.opponent_id)
+            .group_by(fighter_a, fighter_b, event_year, is_upcoming)
+        )
 
-        if earliest_event is not None or latest_event is not None:
-            metadata["event_window"] = {
-                "start": earliest_event,
-                "end": latest_event,
-            }
+        delete_stmt = delete(FightGraphEdge)
+        if fighter_ids is not None:
+            id_list = list(dict.fromkeys(fighter_ids))
+            if not id_list:
+                return
+            delete_stmt = delete_stmt.where(
+                or_(
+                    FightGraphEdge.fighter_a_id.in_(id_list),
+                    FightGraphEdge.fighter_b_id.in_(id_list),
+                )
+            )
+            source = source.where(
+                or_(Fight.fighter_id.in_(id_list), Fight.opponent_id.in_(id_list))
+            )
 
-        return FightGraphResponse(nodes=nodes, links=links, metadata=metadata)
+        columns = [column.name for column in source.selected_columns]
+        await self._session.execute(delete_stmt)
+        await self._session.execute(insert(FightGraphEdge).from_select(columns, source))
@@ -5,11 +5,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 from datetime import UTC, date, datetime
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import load_only
 
-from backend.db.models import Fighter, fighter_stats
+from backend.db.models import Fighter, FighterStatsVersion, fighter_stats
 from backend.db.repositories.base import _calculate_age
+from backend.db.repositories.fighter.types import ComparisonMetricRow
 from backend.schemas.fighter import FighterComparisonEntry
 from backend.services.image_resolver import resolve_fighter_image
 
@@ -88,3 +89,59 @@ class FighterComparisonMixin:
             )
 
         return comparison
+
+    async def get_comparison_stats_watermark(self) -> int:
+        """Return the current stats data version.
+
+        Loaders stamp every fighter whose ``fighter_stats`` rows they rewrite
+        with the next version (see ``StatsRepository.mark_fighter_stats_written``),
+        and a version only becomes visible once every smaller one has committed.
+        """
+
+        result = await self._session.execute(select(func.max(FighterStatsVersion.version)))
+        return int(result.scalar_one_or_none() or 0)
+
+    async def get_comparison_metric_rows(
+        self,
+        metrics: Sequence[str],
+        *,
+        since_version: int | None = None,
+    ) -> list[ComparisonMetricRow]:
+        """Return raw metric values (plus division) for the comparison matrix.
+
+        When ``since_version`` is provided only fighters stamped with a newer
+        stats data version are returned, which lets callers refresh a cached
+        matrix incrementally after a loader run.
+        """
+
+        if not metrics:
+            return []
+
+        stmt = (
+            select(
+                fighter_stats.c.fighter_id,
+                Fighter.division,
+                fighter_stats.c.metric,
+                fighter_stats.c.value,
+            )
+            .join(Fighter, Fighter.id == fighter_stats.c.fighter_id)
+            .where(fighter_stats.c.metric.in_(list(metrics)))
+            .order_by(fighter_stats.c.fighter_id, fighter_stats.c.id)
+        )
+        if since_version is not None:
+            changed_ids = select(FighterStatsVersion.fighter_id).where(
+                FighterStatsVersion.version > since_version
+            )
+            stmt = stmt.where(fighter_stats.c.fighter_id.in_(changed_ids))
+
+        result = await self._session.execute(stmt)
+        return [
+            ComparisonMetricRow(
+                fighter_id=fighter_id,
+                division=division,
+                metric=metric,
+                value=value,
+            )
+            for fighter_id, division, metric, value in result.all()
+            if fighter_id is not None and metric is not None and value is not None
+        ]
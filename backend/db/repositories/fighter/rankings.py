@@ -5,10 +5,11 @@ from __future__ import annotations
 import os
 from collections.abc import Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, select, union_all
 
-from backend.db.models import FighterRanking
+from backend.db.models import FighterRankingRollup
 from backend.db.repositories.fighter.types import FighterRankingSummary
+from backend.db.repositories.ranking_repository import select_ranking_rollup_rows
 
 
 class FighterRankingMixin:
@@ -26,7 +27,13 @@ class FighterRankingMixin:
     async def _fetch_ranking_summaries(
         self, fighter_ids: Sequence[str]
     ) -> dict[str, FighterRankingSummary]:
-        """Lookup current and peak rankings for the provided fighters."""
+        """Lookup current and peak rankings for the provided fighters.
+
+        Reads the importer-maintained ``fighter_ranking_rollups`` rows with a
+        single lookup for the whole batch.  When the source has not been rolled
+        up yet (e.g. before the importers refreshed it) the same statement
+        computes the rows live from ``fighter_rankings`` instead.
+        """
 
         ranking_source = self._ranking_source()
         if not ranking_source:
@@ -36,80 +43,41 @@ class FighterRankingMixin:
         if not deduped_ids:
             return {}
 
-        current_subquery = (
+        rollup = FighterRankingRollup
+        stored = (
             select(
-                FighterRanking.fighter_id.label("fighter_id"),
-                FighterRanking.rank.label("rank"),
-                FighterRanking.rank_date.label("rank_date"),
-                FighterRanking.division.label("division"),
-                FighterRanking.source.label("source"),
-                func.row_number()
-                .over(
-                    partition_by=FighterRanking.fighter_id,
-                    order_by=FighterRanking.rank_date.desc(),
-                )
-                .label("row_number"),
+                rollup.fighter_id,
+                rollup.source,
+                rollup.current_rank,
+                rollup.current_rank_date,
+                rollup.current_rank_division,
+                rollup.peak_ranking_id,
+                rollup.peak_rank,
+                rollup.peak_rank_date,
+                rollup.peak_rank_division,
+                rollup.peak_is_interim,
+                rollup.refreshed_at,
             )
-            .where(FighterRanking.fighter_id.in_(deduped_ids))
-            .where(FighterRanking.source == ranking_source)
-        ).subquery()
-
-        current_rows = await self._session.execute(
-            select(
-                current_subquery.c.fighter_id,
-                current_subquery.c.rank,
-                current_subquery.c.rank_date,
-                current_subquery.c.division,
-                current_subquery.c.source,
-            ).where(current_subquery.c.row_number == 1)
+            .where(rollup.source == ranking_source)
+            .where(rollup.fighter_id.in_(deduped_ids))
         )
-
-        peak_subquery = (
-            select(
-                FighterRanking.fighter_id.label("fighter_id"),
-                FighterRanking.rank.label("rank"),
-                FighterRanking.rank_date.label("rank_date"),
-                FighterRanking.division.label("division"),
-                FighterRanking.source.label("source"),
-                func.row_number()
-                .over(
-                    partition_by=FighterRanking.fighter_id,
-                    order_by=(
-                        FighterRanking.rank.asc(),
-                        FighterRanking.rank_date.desc(),
-                    ),
-                )
-                .label("row_number"),
-            )
-            .where(FighterRanking.fighter_id.in_(deduped_ids))
-            .where(FighterRanking.source == ranking_source)
-            .where(FighterRanking.rank.isnot(None))
-        ).subquery()
-
-        peak_rows = await self._session.execute(
-            select(
-                peak_subquery.c.fighter_id,
-                peak_subquery.c.rank,
-                peak_subquery.c.rank_date,
-                peak_subquery.c.division,
-                peak_subquery.c.source,
-            ).where(peak_subquery.c.row_number == 1)
+        live = select_ranking_rollup_rows([ranking_source], deduped_ids).where(
+            ~exists().where(rollup.source == ranking_source)
         )
+        result = await self._session.execute(union_all(stored, live))
 
         summaries: dict[str, FighterRankingSummary] = {}
-
-        for row in current_rows:
-            summary = summaries.setdefault(row.fighter_id, FighterRankingSummary())
-            summary.current_rank = row.rank
-            summary.current_rank_date = row.rank_date
-            summary.current_rank_division = row.division
-            summary.current_rank_source = row.source
-
-        for row in peak_rows:
-            summary = summaries.setdefault(row.fighter_id, FighterRankingSummary())
-            summary.peak_rank = row.rank
-            summary.peak_rank_date = row.rank_date
-            summary.peak_rank_division = row.division
-            summary.peak_rank_source = row.source
+        for row in result:
+            has_peak = row.peak_rank is not None
+            summaries[row.fighter_id] = FighterRankingSummary(
+                current_rank=row.current_rank,
+                current_rank_date=row.current_rank_date,
+                current_rank_division=row.current_rank_division,
+                current_rank_source=row.source,
+                peak_rank=row.peak_rank,
+                peak_rank_date=row.peak_rank_date,
+                peak_rank_division=row.peak_rank_division,
+                peak_rank_source=row.source if has_peak else None,
+            )
 
         return summaries
@@ -8,10 +8,12 @@ from datetime import UTC, date, datetime
 from typing import Any, Literal
 from typing import cast as typing_cast
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Row, String, and_, delete, func, insert, literal, null, or_, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import load_only
+from sqlalchemy.sql import ColumnElement
 
-from backend.db.models import Fighter
+from backend.db.models import Fighter, FighterLocationRollup
 from backend.db.repositories.base import _calculate_age
 from backend.db.repositories.fighter.filters import (
     _validate_streak_type,
@@ -23,6 +25,29 @@ from backend.services.image_resolver import resolve_fighter_image
 logger = logging.getLogger(__name__)
 
 
+_COUNTRY_COLUMNS = {
+    "birthplace": Fighter.birthplace_country,
+    "training": Fighter.training_country,
+    "nationality": Fighter.nationality,
+}
+_CITY_COLUMNS = {
+    "birthplace": (Fighter.birthplace_city, Fighter.birthplace_country),
+    "training": (Fighter.training_city, Fighter.training_country),
+}
+_COVERAGE_DIMENSION = "coverage"
+
+LOCATION_COVERAGE_COUNTERS: dict[str, ColumnElement[bool]] = {
+    "with_birthplace": Fighter.birthplace.isnot(None),
+    "with_training_gym": Fighter.training_gym.isnot(None),
+    "with_nationality": Fighter.nationality.isnot(None),
+    "with_fighting_out_of": Fighter.fighting_out_of.isnot(None),
+    "with_ufc_com_slug": Fighter.ufc_com_slug.isnot(None),
+    "needs_manual_review": Fighter.needs_manual_review.is_(True),
+    "never_scraped": Fighter.ufc_com_scraped_at.is_(None),
+}
+"""Time-independent location health counters kept in the ``coverage`` rollup."""
+
+
 class FighterRosterMixin:
     """Provide list, search, and aggregation helpers for fighters."""
 
@@ -439,15 +464,22 @@ class FighterRosterMixin:
     async def get_country_stats(self, group_by: str) -> tuple[list[dict[str, Any]], int]:
         """Aggregate fighter counts grouped by country metadata."""
 
-        if group_by == "birthplace":
-            column = Fighter.birthplace_country
-        elif group_by == "training":
-            column = Fighter.training_country
-        elif group_by == "nationality":
-            column = Fighter.nationality
-        else:
+        if group_by not in _COUNTRY_COLUMNS:
             msg = f"Invalid group_by value: {group_by}"
             raise ValueError(msg)
+        column = _COUNTRY_COLUMNS[group_by]
+
+        rollup = await self._location_rollup(column.key)
+        if rollup is not None:
+            rows, total = rollup
+            return [
+                {
+                    "country": row.label,
+                    "count": row.fighter_count,
+                    "percentage": _location_share(row.fighter_count, total),
+                }
+                for row in rows
+            ], total
 
         query = (
             select(column.label("country"), func.count().label("count"))
@@ -458,14 +490,11 @@ class FighterRosterMixin:
 
         result = await self._session.execute(query)
         rows = result.all()
-
-        roster_total_query = select(func.count()).select_from(Fighter)
-        roster_total_result = await self._session.execute(roster_total_query)
-        total = roster_total_result.scalar_one_or_none() or 0
+        total = await self._roster_total()
 
         stats: list[dict[str, Any]] = []
         for row in rows:
-            percentage = round((row.count / total * 100), 1) if total > 0 else 0.0
+            percentage = _location_share(row.count, total)
             stats.append({"country": row.country, "count": row.count, "percentage": percentage})
 
         return stats, total
@@ -475,15 +504,23 @@ class FighterRosterMixin:
     ) -> tuple[list[dict[str, Any]], int]:
         """Aggregate fighter counts grouped by city metadata."""
 
-        if group_by == "birthplace":
-            city_column = Fighter.birthplace_city
-            country_column = Fighter.birthplace_country
-        elif group_by == "training":
-            city_column = Fighter.training_city
-            country_column = Fighter.training_country
-        else:
+        if group_by not in _CITY_COLUMNS:
             msg = f"Invalid group_by value: {group_by}"
             raise ValueError(msg)
+        city_column, country_column = _CITY_COLUMNS[group_by]
+
+        rollup = await self._location_rollup(city_column.key, country=country)
+        if rollup is not None:
+            rows, total = rollup
+            return [
+                {
+                    "city": row.label,
+                    "country": row.country,
+                    "count": row.fighter_count,
+                    "percentage": _location_share(row.fighter_count, total),
+                }
+                for row in rows
+            ], total
 
         query = (
             select(
@@ -501,14 +538,11 @@ class FighterRosterMixin:
 
         result = await self._session.execute(query)
         rows = result.all()
-
-        roster_total_query = select(func.count()).select_from(Fighter)
-        roster_total_result = await self._session.execute(roster_total_query)
-        total = roster_total_result.scalar_one_or_none() or 0
+        total = await self._roster_total()
 
         stats: list[dict[str, Any]] = []
         for row in rows:
-            percentage = round((row.count / total * 100), 1) if total > 0 else 0.0
+            percentage = _location_share(row.count, total)
             stats.append(
                 {
                     "city": row.city,
@@ -523,6 +557,24 @@ class FighterRosterMixin:
     async def get_gym_stats(self, country: str | None = None) -> list[dict[str, Any]]:
         """Aggregate fighter counts by training gym."""
 
+        rollup = await self._location_rollup(Fighter.training_gym.key, country=country)
+        if rollup is not None:
+            rows, _total = rollup
+            stats: list[dict[str, Any]] = []
+            for row in rows:
+                notable_refs = list(row.notable_fighter_refs or [])
+                stats.append(
+                    {
+                        "gym": row.label,
+                        "city": row.city,
+                        "country": row.country,
+                        "fighter_count": row.fighter_count,
+                        "notable_fighters": [ref["fighter_name"] for ref in notable_refs],
+                        "notable_fighter_refs": notable_refs,
+                    }
+                )
+            return stats
+
         query = (
             select(
                 Fighter.training_gym.label("gym"),
@@ -574,7 +626,7 @@ class FighterRosterMixin:
                     {"fighter_id": fighter_id, "fighter_name": name}
                 )
 
-        stats: list[dict[str, Any]] = []
+        stats = []
         for row in rows:
             notable_refs = notable_refs_by_gym.get(row.gym, [])
             stats.append(
@@ -589,3 +641,220 @@ class FighterRosterMixin:
             )
 
         return stats
+
+    async def get_location_coverage(self) -> dict[str, int]:
+        """Return roster-wide location completeness counters.
+
+        Keys are ``total_fighters`` plus every entry of
+        :data:`LOCATION_COVERAGE_COUNTERS`.  Values come from the rollup table
+        when it has been refreshed and from a single live aggregate otherwise.
+        """
+
+        result = await self._session.execute(
+            select(FighterLocationRollup.label, FighterLocationRollup.fighter_count).where(
+                FighterLocationRollup.dimension == _COVERAGE_DIMENSION
+            )
+        )
+        coverage = dict(result.all())
+        if "total_fighters" in coverage:
+            return coverage
+        return await self._compute_location_coverage()
+
+    async def refresh_location_rollups(self) -> datetime:
+        """Rebuild ``fighter_location_rollups`` in the current transaction.
+
+        Rows are replaced with a delete and insert, so readers keep seeing the
+        previous rollup until the caller commits.  The fighter loader and the
+        geography maintenance scripts call this once per run after writing
+        fighters.
+        """
+
+        computed_at = datetime.now(UTC)
+        stamp = literal(computed_at, FighterLocationRollup.computed_at.type)
+        columns = [
+            "dimension",
+            "label",
+            "country",
+            "city",
+            "fighter_count",
+            "notable_fighter_refs",
+            "computed_at",
+        ]
+        no_text = null().cast(String)
+        no_refs = null().cast(FighterLocationRollup.notable_fighter_refs.type)
+
+        await self._session.execute(delete(FighterLocationRollup))
+
+        selects = [
+            select(
+                literal(column.key),
+                column,
+                column,
+                no_text,
+                func.count(),
+                no_refs,
+                stamp,
+            )
+            .where(column.isnot(None))
+            .group_by(column)
+            for column in _COUNTRY_COLUMNS.values()
+        ]
+        selects.extend(
+            select(
+                literal(city_column.key),
+                city_column,
+                country_column,
+                no_text,
+                func.count(),
+                no_refs,
+                stamp,
+            )
+            .where(city_column.isnot(None))
+            .group_by(city_column, country_column)
+            for city_column, country_column in _CITY_COLUMNS.values()
+        )
+
+        ranked = (
+            select(
+                Fighter.training_gym,
+                Fighter.id,
+                Fighter.name,
+                func.row_number()
+                .over(
+                    partition_by=Fighter.training_gym,
+                    order_by=(Fighter.last_fight_date.desc().nulls_last(), Fighter.id),
+                )
+                .label("rn"),
+            )
+            .where(Fighter.training_gym.isnot(None))
+            .subquery()
+        )
+        notable = (
+            select(
+                ranked.c.training_gym,
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "fighter_id", ranked.c.id, "fighter_name", ranked.c.name
+                        ),
+                        ranked.c.rn,
+                    )
+                ).label("refs"),
+            )
+            .where(ranked.c.rn <= 2)
+            .group_by(ranked.c.training_gym)
+            .subquery()
+        )
+        gyms = (
+            select(
+                Fighter.training_gym,
+                Fighter.training_city,
+                Fighter.training_country,
+                func.count().label("fighter_count"),
+            )
+            .where(Fighter.training_gym.isnot(None))
+            .group_by(Fighter.training_gym, Fighter.training_city, Fighter.training_country)
+            .subquery()
+        )
+        selects.append(
+            select(
+                literal(Fighter.training_gym.key),
+                gyms.c.training_gym,
+                gyms.c.training_country,
+                gyms.c.training_city,
+                gyms.c.fighter_count,
+                notable.c.refs,
+                stamp,
+            ).outerjoin(notable, notable.c.training_gym == gyms.c.training_gym)
+        )
+
+        for query in selects:
+            await self._session.execute(
+                insert(FighterLocationRollup).from_select(columns, query)
+            )
+
+        coverage = await self._compute_location_coverage()
+        await self._session.execute(
+            insert(FighterLocationRollup),
+            [
+                {
+                    "dimension": _COVERAGE_DIMENSION,
+                    "label": label,
+                    "fighter_count": count,
+                    "computed_at": computed_at,
+                }
+                for label, count in coverage.items()
+            ],
+        )
+        return computed_at
+
+    async def _location_rollup(
+        self, dimension: str, *, country: str | None = None
+    ) -> tuple[list[Row[Any]], int] | None:
+        """Read one rollup dimension together with the roster total.
+
+        Returns ``None`` when the rollup table has not been populated so callers
+        can fall back to aggregating ``fighters`` directly.
+        """
+
+        bucket = FighterLocationRollup.dimension == dimension
+        if country:
+            bucket = and_(bucket, FighterLocationRollup.country == country)
+        query = (
+            select(
+                FighterLocationRollup.dimension,
+                FighterLocationRollup.label,
+                FighterLocationRollup.country,
+                FighterLocationRollup.city,
+                FighterLocationRollup.fighter_count,
+                FighterLocationRollup.notable_fighter_refs,
+            )
+            .where(
+                or_(
+                    bucket,
+                    and_(
+                        FighterLocationRollup.dimension == _COVERAGE_DIMENSION,
+                        FighterLocationRollup.label == "total_fighters",
+                    ),
+                )
+            )
+            .order_by(FighterLocationRollup.fighter_count.desc(), FighterLocationRollup.label)
+        )
+        result = await self._session.execute(query)
+
+        total: int | None = None
+        rows: list[Row[Any]] = []
+        for row in result.all():
+            if row.dimension == _COVERAGE_DIMENSION:
+                total = row.fighter_count
+            else:
+                rows.append(row)
+        if total is None:
+            return None
+        return rows, total
+
+    async def _roster_total(self) -> int:
+        """Count every fighter on the roster."""
+
+        result = await self._session.execute(select(func.count()).select_from(Fighter))
+        return result.scalar_one_or_none() or 0
+
+    async def _compute_location_coverage(self) -> dict[str, int]:
+        """Derive location completeness counters with one filtered aggregate."""
+
+        query = select(
+            func.count().label("total_fighters"),
+            *(
+                func.count().filter(condition).label(name)
+                for name, condition in LOCATION_COVERAGE_COUNTERS.items()
+            ),
+        ).select_from(Fighter)
+        result = await self._session.execute(query)
+        return {key: int(value or 0) for key, value in result.one()._mapping.items()}
+
+
+def _location_share(count: int, total: int) -> float:
+    """Return ``count`` as a percentage of ``total`` rounded to one decimal."""
+
+    return round((count / total * 100), 1) if total > 0 else 0.0
+
@@ -37,3 +37,13 @@ class FighterRankingSummary:
     peak_rank_date: date | None = None
     peak_rank_division: str | None = None
     peak_rank_source: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ComparisonMetricRow:
+    """Raw ``fighter_stats`` value joined with the fighter's division."""
+
+    fighter_id: str
+    division: str | None
+    metric: str
+    value: str
@@ -2,20 +2,41 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, case, delete, func, insert, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, defer
 from sqlalchemy.sql import Select
 
-from backend.db.models import Fighter, FighterOdds
+from backend.db.models import (
+    Fighter,
+    FighterOdds,
+    FighterOddsAnalytics,
+    FighterOddsPoint,
+    FighterOddsStat,
+)
+
+logger = logging.getLogger(__name__)
 
 QUALITY_TIERS: tuple[str, ...] = ("excellent", "good", "usable", "poor", "no_data")
 _QUALITY_TO_INDEX = {tier: index for index, tier in enumerate(QUALITY_TIERS)}
+# Rows of ``fighter_odds_stats``.
+QUALITY_COUNTERS: tuple[str, ...] = (
+    "total_records",
+    "fighters_with_odds",
+    "total_odds_points",
+    *(f"records:{tier}" for tier in QUALITY_TIERS),
+)
+
 
+def _quality_filter(min_quality: str | None) -> int | None:
+    """Return the largest ``quality_rank`` that satisfies ``min_quality``."""
 
-def _quality_filter(min_quality: str | None) -> Sequence[str] | None:
     if min_quality is None:
         return None
 
@@ -23,8 +44,84 @@ def _quality_filter(min_quality: str | None) -> Sequence[str] | None:
     if normalized not in _QUALITY_TO_INDEX:
         raise ValueError(f"Unknown quality tier '{min_quality}'")
 
-    max_index = _QUALITY_TO_INDEX[normalized]
-    return QUALITY_TIERS[: max_index + 1]
+    return _QUALITY_TO_INDEX[normalized]
+
+
+@dataclass(frozen=True, slots=True)
+class OddsCursor:
+    """Sort key of the last odds record on a page of ``list_fighter_odds``."""
+
+    event_date: date | None
+    scraped_at: datetime
+    odds_id: str
+
+    @classmethod
+    def from_row(cls, row: FighterOdds) -> OddsCursor:
+        return cls(row.event_date, row.scraped_at, row.id)
+
+
+def _after_cursor(cursor: OddsCursor) -> Any:
+    """Keyset predicate for the rows that sort after ``cursor`` in list order.
+
+    List order is ``event_date DESC NULLS LAST, scraped_at DESC, id DESC``,
+    matching ``ix_fighter_odds_list_order``.
+    """
+
+    tie_break = tuple_(FighterOdds.scraped_at, FighterOdds.id) < tuple_(
+        cursor.scraped_at, cursor.odds_id
+    )
+    if cursor.event_date is None:
+        return and_(FighterOdds.event_date.is_(None), tie_break)
+    return or_(
+        FighterOdds.event_date < cursor.event_date,
+        FighterOdds.event_date.is_(None),
+        and_(FighterOdds.event_date == cursor.event_date, tie_break),
+    )
+
+
+OddsPoint = tuple[int, float]
+
+
+@dataclass(frozen=True, slots=True)
+class OddsLine:
+    """Opening and closing American lines of one odds record and its opponent's."""
+
+    odds_id: str
+    opening_odds: str | None
+    closing_odds: str | None
+    opponent_closing_odds: str | None
+
+
+def parse_odds_points(history: Iterable[Mapping[str, Any]]) -> list[OddsPoint]:
+    """Parse a scraped ``mean_odds_history`` array into sorted (timestamp_ms, odds) pairs.
+
+    Samples without numeric odds or a usable timestamp are dropped (malformed
+    ``timestamp_ms`` values are logged), and a repeated timestamp keeps its
+    last sample.
+    """
+
+    points: dict[int, float] = {}
+    for entry in history or []:
+        try:
+            odds = float(entry.get("odds"))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+
+        timestamp_ms = entry.get("timestamp_ms")
+        if timestamp_ms is None:
+            timestamp = entry.get("timestamp")
+            if not timestamp:
+                continue
+            try:
+                parsed = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            timestamp_ms = int(parsed.timestamp() * 1000)
+        try:
+            points[int(timestamp_ms)] = odds
+        except (TypeError, ValueError):
+            logger.warning("Skipping odds sample with invalid timestamp_ms %r", timestamp_ms)
+    return sorted(points.items())
 
 
 class OddsRepository:
@@ -47,9 +144,9 @@ class OddsRepository:
         stmt = select(func.count()).select_from(FighterOdds).where(
             FighterOdds.fighter_id == fighter_id
         )
-        tier_values = _quality_filter(min_quality)
-        if tier_values:
-            stmt = stmt.where(FighterOdds.data_quality_tier.in_(tier_values))
+        max_rank = _quality_filter(min_quality)
+        if max_rank is not None:
+            stmt = stmt.where(FighterOdds.quality_rank <= max_rank)
         result = await self._session.execute(stmt)
         return int(result.scalar_one() or 0)
 
@@ -59,9 +156,13 @@ class OddsRepository:
         *,
         limit: int | None = None,
         min_quality: str | None = None,
+        after: OddsCursor | None = None,
     ) -> list[FighterOdds]:
+        """List a fighter's odds newest first, resuming after ``after`` when given."""
+
         stmt: Select[Any] = (
             select(FighterOdds)
+            .options(defer(FighterOdds.mean_odds_history))
             .where(FighterOdds.fighter_id == fighter_id)
             .order_by(
                 FighterOdds.event_date.desc().nullslast(),
@@ -69,9 +170,11 @@ class OddsRepository:
                 FighterOdds.id.desc(),
             )
         )
-        tier_values = _quality_filter(min_quality)
-        if tier_values:
-            stmt = stmt.where(FighterOdds.data_quality_tier.in_(tier_values))
+        max_rank = _quality_filter(min_quality)
+        if max_rank is not None:
+            stmt = stmt.where(FighterOdds.quality_rank <= max_rank)
+        if after is not None:
+            stmt = stmt.where(_after_cursor(after))
         if limit is not None:
             stmt = stmt.limit(limit)
 
@@ -79,37 +182,191 @@ class OddsRepository:
         return list(result.scalars().all())
 
     async def get_odds_by_id(self, odds_id: str) -> FighterOdds | None:
-        stmt = select(FighterOdds).where(FighterOdds.id == odds_id)
+        stmt = (
+            select(FighterOdds)
+            .options(defer(FighterOdds.mean_odds_history))
+            .where(FighterOdds.id == odds_id)
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_quality_stats(self) -> dict[str, Any]:
-        total_stmt = select(func.count()).select_from(FighterOdds)
-        distinct_stmt = select(func.count(func.distinct(FighterOdds.fighter_id)))
-        avg_stmt = select(func.avg(FighterOdds.num_odds_points))
-        fighters_stmt = select(func.count()).select_from(Fighter)
-        quality_stmt = (
-            select(FighterOdds.data_quality_tier, func.count())
-            .group_by(FighterOdds.data_quality_tier)
-            .order_by(func.count().desc())
+    async def get_odds_points(self, odds_ids: Sequence[str]) -> dict[str, list[OddsPoint]]:
+        """Return each bout's odds series in time order, keyed by odds id."""
+
+        points: dict[str, list[OddsPoint]] = {odds_id: [] for odds_id in odds_ids}
+        if not points:
+            return points
+        stmt = (
+            select(FighterOddsPoint.odds_id, FighterOddsPoint.timestamp_ms, FighterOddsPoint.odds)
+            .where(FighterOddsPoint.odds_id.in_(points))
+            .order_by(FighterOddsPoint.odds_id, FighterOddsPoint.timestamp_ms)
         )
+        for odds_id, timestamp_ms, odds in (await self._session.execute(stmt)).all():
+            points[odds_id].append((timestamp_ms, odds))
+        return points
+
+    async def replace_odds_points(self, points: Mapping[str, Sequence[OddsPoint]]) -> None:
+        """Rewrite the stored series of every bout in ``points``."""
 
-        total = int((await self._session.execute(total_stmt)).scalar_one() or 0)
-        unique_fighters = int(
-            (await self._session.execute(distinct_stmt)).scalar_one() or 0
+        if not points:
+            return
+        await self._session.execute(
+            delete(FighterOddsPoint).where(FighterOddsPoint.odds_id.in_(list(points)))
         )
-        avg_points_value = (await self._session.execute(avg_stmt)).scalar_one()
-        avg_points = float(avg_points_value or 0)
-        total_fighters = int(
+        rows = [
+            {"odds_id": odds_id, "timestamp_ms": timestamp_ms, "odds": odds}
+            for odds_id, series in points.items()
+            for timestamp_ms, odds in series
+        ]
+        if rows:
+            await self._session.execute(insert(FighterOddsPoint), rows)
+
+    async def list_odds_lines(self, odds_ids: Sequence[str] | None = None) -> list[OddsLine]:
+        """Return opening/closing lines, paired with the opponent's closing line.
+
+        The opponent's record is the one from the same event whose fighter is
+        this record's opponent and whose opponent is this record's fighter.
+        """
+
+        def closing_line(model: Any) -> Any:
+            return func.coalesce(
+                func.nullif(model.closing_range_end, ""),
+                func.nullif(model.closing_range_start, ""),
+            )
+
+        fighter = aliased(Fighter)
+        opponent_fighter = aliased(Fighter)
+        opponent = aliased(FighterOdds)
+        stmt = (
+            select(
+                FighterOdds.id,
+                FighterOdds.opening_odds,
+                closing_line(FighterOdds),
+                closing_line(opponent),
+            )
+            .join(fighter, fighter.id == FighterOdds.fighter_id)
+            .outerjoin(
+                opponent_fighter,
+                func.lower(opponent_fighter.name) == func.lower(FighterOdds.opponent_name),
+            )
+            .outerjoin(
+                opponent,
+                and_(
+                    opponent.fighter_id == opponent_fighter.id,
+                    opponent.event_name == FighterOdds.event_name,
+                    func.lower(opponent.opponent_name) == func.lower(fighter.name),
+                ),
+            )
+            .distinct(FighterOdds.id)
+            .order_by(FighterOdds.id, opponent.id.is_(None), opponent.id)
+        )
+        if odds_ids is not None:
+            stmt = stmt.where(FighterOdds.id.in_(odds_ids))
+        result = await self._session.execute(stmt)
+        return [OddsLine(*row) for row in result.all()]
+
+    async def get_odds_analytics(self, odds_id: str) -> FighterOddsAnalytics | None:
+        return await self._session.get(FighterOddsAnalytics, odds_id)
+
+    async def replace_odds_analytics(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Replace every stored analytics row with ``rows`` in the caller's transaction."""
+
+        await self._session.execute(delete(FighterOddsAnalytics))
+        if rows:
+            await self._session.execute(insert(FighterOddsAnalytics), list(rows))
+
+    async def odds_owners(self, odds_ids: Sequence[str]) -> set[str]:
+        """Return the fighters that currently own any of ``odds_ids``."""
+
+        stmt = select(FighterOdds.fighter_id).where(FighterOdds.id.in_(odds_ids)).distinct()
+        result = await self._session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def quality_counters(
+        self,
+        *,
+        odds_ids: Sequence[str] | None = None,
+        fighter_ids: Iterable[str] | None = None,
+    ) -> dict[str, int]:
+        """Aggregate the quality stat counters from ``fighter_odds``.
+
+        Record counters cover ``odds_ids`` and ``fighters_with_odds`` covers
+        ``fighter_ids``; either defaults to the whole table.  Calling this for
+        the same scope before and after a write yields the write's net change.
+        """
+
+        tier = func.coalesce(FighterOdds.data_quality_tier, "no_data")
+        tier_stmt = select(
+            tier, func.count(), func.coalesce(func.sum(FighterOdds.num_odds_points), 0)
+        ).group_by(tier)
+        fighters_stmt = select(func.count(func.distinct(FighterOdds.fighter_id)))
+        if odds_ids is not None:
+            tier_stmt = tier_stmt.where(FighterOdds.id.in_(odds_ids))
+        if fighter_ids is not None:
+            fighters_stmt = fighters_stmt.where(FighterOdds.fighter_id.in_(list(fighter_ids)))
+
+        counters = dict.fromkeys(QUALITY_COUNTERS, 0)
+        for tier_value, records, odds_points in (await self._session.execute(tier_stmt)).all():
+            counters[f"records:{tier_value}"] += int(records)
+            counters["total_records"] += int(records)
+            counters["total_odds_points"] += int(odds_points)
+        counters["fighters_with_odds"] = int(
             (await self._session.execute(fighters_stmt)).scalar_one() or 0
         )
+        return counters
+
+    async def apply_quality_counter_delta(
+        self, before: Mapping[str, int], after: Mapping[str, int]
+    ) -> None:
+        """Add ``after - before`` to the stored counters in the caller's transaction.
+
+        Counters that were never stored are rebuilt from the table instead.
+        """
+
+        delta = {counter: after[counter] - before[counter] for counter in QUALITY_COUNTERS}
+        stmt = (
+            update(FighterOddsStat)
+            .where(FighterOddsStat.counter.in_(QUALITY_COUNTERS))
+            .values(
+                value=FighterOddsStat.value + case(delta, value=FighterOddsStat.counter),
+                updated_at=func.now(),
+            )
+        )
+        result = await self._session.execute(stmt)
+        if result.rowcount != len(QUALITY_COUNTERS):
+            await self.rebuild_quality_counters()
+
+    async def rebuild_quality_counters(self) -> None:
+        """Recompute every stored counter from ``fighter_odds``."""
+
+        counters = await self.quality_counters()
+        updated_at = datetime.now(UTC)
+        await self._session.execute(delete(FighterOddsStat))
+        await self._session.execute(
+            insert(FighterOddsStat),
+            [
+                {"counter": counter, "value": value, "updated_at": updated_at}
+                for counter, value in counters.items()
+            ],
+        )
 
-        quality_counts = {tier: 0 for tier in QUALITY_TIERS}
-        quality_results = await self._session.execute(quality_stmt)
-        for tier, count in quality_results.all():
-            normalized = tier or "no_data"
-            quality_counts[normalized] = int(count)
+    async def get_quality_stats(self) -> dict[str, Any]:
+        stored = await self._session.execute(
+            select(FighterOddsStat.counter, FighterOddsStat.value)
+        )
+        counters = {counter: int(value) for counter, value in stored.all()}
+        if not counters.keys() >= set(QUALITY_COUNTERS):
+            # Counters not built yet (fresh schema); aggregate the table instead.
+            counters = await self.quality_counters()
+        fighters_stmt = select(func.count()).select_from(Fighter)
+        total_fighters = int(
+            (await self._session.execute(fighters_stmt)).scalar_one() or 0
+        )
 
+        total = counters["total_records"]
+        unique_fighters = counters["fighters_with_odds"]
+        avg_points = counters["total_odds_points"] / total if total else 0.0
+        quality_counts = {tier: counters[f"records:{tier}"] for tier in QUALITY_TIERS}
         coverage_percentage = (
             (unique_fighters / total_fighters) * 100 if total_fighters else 0.0
         )
@@ -127,4 +384,12 @@ class OddsRepository:
         }
 
 
-__all__ = ["OddsRepository", "QUALITY_TIERS"]
+__all__ = [
+    "OddsCursor",
+    "OddsLine",
+    "OddsPoint",
+    "OddsRepository",
+    "QUALITY_COUNTERS",
+    "QUALITY_TIERS",
+    "parse_odds_points",
+]
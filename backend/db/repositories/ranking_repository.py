@@ -6,12 +6,296 @@ from various sources (UFC.com, Fight Matrix, etc.).
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import Delete, Insert, Select, and_, delete, desc, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from backend.db.models import Fighter, FighterRanking
+from backend.db.models import (
+    CurrentRanking,
+    Fighter,
+    FighterRanking,
+    FighterRankingRollup,
+    FighterRankingRun,
+)
+
+
+def build_current_rankings_refresh(
+    sources: Sequence[str] | None = None,
+) -> tuple[Delete, Insert]:
+    """Return the statements that rebuild ``current_rankings`` for ``sources``.
+
+    The statements are plain Core DML so the synchronous FightMatrix migration
+    script can run them on its own connection as well.
+    """
+
+    latest = select(
+        FighterRanking.division,
+        FighterRanking.source,
+        func.max(FighterRanking.rank_date).label("rank_date"),
+    ).group_by(FighterRanking.division, FighterRanking.source)
+    clear = delete(CurrentRanking)
+    if sources is not None:
+        latest = latest.where(FighterRanking.source.in_(sources))
+        clear = clear.where(CurrentRanking.source.in_(sources))
+    latest_dates = latest.subquery()
+
+    rows = select(
+        FighterRanking.id,
+        FighterRanking.fighter_id,
+        FighterRanking.division,
+        FighterRanking.source,
+        FighterRanking.rank,
+        FighterRanking.previous_rank,
+        FighterRanking.is_interim,
+        FighterRanking.rank_date,
+        func.now(),
+    ).join(
+        latest_dates,
+        and_(
+            FighterRanking.division == latest_dates.c.division,
+            FighterRanking.source == latest_dates.c.source,
+            FighterRanking.rank_date == latest_dates.c.rank_date,
+        ),
+    )
+    populate = insert(CurrentRanking).from_select(
+        [
+            CurrentRanking.ranking_id,
+            CurrentRanking.fighter_id,
+            CurrentRanking.division,
+            CurrentRanking.source,
+            CurrentRanking.rank,
+            CurrentRanking.previous_rank,
+            CurrentRanking.is_interim,
+            CurrentRanking.rank_date,
+            CurrentRanking.refreshed_at,
+        ],
+        rows,
+    )
+    return clear, populate
+
+
+def select_ranking_rollup_rows(
+    sources: Sequence[str] | None = None,
+    fighter_ids: Sequence[str] | None = None,
+) -> Select[Any]:
+    """Select ``fighter_ranking_rollups`` rows computed live from ``fighter_rankings``.
+
+    Current ranks come from each fighter's latest snapshot; peaks order by
+    rank and then by the most recent date, matching :meth:`get_peak_ranking`.
+    Columns are labelled after the rollup columns they populate.
+    """
+
+    current = (
+        select(
+            FighterRanking.fighter_id,
+            FighterRanking.source,
+            FighterRanking.rank,
+            FighterRanking.rank_date,
+            FighterRanking.division,
+        )
+        .distinct(FighterRanking.fighter_id, FighterRanking.source)
+        .order_by(
+            FighterRanking.fighter_id,
+            FighterRanking.source,
+            FighterRanking.rank_date.desc(),
+            FighterRanking.rank.asc().nullslast(),
+            FighterRanking.division,
+        )
+    )
+    peak = (
+        select(
+            FighterRanking.fighter_id,
+            FighterRanking.source,
+            FighterRanking.id,
+            FighterRanking.rank,
+            FighterRanking.rank_date,
+            FighterRanking.division,
+            FighterRanking.is_interim,
+        )
+        .distinct(FighterRanking.fighter_id, FighterRanking.source)
+        .where(FighterRanking.rank.isnot(None))
+        .order_by(
+            FighterRanking.fighter_id,
+            FighterRanking.source,
+            FighterRanking.rank.asc(),
+            FighterRanking.rank_date.desc(),
+            FighterRanking.division,
+        )
+    )
+    if sources is not None:
+        current = current.where(FighterRanking.source.in_(sources))
+        peak = peak.where(FighterRanking.source.in_(sources))
+    if fighter_ids is not None:
+        current = current.where(FighterRanking.fighter_id.in_(fighter_ids))
+        peak = peak.where(FighterRanking.fighter_id.in_(fighter_ids))
+    current_rows = current.subquery()
+    peak_rows = peak.subquery()
+
+    return select(
+        current_rows.c.fighter_id,
+        current_rows.c.source,
+        current_rows.c.rank.label("current_rank"),
+        current_rows.c.rank_date.label("current_rank_date"),
+        current_rows.c.division.label("current_rank_division"),
+        peak_rows.c.id.label("peak_ranking_id"),
+        peak_rows.c.rank.label("peak_rank"),
+        peak_rows.c.rank_date.label("peak_rank_date"),
+        peak_rows.c.division.label("peak_rank_division"),
+        peak_rows.c.is_interim.label("peak_is_interim"),
+        func.now().label("refreshed_at"),
+    ).outerjoin(
+        peak_rows,
+        and_(
+            peak_rows.c.fighter_id == current_rows.c.fighter_id,
+            peak_rows.c.source == current_rows.c.source,
+        ),
+    )
+
+
+def build_ranking_rollup_refresh(
+    sources: Sequence[str] | None = None,
+) -> tuple[Delete, Insert]:
+    """Return the statements that rebuild ``fighter_ranking_rollups`` for ``sources``."""
+
+    clear = delete(FighterRankingRollup)
+    if sources is not None:
+        clear = clear.where(FighterRankingRollup.source.in_(sources))
+    populate = insert(FighterRankingRollup).from_select(
+        [
+            FighterRankingRollup.fighter_id,
+            FighterRankingRollup.source,
+            FighterRankingRollup.current_rank,
+            FighterRankingRollup.current_rank_date,
+            FighterRankingRollup.current_rank_division,
+            FighterRankingRollup.peak_ranking_id,
+            FighterRankingRollup.peak_rank,
+            FighterRankingRollup.peak_rank_date,
+            FighterRankingRollup.peak_rank_division,
+            FighterRankingRollup.peak_is_interim,
+            FighterRankingRollup.refreshed_at,
+        ],
+        select_ranking_rollup_rows(sources),
+    )
+    return clear, populate
+
+
+def _ranking_runs_select(
+    sources: Sequence[str] | None = None, fighter_id: str | None = None
+) -> Select[Any]:
+    """Select run-length encoded ranking runs with a gaps-and-islands pass.
+
+    Every (source, division) issue date gets an ordinal; subtracting the
+    fighter's ordinal within an unchanged (rank, interim) stretch yields a
+    constant per run, so a missed issue or a rank change starts a new run.
+    """
+
+    issues = select(
+        FighterRanking.source,
+        FighterRanking.division,
+        FighterRanking.rank_date,
+        func.row_number()
+        .over(
+            partition_by=(FighterRanking.source, FighterRanking.division),
+            order_by=FighterRanking.rank_date,
+        )
+        .label("issue_number"),
+    ).group_by(FighterRanking.source, FighterRanking.division, FighterRanking.rank_date)
+    snapshots = select(
+        FighterRanking.fighter_id,
+        FighterRanking.source,
+        FighterRanking.division,
+        FighterRanking.rank,
+        FighterRanking.is_interim,
+        FighterRanking.rank_date,
+    )
+    if sources is not None:
+        issues = issues.where(FighterRanking.source.in_(sources))
+        snapshots = snapshots.where(FighterRanking.source.in_(sources))
+    if fighter_id is not None:
+        snapshots = snapshots.where(FighterRanking.fighter_id == fighter_id)
+    issue_numbers = issues.subquery()
+    ranked = snapshots.subquery()
+
+    islands = (
+        select(
+            ranked,
+            (
+                issue_numbers.c.issue_number
+                - func.row_number().over(
+                    partition_by=(
+                        ranked.c.fighter_id,
+                        ranked.c.source,
+                        ranked.c.division,
+                        ranked.c.rank,
+                        ranked.c.is_interim,
+                    ),
+                    order_by=ranked.c.rank_date,
+                )
+            ).label("island"),
+        )
+        .join(
+            issue_numbers,
+            and_(
+                issue_numbers.c.source == ranked.c.source,
+                issue_numbers.c.division == ranked.c.division,
+                issue_numbers.c.rank_date == ranked.c.rank_date,
+            ),
+        )
+        .subquery()
+    )
+    return select(
+        islands.c.fighter_id,
+        islands.c.source,
+        islands.c.division,
+        islands.c.rank,
+        islands.c.is_interim,
+        func.min(islands.c.rank_date).label("start_date"),
+        func.max(islands.c.rank_date).label("end_date"),
+        func.count().label("snapshot_count"),
+    ).group_by(
+        islands.c.fighter_id,
+        islands.c.source,
+        islands.c.division,
+        islands.c.rank,
+        islands.c.is_interim,
+        islands.c.island,
+    )
+
+
+def build_ranking_runs_refresh(
+    sources: Sequence[str] | None = None,
+) -> tuple[Delete, Insert]:
+    """Return the statements that rebuild ``fighter_ranking_runs`` for ``sources``."""
+
+    clear = delete(FighterRankingRun)
+    if sources is not None:
+        clear = clear.where(FighterRankingRun.source.in_(sources))
+    populate = insert(FighterRankingRun).from_select(
+        [
+            FighterRankingRun.fighter_id,
+            FighterRankingRun.source,
+            FighterRankingRun.division,
+            FighterRankingRun.rank,
+            FighterRankingRun.is_interim,
+            FighterRankingRun.start_date,
+            FighterRankingRun.end_date,
+            FighterRankingRun.snapshot_count,
+        ],
+        _ranking_runs_select(sources),
+    )
+    return clear, populate
+
+
+def build_ranking_refresh(sources: Sequence[str] | None = None) -> list[Delete | Insert]:
+    """Return every statement that republishes derived ranking tables for ``sources``."""
+
+    return [
+        *build_current_rankings_refresh(sources),
+        *build_ranking_rollup_refresh(sources),
+        *build_ranking_runs_refresh(sources),
+    ]
 
 
 class RankingRepository:
@@ -32,6 +316,9 @@ class RankingRepository:
     ) -> list[dict[str, Any]]:
         """Get current rankings for a specific division.
 
+        Reads the ``current_rankings`` snapshot and falls back to the latest
+        ``fighter_rankings`` date when the snapshot has no rows for the pair.
+
         Args:
             division: Weight class (e.g., 'Lightweight')
             source: Ranking source ('ufc', 'fightmatrix', 'tapology')
@@ -39,6 +326,15 @@ class RankingRepository:
         Returns:
             List of ranking dicts with fighter data, ordered by rank
         """
+        snapshot_query = (
+            self._current_rankings_query(CurrentRanking)
+            .where(CurrentRanking.source == source)
+            .where(CurrentRanking.division == division)
+        )
+        rows = await self._execute_rankings(snapshot_query)
+        if rows:
+            return rows
+
         # Get the most recent ranking date for this division/source
         latest_date_query = (
             select(func.max(FighterRanking.rank_date))
@@ -53,31 +349,125 @@ class RankingRepository:
 
         # Get rankings for that date
         query = (
-            select(FighterRanking, Fighter)
-            .join(Fighter, FighterRanking.fighter_id == Fighter.id)
+            self._current_rankings_query(FighterRanking)
             .where(FighterRanking.division == division)
             .where(FighterRanking.source == source)
             .where(FighterRanking.rank_date == latest_date)
-            .order_by(FighterRanking.rank.asc().nullslast())
         )
+        return await self._execute_rankings(query)
+
+    async def get_all_current_rankings(self, source: str = "ufc") -> list[dict[str, Any]]:
+        """Get current rankings for every division in a single query.
+
+        Args:
+            source: Ranking source
+
+        Returns:
+            Ranking dicts (including ``division``) ordered by division, then rank
+        """
+        rows = await self._execute_rankings(
+            self._current_rankings_query(CurrentRanking).where(CurrentRanking.source == source)
+        )
+        if rows:
+            return rows
+
+        latest = (
+            select(
+                FighterRanking.division,
+                func.max(FighterRanking.rank_date).label("rank_date"),
+            )
+            .where(FighterRanking.source == source)
+            .group_by(FighterRanking.division)
+            .subquery()
+        )
+        query = (
+            self._current_rankings_query(FighterRanking)
+            .join(
+                latest,
+                and_(
+                    FighterRanking.division == latest.c.division,
+                    FighterRanking.rank_date == latest.c.rank_date,
+                ),
+            )
+            .where(FighterRanking.source == source)
+        )
+        return await self._execute_rankings(query)
+
+    async def get_current_rankings_version(
+        self, source: str = "ufc", division: str | None = None
+    ) -> datetime | None:
+        """Return when the ``current_rankings`` rows for ``source`` were rebuilt.
+
+        Args:
+            source: Ranking source
+            division: Restrict to one division, whose reads fall back to live
+                tables when the snapshot has no rows for it
 
+        Returns:
+            Refresh timestamp, or None when the snapshot holds no matching rows
+        """
+        query = select(func.max(CurrentRanking.refreshed_at)).where(
+            CurrentRanking.source == source
+        )
+        if division is not None:
+            query = query.where(CurrentRanking.division == division)
         result = await self.session.execute(query)
-        rows = result.all()
+        return result.scalar_one_or_none()
+
+    async def refresh_ranking_tables(self, sources: Sequence[str] | None = None) -> None:
+        """Rebuild every derived ranking table for ``sources`` after an import.
+
+        Importers call this after writing ranking snapshots, in the same
+        transaction, so readers never observe a half-built snapshot.
+
+        Args:
+            sources: Ranking sources to rebuild
+        """
+        for statement in build_ranking_refresh(sources):
+            await self.session.execute(statement)
+
+    def _current_rankings_query(
+        self, model: type[CurrentRanking] | type[FighterRanking]
+    ) -> Select[Any]:
+        """Select ranking rows of ``model`` joined to their fighters in display order."""
+
+        ranking_id = model.ranking_id if model is CurrentRanking else model.id
+        return (
+            select(
+                ranking_id.label("ranking_id"),
+                Fighter.id.label("fighter_id"),
+                Fighter.name.label("fighter_name"),
+                Fighter.nickname,
+                model.division,
+                model.rank,
+                model.previous_rank,
+                model.is_interim,
+                model.rank_date,
+                model.source,
+            )
+            .join(Fighter, model.fighter_id == Fighter.id)
+            .order_by(model.division, model.rank.asc().nullslast())
+        )
+
+    async def _execute_rankings(self, query: Select[Any]) -> list[dict[str, Any]]:
+        """Execute a :meth:`_current_rankings_query` and shape rows as dicts."""
 
+        result = await self.session.execute(query)
         return [
             {
-                "ranking_id": ranking.id,
-                "fighter_id": fighter.id,
-                "fighter_name": fighter.name,
-                "nickname": fighter.nickname,
-                "rank": ranking.rank,
-                "previous_rank": ranking.previous_rank,
-                "rank_movement": self._calculate_rank_movement(ranking.rank, ranking.previous_rank),
-                "is_interim": ranking.is_interim,
-                "rank_date": ranking.rank_date,
-                "source": ranking.source,
+                "ranking_id": row.ranking_id,
+                "fighter_id": row.fighter_id,
+                "fighter_name": row.fighter_name,
+                "nickname": row.nickname,
+                "division": row.division,
+                "rank": row.rank,
+                "previous_rank": row.previous_rank,
+                "rank_movement": self._calculate_rank_movement(row.rank, row.previous_rank),
+                "is_interim": row.is_interim,
+                "rank_date": row.rank_date,
+                "source": row.source,
             }
-            for ranking, fighter in rows
+            for row in result.all()
         ]
 
     async def get_fighter_ranking_history(
@@ -123,6 +513,64 @@ class RankingRepository:
             for ranking in rankings
         ]
 
+    async def get_fighter_ranking_runs(
+        self,
+        fighter_id: str,
+        source: str = "ufc",
+    ) -> list[dict[str, Any]]:
+        """Get a fighter's run-length encoded ranking history.
+
+        Reads ``fighter_ranking_runs`` and derives the runs from
+        ``fighter_rankings`` when the importers have not built them yet.
+
+        Args:
+            fighter_id: Fighter's UUID
+            source: Ranking source
+
+        Returns:
+            Run dicts ordered by start date (oldest first), then division
+        """
+        query = (
+            select(
+                FighterRankingRun.division,
+                FighterRankingRun.rank,
+                FighterRankingRun.is_interim,
+                FighterRankingRun.start_date,
+                FighterRankingRun.end_date,
+                FighterRankingRun.snapshot_count,
+            )
+            .where(FighterRankingRun.fighter_id == fighter_id)
+            .where(FighterRankingRun.source == source)
+            .order_by(FighterRankingRun.start_date, FighterRankingRun.division)
+        )
+        result = await self.session.execute(query)
+        rows = result.all()
+        if not rows:
+            runs = _ranking_runs_select([source], fighter_id).subquery()
+            result = await self.session.execute(
+                select(
+                    runs.c.division,
+                    runs.c.rank,
+                    runs.c.is_interim,
+                    runs.c.start_date,
+                    runs.c.end_date,
+                    runs.c.snapshot_count,
+                ).order_by(runs.c.start_date, runs.c.division)
+            )
+            rows = result.all()
+
+        return [
+            {
+                "division": row.division,
+                "rank": row.rank,
+                "is_interim": row.is_interim,
+                "start_date": row.start_date,
+                "end_date": row.end_date,
+                "snapshot_count": row.snapshot_count,
+            }
+            for row in rows
+        ]
+
     async def get_peak_ranking(
         self,
         fighter_id: str,
@@ -130,6 +578,9 @@ class RankingRepository:
     ) -> dict[str, Any] | None:
         """Get the fighter's best (lowest number) ranking ever.
 
+        Reads the fighter's ``fighter_ranking_rollups`` row, falling back to
+        scanning ``fighter_rankings`` when the summary has not been built.
+
         Args:
             fighter_id: Fighter's UUID
             source: Ranking source
@@ -137,6 +588,20 @@ class RankingRepository:
         Returns:
             Peak ranking dict or None if fighter never ranked
         """
+        summary = await self.session.get(FighterRankingRollup, (fighter_id, source))
+        if summary is not None:
+            if summary.peak_rank is None:
+                return None
+            return {
+                "ranking_id": summary.peak_ranking_id,
+                "division": summary.peak_rank_division,
+                "peak_rank": summary.peak_rank,
+                "rank_date": summary.peak_rank_date,
+                "is_interim": bool(summary.peak_is_interim),
+                "source": summary.source,
+            }
+
+        # No summary row yet (e.g. before the importers refreshed it).
         # Get best rank (lowest number, excluding None/NR)
         query = (
             select(FighterRanking)
@@ -1,7 +1,8 @@
 """Stats repository for analytics and aggregate statistics.
 
 This repository handles:
-- Aggregate statistics (summary, leaderboards)
+- Aggregate statistics (summary, leaderboards); the summary is served from a
+  snapshot table refreshed by the loaders when available
 - Win streak calculations
 - Time-series trends (month/quarter/year buckets)
 - Fight duration analytics
@@ -11,14 +12,45 @@ This repository handles:
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
-from datetime import date, datetime
-from typing import ClassVar, Sequence
-
-from sqlalchemy import Date, Float, Integer, case, cast, func, select
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from itertools import groupby
+from typing import ClassVar, Sequence, get_args
+
+from sqlalchemy import (
+    ARRAY,
+    Date,
+    Float,
+    Integer,
+    Select,
+    String,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    union_all,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql import ColumnElement
 
-from backend.db.models import Fight, Fighter, fighter_stats
-from backend.db.repositories.base import BaseRepository
+from backend.db.models import (
+    Fight,
+    Fighter,
+    FighterStatsVersion,
+    FighterStreak,
+    FightTrendRollup,
+    StatsSummarySnapshot,
+    fighter_stats,
+)
+from backend.db.models.stats import TREND_ROLLUP_COUNTERS
+from backend.db.repositories.base import BaseRepository, _normalize_result_category
 from backend.schemas.stats import (
     DEFAULT_LEADERBOARD_METRICS,
     LEADERBOARD_METRIC_DESCRIPTIONS,
@@ -40,6 +72,101 @@ from backend.schemas.stats import (
     WinStreakSummary,
 )
 
+_STATS_VERSION_LOCK = 0x5354_4154  # pg_advisory_xact_lock key serialising stats writes
+
+LEADERBOARD_MIN_FIGHTS = 5
+"""Fewest dated bouts a fighter needs before appearing on any leaderboard."""
+
+
+@dataclass(frozen=True, slots=True)
+class LeaderboardValueRow:
+    """A fighter's best numeric value for one leaderboard metric."""
+
+    metric_id: str
+    fighter_id: str
+    fighter_name: str
+    division: str | None
+    metric_value: float
+    fight_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class StreakRun:
+    """A maximal run of consecutive wins or losses."""
+
+    streak_type: str
+    length: int
+    start_date: date
+    end_date: date
+    start_position: int
+
+
+def compute_streak_runs(fights: Iterable[tuple[date | None, str | None]]) -> list[StreakRun]:
+    """Split ``(event_date, result)`` pairs into maximal win and loss runs in one pass.
+
+    Undated bouts cannot be placed, so they are skipped.  Any other result that
+    is neither a win nor a loss (draws, no contests, upcoming bouts, blank or
+    missing results) ends the current run.
+    """
+
+    dated = sorted(
+        (
+            (event_date, _normalize_result_category(result))
+            for event_date, result in fights
+            if event_date is not None
+        ),
+        key=lambda fight: fight[0],
+    )
+    runs: list[StreakRun] = []
+    run_type: str | None = None
+    run_length = run_position = 0
+    run_start = run_end = date.min
+    for position, (event_date, category) in enumerate(dated):
+        if category == run_type:
+            run_length += 1
+            run_end = event_date
+            continue
+        if run_type is not None:
+            runs.append(StreakRun(run_type, run_length, run_start, run_end, run_position))
+        run_type = category if category in {"win", "loss"} else None
+        run_length, run_position = 1, position
+        run_start = run_end = event_date
+    if run_type is not None:
+        runs.append(StreakRun(run_type, run_length, run_start, run_end, run_position))
+    return runs
+
+
+def normalize_leaderboard_metrics(
+    metrics: Sequence[LeaderboardMetricId] | None,
+) -> list[LeaderboardMetricId]:
+    """Return a de-duplicated, ordered list of leaderboard metrics to evaluate."""
+
+    return list(dict.fromkeys(metrics or DEFAULT_LEADERBOARD_METRICS))
+
+
+def build_leaderboards_response(
+    metric_ids: Sequence[LeaderboardMetricId],
+    entries_by_metric: Mapping[str, list[LeaderboardEntry]],
+    computed_at: datetime,
+) -> LeaderboardsResponse:
+    """Assemble leaderboard definitions in request order, skipping empty metrics."""
+
+    return LeaderboardsResponse(
+        leaderboards=[
+            LeaderboardDefinition(
+                metric_id=metric_id,
+                title=LEADERBOARD_METRIC_LABELS.get(
+                    metric_id, metric_id.replace("_", " ").title()
+                ),
+                description=LEADERBOARD_METRIC_DESCRIPTIONS.get(metric_id),
+                entries=entries_by_metric[metric_id],
+            )
+            for metric_id in metric_ids
+            if entries_by_metric.get(metric_id)
+        ],
+        computed_at=computed_at,
+    )
+
 
 class StatsRepository(BaseRepository):
     """Repository for analytics and aggregate statistics using SQL window functions."""
@@ -52,7 +179,177 @@ class StatsRepository(BaseRepository):
     }
 
     async def stats_summary(self) -> StatsSummaryResponse:
-        """Return dashboard friendly KPIs derived directly from SQL window functions."""
+        """Return dashboard KPIs from the snapshot, computing them live if none exists."""
+
+        computed_at = await self._snapshot_computed_at()
+        if computed_at is None:
+            return await self._compute_stats_summary()
+
+        result = await self._session.execute(
+            select(StatsSummarySnapshot.metric_id, StatsSummarySnapshot.value)
+        )
+        values = {row.metric_id: row.value for row in result.fetchall()}
+        return StatsSummaryResponse(
+            metrics=[
+                StatsSummaryMetric(
+                    id=metric_id,
+                    label=label,
+                    value=values[metric_id],
+                    description=SUMMARY_METRIC_DESCRIPTIONS[metric_id],
+                )
+                for metric_id, label in SUMMARY_METRIC_LABELS.items()
+                if metric_id in values
+            ],
+            computed_at=computed_at,
+        )
+
+    async def refresh_stats_snapshots(self) -> datetime:
+        """Rebuild the summary snapshot table in the current transaction.
+
+        Rows are replaced with a delete and insert, so readers keep seeing the
+        previous snapshot until the caller commits.  Loaders call this once at
+        the end of a run.
+        """
+
+        computed_at = datetime.now(UTC)
+        summary = await self._compute_stats_summary()
+        await self._session.execute(delete(StatsSummarySnapshot))
+        await self._session.execute(
+            insert(StatsSummarySnapshot),
+            [
+                {"metric_id": metric.id, "value": metric.value, "computed_at": computed_at}
+                for metric in summary.metrics
+            ],
+        )
+
+        return computed_at
+
+    async def _snapshot_computed_at(self) -> datetime | None:
+        """Return when the snapshot tables were last refreshed, if ever."""
+
+        result = await self._session.execute(select(func.max(StatsSummarySnapshot.computed_at)))
+        return result.scalar_one_or_none()
+
+    async def mark_fighter_stats_written(self, fighter_ids: Sequence[str]) -> int:
+        """Stamp ``fighter_ids`` with the next stats data version and return it.
+
+        Call in the transaction that rewrites the fighters' ``fighter_stats``
+        rows.  The advisory lock is held until that transaction ends, so a
+        version is never visible before every smaller one has committed.
+        """
+
+        await self._session.execute(select(func.pg_advisory_xact_lock(_STATS_VERSION_LOCK)))
+        version = int(
+            (
+                await self._session.execute(
+                    select(func.coalesce(func.max(FighterStatsVersion.version), 0) + 1)
+                )
+            ).scalar_one()
+        )
+        if fighter_ids:
+            stmt = pg_insert(FighterStatsVersion).values(
+                [{"fighter_id": fighter_id, "version": version} for fighter_id in fighter_ids]
+            )
+            await self._session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[FighterStatsVersion.fighter_id],
+                    set_={"version": stmt.excluded.version},
+                )
+            )
+        return version
+
+    async def get_leaderboard_version(self) -> tuple[int, datetime | None]:
+        """Return the stats data version and the snapshot refresh time.
+
+        Every ``fighter_stats`` write raises the data version through
+        :meth:`mark_fighter_stats_written`; a new snapshot timestamp marks a
+        full loader run that may also have changed fight counts.
+        """
+
+        result = await self._session.execute(
+            select(
+                select(func.max(FighterStatsVersion.version)).scalar_subquery(),
+                select(func.max(StatsSummarySnapshot.computed_at)).scalar_subquery(),
+            )
+        )
+        version, computed_at = result.one()
+        return int(version or 0), computed_at
+
+    async def get_leaderboard_fighters_since(self, since_version: int) -> list[str]:
+        """Return fighters whose stats were written after data version ``since_version``."""
+
+        result = await self._session.execute(
+            select(FighterStatsVersion.fighter_id).where(
+                FighterStatsVersion.version > since_version
+            )
+        )
+        return list(result.scalars())
+
+    async def get_leaderboard_values(
+        self, *, fighter_ids: Sequence[str] | None = None
+    ) -> list[LeaderboardValueRow]:
+        """Return every fighter's best numeric value per leaderboard metric.
+
+        ``fighter_ids`` restricts the rows to the given fighters so cached
+        leaderboards can be patched after a targeted stats write.
+        """
+
+        if fighter_ids is not None and not fighter_ids:
+            return []
+        result = await self._session.execute(self._leaderboard_values_query(fighter_ids))
+        return [
+            LeaderboardValueRow(
+                metric_id=row.metric_id,
+                fighter_id=row.fighter_id,
+                fighter_name=row.fighter_name,
+                division=row.division,
+                metric_value=float(row.metric_value),
+                fight_count=int(row.fight_count),
+            )
+            for row in result.fetchall()
+        ]
+
+    def _leaderboard_values_query(self, fighter_ids: Sequence[str] | None = None) -> Select:
+        """Select one row per (metric, fighter) with the best value and dated bout count."""
+
+        numeric_value = self._numeric_stat_value()
+        fight_counts = select(Fight.fighter_id, func.count(Fight.id).label("fight_count")).where(
+            Fight.event_date.isnot(None)
+        )
+        per_fighter = (
+            select(
+                fighter_stats.c.metric.label("metric_id"),
+                fighter_stats.c.fighter_id.label("fighter_id"),
+                Fighter.name.label("fighter_name"),
+                Fighter.division.label("division"),
+                func.max(numeric_value).label("metric_value"),
+            )
+            .join(Fighter, Fighter.id == fighter_stats.c.fighter_id)
+            .where(fighter_stats.c.metric.in_(get_args(LeaderboardMetricId)))
+            .where(numeric_value.isnot(None))
+        )
+        if fighter_ids is not None:
+            per_fighter = per_fighter.where(fighter_stats.c.fighter_id.in_(list(fighter_ids)))
+            fight_counts = fight_counts.where(Fight.fighter_id.in_(list(fighter_ids)))
+        per_fighter = per_fighter.group_by(
+            fighter_stats.c.metric,
+            fighter_stats.c.fighter_id,
+            Fighter.name,
+            Fighter.division,
+        ).subquery()
+        fight_counts = fight_counts.group_by(Fight.fighter_id).subquery()
+
+        return select(
+            per_fighter.c.metric_id,
+            per_fighter.c.fighter_id,
+            per_fighter.c.fighter_name,
+            per_fighter.c.division,
+            per_fighter.c.metric_value,
+            func.coalesce(fight_counts.c.fight_count, 0).label("fight_count"),
+        ).outerjoin(fight_counts, fight_counts.c.fighter_id == per_fighter.c.fighter_id)
+
+    async def _compute_stats_summary(self) -> StatsSummaryResponse:
+        """Derive dashboard KPIs directly from SQL window functions."""
 
         metrics: list[StatsSummaryMetric] = []
 
@@ -116,7 +413,7 @@ class StatsRepository(BaseRepository):
                 )
             )
 
-        return StatsSummaryResponse(metrics=metrics)
+        return StatsSummaryResponse(metrics=metrics, computed_at=datetime.now(UTC))
 
     async def get_leaderboards(
         self,
@@ -131,33 +428,19 @@ class StatsRepository(BaseRepository):
     ) -> LeaderboardsResponse:
         """Compute leaderboards for the requested metrics with filtering and pagination."""
 
-        metric_ids = self._normalize_metric_request(metrics)
-        min_fights = max(min_fights or 0, 5)
-        leaderboards: list[LeaderboardDefinition] = []
-
-        for metric_id in metric_ids:
-            entries = await self._collect_leaderboard_entries(
-                metric_name=metric_id,
-                limit=limit,
-                offset=offset,
-                division=division,
-                min_fights=min_fights,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            if not entries:
-                continue
-
-            leaderboards.append(
-                LeaderboardDefinition(
-                    metric_id=metric_id,
-                    title=self._metric_label(metric_id),
-                    description=LEADERBOARD_METRIC_DESCRIPTIONS.get(metric_id),
-                    entries=entries,
-                )
-            )
-
-        return LeaderboardsResponse(leaderboards=leaderboards)
+        metric_ids = normalize_leaderboard_metrics(metrics)
+        min_fights = max(min_fights or 0, LEADERBOARD_MIN_FIGHTS)
+
+        entries_by_metric = await self._collect_leaderboard_entries(
+            metric_ids=metric_ids,
+            limit=limit,
+            offset=offset,
+            division=division,
+            min_fights=min_fights,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return build_leaderboards_response(metric_ids, entries_by_metric, datetime.now(UTC))
 
     async def get_trends(
         self,
@@ -221,131 +504,103 @@ class StatsRepository(BaseRepository):
     async def _collect_leaderboard_entries(
         self,
         *,
-        metric_name: LeaderboardMetricId,
+        metric_ids: Sequence[LeaderboardMetricId],
         limit: int,
         offset: int,
         division: str | None,
         min_fights: int | None,
         start_date: date | None,
         end_date: date | None,
-    ) -> list[LeaderboardEntry]:
-        """Collect leaderboard entries for a specific metric with filtering and pagination.
+    ) -> dict[str, list[LeaderboardEntry]]:
+        """Collect one page of entries for every requested metric in a single query.
 
-        This method deduplicates fighters by taking the maximum value for each fighter
-        when multiple stat entries exist for the same metric.
+        The requested metrics form a ``VALUES`` list and a ``LATERAL`` subquery
+        picks each metric's page, so PostgreSQL ranks every leaderboard in one
+        round trip.  Fighters are deduplicated by taking their maximum value
+        when multiple stat rows exist for the same metric.
 
         Supports filtering by:
         - division: Weight class filter
         - min_fights: Minimum number of UFC fights
-        - start_date/end_date: Time range for fight filtering
+        - start_date/end_date: Only fighters with a bout in the time range
         """
 
-        numeric_value = self._numeric_stat_value()
-
-        fight_exists = select(Fight.id).where(Fight.fighter_id == fighter_stats.c.fighter_id)
-        if start_date is not None:
-            fight_exists = fight_exists.where(Fight.event_date >= start_date)
-        if end_date is not None:
-            fight_exists = fight_exists.where(Fight.event_date <= end_date)
+        if not metric_ids:
+            return {}
 
-        # Correlated scalar subquery to count fights for each fighter
-        fight_count_subq = (
-            select(func.count(Fight.id))
-            .where(Fight.fighter_id == fighter_stats.c.fighter_id)
-            .where(Fight.event_date.isnot(None))
-            .scalar_subquery()
+        numeric_value = self._numeric_stat_value()
+        requested = values(column("metric_id", String), name="requested_metrics").data(
+            [(metric_id,) for metric_id in metric_ids]
         )
 
-        # First, aggregate by fighter to handle duplicates (take max value per fighter)
-        aggregated = (
-            select(
-                fighter_stats.c.fighter_id.label("fighter_id"),
-                Fighter.name.label("fighter_name"),
-                Fighter.division.label("division"),
-                func.max(numeric_value).label("numeric_value"),
-                func.max(fight_count_subq).label("fight_count"),
-            )
-            .join(Fighter, Fighter.id == fighter_stats.c.fighter_id)
-            .where(fighter_stats.c.metric == metric_name)
+        best_value = func.max(numeric_value).label("numeric_value")
+        page = (
+            select(fighter_stats.c.fighter_id.label("fighter_id"), best_value)
+            .where(fighter_stats.c.metric == requested.c.metric_id)
             .where(numeric_value.isnot(None))
-            .group_by(fighter_stats.c.fighter_id, Fighter.name, Fighter.division)
         )
-
-        # Apply division filter
         if division is not None and division.strip():
-            aggregated = aggregated.where(Fighter.division == division.strip())
-
-        # Apply date range filter
+            page = page.join(Fighter, Fighter.id == fighter_stats.c.fighter_id).where(
+                Fighter.division == division.strip()
+            )
         if start_date is not None or end_date is not None:
-            aggregated = aggregated.where(fight_exists.exists())
+            active_fighters = select(Fight.fighter_id)
+            if start_date is not None:
+                active_fighters = active_fighters.where(Fight.event_date >= start_date)
+            if end_date is not None:
+                active_fighters = active_fighters.where(Fight.event_date <= end_date)
+            page = page.where(fighter_stats.c.fighter_id.in_(active_fighters))
+        # Ranks are assigned before the min_fights threshold, so pagination
+        # happens here and the threshold filters the page afterwards.
+        page = (
+            page.group_by(fighter_stats.c.fighter_id)
+            .order_by(best_value.desc(), fighter_stats.c.fighter_id)
+            .offset(offset)
+            .limit(limit)
+            .lateral("leaderboard_page")
+        )
 
-        aggregated_subquery = aggregated.subquery()
+        # Count every fighter's dated bouts once instead of once per stats row.
+        fight_counts = (
+            select(Fight.fighter_id, func.count(Fight.id).label("fight_count"))
+            .where(Fight.event_date.isnot(None))
+            .group_by(Fight.fighter_id)
+            .subquery("fight_counts")
+        )
+        fight_count = func.coalesce(fight_counts.c.fight_count, 0).label("fight_count")
 
-        # Then rank the aggregated results
-        ranked = (
+        stmt = (
             select(
-                aggregated_subquery.c.fighter_id,
-                aggregated_subquery.c.fighter_name,
-                aggregated_subquery.c.numeric_value,
-                aggregated_subquery.c.fight_count,
-                func.row_number()
-                .over(order_by=aggregated_subquery.c.numeric_value.desc())
-                .label("rank"),
+                requested.c.metric_id,
+                page.c.fighter_id,
+                Fighter.name.label("fighter_name"),
+                page.c.numeric_value,
+                fight_count,
+            )
+            .select_from(requested)
+            .join(page, true())
+            .join(Fighter, Fighter.id == page.c.fighter_id)
+            .outerjoin(fight_counts, fight_counts.c.fighter_id == page.c.fighter_id)
+            .order_by(
+                requested.c.metric_id, page.c.numeric_value.desc(), page.c.fighter_id
             )
-        ).subquery()
-
-        # Apply min_fights filter after aggregation
-        stmt = select(
-            ranked.c.fighter_id,
-            ranked.c.fighter_name,
-            ranked.c.numeric_value,
-            ranked.c.fight_count,
-            ranked.c.rank,
         )
-
         if min_fights is not None and min_fights > 0:
-            stmt = stmt.where(ranked.c.fight_count >= min_fights)
-
-        # Apply pagination
-        stmt = (
-            stmt.where(ranked.c.rank > offset)
-            .where(ranked.c.rank <= offset + limit)
-            .order_by(ranked.c.rank)
-        )
+            stmt = stmt.where(func.coalesce(fight_counts.c.fight_count, 0) >= min_fights)
 
         result = await self._session.execute(stmt)
-        return [
-            LeaderboardEntry(
-                fighter_id=row.fighter_id,
-                fighter_name=row.fighter_name,
-                metric_value=float(row.numeric_value),
-                detail_url=f"/fighters/{row.fighter_id}",
-                fight_count=int(row.fight_count) if row.fight_count else None,
+        entries_by_metric: dict[str, list[LeaderboardEntry]] = {}
+        for row in result.fetchall():
+            entries_by_metric.setdefault(row.metric_id, []).append(
+                LeaderboardEntry(
+                    fighter_id=row.fighter_id,
+                    fighter_name=row.fighter_name,
+                    metric_value=float(row.numeric_value),
+                    detail_url=f"/fighters/{row.fighter_id}",
+                    fight_count=int(row.fight_count) if row.fight_count else None,
+                )
             )
-            for row in result.fetchall()
-        ]
-
-    def _normalize_metric_request(
-        self, metrics: Sequence[LeaderboardMetricId] | None
-    ) -> list[LeaderboardMetricId]:
-        """Return a de-duplicated, ordered list of leaderboard metrics to evaluate."""
-
-        metric_sequence = list(metrics or DEFAULT_LEADERBOARD_METRICS)
-        seen: set[LeaderboardMetricId] = set()
-        ordered: list[LeaderboardMetricId] = []
-        for metric in metric_sequence:
-            if metric in seen:
-                continue
-            seen.add(metric)
-            ordered.append(metric)
-        return ordered
-
-    def _metric_label(self, metric_id: LeaderboardMetricId) -> str:
-        """Provide a human-readable label for the metric identifier."""
-
-        return LEADERBOARD_METRIC_LABELS.get(
-            metric_id, metric_id.replace("_", " ").title()
-        )
+        return entries_by_metric
 
     def _numeric_stat_value(self) -> ColumnElement[float | None]:
         """Return an expression that safely coerces the fighter stat value column to a float."""
@@ -379,27 +634,171 @@ class StatsRepository(BaseRepository):
         return {row.metric: float(row.average_value) for row in result.fetchall()}
 
     async def _global_average_fight_duration_seconds(self) -> float | None:
-        """Compute the global average fight duration (in seconds) via windowed aggregation."""
-
-        duration_expr = self._fight_duration_seconds_expression()
-        duration_cte = (
-            select(
-                duration_expr.label("duration_seconds"),
-                func.avg(duration_expr).over().label("avg_duration"),
-            ).where(duration_expr.isnot(None))
-        ).cte("duration_stats")
+        """Compute the global average fight duration (in seconds) from the stored column."""
 
-        stmt = select(duration_cte.c.avg_duration).limit(1)
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(select(func.avg(Fight.duration_seconds)))
         value = result.scalar_one_or_none()
         return float(value) if value is not None else None
 
+    async def refresh_streak_history(self, fighter_ids: Iterable[str] | None = None) -> None:
+        """Rebuild ``fighter_streaks`` for ``fighter_ids`` (every fighter when ``None``).
+
+        Each fighter's bouts are read once in chronological order and split
+        into runs with :func:`compute_streak_runs`.  Loaders call this after
+        rewriting a fighter's history, in the same transaction.
+        """
+
+        fights_query = (
+            select(Fight.fighter_id, Fight.event_date, Fight.result)
+            .where(Fight.event_date.isnot(None))
+            .order_by(Fight.fighter_id, Fight.event_date, Fight.id)
+        )
+        delete_stmt = delete(FighterStreak)
+        if fighter_ids is not None:
+            targets = sorted(set(fighter_ids))
+            if not targets:
+                return
+            fights_query = fights_query.where(Fight.fighter_id.in_(targets))
+            delete_stmt = delete_stmt.where(FighterStreak.fighter_id.in_(targets))
+
+        result = await self._session.execute(fights_query)
+        runs: list[tuple[str, StreakRun]] = [
+            (fighter_id, run)
+            for fighter_id, fights in groupby(result.all(), key=lambda row: row.fighter_id)
+            for run in compute_streak_runs((row.event_date, row.result) for row in fights)
+        ]
+
+        await self._session.execute(delete_stmt)
+        if not runs:
+            return
+        # Ship the runs as one array per column so the rebuild is one statement.
+        columns = {
+            "fighter_id": (String, [fighter_id for fighter_id, _run in runs]),
+            "streak_type": (String, [run.streak_type for _fighter_id, run in runs]),
+            "length": (Integer, [run.length for _fighter_id, run in runs]),
+            "start_date": (Date, [run.start_date for _fighter_id, run in runs]),
+            "end_date": (Date, [run.end_date for _fighter_id, run in runs]),
+            "start_position": (Integer, [run.start_position for _fighter_id, run in runs]),
+        }
+        unnested = func.unnest(
+            *(literal(values, ARRAY(sql_type)) for sql_type, values in columns.values())
+        ).table_valued(*columns).render_derived(name="streak_runs")
+        await self._session.execute(
+            insert(FighterStreak).from_select(list(columns), select(unnested))
+        )
+
     async def _calculate_win_streaks(
         self,
         *,
         start_date: date | None,
         end_date: date | None,
         limit: int,
+    ) -> list[WinStreakSummary]:
+        """Return the longest win streaks in the time range from ``fighter_streaks``.
+
+        A window keeps the part of each run that falls inside it: runs wholly
+        inside keep their stored length, and only the (at most two per fighter)
+        runs crossing a boundary are re-counted from their bouts.  Falls back
+        to deriving streaks from ``fights`` until the table has been populated.
+        """
+
+        populated = await self._session.execute(select(select(FighterStreak.id).exists()))
+        if not populated.scalar():
+            return await self._calculate_win_streaks_from_fights(
+                start_date=start_date, end_date=end_date, limit=limit
+            )
+
+        streak = FighterStreak
+        runs = select(
+            streak.fighter_id,
+            streak.length.label("streak_length"),
+            streak.end_date.label("last_win_date"),
+        ).where(streak.streak_type == "win")
+        if start_date is not None or end_date is not None:
+            window_start = start_date or date.min
+            window_end = end_date or date.max
+            inside = runs.where(
+                streak.start_date >= window_start, streak.end_date <= window_end
+            ).cte("inside_runs")
+            # A clipped run is never longer than the stored run, so crossing runs
+            # shorter than the limit-th inside run cannot reach the result.
+            cutoff = (
+                select(inside.c.streak_length)
+                .order_by(inside.c.streak_length.desc())
+                .offset(max(limit, 1) - 1)
+                .limit(1)
+                .scalar_subquery()
+            )
+            # Filtering inside the aggregates keeps the lookup on the fighter's
+            # own (few) bouts instead of intersecting with an event_date range.
+            in_run = and_(
+                Fight.event_date.between(
+                    func.greatest(streak.start_date, window_start),
+                    func.least(streak.end_date, window_end),
+                ),
+                func.lower(func.trim(Fight.result)).in_(self._WIN_RESULTS),
+            )
+            clipped_fights = (
+                select(
+                    func.count().filter(in_run).label("streak_length"),
+                    func.max(Fight.event_date).filter(in_run).label("last_win_date"),
+                )
+                .where(Fight.fighter_id == streak.fighter_id)
+                .lateral("clipped_fights")
+            )
+            crossing = (
+                select(
+                    streak.fighter_id,
+                    clipped_fights.c.streak_length,
+                    clipped_fights.c.last_win_date,
+                )
+                .join(clipped_fights, true())
+                .where(streak.streak_type == "win")
+                .where(streak.start_date <= window_end, streak.end_date >= window_start)
+                .where(
+                    (streak.start_date < window_start) | (streak.end_date > window_end)
+                )
+                .where(streak.length >= func.coalesce(cutoff, 0))
+            )
+            candidates = union_all(select(inside), crossing).subquery("windowed_runs")
+        else:
+            candidates = runs.subquery("windowed_runs")
+
+        stmt = (
+            select(
+                candidates.c.fighter_id,
+                Fighter.name.label("fighter_name"),
+                Fighter.division,
+                candidates.c.streak_length,
+                candidates.c.last_win_date,
+            )
+            .join(Fighter, Fighter.id == candidates.c.fighter_id)
+            .where(candidates.c.streak_length > 0)
+            .order_by(
+                candidates.c.streak_length.desc(),
+                candidates.c.last_win_date.desc(),
+                Fighter.name,
+            )
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            WinStreakSummary(
+                fighter_id=row.fighter_id,
+                fighter_name=row.fighter_name,
+                division=row.division,
+                streak=int(row.streak_length),
+                last_win_date=row.last_win_date,
+            )
+            for row in result.fetchall()
+        ]
+
+    async def _calculate_win_streaks_from_fights(
+        self,
+        *,
+        start_date: date | None,
+        end_date: date | None,
+        limit: int,
     ) -> list[WinStreakSummary]:
         """Compute longest consecutive win streaks for fighters in the time range."""
 
@@ -473,6 +872,7 @@ class StatsRepository(BaseRepository):
                     order_by=(
                         streak_aggregates.c.streak_length.desc(),
                         streak_aggregates.c.last_win_date.desc(),
+                        streak_aggregates.c.fighter_name,
                     )
                 )
                 .label("streak_rank"),
@@ -507,49 +907,92 @@ class StatsRepository(BaseRepository):
             for row in result.fetchall()
         ]
 
-    async def _calculate_average_durations(
-        self,
-        *,
-        start_date: date | None,
-        end_date: date | None,
-        time_bucket: TrendTimeBucket,
-    ) -> list[AverageFightDuration]:
-        """Compute average fight durations grouped by division and temporal bucket."""
+    async def refresh_trend_rollups(self, event_dates: Iterable[date | None] | None = None) -> None:
+        """Rebuild ``fight_trend_rollups`` for ``event_dates`` (all dates when ``None``).
 
-        duration_expr = self._fight_duration_seconds_expression()
-        bucket_expr = self._bucket_start_expression(time_bucket)
+        Day rows for the given dates are recomputed from ``fights`` across every
+        division, so a fighter changing division is picked up as long as the
+        caller passes the dates of that fighter's bouts.  Month rows are then
+        re-summed from their day rows.
+        """
 
-        base_query = (
+        rollup = FightTrendRollup
+        days: list[date] | None = None
+        if event_dates is not None:
+            days = sorted({value for value in event_dates if value is not None})
+            if not days:
+                return
+
+        is_win = func.lower(func.trim(Fight.result)).in_(self._WIN_RESULTS)
+        method = func.lower(func.coalesce(Fight.method, ""))
+        is_ko_tko = method.like("%ko%")
+        is_submission = method.like("%sub%")
+        is_finish = is_ko_tko | is_submission | method.like("%dq%")
+        day_rows = (
             select(
-                Fighter.division.label("division"),
-                bucket_expr.label("bucket_start"),
-                duration_expr.label("duration_seconds"),
+                Fighter.division,
+                literal("day"),
+                Fight.event_date,
+                func.count(),
+                func.count(Fight.duration_seconds),
+                func.coalesce(func.sum(Fight.duration_seconds), 0),
+                func.count().filter(is_win),
+                func.count().filter(is_win & is_finish),
+                func.count().filter(is_win & is_ko_tko),
+                func.count().filter(is_win & is_submission),
+                func.count().filter(is_win & method.like("%dec%")),
             )
             .join(Fighter, Fighter.id == Fight.fighter_id)
-            .where(duration_expr.isnot(None))
             .where(Fight.event_date.isnot(None))
+            .group_by(Fighter.division, Fight.event_date)
         )
+        delete_days = delete(rollup).where(rollup.bucket_kind == "day")
 
-        if start_date is not None:
-            base_query = base_query.where(Fight.event_date >= start_date)
-        if end_date is not None:
-            base_query = base_query.where(Fight.event_date <= end_date)
-
-        base_cte = base_query.cte("duration_base")
-
-        windowed = (
+        month_start = cast(func.date_trunc("month", rollup.bucket_start), Date)
+        month_rows = (
             select(
-                base_cte.c.division,
-                base_cte.c.bucket_start,
-                func.avg(base_cte.c.duration_seconds)
-                .over(partition_by=(base_cte.c.division, base_cte.c.bucket_start))
-                .label("avg_duration"),
+                rollup.division,
+                literal("month"),
+                month_start,
+                *(func.sum(getattr(rollup, counter)) for counter in TREND_ROLLUP_COUNTERS),
             )
-        ).subquery()
+            .where(rollup.bucket_kind == "day")
+            .group_by(rollup.division, month_start)
+        )
+        delete_months = delete(rollup).where(rollup.bucket_kind == "month")
 
-        stmt = select(
-            windowed.c.division, windowed.c.bucket_start, windowed.c.avg_duration
-        ).distinct()
+        if days is not None:
+            months = sorted({day.replace(day=1) for day in days})
+            day_rows = day_rows.where(Fight.event_date.in_(days))
+            delete_days = delete_days.where(rollup.bucket_start.in_(days))
+            month_rows = month_rows.where(month_start.in_(months))
+            delete_months = delete_months.where(rollup.bucket_start.in_(months))
+
+        columns = ["division", "bucket_kind", "bucket_start", *TREND_ROLLUP_COUNTERS]
+        await self._session.execute(delete_days)
+        await self._session.execute(insert(rollup).from_select(columns, day_rows))
+        await self._session.execute(delete_months)
+        await self._session.execute(insert(rollup).from_select(columns, month_rows))
+
+    async def _calculate_average_durations(
+        self,
+        *,
+        start_date: date | None,
+        end_date: date | None,
+        time_bucket: TrendTimeBucket,
+    ) -> list[AverageFightDuration]:
+        """Compute average fight durations grouped by division and temporal bucket.
+
+        Reads ``fight_trend_rollups`` when it has been populated: whole months
+        inside the range come from month rows and the partial months at either
+        edge from day rows.  Falls back to aggregating ``fights`` otherwise.
+        """
+
+        rollup_probe = await self._session.execute(select(FightTrendRollup.id).limit(1))
+        if rollup_probe.first() is None:
+            stmt = self._average_durations_from_fights(start_date, end_date, time_bucket)
+        else:
+            stmt = self._average_durations_from_rollups(start_date, end_date, time_bucket)
 
         result = await self._session.execute(stmt)
         durations: list[AverageFightDuration] = []
@@ -576,37 +1019,102 @@ class StatsRepository(BaseRepository):
         durations.sort(key=lambda entry: (entry.bucket_start, entry.division or ""))
         return durations
 
-    def _fight_duration_seconds_expression(self) -> ColumnElement[float | None]:
-        """Translate fight round/time combination to elapsed seconds using PostgreSQL functions."""
+    def _average_durations_from_fights(
+        self,
+        start_date: date | None,
+        end_date: date | None,
+        time_bucket: TrendTimeBucket,
+    ) -> Select[tuple[str | None, date, float]]:
+        """Return the GROUP BY over ``fights`` used before rollups exist."""
 
-        raw_minutes = func.split_part(Fight.time, ":", 1)
-        raw_seconds = func.split_part(Fight.time, ":", 2)
+        bucket_expr = self._bucket_start_expression(time_bucket).label("bucket_start")
+        stmt = (
+            select(
+                Fighter.division.label("division"),
+                bucket_expr,
+                func.avg(Fight.duration_seconds).label("avg_duration"),
+            )
+            .join(Fighter, Fighter.id == Fight.fighter_id)
+            .where(Fight.duration_seconds.isnot(None))
+            .where(Fight.event_date.isnot(None))
+            .group_by(Fighter.division, bucket_expr)
+        )
+        if start_date is not None:
+            stmt = stmt.where(Fight.event_date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(Fight.event_date <= end_date)
+        return stmt
 
-        minute_text = func.nullif(func.nullif(raw_minutes, ""), "--")
-        second_text = func.nullif(func.nullif(raw_seconds, ""), "--")
+    def _average_durations_from_rollups(
+        self,
+        start_date: date | None,
+        end_date: date | None,
+        time_bucket: TrendTimeBucket,
+    ) -> Select[tuple[str | None, date, float]]:
+        """Return a query combining month and edge-day rollups for the date range."""
 
-        valid_time = (
-            Fight.time.isnot(None)
-            & minute_text.isnot(None)
-            & second_text.isnot(None)
-            & Fight.round.isnot(None)
-        )
+        rollup = FightTrendRollup
+        # Months fully inside [start_date, end_date] lie in [first_month, month_limit).
+        month_conditions: list[ColumnElement[bool]] = []
+        day_conditions: list[ColumnElement[bool]] = []
+        if start_date is not None:
+            first_month = start_date if start_date.day == 1 else _next_month(start_date)
+            month_conditions.append(rollup.bucket_start >= first_month)
+            day_conditions.append(rollup.bucket_start >= start_date)
+        if end_date is not None:
+            month_limit = (end_date + timedelta(days=1)).replace(day=1)
+            month_conditions.append(rollup.bucket_start < month_limit)
+            day_conditions.append(rollup.bucket_start <= end_date)
 
-        round_index = func.coalesce(Fight.round, 1)
-        completed_rounds = case((round_index > 1, round_index - 1), else_=0)
-        elapsed_before_round = completed_rounds * 300
-        elapsed_this_round = cast(minute_text, Integer) * 60 + cast(second_text, Integer)
+        parts = [
+            select(
+                rollup.division,
+                rollup.bucket_start,
+                rollup.duration_total_seconds,
+                rollup.duration_count,
+            ).where(rollup.bucket_kind == "month", *month_conditions)
+        ]
+        if day_conditions:
+            parts.append(
+                select(
+                    rollup.division,
+                    rollup.bucket_start,
+                    rollup.duration_total_seconds,
+                    rollup.duration_count,
+                ).where(
+                    rollup.bucket_kind == "day",
+                    *day_conditions,
+                    ~and_(*month_conditions),
+                )
+            )
+        combined = union_all(*parts).subquery("duration_rollups")
 
-        return case(
-            (valid_time, cast(elapsed_before_round + elapsed_this_round, Float)),
-            else_=None,
+        bucket_expr = self._bucket_start_expression(
+            time_bucket, combined.c.bucket_start
+        ).label("bucket_start")
+        duration_count = func.sum(combined.c.duration_count)
+        return (
+            select(
+                combined.c.division.label("division"),
+                bucket_expr,
+                (cast(func.sum(combined.c.duration_total_seconds), Float) / duration_count).label(
+                    "avg_duration"
+                ),
+            )
+            .group_by(combined.c.division, bucket_expr)
+            .having(duration_count > 0)
         )
 
-    def _bucket_start_expression(self, bucket: TrendTimeBucket) -> ColumnElement[date]:
+    def _bucket_start_expression(
+        self,
+        bucket: TrendTimeBucket,
+        source: ColumnElement[date] | None = None,
+    ) -> ColumnElement[date]:
         """Return the PostgreSQL date_trunc bucket start for the requested interval."""
 
         truncate_unit = {"year": "year", "quarter": "quarter"}.get(bucket, "month")
-        return cast(func.date_trunc(truncate_unit, Fight.event_date), Date)
+        source = Fight.event_date if source is None else source
+        return cast(func.date_trunc(truncate_unit, source), Date)
 
     def _format_bucket_label(self, bucket_start: date, bucket: TrendTimeBucket) -> str:
         """Format a human readable label for the supplied bucket start."""
@@ -617,3 +1125,9 @@ class StatsRepository(BaseRepository):
             quarter = (bucket_start.month - 1) // 3 + 1
             return f"Q{quarter} {bucket_start.year}"
         return bucket_start.strftime("%b %Y")
+
+
+def _next_month(value: date) -> date:
+    """Return the first day of the month after ``value``."""
+
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
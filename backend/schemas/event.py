@@ -51,3 +51,19 @@ class PaginatedEventsResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+
+
+class EventFacetCount(BaseModel):
+    """Number of events carrying one facet value."""
+
+    value: int | str
+    count: int
+
+
+class EventFacets(BaseModel):
+    """Facet counts, each conditioned on every active filter except its own."""
+
+    years: list[EventFacetCount] = Field(default_factory=list)
+    locations: list[EventFacetCount] = Field(default_factory=list)
+    event_types: list[EventFacetCount] = Field(default_factory=list)
+    statuses: list[EventFacetCount] = Field(default_factory=list)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Any
+from datetime import date, datetime
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, computed_field
 
@@ -37,3 +37,51 @@ class FightGraphResponse(BaseModel):
     def edges(self) -> list[FightGraphLink]:
         """Alias for links to maintain compatibility with frontend."""
         return self.links
+
+
+class FightGraphCentralityEntry(BaseModel):
+    fighter_id: str
+    name: str
+    division: str | None = None
+    degree: int = 0
+    betweenness: float = 0.0
+    eigenvector: float = 0.0
+    community_id: int | None = None
+
+
+class FightGraphCentralityResponse(BaseModel):
+    metric: Literal["betweenness", "eigenvector", "degree"]
+    fighters: list[FightGraphCentralityEntry] = Field(default_factory=list)
+    node_count: int = 0
+    data_version: str
+    computed_at: datetime
+
+
+class FightGraphCommunity(BaseModel):
+    community_id: int
+    size: int
+    dominant_division: str | None = None
+    members: list[FightGraphCentralityEntry] = Field(default_factory=list)
+
+
+class FightGraphCommunitiesResponse(BaseModel):
+    communities: list[FightGraphCommunity] = Field(default_factory=list)
+    community_count: int = 0
+    data_version: str
+    computed_at: datetime
+
+
+class FightGraphPathStep(BaseModel):
+    fighter_id: str
+    name: str
+    division: str | None = None
+    fights_with_previous: int | None = None
+
+
+class FightGraphPathResponse(BaseModel):
+    source: str
+    target: str
+    degrees: int | None = None
+    path: list[FightGraphPathStep] = Field(default_factory=list)
+    data_version: str
+    computed_at: datetime
@@ -85,6 +85,15 @@ class PaginatedFightersResponse(BaseModel):
     has_more: bool
 
 
+class ComparisonMetricContext(BaseModel):
+    """Numeric context for a single metric within a fighter comparison."""
+
+    value: float | None = None
+    roster_percentile: float | None = None
+    division_percentile: float | None = None
+    delta: float | None = None
+
+
 class FighterComparisonEntry(BaseModel):
     fighter_id: str
     name: str
@@ -96,6 +105,7 @@ class FighterComparisonEntry(BaseModel):
     significant_strikes: dict[str, Any] = Field(default_factory=dict)
     takedown_stats: dict[str, Any] = Field(default_factory=dict)
     career: dict[str, Any] = Field(default_factory=dict)
+    metric_context: dict[str, ComparisonMetricContext] = Field(default_factory=dict)
     is_current_champion: bool = False
     is_former_champion: bool = False
     was_interim: bool = False
@@ -36,6 +36,9 @@ class FighterOddsHistoryResponse(BaseModel):
     total_fights: int
     returned: int
     odds_history: list[FighterOddsHistoryEntry]
+    next_cursor: str | None = Field(
+        None, description="Pass as ``cursor`` to fetch the next page; null on the last page."
+    )
 
 
 class FighterOddsChartFight(BaseModel):
@@ -56,6 +59,25 @@ class FighterOddsChartResponse(BaseModel):
     fights: list[FighterOddsChartFight]
 
 
+class FightOddsAnalytics(BaseModel):
+    opening_probability: float | None = Field(
+        None, description="Implied probability of the opening line."
+    )
+    closing_probability: float | None = Field(
+        None, description="Implied probability of the closing line."
+    )
+    fair_closing_probability: float | None = Field(
+        None, description="Closing probability with the bookmaker margin removed."
+    )
+    probability_movement: float | None = Field(
+        None, description="Closing minus opening probability."
+    )
+    volatility: float | None = Field(
+        None, description="Standard deviation of sample-to-sample probability changes."
+    )
+    steam_moves: int = Field(0, description="Sharp probability jumps within an hour.")
+
+
 class FightOddsDetailResponse(BaseModel):
     id: str
     fighter_id: str
@@ -70,6 +92,7 @@ class FightOddsDetailResponse(BaseModel):
     data_quality: str
     scraped_at: datetime
     bfo_fighter_url: str | None = None
+    analytics: FightOddsAnalytics | None = None
 
 
 class OddsCoverageStats(BaseModel):
@@ -92,6 +115,7 @@ __all__ = [
     "FighterOddsChartResponse",
     "FighterOddsHistoryEntry",
     "FighterOddsHistoryResponse",
+    "FightOddsAnalytics",
     "FightOddsDetailResponse",
     "OddsCoverageStats",
     "OddsQualityStatsResponse",
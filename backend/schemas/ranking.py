@@ -51,15 +51,44 @@ class RankingHistoryEntry(BaseModel):
     source: str = Field(description="Ranking source")
 
 
+RankingHistoryResolution = Literal["snapshot", "change", "month", "quarter", "year"]
+
+
+class RankingHistorySeries(BaseModel):
+    """Columnar ranking time series; index ``i`` of every list describes one point.
+
+    At ``change`` resolution each point is a run of unchanged rank starting at
+    ``dates[i]`` and last observed on ``end_dates[i]``.  At interval
+    resolutions each point is the rank held at the end of the interval
+    starting at ``dates[i]``, last observed on ``end_dates[i]``.
+    """
+
+    dates: list[date] = Field(default_factory=list, description="Point start dates (ascending)")
+    end_dates: list[date] = Field(
+        default_factory=list, description="Last snapshot date covered by each point"
+    )
+    divisions: list[str] = Field(default_factory=list, description="Weight class per point")
+    ranks: list[int | None] = Field(
+        default_factory=list, description="Rank per point (0=Champion, null=Not Ranked)"
+    )
+    is_interim: list[bool] = Field(default_factory=list, description="Interim flag per point")
+
+
 class RankingHistoryResponse(BaseModel):
     """Historical ranking progression for a fighter."""
 
     fighter_id: str = Field(description="Fighter's UUID")
     fighter_name: str = Field(description="Fighter's full name")
     source: str = Field(description="Ranking source")
+    resolution: RankingHistoryResolution = Field(
+        default="snapshot", description="Granularity of the returned history"
+    )
     history: list[RankingHistoryEntry] = Field(
         default_factory=list,
-        description="Ranking snapshots ordered by date (most recent first)",
+        description="Ranking snapshots ordered by date (most recent first); snapshot resolution",
+    )
+    series: RankingHistorySeries | None = Field(
+        None, description="Downsampled columnar history; change and interval resolutions"
     )
     total_snapshots: int = Field(description="Total number of ranking snapshots")
 
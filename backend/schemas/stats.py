@@ -144,6 +144,10 @@ class StatsSummaryResponse(BaseModel):
 
     metrics: list[StatsSummaryMetric] = Field(default_factory=list)
     generated_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+    computed_at: datetime | None = Field(
+        default=None,
+        description="When the underlying aggregates were last materialised.",
+    )
 
 
 # Leaderboard Models
@@ -174,6 +178,10 @@ class LeaderboardsResponse(BaseModel):
 
     leaderboards: list[LeaderboardDefinition] = Field(default_factory=list)
     generated_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+    computed_at: datetime | None = Field(
+        default=None,
+        description="When the underlying aggregates were last materialised.",
+    )
 
 
 # Trend Models
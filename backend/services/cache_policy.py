@@ -0,0 +1,81 @@
+"""Cache lifetimes for payloads that settle once the underlying bout is over.
+
+Responses fall into two classes.  *Immutable* payloads describe the past:
+completed event cards, historical fight fragments and odds series whose bout
+has happened.  They only change when a loader rewrites the underlying rows,
+and every such loader clears the affected Redis prefixes afterwards, so they
+can be cached for weeks and served with long-lived HTTP caching.  *Volatile*
+payloads (upcoming cards, current rankings, roster-wide lists) keep short
+lifetimes because their content moves without a loader run.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from fastapi import Response
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """Server and HTTP cache lifetimes for one class of payload."""
+
+    name: str
+    ttl: int
+    http_max_age: int
+    stale_while_revalidate: int = 0
+
+    @property
+    def cache_control(self) -> str:
+        directives = ["public", f"max-age={self.http_max_age}"]
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+
+# Browsers and CDNs cannot be told about a reload, so immutable responses are
+# held for a day downstream and revalidated in the background for a week.
+IMMUTABLE = CachePolicy(
+    "immutable",
+    ttl=30 * 24 * 3600,
+    http_max_age=24 * 3600,
+    stale_while_revalidate=7 * 24 * 3600,
+)
+VOLATILE = CachePolicy("volatile", ttl=300, http_max_age=60, stale_while_revalidate=60)
+
+
+def _is_past(day: date | None, today: date | None) -> bool:
+    return day is not None and day < (today or date.today())
+
+
+def event_policy(
+    status: str | None, event_date: date | None, *, today: date | None = None
+) -> CachePolicy:
+    """Completed events dated before today are immutable; anything else is volatile."""
+
+    if status == "completed" and _is_past(event_date, today):
+        return IMMUTABLE
+    return VOLATILE
+
+
+def fight_policy(event_date: date | None, *, today: date | None = None) -> CachePolicy:
+    """Fight fragments and odds series settle once the bout's date has passed."""
+
+    return IMMUTABLE if _is_past(event_date, today) else VOLATILE
+
+
+def apply_cache_headers(response: Response, policy: CachePolicy) -> None:
+    """Advertise ``policy`` to HTTP caches on ``response``."""
+
+    response.headers["Cache-Control"] = policy.cache_control
+
+
+__all__ = [
+    "IMMUTABLE",
+    "VOLATILE",
+    "CachePolicy",
+    "apply_cache_headers",
+    "event_policy",
+    "fight_policy",
+]
@@ -21,6 +21,8 @@ from backend.cache import CacheClient
 logger = logging.getLogger(__name__)
 
 _LOCAL_CACHE_DEFAULT_TTL = 300
+# Loaders can only clear Redis, so in-process copies never outlive an hour.
+_LOCAL_CACHE_MAX_TTL = 3600
 _local_cache: dict[str, tuple[float, Any]] = {}
 _local_cache_lock = asyncio.Lock()
 
@@ -30,6 +32,7 @@ T = TypeVar("T")
 CacheKeyBuilder = Callable[Concatenate["CacheableService", P], str | None]
 CacheSerializer = Callable[[T], Any]
 CacheDeserializer = Callable[[Any], T]
+CacheTTL = int | Callable[[T], int | None] | None
 DecoratedCallable = Callable[Concatenate["CacheableService", P], Awaitable[T]]
 
 
@@ -52,6 +55,7 @@ async def _local_cache_set(key: str, value: Any, ttl: int | None = None) -> None
     """Store ``value`` in the in-process cache honouring an optional TTL."""
 
     ttl_seconds = ttl if ttl is not None and ttl > 0 else _LOCAL_CACHE_DEFAULT_TTL
+    ttl_seconds = min(ttl_seconds, _LOCAL_CACHE_MAX_TTL)
     async with _local_cache_lock:
         _local_cache[key] = (time.time() + ttl_seconds, value)
 
@@ -91,7 +95,7 @@ class CacheableService:
 def cached(
     key_builder: CacheKeyBuilder[P],
     *,
-    ttl: int | None = None,
+    ttl: CacheTTL[T] = None,
     serializer: CacheSerializer[T] | None = None,
     deserializer: CacheDeserializer[T] | None = None,
     deserialize_error_message: str | None = None,
@@ -104,8 +108,9 @@ def cached(
         Callable that returns the cache key for the invocation.  Returning
         ``None`` short-circuits caching for the call.
     ttl:
-        Optional cache lifetime in seconds.  ``None`` falls back to the default
-        TTL defined for the in-process cache.
+        Optional cache lifetime in seconds, or a callable deriving it from the
+        result (see :mod:`backend.services.cache_policy`).  ``None`` falls back
+        to the default TTL defined for the in-process cache.
     serializer / deserializer:
         Optional hooks that convert between Python objects and JSON-serialisable
         payloads.  They are invoked before writing to the cache and after
@@ -139,8 +144,9 @@ def cached(
                 payload: Any = result
                 if serializer is not None:
                     payload = serializer(result)
+                entry_ttl = ttl(result) if callable(ttl) else ttl
                 try:
-                    await self._cache_set(cache_key, payload, ttl=ttl)
+                    await self._cache_set(cache_key, payload, ttl=entry_ttl)
                 except Exception as exc:  # pragma: no cover - cache backend issues
                     logger.warning("Failed to persist cache entry for key %s: %s", cache_key, exc)
 
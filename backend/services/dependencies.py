@@ -14,6 +14,7 @@ from backend.cache import CacheClient, get_cache_client
 from backend.db.connection import get_db
 from backend.db.repositories.fighter_repository import FighterRepository
 from backend.db.repositories.odds import OddsRepository
+from backend.services.fighter_comparison_engine import get_fighter_comparison_engine
 from backend.services.fighter_query_service import FighterQueryService
 from backend.services.odds_query_service import OddsQueryService
 
@@ -31,7 +32,11 @@ def get_fighter_query_service(
     """
 
     repository = FighterRepository(session)
-    return FighterQueryService(repository, cache=cache)
+    return FighterQueryService(
+        repository,
+        cache=cache,
+        comparison_engine=get_fighter_comparison_engine(),
+    )
 
 
 def get_odds_query_service(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
+from collections.abc import Iterable
 from typing import Any
 
 from fastapi import Depends
@@ -10,10 +12,68 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.cache import CacheClient, get_cache_client
 from backend.db.connection import get_db
 from backend.db.repositories import PostgreSQLEventRepository
-from backend.schemas.event import EventDetail, EventListItem, PaginatedEventsResponse
+from backend.db.repositories.event_repository import EventFacetCellCount
+from backend.schemas.event import (
+    EventDetail,
+    EventFacetCount,
+    EventFacets,
+    EventListItem,
+    PaginatedEventsResponse,
+)
+from backend.services.cache_policy import VOLATILE, event_policy
 
 logger = logging.getLogger(__name__)
 
+_FACET_DIMENSIONS = ("year", "location", "event_type", "status")
+
+
+def _cell_matches(
+    cell: EventFacetCellCount, dimension: str, filters: dict[str, int | str | None]
+) -> bool:
+    """Return whether ``cell`` passes every active filter except ``dimension``'s."""
+
+    for name, value in filters.items():
+        if name == dimension or value is None:
+            continue
+        if name == "location":
+            # Mirror the search endpoint's case-insensitive partial match.
+            if cell.location is None or str(value).lower() not in cell.location.lower():
+                return False
+        elif getattr(cell, name) != value:
+            return False
+    return True
+
+
+def _build_event_facets(
+    cells: Iterable[EventFacetCellCount], filters: dict[str, int | str | None]
+) -> EventFacets:
+    """Sum cell counts per facet value, conditioning each facet on the other filters."""
+
+    counters: dict[str, Counter[int | str]] = {
+        dimension: Counter() for dimension in _FACET_DIMENSIONS
+    }
+    for cell in cells:
+        for dimension, counter in counters.items():
+            value = getattr(cell, dimension)
+            if value is not None and _cell_matches(cell, dimension, filters):
+                counter[value] += cell.event_count
+
+    def ranked(counter: Counter[int | str]) -> list[EventFacetCount]:
+        return [
+            EventFacetCount(value=value, count=count)
+            for value, count in sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    return EventFacets(
+        years=[
+            EventFacetCount(value=year, count=count)
+            for year, count in sorted(counters["year"].items(), reverse=True)
+        ],
+        locations=ranked(counters["location"]),
+        event_types=ranked(counters["event_type"]),
+        statuses=ranked(counters["status"]),
+    )
+
 
 class EventService:
     """Service layer for event operations with optional caching."""
@@ -80,7 +140,8 @@ class EventService:
             await self._cache_set(
                 cache_key,
                 [event.model_dump() for event in event_list],
-                ttl=300,  # 5 minutes
+                # Pages shift whenever an event is added or changes status.
+                ttl=VOLATILE.ttl,
             )
 
         return event_list
@@ -101,7 +162,8 @@ class EventService:
 
         event = await self._repository.get_event(event_id)
         if event:
-            await self._cache_set(cache_key, event.model_dump(), ttl=600)  # 10 minutes
+            policy = event_policy(event.status, event.date)
+            await self._cache_set(cache_key, event.model_dump(), ttl=policy.ttl)
         return event
 
     async def list_upcoming_events(self) -> list[EventListItem]:
@@ -162,16 +224,13 @@ class EventService:
         event_list = list(events)
 
         # Get total count with same filters (but no pagination)
-        all_matching = await self._repository.search_events(
+        total = await self._repository.count_search_events(
             q=q,
             year=year,
             location=location,
             event_type=event_type,
             status=status,
-            limit=None,
-            offset=None,
         )
-        total = len(list(all_matching))
         has_more = (offset + limit) < total
 
         return PaginatedEventsResponse(
@@ -182,11 +241,48 @@ class EventService:
             has_more=has_more,
         )
 
-    async def get_filter_options(self) -> tuple[list[int], list[str]]:
-        """Get available filter options (years and locations)."""
-        years = await self._repository.get_unique_years()
-        locations = await self._repository.get_unique_locations()
-        return years, locations
+    async def get_filter_facets(
+        self,
+        *,
+        q: str | None = None,
+        year: int | None = None,
+        location: str | None = None,
+        event_type: str | None = None,
+        status: str | None = None,
+    ) -> EventFacets:
+        """Return facet counts for the search filters, each conditioned on the others."""
+        filters: dict[str, int | str | None] = {
+            "year": year,
+            "location": location,
+            "event_type": event_type,
+            "status": status,
+        }
+        # Keys carry the facet table version, so event loads never serve stale counts.
+        version = await self._repository.get_event_facet_version()
+        cache_key = (
+            "events:facets:"
+            + version.isoformat()
+            + "".join(f":{name}={value or '*'}" for name, value in filters.items())
+            if version is not None and not q
+            else None
+        )
+        if cache_key is not None:
+            cached = await self._cache_get(cache_key)
+            if isinstance(cached, dict):
+                try:
+                    return EventFacets.model_validate(cached)
+                except ValidationError as exc:
+                    logger.warning(
+                        "Failed to deserialize cached event facets for key %s: %s",
+                        cache_key,
+                        exc,
+                    )
+
+        cells = await self._repository.get_event_facet_cells(q=q)
+        facets = _build_event_facets(cells, filters)
+        if cache_key is not None:
+            await self._cache_set(cache_key, facets.model_dump(), ttl=3600)
+        return facets
 
 
 async def get_event_service(
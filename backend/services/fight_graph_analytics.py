@@ -0,0 +1,485 @@
+"""Network analytics over the fight graph using a compact CSR adjacency.
+
+The whole-roster opponent graph is loaded from ``fight_graph_edges`` into
+NumPy CSR arrays (``indptr``/``indices``/``weights``).  Betweenness and
+eigenvector centrality plus label-propagation communities are precomputed
+once per data version; shortest opponent paths run a vectorised BFS on demand.
+
+Betweenness uses Brandes' algorithm from a fixed, seeded sample of pivot
+fighters (exact when the roster is smaller than the sample), which keeps a
+rebuild to well under a second on the full UFC roster.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Literal, Protocol
+
+import numpy as np
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.db.connection import get_db
+from backend.db.repositories.fight_graph_repository import FightGraphRepository
+from backend.schemas.fight_graph import (
+    FightGraphCentralityEntry,
+    FightGraphCentralityResponse,
+    FightGraphCommunitiesResponse,
+    FightGraphCommunity,
+    FightGraphPathResponse,
+    FightGraphPathStep,
+)
+
+logger = logging.getLogger(__name__)
+
+CentralityMetric = Literal["betweenness", "eigenvector", "degree"]
+
+BETWEENNESS_SAMPLE_SIZE = 256
+_EIGENVECTOR_MAX_ITERATIONS = 200
+_EIGENVECTOR_TOLERANCE = 1e-9
+_LABEL_PROPAGATION_MAX_ITERATIONS = 30
+
+
+class FightGraphAdjacencySource(Protocol):
+    """Repository surface needed to build the analytics snapshot."""
+
+    async def get_fight_graph_version(self) -> tuple[int, int]:
+        """Return a fingerprint that changes whenever the edge index is rebuilt."""
+
+    async def get_fight_graph_adjacency(
+        self,
+    ) -> tuple[list[tuple[str, str, int]], list[tuple[str, str, str | None]]]:
+        """Return ``(a, b, fights)`` edges and ``(id, name, division)`` fighters."""
+
+
+@dataclass(slots=True)
+class FightGraphSnapshot:
+    """Immutable CSR adjacency plus the metrics derived from it."""
+
+    version: str
+    computed_at: datetime
+    fighter_ids: list[str]
+    names: list[str]
+    divisions: list[str | None]
+    index: dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    degree: np.ndarray = field(init=False)
+    betweenness: np.ndarray = field(init=False)
+    eigenvector: np.ndarray = field(init=False)
+    communities: np.ndarray = field(init=False)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.fighter_ids)
+
+    def neighbours(self, node: int) -> np.ndarray:
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def edge_weight(self, source: int, target: int) -> int:
+        row = self.neighbours(source)
+        position = int(np.searchsorted(row, target))
+        if position < row.size and row[position] == target:
+            return int(self.weights[self.indptr[source] + position])
+        return 0
+
+
+def _build_csr(
+    edges: Sequence[tuple[int, int, int]], node_count: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return symmetric CSR arrays with column indices sorted within each row."""
+
+    if not edges:
+        return (
+            np.zeros(node_count + 1, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+        )
+    edge_array = np.asarray(edges, dtype=np.int64)
+    rows = np.concatenate([edge_array[:, 0], edge_array[:, 1]])
+    cols = np.concatenate([edge_array[:, 1], edge_array[:, 0]])
+    weights = np.concatenate([edge_array[:, 2], edge_array[:, 2]])
+    order = np.lexsort((cols, rows))
+    counts = np.bincount(rows, minlength=node_count)
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    return indptr, cols[order], weights[order]
+
+
+def _expand_frontier(
+    indptr: np.ndarray, indices: np.ndarray, frontier: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(source, target)`` arrays for every edge leaving ``frontier``."""
+
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    row_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.arange(total) - row_offsets + np.repeat(starts, counts)
+    return np.repeat(frontier, counts), indices[positions]
+
+
+def _betweenness(
+    indptr: np.ndarray, indices: np.ndarray, node_count: int, *, samples: int
+) -> np.ndarray:
+    """Approximate normalised betweenness with level-synchronous Brandes passes."""
+
+    scores = np.zeros(node_count, dtype=np.float64)
+    if node_count < 3:
+        return scores
+
+    if samples >= node_count:
+        pivots = np.arange(node_count)
+    else:
+        pivots = np.random.default_rng(0).choice(node_count, size=samples, replace=False)
+
+    for pivot in pivots:
+        distance = np.full(node_count, -1, dtype=np.int64)
+        sigma = np.zeros(node_count, dtype=np.float64)
+        distance[pivot] = 0
+        sigma[pivot] = 1.0
+        frontier = np.array([pivot], dtype=np.int64)
+        level = 0
+        tree_edges: list[tuple[np.ndarray, np.ndarray]] = []
+        while frontier.size:
+            sources, targets = _expand_frontier(indptr, indices, frontier)
+            undiscovered = distance[targets] == -1
+            distance[targets[undiscovered]] = level + 1
+            on_path = distance[targets] == level + 1
+            sources, targets = sources[on_path], targets[on_path]
+            np.add.at(sigma, targets, sigma[sources])
+            tree_edges.append((sources, targets))
+            frontier = np.unique(targets)
+            level += 1
+
+        delta = np.zeros(node_count, dtype=np.float64)
+        for sources, targets in reversed(tree_edges):
+            np.add.at(delta, sources, sigma[sources] / sigma[targets] * (1.0 + delta[targets]))
+        delta[pivot] = 0.0
+        scores += delta
+
+    # Undirected pairs are counted from both ends; rescale the sample to all pivots.
+    scores *= node_count / len(pivots) / 2.0
+    return scores / ((node_count - 1) * (node_count - 2) / 2.0)
+
+
+def _eigenvector(indptr: np.ndarray, indices: np.ndarray, node_count: int) -> np.ndarray:
+    """Return eigenvector centrality scaled so the most central fighter scores 1."""
+
+    if node_count == 0 or indices.size == 0:
+        return np.zeros(node_count, dtype=np.float64)
+
+    rows = np.repeat(np.arange(node_count), np.diff(indptr))
+    vector = np.full(node_count, 1.0 / node_count)
+    for _ in range(_EIGENVECTOR_MAX_ITERATIONS):
+        # Adding the identity shifts the spectrum so bipartite cores still converge.
+        updated = np.bincount(rows, weights=vector[indices], minlength=node_count) + vector
+        updated /= np.linalg.norm(updated)
+        converged = np.abs(updated - vector).sum() < node_count * _EIGENVECTOR_TOLERANCE
+        vector = updated
+        if converged:
+            break
+    return vector / vector.max()
+
+
+def _label_propagation(
+    indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, node_count: int
+) -> np.ndarray:
+    """Assign community labels with weighted, semi-synchronous label propagation."""
+
+    labels = np.arange(node_count, dtype=np.int64)
+    if indices.size == 0:
+        return labels
+
+    rows = np.repeat(np.arange(node_count), np.diff(indptr))
+    rng = np.random.default_rng(0)
+    for _ in range(_LABEL_PROPAGATION_MAX_ITERATIONS):
+        # Score every (fighter, neighbour label) pair; a fighter's own label gets
+        # a tiny bonus so ties keep the current assignment and the loop settles.
+        pair_rows = np.concatenate([rows, np.arange(node_count)])
+        pair_labels = np.concatenate([labels[indices], labels])
+        pair_weights = np.concatenate([weights.astype(np.float64), np.full(node_count, 1e-6)])
+        keys, inverse = np.unique(pair_rows * node_count + pair_labels, return_inverse=True)
+        totals = np.bincount(inverse, weights=pair_weights)
+        key_rows = keys // node_count
+        order = np.lexsort((keys % node_count, -totals, key_rows))
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = key_rows[order][1:] != key_rows[order][:-1]
+        best = keys[order][first] % node_count
+
+        # Updating a random half per round avoids the oscillation of fully
+        # synchronous propagation on bipartite structures.
+        update = rng.random(node_count) < 0.5
+        proposed = np.where(update, best, labels)
+        if np.array_equal(proposed, labels) and np.array_equal(best, labels):
+            break
+        labels = proposed
+
+    _, compact = np.unique(labels, return_inverse=True)
+    return compact
+
+
+def build_fight_graph_snapshot(
+    edges: Sequence[tuple[str, str, int]],
+    fighters: Sequence[tuple[str, str, str | None]],
+    *,
+    version: str,
+    betweenness_samples: int = BETWEENNESS_SAMPLE_SIZE,
+) -> FightGraphSnapshot:
+    """Build the CSR adjacency and precompute every per-fighter metric."""
+
+    fighter_ids = [fighter_id for fighter_id, _, _ in fighters]
+    index = {fighter_id: position for position, fighter_id in enumerate(fighter_ids)}
+    indexed_edges = [
+        (index[a], index[b], fights)
+        for a, b, fights in edges
+        if a in index and b in index and a != b
+    ]
+    node_count = len(fighter_ids)
+    indptr, indices, weights = _build_csr(indexed_edges, node_count)
+
+    snapshot = FightGraphSnapshot(
+        version=version,
+        computed_at=datetime.now(UTC),
+        fighter_ids=fighter_ids,
+        names=[name for _, name, _ in fighters],
+        divisions=[division for _, _, division in fighters],
+        index=index,
+        indptr=indptr,
+        indices=indices,
+        weights=weights,
+    )
+    snapshot.degree = np.diff(indptr)
+    snapshot.betweenness = _betweenness(
+        indptr, indices, node_count, samples=betweenness_samples
+    )
+    snapshot.eigenvector = _eigenvector(indptr, indices, node_count)
+    snapshot.communities = _label_propagation(indptr, indices, weights, node_count)
+    return snapshot
+
+
+def shortest_opponent_path(
+    snapshot: FightGraphSnapshot, source: int, target: int
+) -> list[int] | None:
+    """Return node indices on a fewest-hops path from ``source`` to ``target``."""
+
+    if source == target:
+        return [source]
+
+    parent = np.full(snapshot.node_count, -1, dtype=np.int64)
+    parent[source] = source
+    frontier = np.array([source], dtype=np.int64)
+    while frontier.size and parent[target] == -1:
+        sources, targets = _expand_frontier(snapshot.indptr, snapshot.indices, frontier)
+        undiscovered = parent[targets] == -1
+        targets, first = np.unique(targets[undiscovered], return_index=True)
+        parent[targets] = sources[undiscovered][first]
+        frontier = targets
+
+    if parent[target] == -1:
+        return None
+    path = [target]
+    while path[-1] != source:
+        path.append(int(parent[path[-1]]))
+    return path[::-1]
+
+
+class FightGraphAnalyticsEngine:
+    """Hold the current analytics snapshot and rebuild it when the data changes."""
+
+    def __init__(self, *, betweenness_samples: int = BETWEENNESS_SAMPLE_SIZE) -> None:
+        self._betweenness_samples = betweenness_samples
+        self._snapshot: FightGraphSnapshot | None = None
+        self._lock = asyncio.Lock()
+
+    async def snapshot(self, source: FightGraphAdjacencySource) -> FightGraphSnapshot:
+        """Return the snapshot for the current data version, rebuilding if stale."""
+
+        max_id, row_count = await source.get_fight_graph_version()
+        version = f"{max_id}:{row_count}"
+        if self._snapshot is not None and self._snapshot.version == version:
+            return self._snapshot
+
+        async with self._lock:
+            if self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+            edges, fighters = await source.get_fight_graph_adjacency()
+            # The numeric work is CPU bound; keep it off the event loop.
+            self._snapshot = await asyncio.to_thread(
+                build_fight_graph_snapshot,
+                edges,
+                fighters,
+                version=version,
+                betweenness_samples=self._betweenness_samples,
+            )
+            logger.info(
+                "Rebuilt fight graph analytics for version %s (%d fighters)",
+                version,
+                self._snapshot.node_count,
+            )
+            return self._snapshot
+
+
+@lru_cache(maxsize=1)
+def get_fight_graph_analytics_engine() -> FightGraphAnalyticsEngine:
+    """Return the process-wide analytics engine."""
+
+    return FightGraphAnalyticsEngine()
+
+
+def _entry(snapshot: FightGraphSnapshot, node: int) -> FightGraphCentralityEntry:
+    return FightGraphCentralityEntry(
+        fighter_id=snapshot.fighter_ids[node],
+        name=snapshot.names[node],
+        division=snapshot.divisions[node],
+        degree=int(snapshot.degree[node]),
+        betweenness=round(float(snapshot.betweenness[node]), 6),
+        eigenvector=round(float(snapshot.eigenvector[node]), 6),
+        community_id=int(snapshot.communities[node]),
+    )
+
+
+class FightGraphAnalyticsService:
+    """Answer centrality, community and opponent-path queries from the snapshot."""
+
+    def __init__(
+        self,
+        repository: FightGraphAdjacencySource,
+        engine: FightGraphAnalyticsEngine,
+    ) -> None:
+        self._repository = repository
+        self._engine = engine
+
+    async def get_centrality(
+        self,
+        *,
+        metric: CentralityMetric = "betweenness",
+        division: str | None = None,
+        limit: int = 25,
+    ) -> FightGraphCentralityResponse:
+        """Return the most central fighters by ``metric``, optionally within a division."""
+
+        snapshot = await self._engine.snapshot(self._repository)
+        scores = getattr(snapshot, metric)
+        candidates = np.arange(snapshot.node_count)
+        if division:
+            mask = np.array([value == division for value in snapshot.divisions], dtype=bool)
+            candidates = candidates[mask] if mask.size else candidates
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")][:limit]
+        return FightGraphCentralityResponse(
+            metric=metric,
+            fighters=[_entry(snapshot, int(node)) for node in ranked],
+            node_count=snapshot.node_count,
+            data_version=snapshot.version,
+            computed_at=snapshot.computed_at,
+        )
+
+    async def get_communities(
+        self,
+        *,
+        min_size: int = 3,
+        limit: int = 20,
+        members_per_community: int = 10,
+    ) -> FightGraphCommunitiesResponse:
+        """Return the largest communities with their most central members."""
+
+        snapshot = await self._engine.snapshot(self._repository)
+        sizes = np.bincount(snapshot.communities) if snapshot.node_count else np.empty(0)
+        eligible = np.flatnonzero(sizes >= min_size)
+        ordered = eligible[np.argsort(-sizes[eligible], kind="stable")][:limit]
+
+        communities: list[FightGraphCommunity] = []
+        for community_id in ordered:
+            members = np.flatnonzero(snapshot.communities == community_id)
+            top_members = members[np.argsort(-snapshot.eigenvector[members], kind="stable")]
+            division_counts = Counter(
+                snapshot.divisions[node] for node in members if snapshot.divisions[node]
+            )
+            communities.append(
+                FightGraphCommunity(
+                    community_id=int(community_id),
+                    size=int(sizes[community_id]),
+                    dominant_division=(
+                        division_counts.most_common(1)[0][0] if division_counts else None
+                    ),
+                    members=[
+                        _entry(snapshot, int(node))
+                        for node in top_members[:members_per_community]
+                    ],
+                )
+            )
+
+        return FightGraphCommunitiesResponse(
+            communities=communities,
+            community_count=int(eligible.size),
+            data_version=snapshot.version,
+            computed_at=snapshot.computed_at,
+        )
+
+    async def get_shortest_path(self, source_id: str, target_id: str) -> FightGraphPathResponse:
+        """Return the fewest-opponents chain linking two fighters.
+
+        Raises:
+            KeyError: If either fighter has no completed bouts in the graph.
+        """
+
+        snapshot = await self._engine.snapshot(self._repository)
+        missing = [
+            fighter_id for fighter_id in (source_id, target_id) if fighter_id not in snapshot.index
+        ]
+        if missing:
+            raise KeyError(missing[0])
+
+        path = shortest_opponent_path(
+            snapshot, snapshot.index[source_id], snapshot.index[target_id]
+        )
+        steps: list[FightGraphPathStep] = []
+        for position, node in enumerate(path or []):
+            steps.append(
+                FightGraphPathStep(
+                    fighter_id=snapshot.fighter_ids[node],
+                    name=snapshot.names[node],
+                    division=snapshot.divisions[node],
+                    fights_with_previous=(
+                        snapshot.edge_weight(path[position - 1], node) if position else None
+                    ),
+                )
+            )
+        return FightGraphPathResponse(
+            source=source_id,
+            target=target_id,
+            degrees=len(path) - 1 if path is not None else None,
+            path=steps,
+            data_version=snapshot.version,
+            computed_at=snapshot.computed_at,
+        )
+
+
+def get_fight_graph_analytics_service(
+    session: AsyncSession = Depends(get_db),
+) -> FightGraphAnalyticsService:
+    """FastAPI dependency wiring the repository to the process-wide engine."""
+
+    return FightGraphAnalyticsService(
+        FightGraphRepository(session), get_fight_graph_analytics_engine()
+    )
+
+
+__all__ = [
+    "FightGraphAnalyticsEngine",
+    "FightGraphAnalyticsService",
+    "FightGraphSnapshot",
+    "build_fight_graph_snapshot",
+    "get_fight_graph_analytics_engine",
+    "get_fight_graph_analytics_service",
+    "shortest_opponent_path",
+]
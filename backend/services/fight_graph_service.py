@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from collections import Counter
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
 from typing import Any
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.cache import CacheClient, get_cache_client, graph_key
-from backend.db.connection import get_db
-from backend.db.repositories.fight_graph_repository import FightGraphRepository
+from backend.db.connection import get_async_session_context, get_db
+from backend.db.repositories.fight_graph_repository import (
+    FightGraphRepository,
+    fight_graph_metadata,
+)
 from backend.schemas.fight_graph import (
     FightGraphLink,
     FightGraphNode,
@@ -55,16 +60,6 @@ def _derive_division_breakdown(nodes: list[FightGraphNode]) -> list[dict[str, An
     return breakdown
 
 
-def _derive_degree_map(links: list[FightGraphLink]) -> dict[str, int]:
-    """Return a mapping of fighter IDs to their degree within the graph."""
-
-    degree_map: dict[str, int] = {}
-    for link in links:
-        degree_map[link.source] = degree_map.get(link.source, 0) + 1
-        degree_map[link.target] = degree_map.get(link.target, 0) + 1
-    return degree_map
-
-
 def _top_rivalries(
     links: list[FightGraphLink],
     nodes_by_id: dict[str, FightGraphNode],
@@ -95,46 +90,96 @@ def _top_rivalries(
     return rivalries
 
 
-def _augment_fight_graph_metadata(graph: FightGraphResponse) -> FightGraphResponse:
-    """Attach derived insights to a fight graph response before caching."""
+class _FightGraphInsights:
+    """Accumulate graph insights incrementally as nodes and links are produced.
+
+    Only nodes (bounded by the request limit) and the handful of busiest links
+    are retained, so streamed graphs keep memory flat regardless of link count.
+    """
+
+    def __init__(self, *, rivalry_limit: int = 5) -> None:
+        self._nodes: list[FightGraphNode] = []
+        self._degree_map: dict[str, int] = {}
+        self._busiest_links: list[FightGraphLink] = []
+        self._rivalry_limit = rivalry_limit
+        self.link_count = 0
+        self.earliest_event: date | None = None
+        self.latest_event: date | None = None
+
+    def add_node(self, node: FightGraphNode) -> None:
+        self._nodes.append(node)
+
+    def add_link(self, link: FightGraphLink) -> None:
+        self.link_count += 1
+        self._degree_map[link.source] = self._degree_map.get(link.source, 0) + 1
+        self._degree_map[link.target] = self._degree_map.get(link.target, 0) + 1
+
+        busiest = self._busiest_links
+        if len(busiest) < self._rivalry_limit or link.fights > busiest[-1].fights:
+            # Insert after existing links with the same count to mirror a stable sort.
+            position = len(busiest)
+            while position > 0 and busiest[position - 1].fights < link.fights:
+                position -= 1
+            busiest.insert(position, link)
+            del busiest[self._rivalry_limit :]
+
+        if link.first_event_date is not None and (
+            self.earliest_event is None or link.first_event_date < self.earliest_event
+        ):
+            self.earliest_event = link.first_event_date
+        if link.last_event_date is not None and (
+            self.latest_event is None or link.last_event_date > self.latest_event
+        ):
+            self.latest_event = link.last_event_date
+
+    def build(self) -> dict[str, Any]:
+        """Return the ``insights`` metadata block for the accumulated graph."""
+
+        if not self._nodes:
+            return {}
+
+        nodes_by_id = {node.fighter_id: node for node in self._nodes}
+        total_fights = sum(node.total_fights for node in self._nodes)
+        top_hubs = sorted(
+            (
+                {
+                    "fighter_id": node.fighter_id,
+                    "name": node.name,
+                    "division": node.division,
+                    "total_fights": node.total_fights,
+                    "degree": self._degree_map.get(node.fighter_id, 0),
+                }
+                for node in self._nodes
+            ),
+            key=lambda entry: (entry["total_fights"], entry["degree"]),
+            reverse=True,
+        )[:5]
+
+        return {
+            "average_fights_per_fighter": round(total_fights / max(1, len(self._nodes)), 2),
+            "network_density": _calculate_network_density(len(self._nodes), self.link_count),
+            "division_breakdown": _derive_division_breakdown(self._nodes),
+            "top_fighters": top_hubs,
+            "busiest_rivalries": _top_rivalries(
+                self._busiest_links, nodes_by_id, limit=self._rivalry_limit
+            ),
+        }
 
-    if not graph.nodes:
-        metadata = dict(graph.metadata)
-        metadata.setdefault("insights", {})
-        metadata.setdefault("generated_at", datetime.now(UTC).isoformat())
-        return FightGraphResponse(nodes=graph.nodes, links=graph.links, metadata=metadata)
 
-    nodes_by_id: dict[str, FightGraphNode] = {node.fighter_id: node for node in graph.nodes}
-    total_fights = sum(node.total_fights for node in graph.nodes)
-    average_fights = round(total_fights / max(1, len(graph.nodes)), 2)
-    density = _calculate_network_density(len(graph.nodes), len(graph.links))
-    degree_map = _derive_degree_map(graph.links)
+def _augment_fight_graph_metadata(graph: FightGraphResponse) -> FightGraphResponse:
+    """Attach derived insights to a fight graph response before caching."""
 
-    top_hubs = sorted(
-        (
-            {
-                "fighter_id": node.fighter_id,
-                "name": node.name,
-                "division": node.division,
-                "total_fights": node.total_fights,
-                "degree": degree_map.get(node.fighter_id, 0),
-            }
-            for node in graph.nodes
-        ),
-        key=lambda entry: (entry["total_fights"], entry["degree"]),
-        reverse=True,
-    )[:5]
+    insights = _FightGraphInsights()
+    for node in graph.nodes:
+        insights.add_node(node)
+    for link in graph.links:
+        insights.add_link(link)
 
     metadata = dict(graph.metadata)
-    insights: dict[str, Any] = {
-        "average_fights_per_fighter": average_fights,
-        "network_density": density,
-        "division_breakdown": _derive_division_breakdown(graph.nodes),
-        "top_fighters": top_hubs,
-        "busiest_rivalries": _top_rivalries(graph.links, nodes_by_id),
-    }
-
-    metadata["insights"] = insights
+    if graph.nodes:
+        metadata["insights"] = insights.build()
+    else:
+        metadata.setdefault("insights", {})
     metadata.setdefault("generated_at", datetime.now(UTC).isoformat())
 
     return FightGraphResponse(nodes=graph.nodes, links=graph.links, metadata=metadata)
@@ -212,6 +257,85 @@ class FightGraphService(CacheableService):
         )
         return _augment_fight_graph_metadata(raw_graph)
 
+    async def stream_fight_graph(
+        self,
+        *,
+        division: str | None = None,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        limit: int = 200,
+        include_upcoming: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield graph records in order: every node, then every link, then metadata.
+
+        Each record is ``{"type": "node" | "link" | "metadata", "data": ...}``.
+        Streamed graphs bypass the response cache because they are intended for
+        limits too large to buffer.
+        """
+
+        insights = _FightGraphInsights()
+        nodes = await self._repository.get_fight_graph_nodes(
+            division=division,
+            start_year=start_year,
+            end_year=end_year,
+            limit=limit,
+            include_upcoming=include_upcoming,
+        )
+        for node in nodes:
+            insights.add_node(node)
+            yield {"type": "node", "data": node.model_dump(mode="json")}
+
+        async for link in self._repository.iter_fight_graph_links(
+            [node.fighter_id for node in nodes],
+            start_year=start_year,
+            end_year=end_year,
+            include_upcoming=include_upcoming,
+        ):
+            insights.add_link(link)
+            yield {"type": "link", "data": link.model_dump(mode="json")}
+
+        metadata = fight_graph_metadata(
+            division=division,
+            start_year=start_year,
+            end_year=end_year,
+            limit=limit,
+            include_upcoming=include_upcoming,
+            node_count=len(nodes),
+            link_count=insights.link_count,
+            earliest_event=insights.earliest_event,
+            latest_event=insights.latest_event,
+        )
+        metadata["insights"] = insights.build()
+        metadata["generated_at"] = datetime.now(UTC).isoformat()
+        yield {"type": "metadata", "data": metadata}
+
+
+async def stream_fight_graph_ndjson(
+    *,
+    division: str | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    limit: int = 200,
+    include_upcoming: bool = False,
+) -> AsyncIterator[bytes]:
+    """Encode :meth:`FightGraphService.stream_fight_graph` as newline-delimited JSON.
+
+    The generator opens its own session: FastAPI tears down ``yield``
+    dependencies before a streaming body is consumed, so the request-scoped
+    session from :func:`get_db` is already closed by then.
+    """
+
+    async with get_async_session_context() as session:
+        service = FightGraphService(FightGraphRepository(session))
+        async for record in service.stream_fight_graph(
+            division=division,
+            start_year=start_year,
+            end_year=end_year,
+            limit=limit,
+            include_upcoming=include_upcoming,
+        ):
+            yield (json.dumps(record, default=str) + "\n").encode("utf-8")
+
 
 def get_fight_graph_service(
     session: AsyncSession = Depends(get_db),
@@ -223,4 +347,4 @@ def get_fight_graph_service(
     return FightGraphService(repository, cache=cache)
 
 
-__all__ = ["FightGraphService", "get_fight_graph_service"]
+__all__ = ["FightGraphService", "get_fight_graph_service", "stream_fight_graph_ndjson"]
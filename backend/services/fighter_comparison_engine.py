@@ -0,0 +1,265 @@
+"""Vectorised head-to-head comparison engine backed by a cached NumPy matrix.
+
+The engine keeps one ``float64`` row per fighter holding the numeric career
+metrics stored in ``fighter_stats``.  Percentiles within the full roster and
+within each fighter's division, plus deltas between the compared fighters, are
+computed in a single broadcast pass instead of being derived client-side from
+the raw string payloads.
+
+The matrix lives for the lifetime of the process.  Loaders stamp each fighter
+whose stats they rewrite with a new stats data version, so the engine tracks
+the highest version it has seen and only reloads fighters stamped after that
+watermark.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+from backend.db.repositories.fighter.types import ComparisonMetricRow
+from backend.schemas.fighter import ComparisonMetricContext
+
+logger = logging.getLogger(__name__)
+
+COMPARISON_METRICS: tuple[str, ...] = (
+    "sig_strikes_landed_per_min",
+    "sig_strikes_absorbed_per_min",
+    "sig_strikes_accuracy_pct",
+    "sig_strikes_defense_pct",
+    "takedowns_avg",
+    "takedown_accuracy_pct",
+    "takedown_defense_pct",
+    "avg_submissions",
+    "avg_knockdowns",
+    "win_pct",
+    "finish_rate_pct",
+    "longest_win_streak",
+    "avg_fight_duration_seconds",
+)
+"""Career metrics tracked by the comparison matrix (``fighter_stats.metric`` names)."""
+
+_NO_DIVISION = -1
+
+
+@runtime_checkable
+class ComparisonMetricSource(Protocol):
+    """Repository surface used to build and refresh the comparison matrix."""
+
+    async def get_comparison_stats_watermark(self) -> int:
+        """Return the current stats data version."""
+
+    async def get_comparison_metric_rows(
+        self,
+        metrics: Sequence[str],
+        *,
+        since_version: int | None = None,
+    ) -> list[ComparisonMetricRow]:
+        """Return raw metric rows, optionally limited to recently written fighters."""
+
+
+def _parse_metric_value(raw: str) -> float:
+    """Coerce a stored stat string (``"45%"``, ``"3.2"``, ``"--"``) to a float or NaN."""
+
+    cleaned = raw.replace("%", "").strip()
+    if not cleaned or cleaned == "--":
+        return np.nan
+    try:
+        return float(cleaned)
+    except ValueError:
+        return np.nan
+
+
+def _rounded(value: float) -> float | None:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+class FighterComparisonEngine:
+    """Hold the per-fighter metric matrix and answer comparison queries."""
+
+    def __init__(self, metrics: Sequence[str] = COMPARISON_METRICS) -> None:
+        self._metrics: tuple[str, ...] = tuple(metrics)
+        self._metric_index = {metric: index for index, metric in enumerate(self._metrics)}
+        self._row_index: dict[str, int] = {}
+        self._division_lookup: dict[str, int] = {}
+        self._division_codes = np.empty(0, dtype=np.int32)
+        self._values = np.empty((0, len(self._metrics)), dtype=np.float64)
+        self._watermark: int | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def metrics(self) -> tuple[str, ...]:
+        return self._metrics
+
+    @property
+    def fighter_count(self) -> int:
+        return len(self._row_index)
+
+    async def ensure_current(self, source: ComparisonMetricSource) -> None:
+        """Build the matrix on first use and fold in any stats written since.
+
+        The version probe runs without the lock, so concurrent requests only
+        queue behind one another while the matrix is actually being updated.
+        """
+
+        if self._watermark is not None and (
+            await source.get_comparison_stats_watermark() == self._watermark
+        ):
+            return
+        async with self._lock:
+            # Re-probe: another request may have caught up while we waited.
+            watermark = await source.get_comparison_stats_watermark()
+            if watermark == self._watermark:
+                return
+            if self._watermark is None or watermark < self._watermark:
+                # First load, or the table was truncated/reloaded from scratch.
+                rows = await source.get_comparison_metric_rows(self._metrics)
+                self._reset()
+                self._apply_rows(rows)
+                logger.info(
+                    "Built fighter comparison matrix with %d fighters", self.fighter_count
+                )
+            elif watermark > self._watermark:
+                rows = await source.get_comparison_metric_rows(
+                    self._metrics, since_version=self._watermark
+                )
+                self._apply_rows(rows)
+            self._watermark = watermark
+
+    def _reset(self) -> None:
+        self._row_index = {}
+        self._division_lookup = {}
+        self._division_codes = np.empty(0, dtype=np.int32)
+        self._values = np.empty((0, len(self._metrics)), dtype=np.float64)
+
+    def _division_code(self, division: str | None) -> int:
+        if not division:
+            return _NO_DIVISION
+        return self._division_lookup.setdefault(division, len(self._division_lookup))
+
+    def _apply_rows(self, rows: Iterable[ComparisonMetricRow]) -> None:
+        """Replace matrix rows for every fighter present in ``rows``."""
+
+        vectors: dict[str, np.ndarray] = {}
+        divisions: dict[str, int] = {}
+        for row in rows:
+            column = self._metric_index.get(row.metric)
+            if column is None:
+                continue
+            vector = vectors.get(row.fighter_id)
+            if vector is None:
+                vector = np.full(len(self._metrics), np.nan, dtype=np.float64)
+                vectors[row.fighter_id] = vector
+                divisions[row.fighter_id] = self._division_code(row.division)
+            value = _parse_metric_value(row.value)
+            # The same metric may be stored under several categories; keep the max.
+            if np.isnan(value):
+                continue
+            if np.isnan(vector[column]) or value > vector[column]:
+                vector[column] = value
+
+        if not vectors:
+            return
+
+        new_ids = [fighter_id for fighter_id in vectors if fighter_id not in self._row_index]
+        if new_ids:
+            start = len(self._row_index)
+            for offset, fighter_id in enumerate(new_ids):
+                self._row_index[fighter_id] = start + offset
+            self._values = np.vstack(
+                [self._values, np.full((len(new_ids), len(self._metrics)), np.nan)]
+            )
+            self._division_codes = np.concatenate(
+                [self._division_codes, np.full(len(new_ids), _NO_DIVISION, dtype=np.int32)]
+            )
+
+        positions = np.fromiter(
+            (self._row_index[fighter_id] for fighter_id in vectors),
+            dtype=np.intp,
+            count=len(vectors),
+        )
+        self._values[positions] = np.vstack(list(vectors.values()))
+        self._division_codes[positions] = np.fromiter(
+            (divisions[fighter_id] for fighter_id in vectors),
+            dtype=np.int32,
+            count=len(vectors),
+        )
+
+    def compare(
+        self, fighter_ids: Sequence[str]
+    ) -> dict[str, dict[str, ComparisonMetricContext]]:
+        """Return per-metric percentile and delta context for the requested fighters.
+
+        Percentiles use the mid-rank convention: the share of fighters with a
+        lower value plus half of those tied, over fighters with a recorded value.
+        Deltas compare each fighter against the mean of the other fighters in the
+        request, so a head-to-head pair yields mirrored differences.
+        """
+
+        known_ids = [fighter_id for fighter_id in fighter_ids if fighter_id in self._row_index]
+        if not known_ids:
+            return {}
+
+        positions = np.array([self._row_index[fighter_id] for fighter_id in known_ids])
+        selected = self._values[positions]  # (k, m)
+        values = self._values[np.newaxis, :, :]  # (1, n, m)
+        present = ~np.isnan(self._values)  # (n, m)
+
+        # Mid-rank scores for every selected fighter against the whole roster.
+        scores = (values < selected[:, np.newaxis, :]).astype(np.float64)
+        scores += 0.5 * (values == selected[:, np.newaxis, :])  # (k, n, m)
+
+        selected_divisions = self._division_codes[positions]
+        same_division = (
+            self._division_codes[np.newaxis, :] == selected_divisions[:, np.newaxis]
+        ) & (selected_divisions[:, np.newaxis] != _NO_DIVISION)  # (k, n)
+
+        selected_present = ~np.isnan(selected)
+        others_count = selected_present.sum(axis=0) - selected_present
+        others_total = np.nansum(selected, axis=0) - np.nan_to_num(selected)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roster_pct = 100.0 * scores.sum(axis=1) / present.sum(axis=0)
+            division_pct = (
+                100.0
+                * (scores * same_division[:, :, np.newaxis]).sum(axis=1)
+                / (present[np.newaxis, :, :] & same_division[:, :, np.newaxis]).sum(axis=1)
+            )
+            deltas = selected - others_total / others_count
+
+        roster_pct[~selected_present] = np.nan
+        division_pct[~selected_present] = np.nan
+
+        context: dict[str, dict[str, ComparisonMetricContext]] = {}
+        for row, fighter_id in enumerate(known_ids):
+            context[fighter_id] = {
+                metric: ComparisonMetricContext(
+                    value=_rounded(selected[row, column]),
+                    roster_percentile=_rounded(roster_pct[row, column]),
+                    division_percentile=_rounded(division_pct[row, column]),
+                    delta=_rounded(deltas[row, column]),
+                )
+                for column, metric in enumerate(self._metrics)
+                if selected_present[row, column]
+            }
+        return context
+
+
+@lru_cache(maxsize=1)
+def get_fighter_comparison_engine() -> FighterComparisonEngine:
+    """Return the process-wide comparison engine instance."""
+
+    return FighterComparisonEngine()
+
+
+__all__ = [
+    "COMPARISON_METRICS",
+    "ComparisonMetricSource",
+    "FighterComparisonEngine",
+    "get_fighter_comparison_engine",
+]
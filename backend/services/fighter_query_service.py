@@ -6,7 +6,7 @@ import logging
 import secrets
 from collections.abc import Iterable, Sequence
 from datetime import date
-from typing import Literal, Protocol, runtime_checkable
+from typing import Literal, Protocol, cast, runtime_checkable
 
 from pydantic import ValidationError
 
@@ -42,6 +42,10 @@ from backend.services.fighter_cache import (
     serialize_fighter_list,
     serialize_fighter_search,
 )
+from backend.services.fighter_comparison_engine import (
+    ComparisonMetricSource,
+    FighterComparisonEngine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -115,9 +119,11 @@ class FighterQueryService(CacheableService):
         repository: FighterRepositoryProtocol,
         *,
         cache: CacheClient | None = None,
+        comparison_engine: FighterComparisonEngine | None = None,
     ) -> None:
         super().__init__(cache=cache)
         self._repository = repository
+        self._comparison_engine = comparison_engine
 
     @cached(
         lambda _self,
@@ -359,9 +365,25 @@ class FighterQueryService(CacheableService):
         ),
     )
     async def compare_fighters(self, fighter_ids: Sequence[str]) -> list[FighterComparisonEntry]:
-        """Retrieve comparable stat bundles for the requested fighters."""
+        """Retrieve comparable stat bundles for the requested fighters.
+
+        When a comparison engine is configured each entry is enriched with
+        roster/division percentiles and head-to-head deltas for the numeric
+        career metrics.
+        """
+
+        entries = await self._repository.get_fighters_for_comparison(fighter_ids)
+        if self._comparison_engine is None or not entries:
+            return entries
 
-        return await self._repository.get_fighters_for_comparison(fighter_ids)
+        await self._comparison_engine.ensure_current(
+            cast(ComparisonMetricSource, self._repository)
+        )
+        context = self._comparison_engine.compare([entry.fighter_id for entry in entries])
+        return [
+            entry.model_copy(update={"metric_context": context.get(entry.fighter_id, {})})
+            for entry in entries
+        ]
 
 
 class InMemoryFighterRepository(FighterRepositoryProtocol):
@@ -0,0 +1,209 @@
+"""In-memory top-K leaderboards kept current with ``fighter_stats`` writes.
+
+The index holds one sorted array per (metric, division) pair, plus one per
+metric for the full roster, ordered exactly like the SQL leaderboards: highest
+value first with ties broken by fighter identifier.  Unbounded leaderboard
+requests are answered by slicing those arrays, so paging through any metric,
+division or ``min_fights`` threshold needs no query beyond the version probe.
+
+The arrays are rebuilt whenever the loaders publish a new stats snapshot.
+Between snapshots ``upsert_fighter_stats`` stamps each fighter it rewrites with
+a new stats data version, so the index watermarks that version and re-slots
+only the fighters written since the last check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Protocol, runtime_checkable
+
+from backend.db.repositories.stats_repository import (
+    LEADERBOARD_MIN_FIGHTS,
+    LeaderboardValueRow,
+    build_leaderboards_response,
+    normalize_leaderboard_metrics,
+)
+from backend.schemas.stats import LeaderboardEntry, LeaderboardMetricId, LeaderboardsResponse
+
+logger = logging.getLogger(__name__)
+
+_BoardKey = tuple[str, str | None]
+_SortKey = tuple[float, str]
+
+
+@runtime_checkable
+class LeaderboardValueSource(Protocol):
+    """Repository surface used to build and patch the leaderboard index."""
+
+    async def get_leaderboard_version(self) -> tuple[int, datetime | None]:
+        """Return the stats data version and the snapshot refresh time."""
+
+    async def get_leaderboard_fighters_since(self, since_version: int) -> list[str]:
+        """Return fighters whose stats were written after ``since_version``."""
+
+    async def get_leaderboard_values(
+        self, *, fighter_ids: Sequence[str] | None = None
+    ) -> list[LeaderboardValueRow]:
+        """Return best values per (metric, fighter), optionally for some fighters only."""
+
+
+@dataclass(slots=True)
+class _IndexedFighter:
+    name: str
+    division: str | None
+    fight_count: int
+    values: dict[str, float] = field(default_factory=dict)
+
+
+class LeaderboardIndex:
+    """Hold sorted per-metric leaderboards and serve pages from memory."""
+
+    def __init__(self) -> None:
+        self._boards: dict[_BoardKey, list[_SortKey]] = {}
+        self._fighters: dict[str, _IndexedFighter] = {}
+        self._watermark: int | None = None
+        self._snapshot_at: datetime | None = None
+        self._computed_at: datetime | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def fighter_count(self) -> int:
+        return len(self._fighters)
+
+    def _is_current(self, watermark: int, snapshot_at: datetime | None) -> bool:
+        return self._watermark == watermark and self._snapshot_at == snapshot_at
+
+    async def ensure_current(self, source: LeaderboardValueSource) -> None:
+        """Build the index on first use and re-slot fighters written since.
+
+        The version probe runs without the lock, so concurrent requests only
+        queue behind one another while the index is actually being updated.
+        """
+
+        if self._is_current(*await source.get_leaderboard_version()):
+            return
+        async with self._lock:
+            # Re-probe: another request may have caught up while we waited.
+            watermark, snapshot_at = await source.get_leaderboard_version()
+            if self._is_current(watermark, snapshot_at):
+                return
+            if (
+                self._watermark is None
+                or watermark < self._watermark
+                or snapshot_at != self._snapshot_at
+            ):
+                # First load, a new loader snapshot, or stats were truncated.
+                rows = await source.get_leaderboard_values()
+                self._boards = {}
+                self._fighters = {}
+                self._apply_rows(rows)
+                for board in self._boards.values():
+                    board.sort()
+                self._computed_at = snapshot_at or datetime.now(UTC)
+                logger.info("Built leaderboard index with %d fighters", self.fighter_count)
+            elif watermark > self._watermark:
+                fighter_ids = await source.get_leaderboard_fighters_since(self._watermark)
+                rows = await source.get_leaderboard_values(fighter_ids=fighter_ids)
+                for fighter_id in fighter_ids:
+                    self._remove_fighter(fighter_id)
+                self._apply_rows(rows, keep_sorted=True)
+                self._computed_at = datetime.now(UTC)
+            self._watermark = watermark
+            self._snapshot_at = snapshot_at
+
+    def _board_keys(self, metric_id: str, division: str | None) -> Iterable[_BoardKey]:
+        yield (metric_id, None)
+        if division:
+            yield (metric_id, division)
+
+    def _remove_fighter(self, fighter_id: str) -> None:
+        fighter = self._fighters.pop(fighter_id, None)
+        if fighter is None:
+            return
+        for metric_id, value in fighter.values.items():
+            sort_key = (-value, fighter_id)
+            for board_key in self._board_keys(metric_id, fighter.division):
+                board = self._boards[board_key]
+                position = bisect_left(board, sort_key)
+                if position < len(board) and board[position] == sort_key:
+                    del board[position]
+
+    def _apply_rows(
+        self, rows: Iterable[LeaderboardValueRow], *, keep_sorted: bool = False
+    ) -> None:
+        for row in rows:
+            fighter = self._fighters.get(row.fighter_id)
+            if fighter is None:
+                fighter = _IndexedFighter(row.fighter_name, row.division, row.fight_count)
+                self._fighters[row.fighter_id] = fighter
+            fighter.values[row.metric_id] = row.metric_value
+            sort_key = (-row.metric_value, row.fighter_id)
+            for board_key in self._board_keys(row.metric_id, row.division):
+                board = self._boards.setdefault(board_key, [])
+                if keep_sorted:
+                    insort(board, sort_key)
+                else:
+                    board.append(sort_key)
+
+    def leaderboards(
+        self,
+        *,
+        metrics: Sequence[LeaderboardMetricId] | None,
+        limit: int,
+        offset: int,
+        division: str | None,
+        min_fights: int | None,
+    ) -> LeaderboardsResponse:
+        """Return one page per requested metric with the repository's semantics.
+
+        Ranks are positions in the roster (or division) ordering before the
+        ``min_fights`` threshold is applied, so the threshold filters each page
+        rather than shifting it, matching the SQL leaderboards.
+        """
+
+        metric_ids = normalize_leaderboard_metrics(metrics)
+        threshold = max(min_fights or 0, LEADERBOARD_MIN_FIGHTS)
+        division_key = division.strip() if division is not None and division.strip() else None
+
+        entries_by_metric: dict[str, list[LeaderboardEntry]] = {}
+        for metric_id in metric_ids:
+            board = self._boards.get((metric_id, division_key), [])
+            entries: list[LeaderboardEntry] = []
+            for negated_value, fighter_id in board[offset : offset + limit]:
+                fighter = self._fighters[fighter_id]
+                if fighter.fight_count < threshold:
+                    continue
+                entries.append(
+                    LeaderboardEntry(
+                        fighter_id=fighter_id,
+                        fighter_name=fighter.name,
+                        metric_value=-negated_value,
+                        detail_url=f"/fighters/{fighter_id}",
+                        fight_count=fighter.fight_count or None,
+                    )
+                )
+            entries_by_metric[metric_id] = entries
+
+        return build_leaderboards_response(
+            metric_ids, entries_by_metric, self._computed_at or datetime.now(UTC)
+        )
+
+
+@lru_cache(maxsize=1)
+def get_leaderboard_index() -> LeaderboardIndex:
+    """Return the process-wide leaderboard index instance."""
+
+    return LeaderboardIndex()
+
+
+__all__ = [
+    "LeaderboardIndex",
+    "LeaderboardValueSource",
+    "get_leaderboard_index",
+]
@@ -0,0 +1,220 @@
+"""Vectorised implied-probability and line-movement analytics for bout odds.
+
+BestFightOdds gives each bout an American opening line, an American closing
+range and a mean decimal-odds series.  Everything here works on whole arrays:
+a batch is described by per-bout arrays plus one flat, time-ordered series of
+``(bout index, timestamp_ms, decimal odds)`` samples, so computing analytics
+for the full ``fighter_odds`` table is a handful of NumPy passes.
+
+* ``opening_probability`` / ``closing_probability`` – implied probability of
+  the opening line and of the closing line (falling back to the first and last
+  series samples when a line is missing).
+* ``probability_movement`` – close minus open, in probability points.
+* ``volatility`` – standard deviation of sample-to-sample probability changes.
+* ``steam_moves`` – sample-to-sample jumps of at least
+  :data:`STEAM_MOVE_THRESHOLD` within :data:`STEAM_MOVE_WINDOW_MS`.
+* ``fair_closing_probability`` – the closing probability with the bookmaker
+  margin removed using the opponent's closing line (``None`` without one).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+
+import numpy as np
+
+from backend.db.repositories.odds import OddsLine, OddsPoint, OddsRepository
+
+logger = logging.getLogger(__name__)
+
+STEAM_MOVE_THRESHOLD = 0.03
+STEAM_MOVE_WINDOW_MS = 60 * 60 * 1000
+# Bouts per batch-mode pass; bounds the number of series samples held at once.
+ANALYTICS_CHUNK_SIZE = 2000
+
+
+@dataclass(frozen=True, slots=True)
+class OddsAnalytics:
+    """Implied-probability summary for one bout from one fighter's side."""
+
+    odds_id: str
+    opening_probability: float | None
+    closing_probability: float | None
+    fair_closing_probability: float | None
+    probability_movement: float | None
+    volatility: float | None
+    steam_moves: int
+
+
+def parse_american_odds(values: Sequence[str | None]) -> np.ndarray:
+    """Parse American odds strings (``"+150"``, ``"-120"``, ``"EVEN"``) to floats.
+
+    Unparseable or missing values become ``NaN``.
+    """
+
+    parsed = np.full(len(values), np.nan)
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        text = value.strip().upper()
+        if text in {"EV", "EVEN"}:
+            parsed[index] = 100.0
+            continue
+        try:
+            parsed[index] = float(text)
+        except ValueError:
+            continue
+    # American lines are never inside (-100, 100).
+    parsed[np.abs(parsed) < 100] = np.nan
+    return parsed
+
+
+def american_to_probability(odds: np.ndarray) -> np.ndarray:
+    """Convert American odds to implied probability, propagating ``NaN``."""
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(odds < 0, -odds / (100.0 - odds), 100.0 / (odds + 100.0))
+
+
+def decimal_to_probability(odds: np.ndarray) -> np.ndarray:
+    """Convert decimal odds to implied probability; non-positive prices become ``NaN``."""
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(odds > 1.0, 1.0 / odds, np.nan)
+
+
+def remove_vig(probability: np.ndarray, opponent_probability: np.ndarray) -> np.ndarray:
+    """Normalise a two-way market so both sides sum to one."""
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return probability / (probability + opponent_probability)
+
+
+def compute_odds_analytics(
+    odds_ids: Sequence[str],
+    opening_odds: Sequence[str | None],
+    closing_odds: Sequence[str | None],
+    opponent_closing_odds: Sequence[str | None],
+    series_index: np.ndarray,
+    series_timestamps: np.ndarray,
+    series_odds: np.ndarray,
+) -> list[OddsAnalytics]:
+    """Compute analytics for every bout in one vectorised pass.
+
+    ``series_index`` holds the position in ``odds_ids`` of each sample, and
+    the three series arrays must be sorted by bout and then by timestamp.
+    """
+
+    count = len(odds_ids)
+    series_index = np.asarray(series_index, dtype=np.intp)
+    probabilities = decimal_to_probability(np.asarray(series_odds, dtype=np.float64))
+    valid = ~np.isnan(probabilities)
+    series_index = series_index[valid]
+    probabilities = probabilities[valid]
+    timestamps = np.asarray(series_timestamps, dtype=np.float64)[valid]
+
+    opening = american_to_probability(parse_american_odds(opening_odds))
+    closing = american_to_probability(parse_american_odds(closing_odds))
+    opponent_closing = american_to_probability(parse_american_odds(opponent_closing_odds))
+
+    # Missing lines fall back to the first and last series samples.
+    if len(series_index):
+        bouts, first = np.unique(series_index, return_index=True)
+        last = np.append(first[1:], len(series_index)) - 1
+        opening[bouts] = np.where(np.isnan(opening[bouts]), probabilities[first], opening[bouts])
+        closing[bouts] = np.where(np.isnan(closing[bouts]), probabilities[last], closing[bouts])
+
+    # Sample-to-sample changes that stay within one bout.
+    same_bout = series_index[1:] == series_index[:-1]
+    change_index = series_index[1:][same_bout]
+    changes = np.diff(probabilities)[same_bout]
+    gaps = np.diff(timestamps)[same_bout]
+
+    change_count = np.bincount(change_index, minlength=count)
+    change_sum = np.bincount(change_index, weights=changes, minlength=count)
+    change_squares = np.bincount(change_index, weights=changes * changes, minlength=count)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_change = change_sum / change_count
+        volatility = np.sqrt(np.maximum(change_squares / change_count - mean_change**2, 0.0))
+
+    steam = (np.abs(changes) >= STEAM_MOVE_THRESHOLD) & (gaps <= STEAM_MOVE_WINDOW_MS)
+    steam_moves = np.bincount(change_index[steam], minlength=count)
+
+    movement = closing - opening
+    fair_closing = remove_vig(closing, opponent_closing)
+
+    def value(array: np.ndarray, index: int) -> float | None:
+        item = float(array[index])
+        return None if np.isnan(item) else round(item, 6)
+
+    return [
+        OddsAnalytics(
+            odds_id=odds_id,
+            opening_probability=value(opening, index),
+            closing_probability=value(closing, index),
+            fair_closing_probability=value(fair_closing, index),
+            probability_movement=value(movement, index),
+            volatility=value(volatility, index),
+            steam_moves=int(steam_moves[index]),
+        )
+        for index, odds_id in enumerate(odds_ids)
+    ]
+
+
+def analyze_odds(
+    lines: Sequence[OddsLine], points: Mapping[str, Sequence[OddsPoint]]
+) -> list[OddsAnalytics]:
+    """Flatten ``points`` into series arrays and analyse every line in ``lines``."""
+
+    series = [points.get(line.odds_id, ()) for line in lines]
+    lengths = np.fromiter((len(samples) for samples in series), dtype=np.intp, count=len(series))
+    flat = np.array(
+        [sample for samples in series for sample in samples], dtype=np.float64
+    ).reshape(-1, 2)
+    return compute_odds_analytics(
+        [line.odds_id for line in lines],
+        [line.opening_odds for line in lines],
+        [line.closing_odds for line in lines],
+        [line.opponent_closing_odds for line in lines],
+        np.repeat(np.arange(len(series)), lengths),
+        flat[:, 0],
+        flat[:, 1],
+    )
+
+
+async def refresh_odds_analytics(
+    repository: OddsRepository, *, chunk_size: int = ANALYTICS_CHUNK_SIZE
+) -> int:
+    """Recompute analytics for every odds record; returns the number of rows written."""
+
+    lines = await repository.list_odds_lines()
+    computed_at = datetime.now(UTC)
+    rows: list[dict[str, object]] = []
+    for offset in range(0, len(lines), chunk_size):
+        chunk = lines[offset : offset + chunk_size]
+        points = await repository.get_odds_points([line.odds_id for line in chunk])
+        rows.extend(
+            {**asdict(analytics), "computed_at": computed_at}
+            for analytics in analyze_odds(chunk, points)
+        )
+    await repository.replace_odds_analytics(rows)
+    logger.info("Computed odds analytics for %d records", len(rows))
+    return len(rows)
+
+
+__all__ = [
+    "ANALYTICS_CHUNK_SIZE",
+    "STEAM_MOVE_THRESHOLD",
+    "STEAM_MOVE_WINDOW_MS",
+    "OddsAnalytics",
+    "american_to_probability",
+    "analyze_odds",
+    "compute_odds_analytics",
+    "decimal_to_probability",
+    "parse_american_odds",
+    "refresh_odds_analytics",
+    "remove_vig",
+]
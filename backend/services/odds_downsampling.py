@@ -0,0 +1,81 @@
+"""Largest-Triangle-Three-Buckets downsampling for odds time series.
+
+Line-movement series can hold thousands of samples while a sparkline only
+renders a few hundred pixels.  LTTB keeps the first and last samples and, for
+each of ``max_points - 2`` equal-count buckets in between, the sample forming
+the largest triangle with the previously kept sample and the average of the
+next bucket, which preserves the peaks and reversals a reader cares about.
+
+Bucket averages come from cumulative sums and the anchor-independent part of
+every triangle area is precomputed as whole-array operations, so the
+Python-level loop runs once per output point, doing one small array update,
+rather than once per input sample.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from backend.db.repositories.odds import OddsPoint
+
+MIN_POINTS = 3
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Return the sorted indices of the samples LTTB keeps from ``(x, y)``."""
+
+    n = len(x)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < MIN_POINTS:
+        raise ValueError(f"max_points must be at least {MIN_POINTS}")
+
+    # Interior samples 1..n-2 split into max_points - 2 buckets; the spacing is
+    # at least one sample, so every bucket is non-empty.
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    starts, ends = edges[:-1], edges[1:]
+    sums_x = np.concatenate(([0.0], np.cumsum(x)))
+    sums_y = np.concatenate(([0.0], np.cumsum(y)))
+    counts = ends - starts
+    # The "next bucket" of the last bucket is the final sample itself.
+    next_x = np.append(((sums_x[ends] - sums_x[starts]) / counts)[1:], x[-1])
+    next_y = np.append(((sums_y[ends] - sums_y[starts]) / counts)[1:], y[-1])
+
+    # Twice the triangle area between anchor (ax, ay), candidate (x, y) and the
+    # next bucket's average (nx, ny) expands to |ax*(y - ny) + ay*(nx - x) +
+    # (x*ny - nx*y)|; every term but the anchor is known up front.
+    bucket_of = np.repeat(np.arange(len(starts)), counts)
+    inner = slice(1, n - 1)
+    coef_x = y[inner] - next_y[bucket_of]
+    coef_y = next_x[bucket_of] - x[inner]
+    offset = x[inner] * next_y[bucket_of] - next_x[bucket_of] * y[inner]
+
+    selected = np.empty(max_points, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    ax, ay = x[0], y[0]
+    bounds = zip((starts - 1).tolist(), (ends - 1).tolist(), strict=True)
+    for bucket, (start, end) in enumerate(bounds):
+        areas = np.abs(ax * coef_x[start:end] + ay * coef_y[start:end] + offset[start:end])
+        anchor = start + 1 + int(areas.argmax())
+        selected[bucket + 1] = anchor
+        ax, ay = x[anchor], y[anchor]
+    return selected
+
+
+def downsample_odds_points(
+    points: Sequence[OddsPoint], max_points: int | None
+) -> Sequence[OddsPoint]:
+    """Reduce a time-ordered series to at most ``max_points`` samples."""
+
+    if max_points is None or len(points) <= max_points:
+        return points
+
+    series = np.asarray(points, dtype=np.float64)
+    # Offset timestamps so the area products stay well inside float precision.
+    indices = lttb_indices(series[:, 0] - series[0, 0], series[:, 1], max_points)
+    return [points[index] for index in indices]
+
+
+__all__ = ["MIN_POINTS", "downsample_odds_points", "lttb_indices"]
@@ -2,45 +2,46 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 import logging
 from collections.abc import Iterable, Sequence
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from typing import Any, Protocol
 
 from pydantic import BaseModel
 
 from backend.cache import CacheClient
-from backend.db.models import FighterOdds
-from backend.db.repositories.odds import QUALITY_TIERS
+from backend.db.models import FighterOdds, FighterOddsAnalytics
+from backend.db.repositories.odds import QUALITY_TIERS, OddsCursor, OddsLine, OddsPoint
 from backend.schemas.odds import (
     ClosingRange,
     FighterOddsChartFight,
     FighterOddsChartResponse,
     FighterOddsHistoryEntry,
     FighterOddsHistoryResponse,
+    FightOddsAnalytics,
     FightOddsDetailResponse,
     OddsCoverageStats,
     OddsQualityStatsResponse,
     OddsTimeSeriesPoint,
 )
+from backend.services.cache_policy import fight_policy
 from backend.services.caching import CacheableService, cached
+from backend.services.odds_analytics import OddsAnalytics, analyze_odds
+from backend.services.odds_downsampling import downsample_odds_points
 
 logger = logging.getLogger(__name__)
 
 FIGHTER_HISTORY_TTL = 300  # 5 minutes
 FIGHTER_CHART_TTL = 600  # 10 minutes
-FIGHT_DETAIL_TTL = 900  # 15 minutes
-ODDS_STATS_TTL = 3600  # 1 hour
 
 
 class InvalidQualityTierError(ValueError):
     """Raised when the caller passes an unknown quality tier filter."""
 
 
-def _sanitize_datetime_string(value: str) -> datetime:
-    return datetime.fromisoformat(value.replace("Z", "+00:00"))
-
-
 def _normalize_quality_tier(value: str | None) -> str | None:
     if value is None:
         return None
@@ -52,6 +53,33 @@ def _normalize_quality_tier(value: str | None) -> str | None:
     return normalized
 
 
+class InvalidOddsCursorError(ValueError):
+    """Raised when a history page cursor cannot be decoded."""
+
+
+def _encode_cursor(cursor: OddsCursor) -> str:
+    payload = [
+        cursor.event_date.isoformat() if cursor.event_date else None,
+        cursor.scraped_at.isoformat(),
+        cursor.odds_id,
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(value: str) -> OddsCursor:
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        event_date, scraped_at, odds_id = json.loads(raw)
+        return OddsCursor(
+            date.fromisoformat(event_date) if event_date else None,
+            datetime.fromisoformat(scraped_at),
+            str(odds_id),
+        )
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise InvalidOddsCursorError("cursor is not a valid odds history cursor") from exc
+
+
 def _cache_quality_value(value: str | None) -> str | None:
     return value.strip().lower() if value else None
 
@@ -64,41 +92,15 @@ def _make_closing_range(row: FighterOdds) -> ClosingRange | None:
     return ClosingRange(start=start, end=end or start)
 
 
-def _normalize_time_series(history: Iterable[Any]) -> list[OddsTimeSeriesPoint]:
-    points: list[OddsTimeSeriesPoint] = []
-    for entry in history or []:
-        odds_value = entry.get("odds")
-        try:
-            odds = float(odds_value)
-        except (TypeError, ValueError):
-            continue
-
-        timestamp_ms = entry.get("timestamp_ms")
-        timestamp_str = entry.get("timestamp")
-
-        dt: datetime | None = None
-        if timestamp_str:
-            try:
-                dt = _sanitize_datetime_string(timestamp_str)
-                if timestamp_ms is None:
-                    timestamp_ms = int(dt.timestamp() * 1000)
-            except ValueError:
-                dt = None
-        if dt is None and timestamp_ms is not None:
-            dt = datetime.fromtimestamp(int(timestamp_ms) / 1000, tz=UTC)
-        if dt is None or timestamp_ms is None:
-            continue
-
-        points.append(
-            OddsTimeSeriesPoint(
-                timestamp_ms=int(timestamp_ms),
-                timestamp=dt,
-                odds=odds,
-            )
+def _time_series(points: Iterable[OddsPoint]) -> list[OddsTimeSeriesPoint]:
+    return [
+        OddsTimeSeriesPoint(
+            timestamp_ms=timestamp_ms,
+            timestamp=datetime.fromtimestamp(timestamp_ms / 1000, tz=UTC),
+            odds=odds,
         )
-
-    points.sort(key=lambda point: point.timestamp_ms)
-    return points
+        for timestamp_ms, odds in points
+    ]
 
 
 def _serialize_model(model: BaseModel) -> dict[str, Any]:
@@ -117,28 +119,22 @@ def _deserialize_detail(payload: dict[str, Any]) -> FightOddsDetailResponse:
     return FightOddsDetailResponse(**payload)
 
 
-def _deserialize_stats(payload: dict[str, Any]) -> OddsQualityStatsResponse:
-    return OddsQualityStatsResponse(**payload)
-
-
-def _history_cache_key(fighter_id: str, limit: int, min_quality: str | None) -> str:
+def _history_cache_key(
+    fighter_id: str, limit: int, min_quality: str | None, cursor: str | None
+) -> str:
     # [*TO-DO*] - Cache key normalization: Empty string "" should not collide with None
     # Current: both None and "" become "all", causing potential cache pollution
     # Fix: quality_part = _cache_quality_value(min_quality) or "all"
     quality_part = min_quality or "all"
-    return f"odds:fighter:{fighter_id}:history:{limit}:{quality_part}"
-
-
-def _chart_cache_key(fighter_id: str, limit: int) -> str:
-    return f"odds:fighter:{fighter_id}:chart:{limit}"
+    return f"odds:fighter:{fighter_id}:history:{limit}:{quality_part}:{cursor or 'first'}"
 
 
-def _fight_cache_key(odds_id: str) -> str:
-    return f"odds:fight:{odds_id}"
+def _chart_cache_key(fighter_id: str, limit: int, max_points: int | None) -> str:
+    return f"odds:fighter:{fighter_id}:chart:{limit}:{max_points or 'all'}"
 
 
-def _stats_cache_key() -> str:
-    return "odds:stats:quality"
+def _fight_cache_key(odds_id: str, max_points: int | None) -> str:
+    return f"odds:fight:{odds_id}:{max_points or 'all'}"
 
 
 class OddsRepositoryProtocol(Protocol):
@@ -154,10 +150,17 @@ class OddsRepositoryProtocol(Protocol):
         *,
         limit: int | None = None,
         min_quality: str | None = None,
+        after: OddsCursor | None = None,
     ) -> list[FighterOdds]: ...
 
     async def get_odds_by_id(self, odds_id: str) -> FighterOdds | None: ...
 
+    async def get_odds_points(self, odds_ids: Sequence[str]) -> dict[str, list[OddsPoint]]: ...
+
+    async def list_odds_lines(self, odds_ids: Sequence[str] | None = None) -> list[OddsLine]: ...
+
+    async def get_odds_analytics(self, odds_id: str) -> FighterOddsAnalytics | None: ...
+
     async def get_quality_stats(self) -> dict[str, Any]: ...
 
 
@@ -174,8 +177,8 @@ class OddsQueryService(CacheableService):
         self._repository = repository
 
     @cached(
-        lambda _self, fighter_id, *, limit=100, min_quality=None: _history_cache_key(
-            fighter_id, limit, _cache_quality_value(min_quality)
+        lambda _self, fighter_id, *, limit=100, min_quality=None, cursor=None: _history_cache_key(
+            fighter_id, limit, _cache_quality_value(min_quality), cursor
         ),
         ttl=FIGHTER_HISTORY_TTL,
         serializer=_serialize_model,
@@ -188,15 +191,22 @@ class OddsQueryService(CacheableService):
         *,
         limit: int = 100,
         min_quality: str | None = None,
+        cursor: str | None = None,
     ) -> FighterOddsHistoryResponse | None:
         quality = _normalize_quality_tier(min_quality)
+        after = _decode_cursor(cursor) if cursor else None
         exists = await self._repository.fighter_exists(fighter_id)
         if not exists:
             return None
 
+        # One extra row tells whether another page follows.
         rows = await self._repository.list_fighter_odds(
-            fighter_id, limit=limit, min_quality=quality
+            fighter_id, limit=limit + 1, min_quality=quality, after=after
         )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(OddsCursor.from_row(rows[-1]))
         total = await self._repository.count_fighter_odds(
             fighter_id, min_quality=quality
         )
@@ -220,10 +230,13 @@ class OddsQueryService(CacheableService):
             total_fights=total,
             returned=len(entries),
             odds_history=entries,
+            next_cursor=next_cursor,
         )
 
     @cached(
-        lambda _self, fighter_id, *, limit=20: _chart_cache_key(fighter_id, limit),
+        lambda _self, fighter_id, *, limit=20, max_points=None: _chart_cache_key(
+            fighter_id, limit, max_points
+        ),
         ttl=FIGHTER_CHART_TTL,
         serializer=_serialize_model,
         deserializer=_deserialize_chart,
@@ -234,12 +247,14 @@ class OddsQueryService(CacheableService):
         fighter_id: str,
         *,
         limit: int = 20,
+        max_points: int | None = None,
     ) -> FighterOddsChartResponse | None:
         exists = await self._repository.fighter_exists(fighter_id)
         if not exists:
             return None
 
         rows = await self._repository.list_fighter_odds(fighter_id, limit=limit)
+        points = await self._repository.get_odds_points([row.id for row in rows])
         fights = [
             FighterOddsChartFight(
                 fight_id=row.id,
@@ -251,7 +266,7 @@ class OddsQueryService(CacheableService):
                 closing_odds=row.closing_range_end or row.closing_range_start,
                 quality=row.data_quality_tier or "no_data",
                 num_odds_points=row.num_odds_points,
-                time_series=_normalize_time_series(row.mean_odds_history or []),
+                time_series=_time_series(downsample_odds_points(points[row.id], max_points)),
             )
             for row in rows
         ]
@@ -259,16 +274,28 @@ class OddsQueryService(CacheableService):
         return FighterOddsChartResponse(fighter_id=fighter_id, fights=fights)
 
     @cached(
-        lambda _self, odds_id: _fight_cache_key(odds_id),
-        ttl=FIGHT_DETAIL_TTL,
+        lambda _self, odds_id, *, max_points=None: _fight_cache_key(odds_id, max_points),
+        # Odds series stop moving once the bout has happened.
+        ttl=lambda response: fight_policy(response.event_date).ttl,
         serializer=_serialize_model,
         deserializer=_deserialize_detail,
         deserialize_error_message="Failed to deserialize fight odds detail {key}: {error}",
     )
-    async def get_fight_odds_detail(self, odds_id: str) -> FightOddsDetailResponse | None:
+    async def get_fight_odds_detail(
+        self, odds_id: str, *, max_points: int | None = None
+    ) -> FightOddsDetailResponse | None:
         row = await self._repository.get_odds_by_id(odds_id)
         if row is None:
             return None
+        points = await self._repository.get_odds_points([row.id])
+        # Analytics are precomputed by the odds loader; records loaded since
+        # then are analysed from the series already in hand.
+        analytics: FighterOddsAnalytics | OddsAnalytics | None = (
+            await self._repository.get_odds_analytics(row.id)
+        )
+        if analytics is None:
+            lines = await self._repository.list_odds_lines([row.id])
+            analytics = next(iter(analyze_odds(lines, points)), None)
 
         return FightOddsDetailResponse(
             id=row.id,
@@ -279,21 +306,21 @@ class OddsQueryService(CacheableService):
             event_url=row.event_url,
             opening_odds=row.opening_odds,
             closing_range=_make_closing_range(row),
-            mean_odds_history=_normalize_time_series(row.mean_odds_history or []),
+            mean_odds_history=_time_series(downsample_odds_points(points[row.id], max_points)),
             num_odds_points=row.num_odds_points,
             data_quality=row.data_quality_tier or "no_data",
             scraped_at=row.scraped_at,
             bfo_fighter_url=row.bfo_fighter_url,
+            analytics=(
+                FightOddsAnalytics.model_validate(analytics, from_attributes=True)
+                if analytics is not None
+                else None
+            ),
         )
 
-    @cached(
-        lambda _self: _stats_cache_key(),
-        ttl=ODDS_STATS_TTL,
-        serializer=_serialize_model,
-        deserializer=_deserialize_stats,
-        deserialize_error_message="Failed to deserialize odds stats cache {key}: {error}",
-    )
     async def get_quality_stats(self) -> OddsQualityStatsResponse:
+        # Served from loader-maintained counters, so it is cheap enough to stay
+        # uncached and is current as soon as a load commits.
         stats = await self._repository.get_quality_stats()
         coverage = stats["coverage"]
         quality_distribution = stats["quality_distribution"]
@@ -311,6 +338,7 @@ class OddsQueryService(CacheableService):
 
 
 __all__ = [
+    "InvalidOddsCursorError",
     "InvalidQualityTierError",
     "OddsQueryService",
     "OddsRepositoryProtocol",
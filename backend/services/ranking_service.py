@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Any
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.cache import CacheClient, get_cache_client
 from backend.db.connection import get_db
 from backend.db.repositories.ranking_repository import RankingRepository
 from backend.schemas.ranking import (
@@ -18,21 +22,135 @@ from backend.schemas.ranking import (
     PeakRankingResponse,
     RankingEntry,
     RankingHistoryEntry,
+    RankingHistoryResolution,
     RankingHistoryResponse,
+    RankingHistorySeries,
 )
+from backend.services.caching import CacheableService, cached
 
 logger = logging.getLogger(__name__)
 
+# Keys embed the snapshot version, so entries only need to expire to free memory.
+_CURRENT_RANKINGS_TTL = 3600
 
-class RankingService:
+
+def _rankings_cache_key(source: str, version: datetime | None, *parts: str) -> str | None:
+    """Return a cache key scoped to the ``current_rankings`` snapshot version.
+
+    Without a snapshot the repository reads live tables, so nothing is cached.
+    """
+
+    if version is None:
+        return None
+    return ":".join(["rankings", source, version.isoformat(), *parts])
+
+
+def _deserialize_current_rankings(payload: object) -> CurrentRankingsResponse:
+    """Return a :class:`CurrentRankingsResponse` from cached data."""
+
+    if not isinstance(payload, dict):
+        raise TypeError("Expected cached division rankings to be a mapping")
+    return CurrentRankingsResponse.model_validate(payload)
+
+
+def _deserialize_all_rankings(payload: object) -> AllRankingsResponse:
+    """Return an :class:`AllRankingsResponse` from cached data."""
+
+    if not isinstance(payload, dict):
+        raise TypeError("Expected cached rankings payload to be a mapping")
+    return AllRankingsResponse.model_validate(payload)
+
+
+def _build_division_response(
+    division: str, source: str, rankings_data: list[dict[str, Any]]
+) -> CurrentRankingsResponse:
+    """Convert repository ranking dicts for one division into the response schema."""
+
+    rankings = [
+        RankingEntry(
+            ranking_id=r["ranking_id"],
+            fighter_id=r["fighter_id"],
+            fighter_name=r["fighter_name"],
+            nickname=r.get("nickname"),
+            rank=r["rank"],
+            previous_rank=r.get("previous_rank"),
+            rank_movement=r.get("rank_movement", 0),
+            is_interim=r.get("is_interim", False),
+        )
+        for r in rankings_data
+    ]
+
+    return CurrentRankingsResponse(
+        division=division,
+        source=source,
+        rank_date=rankings_data[0]["rank_date"],
+        rankings=rankings,
+        total_fighters=len(rankings),
+    )
+
+
+def _interval_start(day: date, resolution: RankingHistoryResolution) -> date:
+    """Return the first day of the month, quarter or year containing ``day``."""
+
+    if resolution == "year":
+        return date(day.year, 1, 1)
+    if resolution == "quarter":
+        return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    return date(day.year, day.month, 1)
+
+
+def _next_interval(start: date, resolution: RankingHistoryResolution) -> date:
+    """Return the start of the interval following the one beginning at ``start``."""
+
+    months = {"year": 12, "quarter": 3}.get(resolution, 1)
+    month_index = start.month - 1 + months
+    return date(start.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def _downsample_ranking_runs(
+    runs: list[dict[str, Any]], resolution: RankingHistoryResolution
+) -> RankingHistorySeries:
+    """Turn chronological ranking runs into a columnar series at ``resolution``.
+
+    ``change`` keeps one point per run.  Interval resolutions emit one point
+    per (interval, division) the fighter was ranked in, holding the rank of
+    the latest run observed in that interval, so the work is bounded by the
+    number of runs and the intervals they cover rather than by snapshots.
+    """
+
+    points: dict[tuple[date, str], tuple[date, dict[str, Any]]] = {}
+    for run in runs:
+        if resolution == "change":
+            points[(run["start_date"], run["division"])] = (run["end_date"], run)
+            continue
+        interval = _interval_start(run["start_date"], resolution)
+        while interval <= run["end_date"]:
+            following = _next_interval(interval, resolution)
+            last_seen = min(run["end_date"], following - timedelta(days=1))
+            points[(interval, run["division"])] = (last_seen, run)
+            interval = following
+
+    series = RankingHistorySeries()
+    for (start, division), (last_seen, run) in sorted(points.items()):
+        series.dates.append(start)
+        series.end_dates.append(last_seen)
+        series.divisions.append(division)
+        series.ranks.append(run["rank"])
+        series.is_interim.append(run["is_interim"])
+    return series
+
+
+class RankingService(CacheableService):
     """Service for managing fighter rankings operations."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, *, cache: CacheClient | None = None):
         """Initialize ranking service with database session.
 
         Args:
             session: Async SQLAlchemy session
+            cache: Optional distributed cache for current rankings
         """
+        super().__init__(cache=cache)
         self.session = session
         self.repository = RankingRepository(session)
 
@@ -48,6 +166,29 @@ class RankingService:
         Returns:
             CurrentRankingsResponse with ranked fighters
         """
+        # Scope the version to the division: a division missing from the
+        # snapshot is read live and must not be cached under the snapshot key.
+        version = await self.repository.get_current_rankings_version(source, division)
+        return await self._get_current_rankings(
+            division=division, source=source, version=version
+        )
+
+    @cached(
+        lambda _self, *, division, source, version: _rankings_cache_key(
+            source, version, "division", division
+        ),
+        ttl=_CURRENT_RANKINGS_TTL,
+        serializer=lambda response: response.model_dump(mode="json"),
+        deserializer=_deserialize_current_rankings,
+        deserialize_error_message=(
+            "Failed to deserialize cached division rankings for key {key}: {error}"
+        ),
+    )
+    async def _get_current_rankings(
+        self, *, division: str, source: str, version: datetime | None
+    ) -> CurrentRankingsResponse:
+        """Build the division response for the given snapshot ``version``."""
+
         rankings_data = await self.repository.get_current_rankings(division, source)
 
         if not rankings_data:
@@ -61,28 +202,7 @@ class RankingService:
                 total_fighters=0,
             )
 
-        # Convert repository data to response schema
-        rankings = [
-            RankingEntry(
-                ranking_id=r["ranking_id"],
-                fighter_id=r["fighter_id"],
-                fighter_name=r["fighter_name"],
-                nickname=r.get("nickname"),
-                rank=r["rank"],
-                previous_rank=r.get("previous_rank"),
-                rank_movement=r.get("rank_movement", 0),
-                is_interim=r.get("is_interim", False),
-            )
-            for r in rankings_data
-        ]
-
-        return CurrentRankingsResponse(
-            division=division,
-            source=source,
-            rank_date=rankings_data[0]["rank_date"],
-            rankings=rankings,
-            total_fighters=len(rankings),
-        )
+        return _build_division_response(division, source, rankings_data)
 
     async def get_fighter_ranking_history(
         self,
@@ -90,6 +210,7 @@ class RankingService:
         fighter_name: str,
         source: str = "ufc",
         limit: int | None = None,
+        resolution: RankingHistoryResolution = "snapshot",
     ) -> RankingHistoryResponse:
         """Get historical rankings for a specific fighter.
 
@@ -97,11 +218,35 @@ class RankingService:
             fighter_id: Fighter's UUID
             fighter_name: Fighter's full name (for response)
             source: Ranking source
-            limit: Optional limit on number of records
+            limit: Optional limit on number of records (most recent points
+                for downsampled resolutions)
+            resolution: ``snapshot`` for every snapshot row, ``change`` for
+                one point per rank change, or ``month``/``quarter``/``year``
+                for one point per interval
 
         Returns:
             RankingHistoryResponse with timeline
         """
+        if resolution != "snapshot":
+            runs = await self.repository.get_fighter_ranking_runs(fighter_id, source)
+            series = _downsample_ranking_runs(runs, resolution)
+            if limit:
+                series = RankingHistorySeries(
+                    dates=series.dates[-limit:],
+                    end_dates=series.end_dates[-limit:],
+                    divisions=series.divisions[-limit:],
+                    ranks=series.ranks[-limit:],
+                    is_interim=series.is_interim[-limit:],
+                )
+            return RankingHistoryResponse(
+                fighter_id=fighter_id,
+                fighter_name=fighter_name,
+                source=source,
+                resolution=resolution,
+                series=series,
+                total_snapshots=sum(run["snapshot_count"] for run in runs),
+            )
+
         history_data = await self.repository.get_fighter_ranking_history(fighter_id, source, limit)
 
         history = [
@@ -178,53 +323,55 @@ class RankingService:
         Returns:
             AllRankingsResponse with all division rankings
         """
-        # Get all divisions
-        divisions = await self.repository.get_all_divisions(source)
-
-        # Get latest ranking date
-        latest_date = await self.repository.get_latest_ranking_date(source)
-
-        if not latest_date:
-            return AllRankingsResponse(
-                source=source,
-                division_rank_dates=[],
-                divisions=[],
-                total_divisions=0,
-                total_fighters=0,
-            )
-
-        # Fetch rankings for each division
-        division_rankings: list[CurrentRankingsResponse] = []
-        division_rank_dates: list[DivisionRankDate] = []
-        total_fighters = 0
-
-        for division in divisions:
-            division_response = await self.get_current_rankings(division, source)
-            division_rankings.append(division_response)
-            division_rank_dates.append(
-                DivisionRankDate(
-                    division=division_response.division,
-                    rank_date=division_response.rank_date,
-                )
-            )
-            total_fighters += division_response.total_fighters
+        version = await self.repository.get_current_rankings_version(source)
+        return await self._get_all_rankings(source=source, version=version)
+
+    @cached(
+        lambda _self, *, source, version: _rankings_cache_key(source, version, "all"),
+        ttl=_CURRENT_RANKINGS_TTL,
+        serializer=lambda response: response.model_dump(mode="json"),
+        deserializer=_deserialize_all_rankings,
+        deserialize_error_message=(
+            "Failed to deserialize cached rankings for key {key}: {error}"
+        ),
+    )
+    async def _get_all_rankings(
+        self, *, source: str, version: datetime | None
+    ) -> AllRankingsResponse:
+        """Build every division's response from one repository query."""
+
+        rankings_data = await self.repository.get_all_current_rankings(source)
+
+        # Rows arrive ordered by division, then rank.
+        division_rankings = [
+            _build_division_response(division, source, list(rows))
+            for division, rows in groupby(rankings_data, key=itemgetter("division"))
+        ]
+        division_rank_dates = [
+            DivisionRankDate(division=response.division, rank_date=response.rank_date)
+            for response in division_rankings
+        ]
 
         return AllRankingsResponse(
             source=source,
             divisions=division_rankings,
             division_rank_dates=division_rank_dates,
             total_divisions=len(division_rankings),
-            total_fighters=total_fighters,
+            total_fighters=sum(response.total_fighters for response in division_rankings),
         )
 
 
-def get_ranking_service(session: AsyncSession = Depends(get_db)) -> RankingService:
+def get_ranking_service(
+    session: AsyncSession = Depends(get_db),
+    cache: CacheClient = Depends(get_cache_client),
+) -> RankingService:
     """Dependency injection for RankingService.
 
     Args:
         session: Async database session from FastAPI dependency
+        cache: Cache client from FastAPI dependency
 
     Returns:
         RankingService instance
     """
-    return RankingService(session)
+    return RankingService(session, cache=cache)
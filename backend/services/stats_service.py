@@ -28,6 +28,7 @@ from backend.schemas.stats import (
     TrendsResponse,
 )
 from backend.services.caching import CacheableService, cached
+from backend.services.leaderboard_index import LeaderboardIndex, get_leaderboard_index
 
 logger = logging.getLogger(__name__)
 
@@ -113,10 +114,12 @@ class StatsService(CacheableService):
         fighter_repository: FighterRepository,
         *,
         cache: CacheClient | None = None,
+        leaderboard_index: LeaderboardIndex | None = None,
     ) -> None:
         super().__init__(cache=cache)
         self._repository = repository
         self._fighter_repository = fighter_repository
+        self._leaderboard_index = leaderboard_index
 
     @cached(
         lambda _self: "stats:summary",
@@ -132,6 +135,43 @@ class StatsService(CacheableService):
 
         return await self._repository.stats_summary()
 
+    async def get_leaderboards(
+        self,
+        *,
+        limit: int,
+        offset: int,
+        metrics: Sequence[LeaderboardMetricId] | None,
+        division: str | None,
+        min_fights: int | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> LeaderboardsResponse:
+        """Expose fighter leaderboards for the requested metrics.
+
+        Requests without a date window are sliced from the in-memory
+        leaderboard index when one is configured; date-bounded requests change
+        which fighters qualify and are computed (and cached) by the repository.
+        """
+
+        if self._leaderboard_index is not None and start_date is None and end_date is None:
+            await self._leaderboard_index.ensure_current(self._repository)
+            return self._leaderboard_index.leaderboards(
+                metrics=metrics,
+                limit=limit,
+                offset=offset,
+                division=division,
+                min_fights=min_fights,
+            )
+        return await self._get_repository_leaderboards(
+            limit=limit,
+            offset=offset,
+            metrics=metrics,
+            division=division,
+            min_fights=min_fights,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
     @cached(
         lambda _self,
         *,
@@ -157,7 +197,7 @@ class StatsService(CacheableService):
             "Failed to deserialize cached leaderboards for key {key}: {error}"
         ),
     )
-    async def get_leaderboards(
+    async def _get_repository_leaderboards(
         self,
         *,
         limit: int,
@@ -168,7 +208,7 @@ class StatsService(CacheableService):
         start_date: date | None,
         end_date: date | None,
     ) -> LeaderboardsResponse:
-        """Expose fighter leaderboards for the requested metrics."""
+        """Compute leaderboards in SQL for requests the index cannot answer."""
 
         try:
             return await self._repository.get_leaderboards(
@@ -308,7 +348,12 @@ def get_stats_service(
 
     repository = StatsRepository(session)
     fighter_repository = FighterRepository(session)
-    return StatsService(repository, fighter_repository, cache=cache)
+    return StatsService(
+        repository,
+        fighter_repository,
+        cache=cache,
+        leaderboard_index=get_leaderboard_index(),
+    )
 
 
 __all__ = ["StatsService", "get_stats_service"]
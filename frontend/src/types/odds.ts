@@ -33,6 +33,7 @@ export type FighterOddsHistoryResponse = {
   total_fights: number;
   returned: number;
   odds_history: FighterOddsHistoryEntry[];
+  next_cursor?: string | null;
 };
 
 export type FighterOddsChartFight = {
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.connection import get_session
 from backend.db.models import Fighter
+from backend.db.repositories.fighter import FighterRepository
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -76,6 +77,7 @@ async def backfill_geography():
                 logger.error(f"Error processing {json_file}: {e}")
                 skipped_count += 1
 
+        await FighterRepository(session).refresh_location_rollups()
         await session.commit()
 
         logger.info(f"Backfill complete: {updated_count} updated, {skipped_count} skipped")
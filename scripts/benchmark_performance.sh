@@ -19,7 +19,7 @@ benchmark_endpoint() {
 
     echo "Testing: $name"
     echo "URL: $url"
-    curl -w "\n  Time: %{time_total}s\n  Status: %{http_code}\n" -o /dev/null -s "$url"
+    curl -w "\n  Time: %{time_total}s\n  Size: %{size_download} bytes\n  Status: %{http_code}\n" -o /dev/null -s "$url"
     echo ""
 }
 
@@ -43,6 +43,10 @@ benchmark_endpoint "Search with Win Streak" "$API_BASE/search/?q=&streak_type=wi
 SAMPLE_FIGHTER_ID="${SAMPLE_FIGHTER_ID:-d1053e55f00e53fe}"
 benchmark_endpoint "Fighter Detail (with fight history)" "$API_BASE/fighters/$SAMPLE_FIGHTER_ID"
 
+# Odds chart: full mean-odds series vs LTTB-downsampled sparkline series
+benchmark_endpoint "Odds Chart (full series)" "$API_BASE/odds/fighter/$SAMPLE_FIGHTER_ID/chart?limit=100"
+benchmark_endpoint "Odds Chart (max_points=100)" "$API_BASE/odds/fighter/$SAMPLE_FIGHTER_ID/chart?limit=100&max_points=100"
+
 echo "=== Benchmark Complete ==="
 echo ""
 echo "Expected improvements after Phase 1:"
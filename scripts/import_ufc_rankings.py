@@ -129,6 +129,10 @@ async def import_rankings(json_path: str, dry_run: bool = False):
             await repo.upsert_ranking(ranking_data)
             inserted_count += 1
 
+        # Republish current snapshots, per-fighter summaries and history runs.
+        await repo.refresh_ranking_tables(
+            sorted({ranking["source"] for ranking in rankings_data})
+        )
         await session.commit()
 
         print(f"\n✅ Import complete:")
@@ -7,13 +7,12 @@ import asyncio
 
 from dotenv import load_dotenv
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from sqlalchemy import select
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.cache import close_redis, get_cache_client
 from backend.db.connection import get_session
-from backend.db.models import Event, Fight
+from backend.db.repositories import PostgreSQLEventRepository
 
 # Load environment variables
 load_dotenv()
@@ -21,9 +20,65 @@ load_dotenv()
 console = Console()
 
 
-def normalize_event_name(name: str) -> str:
-    """Normalize event name for matching (lowercase, strip whitespace)."""
-    return name.lower().strip()
+_CREATE_EVENT_NAME_MAP = text(
+    """
+    CREATE TEMP TABLE event_name_map (
+        normalized_name text PRIMARY KEY,
+        event_id text NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+# Event names match case-insensitively, ignoring surrounding whitespace; the
+# same normalization is spelled out in each statement below.  Duplicate event
+# names resolve to the lowest event id so reruns are stable.
+_FILL_EVENT_NAME_MAP = text(
+    """
+    INSERT INTO event_name_map (normalized_name, event_id)
+    SELECT DISTINCT ON (normalized_name) normalized_name, id
+    FROM (
+        SELECT lower(btrim(name, E' \\t\\n\\r')) AS normalized_name, id
+        FROM events
+    ) AS named
+    ORDER BY normalized_name, id
+    """
+)
+
+_LINK_FIGHTS = text(
+    """
+    UPDATE fights
+    SET event_id = event_name_map.event_id
+    FROM event_name_map
+    WHERE fights.event_id IS NULL
+      AND lower(btrim(fights.event_name, E' \\t\\n\\r'))
+          = event_name_map.normalized_name
+    RETURNING fights.event_id
+    """
+)
+
+_PREVIEW_LINKS = text(
+    """
+    SELECT event_name_map.event_id
+    FROM fights
+    JOIN event_name_map
+      ON lower(btrim(fights.event_name, E' \\t\\n\\r'))
+         = event_name_map.normalized_name
+    WHERE fights.event_id IS NULL
+    """
+)
+
+_UNMATCHED_EVENT_NAMES = text(
+    """
+    SELECT fights.event_name, count(*) AS fight_count
+    FROM fights
+    LEFT JOIN event_name_map
+      ON lower(btrim(fights.event_name, E' \\t\\n\\r'))
+         = event_name_map.normalized_name
+    WHERE fights.event_id IS NULL AND event_name_map.event_id IS NULL
+    GROUP BY fights.event_name
+    ORDER BY fight_count DESC, fights.event_name
+    """
+)
 
 
 async def link_fights_to_events(
@@ -32,81 +87,50 @@ async def link_fights_to_events(
 ) -> tuple[int, int]:
     """Link fights to events by matching event names.
 
+    The normalized name -> event mapping lives in a temp table, so linking is
+    a single ``UPDATE ... FROM`` and the unmatched report a single
+    ``GROUP BY``, whatever the size of ``fights``.
+
     Returns:
         Tuple of (matched_count, unmatched_count)
     """
-    # Load all events and create a mapping
-    console.print("[bold blue]Loading events from database...[/bold blue]")
-    result = await session.execute(select(Event))
-    events = result.scalars().all()
-
-    # Create normalized name -> event mapping
-    event_map: dict[str, Event] = {}
-    for event in events:
-        normalized_name = normalize_event_name(event.name)
-        event_map[normalized_name] = event
-
-    console.print(f"[green]✓ Loaded {len(events)} events[/green]\n")
-
-    # Load all fights without event_id
-    console.print("[bold blue]Loading unlinked fights...[/bold blue]")
-    result = await session.execute(
-        select(Fight).where(Fight.event_id.is_(None))
-    )
-    unlinked_fights = result.scalars().all()
+    console.print("[bold blue]Building event name map...[/bold blue]")
+    await session.execute(_CREATE_EVENT_NAME_MAP)
+    await session.execute(_FILL_EVENT_NAME_MAP)
+
+    if dry_run:
+        linked_event_ids = (await session.execute(_PREVIEW_LINKS)).scalars().all()
+    else:
+        linked_event_ids = (await session.execute(_LINK_FIGHTS)).scalars().all()
+    matched_count = len(linked_event_ids)
 
-    console.print(f"[yellow]Found {len(unlinked_fights)} fights without event_id[/yellow]\n")
+    unmatched_events = (await session.execute(_UNMATCHED_EVENT_NAMES)).all()
+    unmatched_count = sum(row.fight_count for row in unmatched_events)
 
-    if not unlinked_fights:
+    if matched_count == 0 and unmatched_count == 0:
         console.print("[green]✓ All fights are already linked to events![/green]")
-        return 0, 0
-
-    matched_count = 0
-    unmatched_count = 0
-    unmatched_events = set()
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Linking fights to events...", total=len(unlinked_fights))
-
-        for fight in unlinked_fights:
-            normalized_name = normalize_event_name(fight.event_name)
-            matched_event = event_map.get(normalized_name)
-
-            if matched_event:
-                if dry_run:
-                    console.print(
-                        f"[cyan]Would link: {fight.fighter_id[:8]} → {matched_event.name}[/cyan]"
-                    )
-                else:
-                    fight.event_id = matched_event.id
-                matched_count += 1
-            else:
-                unmatched_count += 1
-                unmatched_events.add(fight.event_name)
-
-            progress.advance(task)
-
-            # Commit in batches for performance
-            if not dry_run and matched_count % 100 == 0:
-                await session.commit()
-                progress.update(
-                    task,
-                    description=f"Linked {matched_count} fights ({unmatched_count} unmatched)...",
-                )
-
-    # Final commit
-    if not dry_run and session.in_transaction():
+    elif dry_run:
+        console.print(
+            f"[cyan]Would link {matched_count} fights "
+            f"to {len(set(linked_event_ids))} events[/cyan]"
+        )
+
+    if dry_run:
+        await session.rollback()
+    else:
+        if linked_event_ids:
+            # Newly linked fights may add bouts to published event cards.
+            await PostgreSQLEventRepository(session).refresh_event_cards(set(linked_event_ids))
         await session.commit()
 
     # Report unmatched events (if any)
     if unmatched_events:
-        console.print(f"\n[yellow]⚠ {len(unmatched_events)} unique event names could not be matched:[/yellow]")
-        for event_name in sorted(unmatched_events)[:10]:  # Show first 10
-            console.print(f"  • {event_name}")
+        console.print(
+            f"\n[yellow]⚠ {len(unmatched_events)} unique event names "
+            "could not be matched:[/yellow]"
+        )
+        for row in unmatched_events[:10]:  # Show the 10 most common
+            console.print(f"  • {row.event_name} ({row.fight_count} fights)")
         if len(unmatched_events) > 10:
             console.print(f"  ... and {len(unmatched_events) - 10} more")
 
@@ -126,7 +150,9 @@ async def main(args: argparse.Namespace) -> None:
         console.print("\n[bold]Results:[/bold]")
         console.print(f"  • Matched: [green]{matched}[/green]")
         console.print(f"  • Unmatched: [yellow]{unmatched}[/yellow]")
-        console.print(f"  • Success rate: [cyan]{matched / (matched + unmatched) * 100:.1f}%[/cyan]")
+        if matched + unmatched:
+            success_rate = matched / (matched + unmatched) * 100
+            console.print(f"  • Success rate: [cyan]{success_rate:.1f}%[/cyan]")
 
     # Invalidate cache if we made changes
     if not args.dry_run and matched > 0:
@@ -17,9 +17,12 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
+from backend.cache import close_redis, get_cache_client, invalidate_odds
 from backend.db.connection import create_engine, create_session_factory, get_database_url
 from backend.db.models import Fighter, FighterOdds
 from backend.db.models.odds import QUALITY_CHOICES
+from backend.db.repositories.odds import OddsRepository, parse_odds_points
+from backend.services.odds_analytics import refresh_odds_analytics
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +62,11 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Insert rows even if the fighter_id has not been seeded yet.",
     )
+    parser.add_argument(
+        "--analytics-only",
+        action="store_true",
+        help="Skip loading and only recompute odds analytics for the stored records.",
+    )
     return parser.parse_args()
 
 
@@ -158,6 +166,14 @@ async def _fetch_existing_fighters(session: AsyncSession) -> set[str]:
 async def _upsert_batch(session: AsyncSession, batch: list[dict[str, Any]]) -> None:
     if not batch:
         return
+    repository = OddsRepository(session)
+    # Quality counters move by this batch's net change to its own records and
+    # to every fighter that owns one of them before or after the upsert.
+    odds_ids = [payload["id"] for payload in batch]
+    fighter_ids = {payload["fighter_id"] for payload in batch}
+    fighter_ids |= await repository.odds_owners(odds_ids)
+    before = await repository.quality_counters(odds_ids=odds_ids, fighter_ids=fighter_ids)
+
     stmt = insert(FighterOdds).values(batch)
     update_columns = {
         column: getattr(stmt.excluded, column)
@@ -180,6 +196,12 @@ async def _upsert_batch(session: AsyncSession, batch: list[dict[str, Any]]) -> N
     }
     stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=update_columns)
     await session.execute(stmt)
+    # Publish parsed series so chart reads never re-parse the JSON history.
+    await repository.replace_odds_points(
+        {payload["id"]: parse_odds_points(payload["mean_odds_history"]) for payload in batch}
+    )
+    after = await repository.quality_counters(odds_ids=odds_ids, fighter_ids=fighter_ids)
+    await repository.apply_quality_counter_delta(before, after)
 
 
 async def load_odds_data(
@@ -220,7 +242,24 @@ async def load_odds_data(
             await _upsert_batch(session, batch)
             await session.commit()
 
-    return {"processed": processed, "skipped": skipped}
+        analysed = 0
+        if processed:
+            # Precompute line-movement analytics once for the whole table so
+            # fight detail reads never analyse a series on the request path.
+            analysed = await refresh_odds_analytics(OddsRepository(session))
+            await session.commit()
+
+    return {"processed": processed, "skipped": skipped, "analysed": analysed}
+
+
+async def refresh_analytics(engine: AsyncEngine) -> int:
+    """Recompute odds analytics for every stored record without loading new data."""
+
+    session_factory: sessionmaker[AsyncSession] = create_session_factory(engine)
+    async with session_factory() as session:
+        analysed = await refresh_odds_analytics(OddsRepository(session))
+        await session.commit()
+    return analysed
 
 
 async def async_main() -> None:
@@ -230,24 +269,37 @@ async def async_main() -> None:
     database_url = _resolve_database_url(args.database_url)
     logger.info("Using database %s", _sanitize_database_url(database_url))
     engine = create_engine()
-    logger.info("Loading odds data from %s", args.input)
 
     try:
-        stats = await load_odds_data(
-            args.input,
-            engine,
-            batch_size=args.batch_size,
-            skip_missing_fighters=args.skip_missing_fighters,
-        )
+        if args.analytics_only:
+            stats = {"processed": 0, "skipped": 0, "analysed": await refresh_analytics(engine)}
+        else:
+            logger.info("Loading odds data from %s", args.input)
+            stats = await load_odds_data(
+                args.input,
+                engine,
+                batch_size=args.batch_size,
+                skip_missing_fighters=args.skip_missing_fighters,
+            )
     finally:
         await engine.dispose()
 
     logger.info(
-        "Upserted %s records (skipped %s missing fighters)",
+        "Upserted %s records (skipped %s missing fighters), analysed %s",
         stats["processed"],
         stats["skipped"],
+        stats["analysed"],
     )
 
+    if stats["analysed"]:
+        # Odds for past bouts are cached as immutable, so only a reload clears them.
+        try:
+            await invalidate_odds(await get_cache_client())
+        except (ConnectionError, OSError, TimeoutError) as exc:
+            logger.warning("Could not invalidate odds cache: %s", exc)
+        finally:
+            await close_redis()
+
 
 def main() -> None:
     asyncio.run(async_main())
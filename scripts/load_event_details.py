@@ -16,6 +16,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.cache import CacheClient, close_redis, get_cache_client
 from backend.db.connection import get_session
 from backend.db.models import Event, Fight
+from backend.db.repositories import PostgreSQLEventRepository
+from backend.db.repositories.fight_graph_repository import FightGraphRepository
+from backend.db.repositories.stats_repository import StatsRepository
 
 # Load environment variables
 load_dotenv()
@@ -56,6 +59,9 @@ async def load_event_details_from_json(
     events_loaded = 0
     fights_loaded = 0
     skipped_count = 0
+    loaded_dates: set[date_type] = set()
+    loaded_event_ids: set[str] = set()
+    loaded_fighter_ids: set[str] = set()
 
     with Progress(
         SpinnerColumn(),
@@ -117,9 +123,11 @@ async def load_event_details_from_json(
                 )
                 await session.merge(event)
                 events_loaded += 1
+                loaded_dates.add(event_date)
+                loaded_event_ids.add(event_id)
 
                 # Load fights from fight card
-                for fight_data in fight_card:
+                for card_position, fight_data in enumerate(fight_card):
                     fight_id = fight_data.get("fight_id")
                     if not fight_id:
                         continue
@@ -157,9 +165,11 @@ async def load_event_details_from_json(
                         time=fight_time,
                         fight_card_url=fight_url,
                         weight_class=weight_class,
+                        card_position=card_position,
                     )
                     await session.merge(fight)
                     fights_loaded += 1
+                    loaded_fighter_ids.add(fighter_one_id)
 
                     # For upcoming fights, capture the fighter_2 perspective so both fighters
                     # get downstream "next fight" metadata (important for roster cards).
@@ -179,9 +189,11 @@ async def load_event_details_from_json(
                             time=fight_time,
                             fight_card_url=fight_url,
                             weight_class=weight_class,
+                            card_position=card_position,
                         )
                         await session.merge(mirrored_fight)
                         fights_loaded += 1
+                        loaded_fighter_ids.add(fighter_two_id)
 
                 # Commit every 50 events for progress visibility
                 if not dry_run and events_loaded % 50 == 0:
@@ -204,9 +216,24 @@ async def load_event_details_from_json(
                     await session.rollback()
                 skipped_count += 1
 
-        if not dry_run and session.in_transaction():
+        if not dry_run:
+            event_repository = PostgreSQLEventRepository(session)
+            # Rebuild the deduplicated, card-ordered bouts served by event detail.
+            await event_repository.refresh_event_cards(loaded_event_ids)
+            # Republish filter facet counts; cached facets are keyed by their refresh time.
+            await event_repository.refresh_event_facets()
             await session.commit()
 
+    if not dry_run and fights_loaded > 0:
+        # Fight cards can touch any pair on the roster, so rebuild the whole
+        # adjacency index once rather than per event.
+        await FightGraphRepository(session).refresh_edges()
+        stats_repository = StatsRepository(session)
+        await stats_repository.refresh_trend_rollups(loaded_dates)
+        await stats_repository.refresh_streak_history(loaded_fighter_ids)
+        await stats_repository.refresh_stats_snapshots()
+        await session.commit()
+
     if skipped_count > 0:
         console.print(f"[yellow]Skipped {skipped_count} invalid events[/yellow]")
 
@@ -247,7 +274,7 @@ async def main(args: argparse.Namespace) -> None:
         # Invalidate event and fighter cache keys
         try:
             keys_to_delete = []
-            patterns = ["events:*", "fighters:*"]
+            patterns = ["events:*", "fighters:*", "stats:*"]
             for pattern in patterns:
                 cursor = 0
                 while True:
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.cache import CacheClient, close_redis, get_cache_client
 from backend.db.connection import get_session
 from backend.db.models import Event
+from backend.db.repositories import PostgreSQLEventRepository
 
 # Load environment variables
 load_dotenv()
@@ -140,7 +141,9 @@ async def load_events_from_jsonl(
                         await session.rollback()
                     skipped_count += 1
 
-        if not dry_run and session.in_transaction():
+        if not dry_run:
+            # Republish filter facet counts; cached facets are keyed by their refresh time.
+            await PostgreSQLEventRepository(session).refresh_event_facets()
             await session.commit()
 
     if skipped_count > 0:
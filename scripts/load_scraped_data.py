@@ -14,7 +14,7 @@ from typing import Any
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from sqlalchemy import delete, insert
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.cache import (
@@ -22,10 +22,14 @@ from backend.cache import (
     close_redis,
     get_cache_client,
     invalidate_collections,
+    invalidate_event_details,
     invalidate_fighter,
 )
 from backend.db.connection import get_session
 from backend.db.models import Fight, Fighter, fighter_stats
+from backend.db.repositories.fight_graph_repository import FightGraphRepository
+from backend.db.repositories.fighter import FighterRepository
+from backend.db.repositories.stats_repository import StatsRepository, compute_streak_runs
 
 # Load environment variables
 load_dotenv()
@@ -192,35 +196,26 @@ def _coerce_event_date(value: Any) -> date | None:
 
 
 def calculate_longest_win_streak(fight_history: list[dict[str, Any]]) -> int:
-    """Return the longest consecutive win streak ordered by event date."""
+    """Return the longest consecutive win streak ordered by event date.
 
-    if not fight_history:
-        return 0
+    Scraped histories spell wins several ways ("W", "Win", "WIN (KO)"), so any
+    result starting with "W" counts as a win.  Blank results carry no outcome
+    yet and are skipped rather than breaking the streak.
+    """
 
-    sortable_fights = []
-    for fight in fight_history:
-        event_date = _coerce_event_date(fight.get("event_date"))
-        if event_date is None:
-            # Without a date we cannot deterministically place the fight, so skip it.
+    outcomes: list[tuple[date | None, str]] = []
+    for fight in fight_history or []:
+        result = str(fight.get("result") or "").strip()
+        if not result:
             continue
-        sortable_fights.append((event_date, fight))
-
-    if not sortable_fights:
-        return 0
-
-    sortable_fights.sort(key=lambda item: item[0])
-
-    longest = 0
-    current = 0
-    for _, fight in sortable_fights:
-        result = str(fight.get("result", "")).strip().upper()
-        if result.startswith("W"):
-            current += 1
-            longest = max(longest, current)
-        elif result:
-            current = 0
-
-    return longest
+        outcomes.append(
+            (
+                _coerce_event_date(fight.get("event_date")),
+                "win" if result.upper().startswith("W") else result,
+            )
+        )
+    runs = compute_streak_runs(outcomes)
+    return max((run.length for run in runs if run.streak_type == "win"), default=0)
 
 
 def _store_stat(
@@ -596,6 +591,8 @@ async def upsert_fighter_stats(
 
     if rows:
         await session.execute(insert(fighter_stats), rows)
+    # Lets in-memory leaderboards re-slot this fighter without a full rebuild.
+    await StatsRepository(session).mark_fighter_stats_written([fighter_id])
 
 
 def _parse_date(value: Any) -> date | None:
@@ -753,8 +750,14 @@ async def load_fighter_detail(
     json_path: Path,
     dry_run: bool = False,
     cache: CacheClient | None = None,
+    trend_dates: set[date | None] | None = None,
 ) -> bool:
-    """Load detailed fighter data from individual JSON file."""
+    """Load detailed fighter data from individual JSON file.
+
+    When ``trend_dates`` is given, the event dates touched by this fighter are
+    added to it after the commit and the caller refreshes the trend rollups
+    once for the whole run; otherwise they are refreshed here.
+    """
     if not json_path.exists():
         console.print(f"[red]File not found: {json_path}[/red]")
         return False
@@ -793,6 +796,12 @@ async def load_fighter_detail(
         fighter.division = data.get("division")
         fighter.record = data.get("record")
 
+        # Remember the dates being replaced so their trend rollups are rebuilt too.
+        previous_dates = await session.scalars(
+            select(Fight.event_date).where(Fight.fighter_id == fighter_id).distinct()
+        )
+        touched_dates = set(previous_dates)
+
         # Delete old fights for this fighter to allow re-scraping with updated data
         await session.execute(delete(Fight).where(Fight.fighter_id == fighter_id))
 
@@ -823,6 +832,16 @@ async def load_fighter_detail(
                 weight_class=fight_data.get("weight_class"),
             )
             await session.merge(fight)
+            touched_dates.add(fight.event_date)
+
+        # Keep the fight graph adjacency index, trend rollups and streak
+        # history in step with the rewritten history.
+        await session.flush()
+        await FightGraphRepository(session).refresh_edges([fighter_id])
+        stats_repository = StatsRepository(session)
+        if trend_dates is None:
+            await stats_repository.refresh_trend_rollups(touched_dates)
+        await stats_repository.refresh_streak_history([fighter_id])
 
         summary_payload = {
             key: data.get(key) or {}
@@ -846,6 +865,8 @@ async def load_fighter_detail(
         await upsert_fighter_stats(session, fighter_id, aggregated_stats)
 
         await session.commit()
+        if trend_dates is not None:
+            trend_dates.update(touched_dates)
         if cache is not None and not dry_run:
             await invalidate_fighter(cache, fighter_id)
         return True
@@ -876,6 +897,9 @@ async def main(args: argparse.Namespace) -> None:
             )
             cache_client = None
 
+    # Event dates whose trend rollups are rebuilt once at the end of the run.
+    trend_dates: set[date | None] = set()
+
     async with get_session() as session:
         if args.fighter_id:
             # Load specific fighter detail
@@ -885,6 +909,7 @@ async def main(args: argparse.Namespace) -> None:
                 detail_path,
                 dry_run=args.dry_run,
                 cache=cache_client,
+                trend_dates=trend_dates,
             )
             if success:
                 console.print(f"[green]✓ Loaded fighter {args.fighter_id}[/green]")
@@ -921,6 +946,7 @@ async def main(args: argparse.Namespace) -> None:
                             fighter_file,
                             dry_run=args.dry_run,
                             cache=cache_client,
+                            trend_dates=trend_dates,
                         )
                         if success:
                             success_count += 1
@@ -929,8 +955,25 @@ async def main(args: argparse.Namespace) -> None:
                         f"[green]✓ Loaded detailed data for {success_count} fighters[/green]"
                     )
 
+        if not args.dry_run:
+            stats_repository = StatsRepository(session)
+            if args.fighter_id:
+                await stats_repository.refresh_trend_rollups(trend_dates)
+            else:
+                # The list load resets divisions, which moves every fighter's
+                # bouts between rollup buckets, so the full rebuild also
+                # covers every date touched by the detail loads.
+                await stats_repository.refresh_trend_rollups()
+            # Refresh dashboard snapshots and location rollups once per run
+            # rather than per fighter.
+            await stats_repository.refresh_stats_snapshots()
+            await FighterRepository(session).refresh_location_rollups()
+            await session.commit()
+
     if cache_client is not None and not args.dry_run:
         await invalidate_collections(cache_client)
+        # Event cards show fighter names, so renamed fighters must reach them.
+        await invalidate_event_details(cache_client)
         # Close Redis connection gracefully
         await close_redis()
 
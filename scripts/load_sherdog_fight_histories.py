@@ -24,6 +24,7 @@ from sqlalchemy.dialects.postgresql import insert
 
 from backend.db.connection import get_session
 from backend.db.models import Fighter, Fight
+from backend.db.repositories.stats_repository import StatsRepository
 
 
 async def load_or_create_fighter(
@@ -261,6 +262,10 @@ async def process_fight_histories(
                     continue
 
         if not dry_run:
+            stats_repository = StatsRepository(session)
+            await stats_repository.refresh_trend_rollups()
+            await stats_repository.refresh_streak_history()
+            await stats_repository.refresh_stats_snapshots()
             await session.commit()
             click.echo("\n✅ Changes committed to database")
         else:
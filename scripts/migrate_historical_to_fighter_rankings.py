@@ -36,6 +36,7 @@ from sqlalchemy.engine import Engine, make_url
 # Import database connection and models
 from backend.db.connection import get_database_url, get_session
 from backend.db.models import Fighter
+from backend.db.repositories.ranking_repository import build_ranking_refresh
 
 # Import name matcher
 from scraper.utils.name_matcher import FighterNameMatcher
@@ -274,6 +275,9 @@ async def migrate_historical_rankings_async(
                 stats["errors"] += 1
 
         if not dry_run:
+            # Republish current snapshots, per-fighter summaries and history runs.
+            for statement in build_ranking_refresh(["fightmatrix"]):
+                conn.execute(statement)
             conn.commit()
 
     return stats
@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.connection import get_session
 from backend.db.models import Fighter
+from backend.db.repositories.fighter import FighterRepository
 
 
 async def get_health_stats(session: AsyncSession) -> dict:
@@ -35,118 +36,38 @@ async def get_health_stats(session: AsyncSession) -> dict:
         - never_scraped: int
         - recent_changes_7d: int
     """
-    stats = {}
-
-    # Total fighters
-    result = await session.execute(select(func.count(Fighter.id)))
-    stats["total_fighters"] = result.scalar()
-
-    # Fighters with birthplace data
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(Fighter.birthplace.isnot(None))
-    )
-    stats["with_birthplace"] = result.scalar()
-    stats["with_birthplace_pct"] = (
-        stats["with_birthplace"] / stats["total_fighters"] * 100
-        if stats["total_fighters"]
-        else 0
-    )
-
-    # Fighters with training gym data
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(Fighter.training_gym.isnot(None))
-    )
-    stats["with_training_gym"] = result.scalar()
-    stats["with_training_gym_pct"] = (
-        stats["with_training_gym"] / stats["total_fighters"] * 100
-        if stats["total_fighters"]
-        else 0
-    )
-
-    # Fighters with nationality data
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(Fighter.nationality.isnot(None))
-    )
-    stats["with_nationality"] = result.scalar()
-    stats["with_nationality_pct"] = (
-        stats["with_nationality"] / stats["total_fighters"] * 100
-        if stats["total_fighters"]
-        else 0
-    )
-
-    # Fighters with fighting_out_of data
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(Fighter.fighting_out_of.isnot(None))
-    )
-    stats["with_fighting_out_of"] = result.scalar()
-    stats["with_fighting_out_of_pct"] = (
-        stats["with_fighting_out_of"] / stats["total_fighters"] * 100
-        if stats["total_fighters"]
-        else 0
-    )
-
-    # Fighters needing manual review
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(Fighter.needs_manual_review == True)  # noqa: E712
-    )
-    stats["needs_manual_review"] = result.scalar()
-
-    # Never scraped from UFC.com
+    stats: dict = dict(await FighterRepository(session).get_location_coverage())
+    total = stats["total_fighters"]
+
+    # Coverage counters come from the location rollup, which the fighter
+    # loader and geography scripts refresh after every run; percentages are
+    # derived from the same snapshot.
+
+    for key in (
+        "with_birthplace",
+        "with_training_gym",
+        "with_nationality",
+        "with_fighting_out_of",
+        "with_ufc_com_slug",
+    ):
+        stats[f"{key}_pct"] = stats[key] / total * 100 if total else 0
+
+    # Freshness depends on the current time, so it is counted live in one pass.
+    now = datetime.utcnow()
+    scraped_at = Fighter.ufc_com_scraped_at
     result = await session.execute(
-        select(func.count(Fighter.id)).where(Fighter.ufc_com_scraped_at.is_(None))
-    )
-    stats["never_scraped"] = result.scalar()
-
-    # Stale data (>30 days)
-    cutoff_30d = datetime.utcnow() - timedelta(days=30)
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(
-            Fighter.ufc_com_scraped_at.isnot(None),
-            Fighter.ufc_com_scraped_at < cutoff_30d,
-        )
-    )
-    stats["stale_data_30d"] = result.scalar()
-
-    # Stale data (>90 days)
-    cutoff_90d = datetime.utcnow() - timedelta(days=90)
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(
-            Fighter.ufc_com_scraped_at.isnot(None),
-            Fighter.ufc_com_scraped_at < cutoff_90d,
-        )
-    )
-    stats["stale_data_90d"] = result.scalar()
-
-    # Recent changes (last 7 days)
-    cutoff_7d = datetime.utcnow() - timedelta(days=7)
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(
-            Fighter.ufc_com_scraped_at.isnot(None),
-            Fighter.ufc_com_scraped_at >= cutoff_7d,
-        )
-    )
-    stats["recent_changes_7d"] = result.scalar()
-
-    # UFC.com matched fighters
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(Fighter.ufc_com_slug.isnot(None))
-    )
-    stats["with_ufc_com_slug"] = result.scalar()
-    stats["with_ufc_com_slug_pct"] = (
-        stats["with_ufc_com_slug"] / stats["total_fighters"] * 100
-        if stats["total_fighters"]
-        else 0
-    )
-
-    # Active fighters (fought in last 6 months)
-    cutoff_6mo = datetime.utcnow().date() - timedelta(days=180)
-    result = await session.execute(
-        select(func.count(Fighter.id)).where(
-            Fighter.last_fight_date.isnot(None),
-            Fighter.last_fight_date >= cutoff_6mo,
-        )
-    )
-    stats["active_fighters_6mo"] = result.scalar()
+        select(
+            func.count().filter(scraped_at < now - timedelta(days=30)).label("stale_data_30d"),
+            func.count().filter(scraped_at < now - timedelta(days=90)).label("stale_data_90d"),
+            func.count()
+            .filter(scraped_at >= now - timedelta(days=7))
+            .label("recent_changes_7d"),
+            func.count()
+            .filter(Fighter.last_fight_date >= now.date() - timedelta(days=180))
+            .label("active_fighters_6mo"),
+        ).select_from(Fighter)
+    )
+    stats.update(result.one()._mapping)
 
     return stats
 
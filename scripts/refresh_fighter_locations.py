@@ -21,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.connection import get_session
 from backend.db.models import Fighter
+from backend.db.repositories.fighter import FighterRepository
 from scripts.utils.gym_locations import resolve_gym_location
 
 
@@ -454,8 +455,10 @@ async def run_refresh(priority: PriorityLevel, limit: int | None, dry_run: bool)
                 stats["errors"] += 1
                 click.echo(f"❌ Error refreshing {fighter.name}: {e}")
 
-        # Final commit
+        # Final commit, rebuilding the location rollups alongside the updates
         if not dry_run:
+            if stats["changed"]:
+                await FighterRepository(session).refresh_location_rollups()
             await session.commit()
 
     # Print summary
@@ -0,0 +1,129 @@
+"""PostgreSQL tests for the fight graph adjacency index."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import date
+
+import pytest
+
+try:
+    import pytest_asyncio
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
+    pytest.skip(
+        f"Optional dependency '{exc.name}' is required for fight graph tests.",
+        allow_module_level=True,
+    )
+
+from backend.db.models import Base, Fight, Fighter, FightGraphEdge
+from backend.db.repositories.fight_graph_repository import FightGraphRepository
+from tests.backend.postgres import TemporaryPostgresSchema, postgres_schema  # noqa: F401
+
+
+@pytest_asyncio.fixture
+async def session(
+    postgres_schema: TemporaryPostgresSchema,
+) -> AsyncIterator[AsyncSession]:
+    async with postgres_schema.session_scope(Base.metadata) as session:
+        yield session
+
+
+def _fight(
+    fight_id: str,
+    fighter_id: str,
+    opponent_id: str,
+    *,
+    event_name: str,
+    event_date: date | None,
+    result: str,
+) -> Fight:
+    return Fight(
+        id=fight_id,
+        fighter_id=fighter_id,
+        opponent_id=opponent_id,
+        opponent_name=opponent_id.upper(),
+        event_name=event_name,
+        event_date=event_date,
+        result=result,
+        stats={},
+    )
+
+
+async def _seed(session: AsyncSession) -> None:
+    session.add_all(
+        [
+            Fighter(id="alpha", name="Alpha", division="Lightweight"),
+            Fighter(id="bravo", name="Bravo", division="Lightweight"),
+            Fighter(id="charlie", name="Charlie", division="Lightweight"),
+        ]
+    )
+    await session.flush()
+    ufc_100 = {"event_name": "UFC 100", "event_date": date(2010, 5, 1)}
+    session.add_all(
+        [
+            _fight("f1", "bravo", "alpha", result="W", **ufc_100),
+            _fight("f2", "alpha", "bravo", result="L", **ufc_100),
+            _fight("f3", "alpha", "bravo", event_name="UFC 200", event_date=date(2016, 7, 9),
+                   result="Draw"),
+            _fight("f4", "alpha", "charlie", event_name="UFC 400", event_date=date(2030, 1, 1),
+                   result="next"),
+        ]
+    )
+    await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_graph_links_are_read_from_adjacency_index(session: AsyncSession) -> None:
+    await _seed(session)
+    repo = FightGraphRepository(session)
+    await repo.refresh_edges()
+
+    graph = await repo.get_fight_graph(limit=10)
+
+    assert len(graph.links) == 1
+    link = graph.links[0]
+    assert (link.source, link.target, link.fights) == ("alpha", "bravo", 3)
+    assert (link.first_event_name, link.first_event_date) == ("UFC 100", date(2010, 5, 1))
+    assert (link.last_event_name, link.last_event_date) == ("UFC 200", date(2016, 7, 9))
+    assert link.result_breakdown["alpha"]["loss"] == 1
+    assert link.result_breakdown["alpha"]["draw"] == 1
+    assert link.result_breakdown["bravo"]["win"] == 1
+    assert graph.metadata["event_window"] == {
+        "start": date(2010, 5, 1),
+        "end": date(2016, 7, 9),
+    }
+
+    windowed = await repo.get_fight_graph(end_year=2012, limit=10)
+    assert [(link.source, link.target, link.fights) for link in windowed.links] == [
+        ("alpha", "bravo", 2)
+    ]
+    assert windowed.links[0].last_event_name == "UFC 100"
+
+
+@pytest.mark.asyncio
+async def test_refresh_edges_only_rebuilds_pairs_for_changed_fighters(
+    session: AsyncSession,
+) -> None:
+    await _seed(session)
+    repo = FightGraphRepository(session)
+    await repo.refresh_edges()
+
+    session.add(
+        _fight(
+            "f5", "charlie", "bravo", event_name="UFC 300", event_date=date(2024, 4, 13), result="W"
+        )
+    )
+    await session.flush()
+    await repo.refresh_edges(["charlie"])
+
+    pair = (FightGraphEdge.fighter_a_id, FightGraphEdge.fighter_b_id)
+    rows = await session.execute(
+        select(*pair, func.sum(FightGraphEdge.fights)).group_by(*pair).order_by(*pair)
+    )
+    assert rows.all() == [
+        ("alpha", "bravo", 3),
+        ("alpha", "charlie", 1),
+        ("bravo", "charlie", 1),
+    ]
@@ -9,6 +9,7 @@ import pytest
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.sql import ColumnElement
 
+from backend.db.models import Fight
 from backend.db.repositories.stats_repository import StatsRepository
 
 
@@ -22,15 +23,12 @@ def _compile_expression(expression: ColumnElement[Any]) -> str:
     return str(compiled)
 
 
-@pytest.mark.asyncio
-async def test_fight_duration_expression_uses_split_part() -> None:
-    """The duration helper should rely on PostgreSQL's ``split_part`` function."""
-
-    repository = StatsRepository(AsyncMock())
-    expression = repository._fight_duration_seconds_expression()
-    compiled = _compile_expression(expression).lower()
+def test_fight_duration_column_is_generated_from_round_and_time() -> None:
+    """Durations are stored by PostgreSQL rather than parsed per query."""
 
-    assert "split_part" in compiled
+    computed = Fight.__table__.c.duration_seconds.computed
+    assert computed is not None and computed.persisted
+    assert "split_part" in str(computed.sqltext)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+try:
+    import numpy  # noqa: F401
+    import pytest_asyncio
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
+    pytest.skip(
+        f"Optional dependency '{exc.name}' is required for fight graph analytics tests.",
+        allow_module_level=True,
+    )
+
+from backend.db.models import Base, Fight, Fighter
+from backend.db.repositories.fight_graph_repository import FightGraphRepository
+from backend.services.fight_graph_analytics import (
+    FightGraphAnalyticsEngine,
+    FightGraphAnalyticsService,
+    build_fight_graph_snapshot,
+)
+from tests.backend.postgres import TemporaryPostgresSchema, postgres_schema  # noqa: F401
+
+
+class StaticAdjacencySource:
+    """In-memory adjacency source mimicking the repository version contract."""
+
+    def __init__(
+        self,
+        edges: list[tuple[str, str, int]],
+        fighters: list[tuple[str, str, str | None]],
+    ) -> None:
+        self.edges = edges
+        self.fighters = fighters
+        self.version = (1, len(edges))
+        self.loads = 0
+
+    async def get_fight_graph_version(self) -> tuple[int, int]:
+        return self.version
+
+    async def get_fight_graph_adjacency(
+        self,
+    ) -> tuple[list[tuple[str, str, int]], list[tuple[str, str, str | None]]]:
+        self.loads += 1
+        return self.edges, self.fighters
+
+
+def _barbell() -> StaticAdjacencySource:
+    """Two four-fighter cliques joined through a single bridge bout d-e."""
+
+    left = ["a", "b", "c", "d"]
+    right = ["e", "f", "g", "h"]
+    edges = [
+        (x, y, 1)
+        for group in (left, right)
+        for index, x in enumerate(group)
+        for y in group[index + 1 :]
+    ]
+    edges.append(("d", "e", 2))
+    fighters = [(fid, fid.upper(), "Lightweight") for fid in left] + [
+        (fid, fid.upper(), "Welterweight") for fid in right
+    ]
+    return StaticAdjacencySource(edges, fighters)
+
+
+def test_exact_betweenness_on_path_matches_closed_form() -> None:
+    snapshot = build_fight_graph_snapshot(
+        [("a", "b", 1), ("b", "c", 1), ("c", "d", 1)],
+        [(fid, fid, None) for fid in "abcd"],
+        version="v",
+    )
+    # Interior nodes of a 4-path each lie on 2 of the 3 pairs not involving them.
+    assert snapshot.betweenness.tolist() == pytest.approx([0.0, 2 / 3, 2 / 3, 0.0])
+    assert snapshot.degree.tolist() == [1, 2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_bridge_fighters_rank_first_and_cliques_form_communities() -> None:
+    source = _barbell()
+    service = FightGraphAnalyticsService(source, FightGraphAnalyticsEngine())
+
+    centrality = await service.get_centrality(metric="betweenness", limit=2)
+    assert {entry.fighter_id for entry in centrality.fighters} == {"d", "e"}
+    assert centrality.data_version == "1:13"
+
+    communities = await service.get_communities(min_size=2)
+    assert communities.community_count == 2
+    groups = [{member.fighter_id for member in c.members} for c in communities.communities]
+    assert sorted(groups, key=sorted) == [set("abcd"), set("efgh")]
+    assert {c.dominant_division for c in communities.communities} == {
+        "Lightweight",
+        "Welterweight",
+    }
+
+    welterweights = await service.get_centrality(metric="eigenvector", division="Welterweight")
+    assert [entry.fighter_id for entry in welterweights.fighters][0] == "e"
+    assert source.loads == 1
+
+
+@pytest.mark.asyncio
+async def test_shortest_path_reports_hops_and_shared_bouts() -> None:
+    source = _barbell()
+    engine = FightGraphAnalyticsEngine()
+    service = FightGraphAnalyticsService(source, engine)
+
+    result = await service.get_shortest_path("a", "h")
+    assert result.degrees == 3
+    assert [step.fighter_id for step in result.path] == ["a", "d", "e", "h"]
+    assert [step.fights_with_previous for step in result.path] == [None, 1, 2, 1]
+
+    with pytest.raises(KeyError):
+        await service.get_shortest_path("a", "nobody")
+
+    source.edges = [edge for edge in source.edges if edge[:2] != ("d", "e")]
+    source.version = (2, len(source.edges))
+    disconnected = await service.get_shortest_path("a", "h")
+    assert disconnected.degrees is None
+    assert disconnected.path == []
+    assert source.loads == 2
+
+
+@pytest_asyncio.fixture
+async def session(
+    postgres_schema: TemporaryPostgresSchema,
+) -> AsyncIterator[AsyncSession]:
+    async with postgres_schema.session_scope(Base.metadata) as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_repository_adjacency_excludes_upcoming_bouts(session: AsyncSession) -> None:
+    session.add_all(
+        [
+            Fighter(id="a", name="Alpha", division="Lightweight"),
+            Fighter(id="b", name="Bravo", division="Lightweight"),
+            Fighter(id="c", name="Charlie", division=None),
+        ]
+    )
+    await session.flush()
+    session.add_all(
+        [
+            Fight(id="f1", fighter_id="a", opponent_id="b", opponent_name="Bravo",
+                  event_name="UFC 1", result="W", stats={}),
+            Fight(id="f2", fighter_id="b", opponent_id="a", opponent_name="Alpha",
+                  event_name="UFC 1", result="L", stats={}),
+            Fight(id="f3", fighter_id="a", opponent_id="c", opponent_name="Charlie",
+                  event_name="UFC 2", result="next", stats={}),
+        ]
+    )
+    await session.flush()
+    repo = FightGraphRepository(session)
+    await repo.refresh_edges()
+
+    edges, fighters = await repo.get_fight_graph_adjacency()
+    assert edges == [("a", "b", 2)]
+    assert sorted(fighters) == [("a", "Alpha", "Lightweight"), ("b", "Bravo", "Lightweight")]
+    max_id, count = await repo.get_fight_graph_version()
+    assert count == 2 and max_id > 0
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import date
+
+import pytest
+
+try:
+    import pytest_asyncio
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
+    pytest.skip(
+        f"Optional dependency '{exc.name}' is required for fight graph service tests.",
+        allow_module_level=True,
+    )
+
+from backend.db.models import Base, Fight, Fighter
+from backend.db.repositories.fight_graph_repository import FightGraphRepository
+from backend.services.fight_graph_service import FightGraphService
+from tests.backend.postgres import TemporaryPostgresSchema, postgres_schema  # noqa: F401
+
+
+@pytest_asyncio.fixture
+async def session(
+    postgres_schema: TemporaryPostgresSchema,
+) -> AsyncIterator[AsyncSession]:
+    async with postgres_schema.session_scope(Base.metadata) as session:
+        yield session
+
+
+async def _seed_round_robin(session: AsyncSession) -> None:
+    fighter_ids = ["ada", "bea", "cat", "dee"]
+    session.add_all(
+        [Fighter(id=fighter_id, name=fighter_id.title(), division="Flyweight")
+         for fighter_id in fighter_ids]
+    )
+    await session.flush()
+    fights: list[Fight] = []
+    for index, fighter_id in enumerate(fighter_ids):
+        for offset, opponent_id in enumerate(fighter_ids[index + 1 :], start=1):
+            for repeat in range(offset):
+                fight_key = f"{fighter_id}-{opponent_id}-{repeat}"
+                for side, other, result in (
+                    (fighter_id, opponent_id, "W"),
+                    (opponent_id, fighter_id, "L"),
+                ):
+                    fights.append(
+                        Fight(
+                            id=f"{fight_key}-{side}",
+                            fighter_id=side,
+                            opponent_id=other,
+                            opponent_name=other.title(),
+                            event_name=f"Event {fight_key}",
+                            event_date=date(2015 + repeat, 1 + index, 1),
+                            result=result,
+                            stats={},
+                        )
+                    )
+    session.add_all(fights)
+    await session.flush()
+    await FightGraphRepository(session).refresh_edges()
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_nodes_then_links_then_matching_metadata(
+    session: AsyncSession,
+) -> None:
+    await _seed_round_robin(session)
+    service = FightGraphService(FightGraphRepository(session))
+
+    records = [record async for record in service.stream_fight_graph(limit=10)]
+    buffered = await service.get_fight_graph(
+        division=None, start_year=None, end_year=None, limit=10, include_upcoming=False
+    )
+
+    kinds = [record["type"] for record in records]
+    assert kinds == ["node"] * 4 + ["link"] * 6 + ["metadata"]
+
+    streamed_links = [record["data"] for record in records if record["type"] == "link"]
+    assert streamed_links == [link.model_dump(mode="json") for link in buffered.links]
+
+    streamed_metadata = records[-1]["data"]
+    streamed_metadata.pop("generated_at")
+    buffered_metadata = dict(buffered.metadata)
+    buffered_metadata.pop("generated_at")
+    assert streamed_metadata == buffered_metadata
+    assert [entry["fights"] for entry in streamed_metadata["insights"]["busiest_rivalries"]] == [
+        6,
+        4,
+        4,
+        2,
+        2,
+    ]
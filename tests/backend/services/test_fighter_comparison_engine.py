@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Sequence
+
+import pytest
+
+try:
+    import numpy  # noqa: F401
+    import pytest_asyncio
+    from sqlalchemy import delete, insert
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
+    pytest.skip(
+        f"Optional dependency '{exc.name}' is required for comparison engine tests.",
+        allow_module_level=True,
+    )
+
+from backend.db.models import Base, Fighter, fighter_stats
+from backend.db.repositories.fighter.types import ComparisonMetricRow
+from backend.db.repositories.fighter_repository import FighterRepository
+from backend.db.repositories.stats_repository import StatsRepository
+from backend.services.fighter_comparison_engine import FighterComparisonEngine
+from tests.backend.postgres import TemporaryPostgresSchema, postgres_schema  # noqa: F401
+
+
+class StaticMetricSource:
+    """In-memory metric source that mimics the repository version contract."""
+
+    def __init__(self, rows: list[ComparisonMetricRow]) -> None:
+        self.rows = rows
+        self.watermark = 1
+        self.changed: set[str] = set()
+        self.calls: list[int | None] = []
+
+    async def get_comparison_stats_watermark(self) -> int:
+        return self.watermark
+
+    async def get_comparison_metric_rows(
+        self, metrics: Sequence[str], *, since_version: int | None = None
+    ) -> list[ComparisonMetricRow]:
+        self.calls.append(since_version)
+        return [
+            row
+            for row in self.rows
+            if row.metric in metrics and (since_version is None or row.fighter_id in self.changed)
+        ]
+
+
+def _row(fighter_id: str, division: str | None, metric: str, value: str) -> ComparisonMetricRow:
+    return ComparisonMetricRow(
+        fighter_id=fighter_id, division=division, metric=metric, value=value
+    )
+
+
+@pytest.mark.asyncio
+async def test_compare_returns_roster_and_division_percentiles_with_deltas() -> None:
+    source = StaticMetricSource(
+        [
+            _row("a", "Lightweight", "win_pct", "80%"),
+            _row("b", "Lightweight", "win_pct", "60%"),
+            _row("c", "Lightweight", "win_pct", "40%"),
+            _row("d", "Welterweight", "win_pct", "90%"),
+            _row("a", "Lightweight", "sig_strikes_landed_per_min", "--"),
+            _row("b", "Lightweight", "sig_strikes_landed_per_min", "4.5"),
+        ]
+    )
+    engine = FighterComparisonEngine(metrics=("win_pct", "sig_strikes_landed_per_min"))
+
+    await engine.ensure_current(source)
+    context = engine.compare(["a", "b", "missing"])
+
+    assert set(context) == {"a", "b"}
+    alpha = context["a"]["win_pct"]
+    assert alpha.value == 80.0
+    assert alpha.roster_percentile == 62.5
+    assert alpha.division_percentile == pytest.approx(83.33)
+    assert alpha.delta == 20.0
+    assert context["b"]["win_pct"].delta == -20.0
+    # Missing or placeholder values are omitted rather than reported as zero.
+    assert "sig_strikes_landed_per_min" not in context["a"]
+    assert context["b"]["sig_strikes_landed_per_min"].delta is None
+
+
+@pytest.mark.asyncio
+async def test_ensure_current_reloads_only_changed_fighters() -> None:
+    source = StaticMetricSource(
+        [
+            _row("a", "Lightweight", "win_pct", "50%"),
+            _row("b", "Lightweight", "win_pct", "70%"),
+        ]
+    )
+    engine = FighterComparisonEngine(metrics=("win_pct",))
+    await engine.ensure_current(source)
+    await engine.ensure_current(source)
+    assert source.calls == [None]
+
+    source.rows[0] = _row("a", "Lightweight", "win_pct", "90%")
+    source.changed = {"a"}
+    source.watermark = 5
+    await engine.ensure_current(source)
+
+    assert source.calls == [None, 1]
+    context = engine.compare(["a", "b"])
+    assert context["a"]["win_pct"].roster_percentile == 75.0
+    assert context["b"]["win_pct"].roster_percentile == 25.0
+
+
+@pytest.mark.asyncio
+async def test_current_matrix_skips_the_lock() -> None:
+    source = StaticMetricSource([_row("a", "Lightweight", "win_pct", "50%")])
+    engine = FighterComparisonEngine(metrics=("win_pct",))
+    await engine.ensure_current(source)
+
+    # An up-to-date matrix answers without queueing behind an in-flight update.
+    async with engine._lock:
+        await engine.ensure_current(source)
+    assert source.calls == [None]
+
+
+@pytest_asyncio.fixture
+async def session(
+    postgres_schema: TemporaryPostgresSchema,
+) -> AsyncIterator[AsyncSession]:
+    async with postgres_schema.session_scope(Base.metadata) as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_repository_rows_track_loader_rewrites(session: AsyncSession) -> None:
+    session.add_all(
+        [
+            Fighter(id="a", name="Alpha", division="Lightweight"),
+            Fighter(id="b", name="Bravo", division="Lightweight"),
+        ]
+    )
+    await session.flush()
+    await session.execute(
+        insert(fighter_stats),
+        [
+            {"fighter_id": "a", "category": "career", "metric": "win_pct", "value": "50%"},
+            {"fighter_id": "b", "category": "career", "metric": "win_pct", "value": "70%"},
+        ],
+    )
+    repo = FighterRepository(session)
+    engine = FighterComparisonEngine(metrics=("win_pct",))
+    await engine.ensure_current(repo)
+    watermark = await repo.get_comparison_stats_watermark()
+
+    # Mirror ``upsert_fighter_stats``: delete then re-insert the fighter's rows.
+    await session.execute(delete(fighter_stats).where(fighter_stats.c.fighter_id == "a"))
+    await session.execute(
+        insert(fighter_stats),
+        [{"fighter_id": "a", "category": "career", "metric": "win_pct", "value": "95%"}],
+    )
+    await StatsRepository(session).mark_fighter_stats_written(["a"])
+
+    changed = await repo.get_comparison_metric_rows(("win_pct",), since_version=watermark)
+    assert [row.fighter_id for row in changed] == ["a"]
+
+    await engine.ensure_current(repo)
+    assert engine.compare(["a", "b"])["a"]["win_pct"].roster_percentile == 75.0
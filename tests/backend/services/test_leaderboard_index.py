@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import date
+
+import pytest
+
+try:
+    import pytest_asyncio
+    from sqlalchemy import delete, insert
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
+    pytest.skip(
+        f"Optional dependency '{exc.name}' is required for leaderboard index tests.",
+        allow_module_level=True,
+    )
+
+from backend.db.models import Base, Fight, Fighter, fighter_stats
+from backend.db.repositories.stats_repository import StatsRepository
+from backend.services.leaderboard_index import LeaderboardIndex
+from tests.backend.postgres import TemporaryPostgresSchema, postgres_schema  # noqa: F401
+
+_FIGHTERS = {
+    # fighter_id: (division, dated bouts, win_pct, takedowns_avg)
+    "lw-a": ("Lightweight", 6, "70%", "2.5"),
+    "lw-b": ("Lightweight", 5, "90%", "1.0"),
+    "lw-c": ("Lightweight", 2, "95%", "4.0"),
+    "fw-a": ("Featherweight", 7, "80%", "3.0"),
+    "fw-b": ("Featherweight", 5, "80%", "--"),
+}
+
+
+@pytest_asyncio.fixture
+async def session(
+    postgres_schema: TemporaryPostgresSchema,
+) -> AsyncIterator[AsyncSession]:
+    async with postgres_schema.session_scope(Base.metadata) as session:
+        yield session
+
+
+async def _seed(session: AsyncSession) -> None:
+    session.add_all(
+        [
+            Fighter(id=fighter_id, name=fighter_id.upper(), division=division)
+            for fighter_id, (division, *_rest) in _FIGHTERS.items()
+        ]
+    )
+    await session.flush()
+    session.add_all(
+        [
+            Fight(
+                id=f"{fighter_id}-{idx}",
+                fighter_id=fighter_id,
+                opponent_id=None,
+                opponent_name=f"Opponent {idx}",
+                event_name="Test Event",
+                event_date=date(2022, 1, idx + 1),
+                result="Win",
+            )
+            for fighter_id, (_division, bouts, *_rest) in _FIGHTERS.items()
+            for idx in range(bouts)
+        ]
+    )
+    await session.execute(
+        insert(fighter_stats),
+        [
+            {"fighter_id": fighter_id, "category": "career", "metric": metric, "value": value}
+            for fighter_id, (_division, _bouts, *pair) in _FIGHTERS.items()
+            for metric, value in zip(("win_pct", "takedowns_avg"), pair, strict=True)
+        ],
+    )
+    await session.flush()
+
+
+async def _assert_matches_repository(
+    repository: StatsRepository, index: LeaderboardIndex
+) -> None:
+    for division in (None, "Lightweight", "Featherweight"):
+        for offset in (0, 1, 2):
+            query = {
+                "limit": 2,
+                "offset": offset,
+                "metrics": ("takedowns_avg", "win_pct"),
+                "division": division,
+                "min_fights": None,
+            }
+            expected = await repository.get_leaderboards(start_date=None, end_date=None, **query)
+            await index.ensure_current(repository)
+            assert index.leaderboards(**query).leaderboards == expected.leaderboards
+
+
+@pytest.mark.asyncio
+async def test_index_pages_match_sql_leaderboards(session: AsyncSession) -> None:
+    await _seed(session)
+    repository = StatsRepository(session)
+    index = LeaderboardIndex()
+
+    await _assert_matches_repository(repository, index)
+    computed_at = await repository.refresh_stats_snapshots()
+    await _assert_matches_repository(repository, index)
+
+    page = index.leaderboards(
+        metrics=("win_pct",), limit=3, offset=0, division=None, min_fights=None
+    )
+    # lw-c holds rank one but has too few bouts; fw-a beats fw-b on the id tiebreak.
+    assert [entry.fighter_id for entry in page.leaderboards[0].entries] == ["lw-b", "fw-a"]
+    assert page.computed_at == computed_at
+
+
+@pytest.mark.asyncio
+async def test_index_reslots_fighters_after_stats_upsert(session: AsyncSession) -> None:
+    await _seed(session)
+    repository = StatsRepository(session)
+    await repository.refresh_stats_snapshots()
+    index = LeaderboardIndex()
+    await index.ensure_current(repository)
+
+    # Mirror upsert_fighter_stats: replace every row for the fighter.
+    await session.execute(delete(fighter_stats).where(fighter_stats.c.fighter_id == "lw-a"))
+    await session.execute(
+        insert(fighter_stats),
+        [{"fighter_id": "lw-a", "category": "career", "metric": "win_pct", "value": "99%"}],
+    )
+    await repository.mark_fighter_stats_written(["lw-a"])
+    await session.flush()
+
+    await index.ensure_current(repository)
+    page = index.leaderboards(
+        metrics=("win_pct", "takedowns_avg"),
+        limit=5,
+        offset=0,
+        division="Lightweight",
+        min_fights=None,
+    )
+    boards = {
+        board.metric_id: [entry.fighter_id for entry in board.entries]
+        for board in page.leaderboards
+    }
+    assert boards == {"win_pct": ["lw-a", "lw-b"], "takedowns_avg": ["lw-b"]}
+    assert index.fighter_count == 5
+
+
+@pytest.mark.asyncio
+async def test_current_index_skips_the_lock(session: AsyncSession) -> None:
+    await _seed(session)
+    repository = StatsRepository(session)
+    index = LeaderboardIndex()
+    assert await repository.mark_fighter_stats_written(["lw-a"]) == 1
+    await index.ensure_current(repository)
+
+    # An up-to-date index answers without queueing behind an in-flight update.
+    async with index._lock:
+        await index.ensure_current(repository)
+    assert await repository.mark_fighter_stats_written(["fw-b"]) == 2
+    await index.ensure_current(repository)
+    assert index._watermark == 2
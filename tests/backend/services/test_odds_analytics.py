@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from backend.db.repositories.odds import OddsLine
+from backend.services.odds_analytics import (
+    STEAM_MOVE_WINDOW_MS,
+    american_to_probability,
+    analyze_odds,
+    parse_american_odds,
+)
+
+
+def test_american_odds_parse_to_implied_probability() -> None:
+    odds = parse_american_odds(["-200", "+150", "EVEN", " ev ", "+50", "n/a", None])
+    probabilities = american_to_probability(odds)
+
+    assert probabilities[:4] == pytest.approx([2 / 3, 0.4, 0.5, 0.5])
+    assert np.isnan(probabilities[4:]).all()
+
+
+def test_analytics_match_per_bout_loop() -> None:
+    hour = STEAM_MOVE_WINDOW_MS
+    lines = [
+        OddsLine("favourite", "-150", "-200", "+170"),
+        OddsLine("series-only", None, None, None),
+        OddsLine("empty", "+120", "", None),
+    ]
+    points = {
+        "favourite": [(0, 1.7), (hour // 2, 1.6), (hour, 1.58), (4 * hour, 1.5)],
+        "series-only": [(0, 2.5), (10, 0.0), (20, 2.2)],
+    }
+
+    favourite, series_only, empty = analyze_odds(lines, points)
+
+    assert favourite.opening_probability == pytest.approx(0.6, abs=1e-6)
+    assert favourite.closing_probability == pytest.approx(2 / 3, abs=1e-6)
+    assert favourite.probability_movement == pytest.approx(2 / 3 - 0.6, abs=1e-6)
+    assert favourite.fair_closing_probability == pytest.approx(
+        (2 / 3) / (2 / 3 + 100 / 270), abs=1e-6
+    )
+    changes = np.diff([1 / 1.7, 1 / 1.6, 1 / 1.58, 1 / 1.5])
+    assert favourite.volatility == pytest.approx(np.std(changes), abs=1e-6)
+    # The last jump is large but spread over three hours.
+    assert favourite.steam_moves == 1
+
+    # Without quoted lines the series endpoints stand in; the invalid price is dropped.
+    assert series_only.opening_probability == pytest.approx(0.4, abs=1e-6)
+    assert series_only.closing_probability == pytest.approx(1 / 2.2, abs=1e-6)
+    assert series_only.fair_closing_probability is None
+    assert series_only.steam_moves == 1
+
+    assert empty.opening_probability == pytest.approx(100 / 220, abs=1e-6)
+    assert empty.closing_probability is None
+    assert empty.probability_movement is None
+    assert empty.volatility is None
+    assert empty.steam_moves == 0
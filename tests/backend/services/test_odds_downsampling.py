@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from backend.services.odds_downsampling import downsample_odds_points, lttb_indices
+
+
+def _reference_lttb(points: list[tuple[float, float]], threshold: int) -> list[int]:
+    """Textbook per-sample LTTB used as the oracle for the vectorised version."""
+
+    n = len(points)
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    anchor = 0
+    for bucket in range(threshold - 2):
+        start = int(np.floor(1 + bucket * every))
+        end = int(np.floor(1 + (bucket + 1) * every))
+        next_end = int(np.floor(1 + (bucket + 2) * every)) if bucket < threshold - 3 else n
+        next_bucket = points[end:next_end] if bucket < threshold - 3 else points[-1:]
+        avg_x = sum(x for x, _ in next_bucket) / len(next_bucket)
+        avg_y = sum(y for _, y in next_bucket) / len(next_bucket)
+        ax, ay = points[anchor]
+        best_area, best = -1.0, start
+        for index in range(start, end):
+            x, y = points[index]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best_area, best = area, index
+        selected.append(best)
+        anchor = best
+    selected.append(n - 1)
+    return selected
+
+
+@pytest.mark.parametrize(("size", "threshold"), [(10, 3), (101, 7), (1000, 100), (2357, 250)])
+def test_lttb_matches_reference(size: int, threshold: int) -> None:
+    rng = np.random.default_rng(size)
+    x = np.cumsum(rng.integers(1, 60_000, size)).astype(np.float64)
+    y = 2.0 + np.cumsum(rng.normal(0, 0.02, size))
+
+    indices = lttb_indices(x, y, threshold)
+
+    points = list(zip(x.tolist(), y.tolist(), strict=True))
+    assert indices.tolist() == _reference_lttb(points, threshold)
+
+
+def test_downsample_keeps_endpoints_and_spikes() -> None:
+    points = [(1_700_000_000_000 + step * 60_000, 2.0) for step in range(500)]
+    points[321] = (points[321][0], 9.5)
+
+    sampled = downsample_odds_points(points, 20)
+
+    assert len(sampled) == 20
+    assert sampled[0] == points[0] and sampled[-1] == points[-1]
+    assert points[321] in sampled
+    assert [timestamp for timestamp, _ in sampled] == sorted(t for t, _ in sampled)
+
+
+def test_downsample_passes_short_series_through() -> None:
+    points = [(1, 2.0), (2, 2.1)]
+
+    assert downsample_odds_points(points, 3) is points
+    assert downsample_odds_points(points, None) is points
@@ -59,6 +59,7 @@ sys.modules["redis.exceptions"] = _redis_exceptions_module
 
 try:
     import pytest_asyncio
+    from sqlalchemy import func, select
     from sqlalchemy.ext.asyncio import AsyncSession
 except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
     pytest.skip(
@@ -67,7 +68,7 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency gua
     )
 
 # Import backend modules after dependency stubs are registered to avoid optional import errors.
-from backend.db.models import Base, Event, Fight, Fighter  # noqa: E402
+from backend.db.models import Base, Event, EventCardBout, Fight, Fighter  # noqa: E402
 from backend.db.repositories import PostgreSQLEventRepository  # noqa: E402
 from backend.schemas.event import PaginatedEventsResponse  # noqa: E402
 from backend.services.event_service import EventService  # noqa: E402
@@ -179,11 +180,77 @@ async def test_get_event_with_missing_weight_class(
     assert detail.fight_card[0].weight_class is None
 
 
+@pytest.mark.asyncio
+async def test_event_card_dedupes_perspectives_in_card_order(session: AsyncSession) -> None:
+    """Both corners of a bout should render once, following the scraped card order."""
+
+    event = Event(
+        id="evt-card",
+        name="UFC Card Night",
+        date=date(2024, 3, 3),
+        location="Card City",
+        status="upcoming",
+        promotion="UFC",
+        ufcstats_url="https://www.ufcstats.com/event-details/evt-card",
+    )
+    fighters = [Fighter(id=f"card-{idx}", name=f"Card Fighter {idx}") for idx in range(4)]
+    session.add_all([event, *fighters])
+    await session.flush()
+
+    def bout(fight_id: str, fighter: int, opponent: int, position: int | None) -> Fight:
+        return Fight(
+            id=fight_id,
+            fighter_id=f"card-{fighter}",
+            event_id=event.id,
+            opponent_id=f"card-{opponent}",
+            opponent_name=f"Listed Name {opponent}",
+            event_name=event.name,
+            event_date=event.date,
+            result="next",
+            weight_class="Welterweight",
+            card_position=position,
+        )
+
+    session.add_all(
+        [
+            bout("co-main", 0, 1, 1),
+            bout("co-main-opp", 1, 0, 1),
+            bout("history-row", 1, 0, None),
+            bout("main", 2, 3, 0),
+        ]
+    )
+    await session.flush()
+
+    repository = PostgreSQLEventRepository(session)
+
+    live = await repository.get_event(event.id)
+    await repository.refresh_event_cards([event.id])
+    assert await session.scalar(select(func.count()).select_from(EventCardBout)) == 2
+    published = await repository.get_event(event.id)
+
+    for detail in (live, published):
+        assert detail is not None
+        assert [
+            (fight.fight_id, fight.fighter_1_name, fight.fighter_2_name)
+            for fight in detail.fight_card
+        ] == [
+            ("main", "Card Fighter 2", "Card Fighter 3"),
+            ("co-main", "Card Fighter 0", "Card Fighter 1"),
+        ]
+
+    # Published cards pick up renames without being rebuilt.
+    fighters[0].name = "Renamed Fighter"
+    await session.flush()
+    renamed = await repository.get_event(event.id)
+    assert renamed is not None
+    assert renamed.fight_card[1].fighter_1_name == "Renamed Fighter"
+
+
 @pytest.mark.asyncio
 async def test_search_events_filters_event_type_with_manual_pagination(
     session: AsyncSession,
 ) -> None:
-    """Ensure event-type filtering paginates after in-memory classification."""
+    """Ensure event-type filtering paginates on the stored classification."""
 
     events: list[Event] = [
         Event(
@@ -248,3 +315,86 @@ async def test_search_events_filters_event_type_with_manual_pagination(
     assert [event.event_id for event in second_page.events] == ["evt-a"]
     assert len(second_page.events) == 1
     assert second_page.has_more is False
+
+
+@pytest.mark.asyncio
+async def test_search_events_combines_year_text_and_type_filters(
+    session: AsyncSession,
+) -> None:
+    """Year ranges, text search and event types should filter and count in SQL."""
+
+    session.add_all(
+        [
+            Event(
+                id=f"evt-{idx}",
+                name=name,
+                date=event_date,
+                location=location,
+                status="completed",
+            )
+            for idx, (name, event_date, location) in enumerate(
+                [
+                    ("UFC 299: Miami", date(2024, 3, 9), "Miami, Florida"),
+                    ("UFC Fight Night: Vegas 90", date(2024, 4, 6), "Las Vegas, Nevada"),
+                    ("UFC 300: Vegas", date(2024, 4, 13), "Las Vegas, Nevada"),
+                    ("UFC 309: New York", date(2024, 12, 31), "New York, New York"),
+                    ("UFC 310: Vegas", date(2025, 1, 1), "Las Vegas, Nevada"),
+                ]
+            )
+        ]
+    )
+    await session.flush()
+
+    repository = PostgreSQLEventRepository(session)
+    service = EventService(repository)
+
+    vegas_2024 = await service.search_events(q="vegas", year=2024, limit=1, offset=0)
+    assert [event.event_id for event in vegas_2024.events] == ["evt-2"]
+    assert (vegas_2024.total, vegas_2024.has_more) == (2, True)
+
+    ppv_2024 = await service.search_events(year=2024, event_type="ppv", limit=10, offset=0)
+    assert [event.event_id for event in ppv_2024.events] == ["evt-3", "evt-2", "evt-0"]
+    assert ppv_2024.total == 3
+    assert {event.event_type for event in ppv_2024.events} == {"ppv"}
+
+
+@pytest.mark.asyncio
+async def test_event_facets_condition_on_other_filters(session: AsyncSession) -> None:
+    """Facet counts should ignore their own filter but honour every other one."""
+
+    session.add_all(
+        [
+            Event(id=event_id, name=name, date=event_date, location=location, status=status)
+            for event_id, name, event_date, location, status in [
+                ("f-1", "UFC 290: A", date(2023, 7, 8), "Las Vegas, NV", "completed"),
+                ("f-2", "UFC Fight Night: B", date(2023, 9, 2), "Paris", "completed"),
+                ("f-3", "UFC 300: C", date(2024, 4, 13), "Las Vegas, NV", "completed"),
+                ("f-4", "UFC Fight Night: D", date(2024, 6, 1), "Las Vegas, NV", "completed"),
+                ("f-5", "UFC 320: E", date(2025, 10, 4), None, "upcoming"),
+            ]
+        ]
+    )
+    await session.flush()
+
+    repository = PostgreSQLEventRepository(session)
+    service = EventService(repository)
+    live = await service.get_filter_facets(year=2024, location="vegas")
+    await repository.refresh_event_facets()
+    facets = await service.get_filter_facets(year=2024, location="vegas")
+
+    assert facets == live
+    # Years ignore the year filter but keep the location filter.
+    assert [(facet.value, facet.count) for facet in facets.years] == [(2024, 2), (2023, 1)]
+    assert [(facet.value, facet.count) for facet in facets.locations] == [("Las Vegas, NV", 2)]
+    assert {facet.value: facet.count for facet in facets.event_types} == {
+        "ppv": 1,
+        "fight_night": 1,
+    }
+
+    unfiltered = await service.get_filter_facets()
+    assert [(facet.value, facet.count) for facet in unfiltered.statuses] == [
+        ("completed", 4),
+        ("upcoming", 1),
+    ]
+    searched = await service.get_filter_facets(q="fight night")
+    assert [(facet.value, facet.count) for facet in searched.years] == [(2024, 1), (2023, 1)]
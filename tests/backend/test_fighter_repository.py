@@ -17,6 +17,7 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency gua
 
 from backend.db.models import Base, Fighter
 from backend.db.repositories import PostgreSQLFighterRepository
+from backend.db.repositories.fighter import FighterRepository
 from tests.backend.postgres import (
     TemporaryPostgresSchema,
     postgres_schema,
@@ -393,3 +394,85 @@ async def test_search_fighters_facade_forwards_latest_options(
     # default values.
     assert captured_kwargs["streak_window"] == 12
     assert captured_kwargs["include_locations"] is False
+
+
+@pytest.mark.asyncio
+async def test_location_rollups_match_live_aggregates(session: AsyncSession) -> None:
+    """Location stats served from the rollup table should mirror the live GROUP BYs."""
+
+    session.add_all(
+        [
+            Fighter(
+                id="loc-1",
+                name="Ana",
+                birthplace_city="Dublin",
+                birthplace_country="Ireland",
+                nationality="Irish",
+                training_gym="SBG",
+                training_city="Dublin",
+                training_country="Ireland",
+                last_fight_date=date(2024, 1, 1),
+            ),
+            Fighter(
+                id="loc-2",
+                name="Bo",
+                birthplace_city="Cork",
+                birthplace_country="Ireland",
+                nationality="Irish",
+                training_gym="SBG",
+                training_city="Dublin",
+                training_country="Ireland",
+                last_fight_date=date(2023, 1, 1),
+                ufc_com_slug="bo",
+            ),
+            Fighter(
+                id="loc-3",
+                name="Cy",
+                training_gym="SBG",
+                training_city="Dublin",
+                training_country="Ireland",
+                needs_manual_review=True,
+            ),
+            Fighter(
+                id="loc-4",
+                name="Di",
+                birthplace_city="Albuquerque",
+                birthplace_country="USA",
+                training_gym="Jackson Wink",
+                training_city="Albuquerque",
+                training_country="USA",
+            ),
+        ]
+    )
+    await session.flush()
+    repo = FighterRepository(session)
+
+    live = (
+        await repo.get_country_stats("birthplace"),
+        await repo.get_city_stats("training", "Ireland"),
+        await repo.get_gym_stats(),
+        await repo.get_location_coverage(),
+    )
+    await repo.refresh_location_rollups()
+    rolled = (
+        await repo.get_country_stats("birthplace"),
+        await repo.get_city_stats("training", "Ireland"),
+        await repo.get_gym_stats(),
+        await repo.get_location_coverage(),
+    )
+
+    assert rolled == live
+    session.add(Fighter(id="loc-5", name="Ed", nationality="Brazil"))
+    await session.flush()
+    assert (await repo.get_location_coverage())["total_fighters"] == 4
+    await repo.refresh_location_rollups()
+    assert (await repo.get_location_coverage())["total_fighters"] == 5
+    countries, total = rolled[0]
+    assert total == 4
+    assert countries[0] == {"country": "Ireland", "count": 2, "percentage": 50.0}
+    sbg = rolled[2][0]
+    assert (sbg["gym"], sbg["fighter_count"]) == ("SBG", 3)
+    assert sbg["notable_fighters"] == ["Ana", "Bo"]
+    assert rolled[3]["with_ufc_com_slug"] == 1
+    assert rolled[3]["needs_manual_review"] == 1
+    assert rolled[3]["never_scraped"] == 4
@@ -9,7 +9,7 @@ import pytest
 
 try:
     import pytest_asyncio
-    from sqlalchemy import insert
+    from sqlalchemy import insert, select
     from sqlalchemy.ext.asyncio import AsyncSession
 except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
     pytest.skip(
@@ -17,10 +17,11 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency gua
         allow_module_level=True,
     )
 
-from backend.db.models import Base, Fight, Fighter, fighter_stats
+from backend.db.models import Base, Fight, Fighter, FightTrendRollup, fighter_stats
 from backend.db.repositories import PostgreSQLFighterRepository
 from backend.schemas.fighter import FighterDetail
 from scripts.load_scraped_data import (
+    _parse_fight_duration_seconds,
     calculate_fighter_stats,
     calculate_longest_win_streak,
     load_fighter_detail,
@@ -249,6 +250,21 @@ def test_calculate_longest_win_streak_orders_by_event_date() -> None:
     assert calculate_longest_win_streak(fights) == 3
 
 
+def test_calculate_longest_win_streak_accepts_w_prefixed_results() -> None:
+    """Any result starting with "W" counts as a win; blank results are skipped."""
+
+    fights: list[dict[str, Any]] = [
+        {"event_date": "2024-01-01", "result": "Win (KO)"},
+        {"event_date": "2024-02-01", "result": "WIN"},
+        {"event_date": "2024-03-01", "result": ""},
+        {"event_date": "2024-04-01", "result": "w"},
+        {"event_date": "2024-05-01", "result": "NC"},
+        {"event_date": "2024-06-01", "result": "W"},
+    ]
+
+    assert calculate_longest_win_streak(fights) == 3
+
+
 @pytest.mark.asyncio
 async def test_get_fighter_returns_aggregated_stats(session: AsyncSession) -> None:
     fighter = Fighter(
@@ -519,6 +535,45 @@ async def test_load_fighter_detail_defaults_missing_stats(
     assert stored_fight.stats == {}
 
 
+@pytest.mark.asyncio
+async def test_load_fighter_detail_defers_trend_rollups_to_caller(
+    session: AsyncSession, tmp_path: Path
+) -> None:
+    """Touched event dates are collected for one refresh per run instead of per fighter."""
+
+    fighter_payload: dict[str, Any] = {
+        "fighter_id": "loader-fighter-trends",
+        "name": "Loader Fighter Trends",
+        "division": "Lightweight",
+        "fight_history": [
+            {
+                "fight_id": "loader-fight-3",
+                "event_name": "Loader Event",
+                "event_date": "2024-03-03",
+                "opponent": "Opponent",
+                "result": "W",
+                "method": "KO/TKO",
+            }
+        ],
+    }
+    detail_path: Path = tmp_path / "loader_fighter_trends.json"
+    detail_path.write_text(json.dumps(fighter_payload), encoding="utf-8")
+
+    trend_dates: set[date | None] = set()
+    assert await load_fighter_detail(session, detail_path, trend_dates=trend_dates) is True
+
+    assert trend_dates == {date(2024, 3, 3)}
+    assert (await session.scalars(select(FightTrendRollup))).all() == []
+
+    # Reloading also reports the dates being replaced.
+    fighter_payload["fight_history"][0]["event_date"] = "2024-04-04"
+    detail_path.write_text(json.dumps(fighter_payload), encoding="utf-8")
+    trend_dates.clear()
+    assert await load_fighter_detail(session, detail_path, trend_dates=trend_dates) is True
+
+    assert trend_dates == {date(2024, 3, 3), date(2024, 4, 4)}
+
+
 @pytest.mark.asyncio
 async def test_compare_fighters_returns_stats(session: AsyncSession) -> None:
     first = Fighter(id="alpha", name="Alpha", record="10-2-0", division="Lightweight")
@@ -677,3 +732,36 @@ async def test_search_fighters_filters_by_extended_win_streak(
     assert [fighter.fighter_id for fighter in fighters] == ["streaker"]
     assert fighters[0].current_streak_type == "win"
     assert fighters[0].current_streak_count == 7
+
+
+@pytest.mark.asyncio
+async def test_stored_duration_matches_loader_parser(session: AsyncSession) -> None:
+    """The generated ``duration_seconds`` column should agree with the loader helper."""
+
+    session.add(Fighter(id="clock", name="Clock Watcher"))
+    await session.flush()
+    samples = [(3, "04:30"), (1, "0:30"), (5, "5:00"), (1, "--"), (None, "2:00"), (2, "bad")]
+    session.add_all(
+        [
+            Fight(
+                id=f"clock-{index}",
+                fighter_id="clock",
+                opponent_name="Opponent",
+                event_name="Event",
+                result="W",
+                round=round_value,
+                time=time_value,
+            )
+            for index, (round_value, time_value) in enumerate(samples)
+        ]
+    )
+    await session.flush()
+
+    result = await session.execute(
+        select(Fight.round, Fight.time, Fight.duration_seconds).order_by(Fight.id)
+    )
+    rows = result.all()
+    assert [row.duration_seconds for row in rows] == [
+        _parse_fight_duration_seconds(row.time, row.round) for row in rows
+    ]
+    assert [row.duration_seconds for row in rows][:3] == [870, 30, 1500]
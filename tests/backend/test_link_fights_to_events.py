@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import date
+
+import pytest
+
+try:
+    import pytest_asyncio
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
+except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
+    pytest.skip(
+        f"Optional dependency '{exc.name}' is required for fight-event linker tests.",
+        allow_module_level=True,
+    )
+
+from backend.db.models import Base, Event, EventCardBout, Fight, Fighter
+from scripts.link_fights_to_events import link_fights_to_events
+from tests.backend.postgres import TemporaryPostgresSchema, postgres_schema  # noqa: F401
+
+
+@pytest_asyncio.fixture
+async def session(
+    postgres_schema: TemporaryPostgresSchema,  # noqa: F811
+) -> AsyncIterator[AsyncSession]:
+    """Provide an async session bound to a disposable PostgreSQL schema."""
+
+    async with postgres_schema.session_scope(Base.metadata) as session:
+        yield session
+
+
+async def _seed(session: AsyncSession) -> None:
+    session.add_all(
+        [
+            Event(id="evt-b", name="UFC 300", date=date(2024, 4, 13), status="completed"),
+            # Duplicate names resolve to the lowest event id.
+            Event(id="evt-a", name="ufc 300 ", date=date(2024, 4, 13), status="completed"),
+            Event(id="evt-c", name="UFC 301", date=date(2024, 5, 4), status="completed"),
+            Fighter(id="fighter-1", name="Fighter One"),
+        ]
+    )
+    await session.flush()
+
+    def fight(fight_id: str, event_name: str, event_id: str | None = None) -> Fight:
+        return Fight(
+            id=fight_id,
+            fighter_id="fighter-1",
+            opponent_name=f"Opponent {fight_id}",
+            event_name=event_name,
+            event_id=event_id,
+            event_date=date(2024, 4, 13),
+            result="W",
+        )
+
+    session.add_all(
+        [
+            fight("matched", "  UFC 300\t"),
+            fight("unmatched", "UFC Fight Night Nowhere"),
+            fight("already-linked", "UFC 300", event_id="evt-c"),
+        ]
+    )
+    await session.commit()
+
+
+async def _event_ids(session: AsyncSession) -> dict[str, str | None]:
+    result = await session.execute(select(Fight.id, Fight.event_id))
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_link_fights_matches_normalized_names(session: AsyncSession) -> None:
+    await _seed(session)
+
+    assert await link_fights_to_events(session) == (1, 1)
+
+    assert await _event_ids(session) == {
+        "matched": "evt-a",
+        "unmatched": None,
+        "already-linked": "evt-c",
+    }
+    cards = await session.execute(select(EventCardBout.event_id, EventCardBout.fight_id))
+    assert cards.all() == [("evt-a", "matched")]
+
+    # Rerunning finds nothing new to link.
+    assert await link_fights_to_events(session) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_link_fights_dry_run_leaves_fights_unlinked(session: AsyncSession) -> None:
+    await _seed(session)
+
+    assert await link_fights_to_events(session, dry_run=True) == (1, 1)
+
+    assert await _event_ids(session) == {
+        "matched": None,
+        "unmatched": None,
+        "already-linked": "evt-c",
+    }
@@ -101,7 +101,12 @@ class StubOddsQueryService:
         self.return_none = False
 
     async def get_fighter_odds_history(
-        self, fighter_id: str, *, limit: int = 100, min_quality: str | None = None
+        self,
+        fighter_id: str,
+        *,
+        limit: int = 100,
+        min_quality: str | None = None,
+        cursor: str | None = None,
     ):
         if self.raise_invalid:
             raise InvalidQualityTierError("bad quality")
@@ -109,12 +114,14 @@ class StubOddsQueryService:
             return None
         return self.history_response
 
-    async def get_fighter_odds_chart(self, fighter_id: str, *, limit: int = 20):
+    async def get_fighter_odds_chart(
+        self, fighter_id: str, *, limit: int = 20, max_points: int | None = None
+    ):
         if self.return_none:
             return None
         return self.chart_response
 
-    async def get_fight_odds_detail(self, odds_id: str):
+    async def get_fight_odds_detail(self, odds_id: str, *, max_points: int | None = None):
         if self.return_none:
             return None
         return self.detail_response
@@ -213,6 +220,8 @@ def test_fight_detail_endpoint(client: TestClient) -> None:
     response = client.get("/odds/fight/odds-1")
     assert response.status_code == 200
     assert response.json()["opponent_name"] == "Opponent"
+    # The stubbed bout is in the past, so its odds series is immutable.
+    assert "max-age=86400" in response.headers["cache-control"]
 
 
 def test_stats_endpoint(client: TestClient) -> None:
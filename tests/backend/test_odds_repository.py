@@ -15,7 +15,7 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency gua
     )
 
 from backend.db.models import Base, Fighter, FighterOdds
-from backend.db.repositories.odds import OddsRepository
+from backend.db.repositories.odds import OddsCursor, OddsLine, OddsRepository, parse_odds_points
 from tests.backend.postgres import TemporaryPostgresSchema, postgres_schema  # noqa: F401
 
 
@@ -164,3 +164,178 @@ async def test_quality_stats_reflects_dataset(session: AsyncSession) -> None:
     assert stats["coverage"]["fighters_with_odds"] == 1
     assert stats["quality_distribution"]["excellent"] == 1
     assert stats["quality_distribution"]["good"] == 0
+
+
+@pytest.mark.asyncio
+async def test_odds_points_round_trip_in_time_order(session: AsyncSession) -> None:
+    session.add(Fighter(id="fighter-p", name="Points"))
+    await session.flush()
+    session.add(
+        FighterOdds(
+            id="odds-points",
+            fighter_id="fighter-p",
+            opponent_name="Opponent",
+            event_name="Event",
+            mean_odds_history=[],
+            num_odds_points=0,
+            scraped_at=datetime(2024, 1, 1),
+        )
+    )
+    await session.flush()
+
+    history = [
+        *reversed(_make_history()),
+        {"timestamp": "2023-11-14T02:00:00+00:00", "odds": "1.95"},
+        {"timestamp_ms": 1700003600000, "odds": 2.0},
+        {"timestamp_ms": 1700010800000, "odds": "n/a"},
+    ]
+    repository = OddsRepository(session)
+    await repository.replace_odds_points({"odds-points": parse_odds_points(history)})
+    await repository.replace_odds_points({"odds-points": parse_odds_points(history)})
+
+    points = await repository.get_odds_points(["odds-points", "odds-missing"])
+    assert points == {
+        "odds-points": [
+            (1699927200000, 1.95),
+            (1700000000000, 2.1),
+            (1700003600000, 2.0),
+        ],
+        "odds-missing": [],
+    }
+
+
+def test_parse_odds_points_skips_malformed_timestamps(caplog: pytest.LogCaptureFixture) -> None:
+    history = [
+        {"timestamp_ms": "not-a-number", "odds": 1.8},
+        {"timestamp_ms": [1700000000000], "odds": 1.9},
+        {"timestamp_ms": "1700000000000", "odds": 2.1},
+    ]
+
+    with caplog.at_level("WARNING", logger="backend.db.repositories.odds"):
+        assert parse_odds_points(history) == [(1700000000000, 2.1)]
+    assert len(caplog.records) == 2
+
+
+@pytest.mark.asyncio
+async def test_odds_lines_pair_opponent_closing_line(session: AsyncSession) -> None:
+    session.add_all([Fighter(id="fighter-r", name="Red"), Fighter(id="fighter-b2", name="Blue")])
+    await session.flush()
+
+    def odds(odds_id: str, fighter_id: str, opponent: str, event: str, **lines: str) -> FighterOdds:
+        return FighterOdds(
+            id=odds_id,
+            fighter_id=fighter_id,
+            opponent_name=opponent,
+            event_name=event,
+            mean_odds_history=[],
+            num_odds_points=0,
+            scraped_at=datetime(2024, 1, 1),
+            **lines,
+        )
+
+    session.add_all(
+        [
+            odds(
+                "red-1",
+                "fighter-r",
+                "blue",
+                "Event 1",
+                opening_odds="-150",
+                closing_range_start="-180",
+                closing_range_end="",
+            ),
+            odds("blue-1", "fighter-b2", "Red", "Event 1", closing_range_end="+160"),
+            odds("red-2", "fighter-r", "Blue", "Event 2", closing_range_end="-110"),
+        ]
+    )
+    await session.flush()
+
+    lines = await OddsRepository(session).list_odds_lines()
+
+    assert lines == [
+        OddsLine("blue-1", None, "+160", "-180"),
+        OddsLine("red-1", "-150", "-180", "+160"),
+        OddsLine("red-2", None, "-110", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_follow_list_order(session: AsyncSession) -> None:
+    session.add(Fighter(id="fighter-k", name="Keyset"))
+    await session.flush()
+    tiers = ["excellent", "poor", "good", None, "usable", "no_data"]
+    session.add_all(
+        FighterOdds(
+            id=f"odds-k{index}",
+            fighter_id="fighter-k",
+            opponent_name=f"Opponent {index}",
+            event_name=f"Event {index}",
+            # Two bouts share each date (or lack one) so pages split on ties.
+            event_date=date(2024, 1 + index // 2, 1) if index < 4 else None,
+            mean_odds_history=[],
+            num_odds_points=0,
+            data_quality_tier=tier,
+            scraped_at=datetime(2024, 6, 1),
+        )
+        for index, tier in enumerate(tiers)
+    )
+    await session.flush()
+
+    repo = OddsRepository(session)
+    expected = [row.id for row in await repo.list_fighter_odds("fighter-k")]
+    assert expected == ["odds-k3", "odds-k2", "odds-k1", "odds-k0", "odds-k5", "odds-k4"]
+
+    paged: list[str] = []
+    cursor = None
+    while True:
+        page = await repo.list_fighter_odds("fighter-k", limit=2, after=cursor)
+        if not page:
+            break
+        paged.extend(row.id for row in page)
+        cursor = OddsCursor.from_row(page[-1])
+    assert paged == expected
+
+    good = await repo.list_fighter_odds("fighter-k", min_quality="good")
+    assert [row.id for row in good] == ["odds-k2", "odds-k0"]
+    assert await repo.count_fighter_odds("fighter-k", min_quality="no_data") == 5
+
+
+@pytest.mark.asyncio
+async def test_quality_counter_deltas_track_rewrites(session: AsyncSession) -> None:
+    session.add_all([Fighter(id="fighter-s1", name="One"), Fighter(id="fighter-s2", name="Two")])
+    session.add(
+        FighterOdds(
+            id="odds-s1",
+            fighter_id="fighter-s1",
+            opponent_name="Opp",
+            event_name="Event",
+            mean_odds_history=[],
+            num_odds_points=40,
+            data_quality_tier="good",
+            scraped_at=datetime(2024, 1, 1),
+        )
+    )
+    await session.flush()
+    repo = OddsRepository(session)
+    await repo.rebuild_quality_counters()
+
+    # Reassign the record to another fighter with a new tier, as a reload might.
+    odds_ids = ["odds-s1"]
+    fighter_ids = {"fighter-s2"} | await repo.odds_owners(odds_ids)
+    before = await repo.quality_counters(odds_ids=odds_ids, fighter_ids=fighter_ids)
+    record = await session.get(FighterOdds, "odds-s1")
+    assert record is not None
+    record.fighter_id = "fighter-s2"
+    record.num_odds_points = 60
+    record.data_quality_tier = "excellent"
+    await session.flush()
+    after = await repo.quality_counters(odds_ids=odds_ids, fighter_ids=fighter_ids)
+    await repo.apply_quality_counter_delta(before, after)
+
+    stats = await repo.get_quality_stats()
+    assert stats["total_records"] == 1
+    assert stats["unique_fighters"] == 1
+    assert stats["avg_odds_points"] == 60
+    assert stats["quality_distribution"]["excellent"] == 1
+    assert stats["quality_distribution"]["good"] == 0
+    assert stats["coverage"]["coverage_percentage"] == 50.0
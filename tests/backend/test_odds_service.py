@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
+from backend.db.repositories.odds import OddsCursor, OddsLine, parse_odds_points
 from backend.schemas.odds import (
     FighterOddsHistoryResponse,
     OddsQualityStatsResponse,
 )
+from backend.services import caching
+from backend.services.cache_policy import IMMUTABLE, VOLATILE
 from backend.services.odds_query_service import (
+    InvalidOddsCursorError,
     InvalidQualityTierError,
     OddsQueryService,
 )
@@ -21,6 +26,8 @@ class StubRepository:
         self.rows: list[SimpleNamespace] = []
         self.total = 0
         self.detail_row: SimpleNamespace | None = None
+        self.analytics_row: SimpleNamespace | None = None
+        self.last_after: OddsCursor | None = None
         self.stats_payload = {
             "total_records": 0,
             "unique_fighters": 0,
@@ -41,12 +48,29 @@ class StubRepository:
         *,
         limit: int | None = None,
         min_quality: str | None = None,
+        after: OddsCursor | None = None,
     ) -> list[SimpleNamespace]:
-        return list(self.rows)
+        self.last_after = after
+        return list(self.rows)[:limit]
 
     async def get_odds_by_id(self, odds_id: str) -> SimpleNamespace | None:
         return self.detail_row if self.detail_row and self.detail_row.id == odds_id else None
 
+    async def get_odds_points(self, odds_ids: list[str]) -> dict[str, list[tuple[int, float]]]:
+        rows = {row.id: row for row in [*self.rows, self.detail_row] if row is not None}
+        return {odds_id: parse_odds_points(rows[odds_id].mean_odds_history) for odds_id in odds_ids}
+
+    async def list_odds_lines(self, odds_ids: list[str] | None = None) -> list[OddsLine]:
+        rows = [row for row in [*self.rows, self.detail_row] if row is not None]
+        return [
+            OddsLine(row.id, row.opening_odds, row.closing_range_end, None)
+            for row in rows
+            if odds_ids is None or row.id in odds_ids
+        ]
+
+    async def get_odds_analytics(self, odds_id: str) -> SimpleNamespace | None:
+        return self.analytics_row
+
     async def get_quality_stats(self) -> dict:
         return self.stats_payload
 
@@ -108,6 +132,32 @@ async def test_invalid_quality_raises() -> None:
         await service.get_fighter_odds_history("fighter-1", min_quality="legendary")
 
 
+@pytest.mark.asyncio
+async def test_history_pages_with_opaque_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(caching, "_local_cache", {})
+    repo = StubRepository()
+    repo.total = 3
+    repo.rows = [
+        _row(id="odds-3", event_date=date(2024, 3, 1)),
+        _row(id="odds-2", event_date=None),
+        _row(id="odds-1", event_date=None),
+    ]
+    service = OddsQueryService(repo, cache=None)
+
+    first = await service.get_fighter_odds_history("fighter-1", limit=2)
+    assert first is not None and first.next_cursor is not None
+    assert [entry.id for entry in first.odds_history] == ["odds-3", "odds-2"]
+
+    repo.rows = repo.rows[2:]
+    second = await service.get_fighter_odds_history("fighter-1", limit=2, cursor=first.next_cursor)
+    assert second is not None
+    assert second.next_cursor is None
+    assert repo.last_after == OddsCursor(None, datetime(2024, 1, 1, 12, 0, 0), "odds-2")
+
+    with pytest.raises(InvalidOddsCursorError):
+        await service.get_fighter_odds_history("fighter-1", cursor="not-a-cursor")
+
+
 @pytest.mark.asyncio
 async def test_chart_sorts_time_series() -> None:
     repo = StubRepository()
@@ -132,6 +182,86 @@ async def test_detail_payload_includes_history() -> None:
     assert len(detail.mean_odds_history) == 2
 
 
+@pytest.mark.asyncio
+async def test_detail_analytics_prefer_stored_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(caching, "_local_cache", {})
+    repo = StubRepository()
+    repo.detail_row = _row()
+    service = OddsQueryService(repo, cache=None)
+
+    # Nothing precomputed yet: analysed from the series in hand.
+    live = await service.get_fight_odds_detail("odds-1")
+    assert live is not None and live.analytics is not None
+    assert live.analytics.opening_probability == pytest.approx(100 / 210, abs=1e-6)
+    assert live.analytics.closing_probability == pytest.approx(100 / 230, abs=1e-6)
+    assert live.analytics.fair_closing_probability is None
+
+    monkeypatch.setattr(caching, "_local_cache", {})
+    repo.analytics_row = SimpleNamespace(
+        opening_probability=0.5,
+        closing_probability=0.4,
+        fair_closing_probability=0.38,
+        probability_movement=-0.1,
+        volatility=0.02,
+        steam_moves=1,
+    )
+    stored = await service.get_fight_odds_detail("odds-1")
+    assert stored is not None and stored.analytics is not None
+    assert stored.analytics.fair_closing_probability == 0.38
+    assert stored.analytics.steam_moves == 1
+
+
+@pytest.mark.asyncio
+async def test_chart_downsamples_series_to_max_points(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(caching, "_local_cache", {})
+    repo = StubRepository()
+    history = [
+        {"timestamp_ms": 1_700_000_000_000 + step * 60_000, "odds": 2.0 + (step % 7) / 10}
+        for step in range(400)
+    ]
+    repo.rows = [_row(id="dense", mean_odds_history=history)]
+    service = OddsQueryService(repo, cache=None)
+
+    full = await service.get_fighter_odds_chart("fighter-1")
+    sampled = await service.get_fighter_odds_chart("fighter-1", max_points=50)
+
+    assert full is not None and sampled is not None
+    assert len(full.fights[0].time_series) == 400
+    series = sampled.fights[0].time_series
+    assert len(series) == 50
+    assert series[0] == full.fights[0].time_series[0]
+    assert series[-1] == full.fights[0].time_series[-1]
+
+
+class RecordingCache:
+    def __init__(self) -> None:
+        self.ttls: dict[str, int | None] = {}
+
+    async def get_json(self, key: str) -> Any:
+        return None
+
+    async def set_json(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.ttls[key] = ttl
+
+
+@pytest.mark.asyncio
+async def test_detail_cache_lifetime_follows_bout_date(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(caching, "_local_cache", {})
+    repo = StubRepository()
+    cache = RecordingCache()
+    service = OddsQueryService(repo, cache=cache)  # type: ignore[arg-type]
+
+    repo.detail_row = _row(id="past", event_date=date(2020, 1, 1))
+    await service.get_fight_odds_detail("past")
+    repo.detail_row = _row(id="next", event_date=date.today() + timedelta(days=7))
+    await service.get_fight_odds_detail("next")
+
+    assert cache.ttls == {
+        "odds:fight:past:all": IMMUTABLE.ttl,
+        "odds:fight:next:all": VOLATILE.ttl,
+    }
+
+
 @pytest.mark.asyncio
 async def test_stats_adapts_repository_payload() -> None:
     repo = StubRepository()
@@ -15,6 +15,7 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency gua
     )
 
 from backend.db.models import Base, Fighter, FighterRanking
+from backend.db.repositories.fighter_repository import FighterRepository
 from backend.db.repositories.ranking_repository import RankingRepository
 from tests.backend.postgres import (
     TemporaryPostgresSchema,
@@ -68,3 +69,148 @@ async def test_get_peak_ranking_prefers_latest_snapshot_for_tied_rank(
     assert peak is not None
     assert peak["rank_date"] == date(2024, 4, 1)
     assert peak["peak_rank"] == 3
+
+
+@pytest.mark.asyncio
+async def test_current_rankings_snapshot_matches_latest_dates(session: AsyncSession) -> None:
+    session.add_all([Fighter(id=f"fighter-{idx}", name=f"Fighter {idx}") for idx in range(4)])
+    await session.flush()
+
+    def ranking(fighter: int, division: str, rank: int | None, day: date, source: str):
+        return FighterRanking(
+            fighter_id=f"fighter-{fighter}",
+            division=division,
+            rank=rank,
+            previous_rank=None,
+            rank_date=day,
+            source=source,
+        )
+
+    session.add_all(
+        [
+            ranking(0, "Lightweight", 1, date(2024, 1, 1), "ufc"),
+            ranking(1, "Lightweight", 2, date(2024, 1, 1), "ufc"),
+            ranking(1, "Lightweight", 1, date(2024, 3, 1), "ufc"),
+            ranking(0, "Lightweight", None, date(2024, 3, 1), "ufc"),
+            ranking(2, "Lightweight", 0, date(2024, 3, 1), "ufc"),
+            ranking(3, "Flyweight", 4, date(2023, 12, 1), "ufc"),
+            ranking(3, "Flyweight", 2, date(2024, 6, 1), "fightmatrix"),
+        ]
+    )
+    await session.flush()
+
+    repo = RankingRepository(session)
+    live_all = await repo.get_all_current_rankings("ufc")
+    live_lightweight = await repo.get_current_rankings("Lightweight", "ufc")
+    assert await repo.get_current_rankings_version("ufc") is None
+    assert [(row["division"], row["fighter_id"]) for row in live_all] == [
+        ("Flyweight", "fighter-3"),
+        ("Lightweight", "fighter-2"),
+        ("Lightweight", "fighter-1"),
+        ("Lightweight", "fighter-0"),
+    ]
+
+    await repo.refresh_ranking_tables(["ufc"])
+
+    assert await repo.get_current_rankings_version("ufc") is not None
+    assert await repo.get_current_rankings_version("fightmatrix") is None
+    assert await repo.get_current_rankings_version("ufc", "Flyweight") is not None
+    assert await repo.get_current_rankings_version("ufc", "Heavyweight") is None
+    assert await repo.get_all_current_rankings("ufc") == live_all
+    assert await repo.get_current_rankings("Lightweight", "ufc") == live_lightweight
+    assert [row["rank_date"] for row in live_lightweight] == [date(2024, 3, 1)] * 3
+
+
+@pytest.mark.asyncio
+async def test_ranking_summaries_track_current_and_peak(session: AsyncSession) -> None:
+    session.add_all([Fighter(id=f"fighter-{idx}", name=f"Fighter {idx}") for idx in range(3)])
+    await session.flush()
+    session.add_all(
+        [
+            FighterRanking(
+                fighter_id=fighter_id,
+                division=division,
+                rank=rank,
+                rank_date=day,
+                source="fightmatrix",
+                is_interim=interim,
+            )
+            for fighter_id, division, rank, day, interim in [
+                ("fighter-0", "Lightweight", 5, date(2023, 1, 1), False),
+                ("fighter-0", "Lightweight", 2, date(2023, 6, 1), True),
+                ("fighter-0", "Lightweight", 2, date(2023, 9, 1), False),
+                ("fighter-0", "Welterweight", 7, date(2024, 2, 1), False),
+                ("fighter-1", "Flyweight", None, date(2024, 2, 1), False),
+            ]
+        ]
+    )
+    await session.flush()
+
+    # Before the importers build the rollups the fighter list reads live rankings.
+    fighters = FighterRepository(session)
+    fighter_ids = ["fighter-0", "fighter-1", "fighter-2"]
+    live = await fighters._fetch_ranking_summaries(fighter_ids)
+
+    repo = RankingRepository(session)
+    await repo.refresh_ranking_tables(["fightmatrix"])
+
+    peak = await repo.get_peak_ranking("fighter-0", source="fightmatrix")
+    assert peak is not None
+    assert (peak["peak_rank"], peak["rank_date"], peak["is_interim"]) == (
+        2,
+        date(2023, 9, 1),
+        False,
+    )
+    assert await repo.get_peak_ranking("fighter-1", source="fightmatrix") is None
+
+    summaries = await fighters._fetch_ranking_summaries(fighter_ids)
+    assert summaries == live
+    assert set(summaries) == {"fighter-0", "fighter-1"}
+    assert (
+        summaries["fighter-0"].current_rank,
+        summaries["fighter-0"].current_rank_division,
+        summaries["fighter-0"].peak_rank_division,
+    ) == (7, "Welterweight", "Lightweight")
+    assert summaries["fighter-1"].current_rank is None
+    assert summaries["fighter-1"].peak_rank_source is None
+
+
+@pytest.mark.asyncio
+async def test_ranking_runs_split_on_rank_changes_and_missed_issues(
+    session: AsyncSession,
+) -> None:
+    session.add_all([Fighter(id=f"fighter-{idx}", name=f"Fighter {idx}") for idx in range(2)])
+    await session.flush()
+    issues = [date(2024, month, 1) for month in range(1, 8)]
+    # fighter-0 misses the April issue, so the two rank-3 stretches stay separate.
+    ranks = {"fighter-0": [3, 3, 2, None, 3, 3, 3], "fighter-1": [5, 5, 5, 5, 4, 4, 1]}
+    session.add_all(
+        [
+            FighterRanking(
+                fighter_id=fighter_id,
+                division="Lightweight",
+                rank=rank,
+                rank_date=issue,
+                source="fightmatrix",
+            )
+            for fighter_id, fighter_ranks in ranks.items()
+            for issue, rank in zip(issues, fighter_ranks, strict=True)
+            if not (fighter_id == "fighter-0" and rank is None)
+        ]
+    )
+    await session.flush()
+
+    repo = RankingRepository(session)
+    derived = await repo.get_fighter_ranking_runs("fighter-0", source="fightmatrix")
+    await repo.refresh_ranking_tables(["fightmatrix"])
+    stored = await repo.get_fighter_ranking_runs("fighter-0", source="fightmatrix")
+
+    assert stored == derived
+    assert [(run["rank"], run["start_date"], run["snapshot_count"]) for run in stored] == [
+        (3, date(2024, 1, 1), 2),
+        (2, date(2024, 3, 1), 1),
+        (3, date(2024, 5, 1), 3),
+    ]
+    other = await repo.get_fighter_ranking_runs("fighter-1", source="fightmatrix")
+    assert [run["rank"] for run in other] == [5, 4, 1]
+    assert sum(run["snapshot_count"] for run in other) == 7
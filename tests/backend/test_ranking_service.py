@@ -1,30 +1,41 @@
 from __future__ import annotations
 
-from datetime import date
-from unittest.mock import AsyncMock
+from datetime import UTC, date, datetime
+from typing import Any
 
 import pytest
 
-from backend.schemas.ranking import (
-    CurrentRankingsResponse,
-    DivisionRankDate,
-    RankingEntry,
-)
-from backend.services.ranking_service import RankingService
+from backend.schemas.ranking import DivisionRankDate
+from backend.services import caching
+from backend.services.ranking_service import RankingService, _downsample_ranking_runs
 
 
 class _StubRankingRepository:
     """Minimal stub that mimics the repository contract for service tests."""
 
-    def __init__(self, *, divisions: list[str], latest_date: date | None) -> None:
-        self._divisions = divisions
-        self._latest_date = latest_date
+    def __init__(self, *, rows: list[dict[str, Any]]) -> None:
+        self._rows = rows
+        self.calls = 0
 
-    async def get_all_divisions(self, source: str) -> list[str]:  # pragma: no cover - exercised in tests
-        return self._divisions
+    async def get_current_rankings_version(
+        self, source: str, division: str | None = None
+    ) -> datetime | None:  # pragma: no cover - exercised in tests
+        snapshot_divisions = {row["division"] for row in self._rows if row.get("snapshot", True)}
+        if division is not None and division not in snapshot_divisions:
+            return None
+        return datetime(2024, 6, 1, tzinfo=UTC) if snapshot_divisions else None
 
-    async def get_latest_ranking_date(self, source: str) -> date | None:  # pragma: no cover - exercised in tests
-        return self._latest_date
+    async def get_all_current_rankings(
+        self, source: str
+    ) -> list[dict[str, Any]]:  # pragma: no cover - exercised in tests
+        self.calls += 1
+        return self._rows
+
+    async def get_current_rankings(
+        self, division: str, source: str
+    ) -> list[dict[str, Any]]:  # pragma: no cover - exercised in tests
+        self.calls += 1
+        return [row for row in self._rows if row["division"] == division]
 
 
 def _build_service_stub(repo: _StubRankingRepository) -> RankingService:
@@ -32,58 +43,100 @@ def _build_service_stub(repo: _StubRankingRepository) -> RankingService:
 
     service: RankingService = RankingService.__new__(RankingService)  # type: ignore[call-arg]
     service.repository = repo  # type: ignore[attr-defined]
+    service._cache = None
     return service
 
 
-def _division_response(division: str, snapshot: date, *, fighters: int) -> CurrentRankingsResponse:
-    entry = RankingEntry(
-        ranking_id=f"{division}-rank",
-        fighter_id=f"{division}-fighter",
-        fighter_name=f"{division} Champ",
-        nickname=None,
-        rank=1,
-        previous_rank=2,
-        rank_movement=1,
-        is_interim=False,
-    )
-    return CurrentRankingsResponse(
-        division=division,
-        source="ufc",
-        rank_date=snapshot,
-        rankings=[entry] * fighters,
-        total_fighters=fighters,
-    )
+def _ranking_rows(division: str, snapshot: date, *, fighters: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "ranking_id": f"{division}-rank-{rank}",
+            "fighter_id": f"{division}-fighter-{rank}",
+            "fighter_name": f"{division} Fighter {rank}",
+            "nickname": None,
+            "division": division,
+            "rank": rank,
+            "previous_rank": rank + 1,
+            "rank_movement": 1,
+            "is_interim": False,
+            "rank_date": snapshot,
+            "source": "ufc",
+        }
+        for rank in range(fighters)
+    ]
 
 
 @pytest.mark.asyncio
 async def test_get_all_rankings_includes_per_division_rank_dates() -> None:
-    divisions = ["Flyweight", "Bantamweight"]
-    repo = _StubRankingRepository(divisions=divisions, latest_date=date(2024, 6, 1))
-    service = _build_service_stub(repo)
-
-    flyweight = _division_response("Flyweight", date(2024, 5, 15), fighters=2)
-    bantamweight = _division_response("Bantamweight", date(2024, 4, 20), fighters=1)
-
-    service.get_current_rankings = AsyncMock(  # type: ignore[attr-defined]
-        side_effect=[flyweight, bantamweight]
+    repo = _StubRankingRepository(
+        rows=[
+            *_ranking_rows("Bantamweight", date(2024, 4, 20), fighters=1),
+            *_ranking_rows("Flyweight", date(2024, 5, 15), fighters=2),
+        ]
     )
+    service = _build_service_stub(repo)
 
     response = await RankingService.get_all_rankings(service, source="ufc")
 
     assert response.total_divisions == 2
     assert response.total_fighters == 3
     assert [model.model_dump() for model in response.division_rank_dates] == [
-        DivisionRankDate(division="Flyweight", rank_date=date(2024, 5, 15)).model_dump(),
         DivisionRankDate(division="Bantamweight", rank_date=date(2024, 4, 20)).model_dump(),
+        DivisionRankDate(division="Flyweight", rank_date=date(2024, 5, 15)).model_dump(),
+    ]
+    flyweight = response.divisions[1]
+    assert flyweight.rank_date == date(2024, 5, 15)
+    assert [entry.fighter_id for entry in flyweight.rankings] == [
+        "Flyweight-fighter-0",
+        "Flyweight-fighter-1",
     ]
-    assert response.divisions == [flyweight, bantamweight]
+
+
+@pytest.mark.asyncio
+async def test_get_all_rankings_is_cached_per_snapshot_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(caching, "_local_cache", {})
+    repo = _StubRankingRepository(
+        rows=_ranking_rows("Flyweight", date(2024, 5, 15), fighters=2)
+    )
+    service = _build_service_stub(repo)
+
+    first = await RankingService.get_all_rankings(service, source="ufc")
+    second = await RankingService.get_all_rankings(service, source="ufc")
+
+    assert second == first
+    assert repo.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_division_live_fallback_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(caching, "_local_cache", {})
+    live_rows = [
+        {**row, "snapshot": False}
+        for row in _ranking_rows("Bantamweight", date(2024, 4, 20), fighters=1)
+    ]
+    repo = _StubRankingRepository(
+        rows=[*_ranking_rows("Flyweight", date(2024, 5, 15), fighters=2), *live_rows]
+    )
+    service = _build_service_stub(repo)
+
+    for _ in range(2):
+        await RankingService.get_current_rankings(service, "Flyweight", source="ufc")
+    assert repo.calls == 1
+
+    for _ in range(2):
+        response = await RankingService.get_current_rankings(
+            service, "Bantamweight", source="ufc"
+        )
+    assert response.total_fighters == 1
+    assert repo.calls == 3
 
 
 @pytest.mark.asyncio
 async def test_get_all_rankings_short_circuits_when_no_snapshots() -> None:
-    repo = _StubRankingRepository(divisions=[], latest_date=None)
+    repo = _StubRankingRepository(rows=[])
     service = _build_service_stub(repo)
-    service.get_current_rankings = AsyncMock()  # type: ignore[attr-defined]
 
     response = await RankingService.get_all_rankings(service, source="ufc")
 
@@ -91,4 +144,42 @@ async def test_get_all_rankings_short_circuits_when_no_snapshots() -> None:
     assert response.division_rank_dates == []
     assert response.total_divisions == 0
     assert response.total_fighters == 0
-    service.get_current_rankings.assert_not_called()
+
+
+def _run(division: str, rank: int | None, start: date, end: date, count: int) -> dict[str, Any]:
+    return {
+        "division": division,
+        "rank": rank,
+        "is_interim": False,
+        "start_date": start,
+        "end_date": end,
+        "snapshot_count": count,
+    }
+
+
+def test_downsample_ranking_runs_by_change_and_interval() -> None:
+    runs = [
+        _run("Lightweight", 5, date(2023, 11, 6), date(2024, 1, 8), 10),
+        _run("Lightweight", 3, date(2024, 1, 15), date(2024, 2, 26), 7),
+        _run("Welterweight", 9, date(2024, 2, 5), date(2024, 2, 5), 1),
+    ]
+
+    changes = _downsample_ranking_runs(runs, "change")
+    assert changes.dates == [date(2023, 11, 6), date(2024, 1, 15), date(2024, 2, 5)]
+    assert changes.ranks == [5, 3, 9]
+
+    quarterly = _downsample_ranking_runs(runs, "quarter")
+    assert list(zip(quarterly.dates, quarterly.divisions, quarterly.ranks, strict=True)) == [
+        (date(2023, 10, 1), "Lightweight", 5),
+        (date(2024, 1, 1), "Lightweight", 3),
+        (date(2024, 1, 1), "Welterweight", 9),
+    ]
+    assert quarterly.end_dates == [date(2023, 12, 31), date(2024, 2, 26), date(2024, 2, 5)]
+
+    monthly = _downsample_ranking_runs(runs, "month")
+    assert list(zip(monthly.dates, monthly.ranks, strict=True))[:4] == [
+        (date(2023, 11, 1), 5),
+        (date(2023, 12, 1), 5),
+        (date(2024, 1, 1), 3),
+        (date(2024, 2, 1), 3),
+    ]
@@ -7,7 +7,7 @@ import pytest
 
 try:
     import pytest_asyncio
-    from sqlalchemy import insert
+    from sqlalchemy import insert, select
     from sqlalchemy.ext.asyncio import AsyncSession
 except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency guard
     pytest.skip(
@@ -15,8 +15,13 @@ except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency gua
         allow_module_level=True,
     )
 
-from backend.db.models import Base, Fight, Fighter, fighter_stats
+from backend.db.models import Base, Fight, Fighter, FightTrendRollup, fighter_stats
 from backend.db.repositories import PostgreSQLFighterRepository
+from backend.db.repositories.stats_repository import (
+    StatsRepository,
+    StreakRun,
+    compute_streak_runs,
+)
 from tests.backend.postgres import (
     TemporaryPostgresSchema,
     postgres_schema,
@@ -428,3 +433,324 @@ async def test_leaderboards_enforce_minimum_fight_threshold(
         for entry in relaxed_response.leaderboards[0].entries
     ]
     assert relaxed_entries == ["prospect", "veteran"]
+
+
+@pytest.mark.asyncio
+async def test_summary_snapshot_matches_live_aggregates(
+    session: AsyncSession,
+) -> None:
+    """The refreshed summary should match the live aggregates and expose computed_at."""
+
+    session.add_all(
+        [
+            Fighter(id="lw-1", name="Lightweight One", division="Lightweight"),
+            Fighter(id="lw-2", name="Lightweight Two", division="Lightweight"),
+            Fighter(id="fw-1", name="Featherweight One", division="Featherweight"),
+        ]
+    )
+    await session.flush()
+    session.add_all(
+        [
+            Fight(
+                id=f"{fighter_id}-{idx}",
+                fighter_id=fighter_id,
+                opponent_id=None,
+                opponent_name=f"Opponent {idx}",
+                event_name="Test Event",
+                event_date=date(2023, 1, idx + 1),
+                result="Win",
+                round=1,
+                time="1:00",
+            )
+            for fighter_id in ("lw-1", "lw-2", "fw-1")
+            for idx in range(5)
+        ]
+    )
+    await session.execute(
+        insert(fighter_stats),
+        [
+            {"fighter_id": "lw-1", "category": "career", "metric": "win_pct", "value": "70%"},
+            {"fighter_id": "lw-2", "category": "career", "metric": "win_pct", "value": "90%"},
+            {"fighter_id": "fw-1", "category": "career", "metric": "win_pct", "value": "80%"},
+        ],
+    )
+    await session.flush()
+
+    repository = StatsRepository(session)
+    query = {"limit": 1, "metrics": ("win_pct",), "min_fights": 5}
+    live_summary = await repository.stats_summary()
+    live_page = await repository.get_leaderboards(
+        offset=1, division=None, start_date=None, end_date=None, **query
+    )
+
+    computed_at = await repository.refresh_stats_snapshots()
+
+    summary = await repository.stats_summary()
+    assert summary.computed_at == computed_at
+    assert summary.metrics == live_summary.metrics
+
+    # Leaderboards are not snapshotted; the in-memory index serves them.
+    page = await repository.get_leaderboards(
+        offset=1, division=None, start_date=None, end_date=None, **query
+    )
+    assert page.leaderboards == live_page.leaderboards
+    assert [entry.fighter_id for entry in page.leaderboards[0].entries] == ["fw-1"]
+
+    lightweight = await repository.get_leaderboards(
+        offset=1, division="Lightweight", start_date=None, end_date=None, **query
+    )
+    assert [entry.fighter_id for entry in lightweight.leaderboards[0].entries] == ["lw-1"]
+    assert lightweight.leaderboards[0].entries[0].fight_count == 5
+
+
+@pytest.mark.asyncio
+async def test_live_leaderboards_rank_every_metric_in_one_query(
+    session: AsyncSession,
+) -> None:
+    """Date-windowed leaderboards rank each metric before applying min_fights."""
+
+    session.add_all(
+        [
+            Fighter(id="old-guard", name="Old Guard"),
+            Fighter(id="regular", name="Regular"),
+            Fighter(id="newcomer", name="Newcomer"),
+        ]
+    )
+    await session.flush()
+    fight_plan = {"old-guard": (2010, 6), "regular": (2020, 6), "newcomer": (2021, 1)}
+    session.add_all(
+        [
+            Fight(
+                id=f"{fighter_id}-{idx}",
+                fighter_id=fighter_id,
+                opponent_id=None,
+                opponent_name=f"Opponent {idx}",
+                event_name="Test Event",
+                event_date=date(year, 1, idx + 1),
+                result="Win",
+            )
+            for fighter_id, (year, count) in fight_plan.items()
+            for idx in range(count)
+        ]
+    )
+    stat_values = {
+        "old-guard": ("99", "1.0"),
+        "regular": ("60", "3.5"),
+        "newcomer": ("80", "2.0"),
+    }
+    await session.execute(
+        insert(fighter_stats),
+        [
+            {"fighter_id": fighter_id, "category": "career", "metric": metric, "value": value}
+            for fighter_id, pair in stat_values.items()
+            for metric, value in zip(("win_pct", "takedowns_avg"), pair, strict=True)
+        ],
+    )
+    await session.flush()
+
+    response = await StatsRepository(session).get_leaderboards(
+        limit=2,
+        offset=0,
+        metrics=("takedowns_avg", "win_pct"),
+        division=None,
+        min_fights=5,
+        start_date=date(2019, 1, 1),
+        end_date=None,
+    )
+
+    assert [board.metric_id for board in response.leaderboards] == ["takedowns_avg", "win_pct"]
+    entries = {
+        board.metric_id: [(entry.fighter_id, entry.fight_count) for entry in board.entries]
+        for board in response.leaderboards
+    }
+    # The newcomer holds a top-two rank but falls below the fight threshold.
+    assert entries == {"takedowns_avg": [("regular", 6)], "win_pct": [("regular", 6)]}
+
+
+@pytest.mark.asyncio
+async def test_trend_rollups_match_fight_aggregates_for_any_range(
+    session: AsyncSession,
+) -> None:
+    """Rollup-backed duration trends should equal aggregating the fights table."""
+
+    session.add_all(
+        [
+            Fighter(id="lw", name="Lightweight", division="Lightweight"),
+            Fighter(id="hw", name="Heavyweight", division="Heavyweight"),
+        ]
+    )
+    await session.flush()
+    schedule = [
+        ("lw", date(2023, 1, 10), 1, "1:00"),
+        ("lw", date(2023, 1, 25), 3, "5:00"),
+        ("hw", date(2023, 2, 14), 2, "2:30"),
+        ("lw", date(2023, 3, 31), 1, "0:45"),
+        ("hw", date(2023, 4, 1), 3, "5:00"),
+        ("hw", date(2024, 7, 4), 5, "5:00"),
+    ]
+    session.add_all(
+        [
+            Fight(
+                id=f"{fighter_id}-{index}",
+                fighter_id=fighter_id,
+                opponent_name="Opponent",
+                event_name="Event",
+                event_date=event_date,
+                result="W",
+                method="KO/TKO" if round_value < 3 else "U-DEC",
+                round=round_value,
+                time=time_value,
+            )
+            for index, (fighter_id, event_date, round_value, time_value) in enumerate(schedule)
+        ]
+    )
+    await session.flush()
+
+    repository = StatsRepository(session)
+    windows = [
+        (None, None),
+        (date(2023, 1, 15), None),
+        (None, date(2023, 3, 31)),
+        (date(2023, 1, 20), date(2023, 1, 30)),
+        (date(2023, 2, 1), date(2024, 7, 3)),
+    ]
+
+    async def durations_for(bucket: str) -> list[list[tuple[str | None, date, float]]]:
+        return [
+            [
+                (entry.division, entry.bucket_start, round(entry.average_duration_seconds, 6))
+                for entry in await repository._calculate_average_durations(
+                    start_date=start, end_date=end, time_bucket=bucket
+                )
+            ]
+            for start, end in windows
+        ]
+
+    live = {bucket: await durations_for(bucket) for bucket in ("month", "quarter", "year")}
+    await repository.refresh_trend_rollups()
+    for bucket, expected in live.items():
+        assert await durations_for(bucket) == expected
+
+    # Incremental refresh: a new bout only rebuilds its own day and month.
+    session.add(
+        Fight(
+            id="lw-late",
+            fighter_id="lw",
+            opponent_name="Opponent",
+            event_name="Event",
+            event_date=date(2023, 1, 25),
+            result="L",
+            round=1,
+            time="3:00",
+        )
+    )
+    await session.flush()
+    await repository.refresh_trend_rollups([date(2023, 1, 25)])
+    january = await repository._calculate_average_durations(
+        start_date=date(2023, 1, 1), end_date=date(2023, 1, 31), time_bucket="month"
+    )
+    assert [(entry.division, entry.average_duration_seconds) for entry in january] == [
+        ("Lightweight", (60 + 900 + 180) / 3)
+    ]
+
+    rollups = await session.execute(
+        select(FightTrendRollup).where(
+            FightTrendRollup.bucket_kind == "month",
+            FightTrendRollup.bucket_start == date(2023, 1, 1),
+        )
+    )
+    january_rollup = rollups.scalar_one()
+    assert (january_rollup.fight_count, january_rollup.win_count) == (3, 2)
+    assert (january_rollup.ko_tko_win_count, january_rollup.decision_win_count) == (1, 1)
+
+
+def test_compute_streak_runs_splits_on_non_decisive_and_blank_results() -> None:
+    runs = compute_streak_runs(
+        [
+            (date(2020, 3, 1), "W"),
+            (date(2020, 1, 1), "W"),
+            (None, "W"),
+            (date(2020, 5, 1), "Draw"),
+            (date(2020, 6, 1), "L"),
+            (date(2020, 7, 1), ""),
+            (date(2020, 8, 1), "Loss"),
+            (date(2020, 9, 1), "Win"),
+        ]
+    )
+    assert runs == [
+        StreakRun("win", 2, date(2020, 1, 1), date(2020, 3, 1), 0),
+        StreakRun("loss", 1, date(2020, 6, 1), date(2020, 6, 1), 3),
+        StreakRun("loss", 1, date(2020, 8, 1), date(2020, 8, 1), 5),
+        StreakRun("win", 1, date(2020, 9, 1), date(2020, 9, 1), 6),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streak_history_matches_live_win_streaks(session: AsyncSession) -> None:
+    histories = {
+        "alpha": "WWWLWWWWD",
+        "bravo": "WLWWWWWW",
+        "charlie": "LLWWWNW",
+        "delta": "WWWWWWWWWL",
+        "echo": "WWW_WWWW",
+    }
+    session.add_all(
+        [Fighter(id=fighter_id, name=fighter_id.title()) for fighter_id in histories]
+    )
+    await session.flush()
+    session.add_all(
+        [
+            Fight(
+                id=f"{fighter_id}-{idx}",
+                fighter_id=fighter_id,
+                opponent_name="Opponent",
+                event_name="Event",
+                event_date=date(2019 + idx // 4, 1 + 3 * (idx % 4), 10),
+                result={"N": "NC", "D": "Draw", "_": ""}.get(outcome, outcome),
+            )
+            for fighter_id, outcomes in histories.items()
+            for idx, outcome in enumerate(outcomes)
+        ]
+    )
+    await session.flush()
+
+    repository = StatsRepository(session)
+    await repository.refresh_streak_history()
+
+    windows = [
+        (None, None),
+        (date(2019, 5, 1), None),
+        (None, date(2020, 6, 1)),
+        (date(2019, 6, 1), date(2020, 9, 1)),
+    ]
+    for start_date, end_date in windows:
+        for limit in (1, 3, 10):
+            expected = await repository._calculate_win_streaks_from_fights(
+                start_date=start_date, end_date=end_date, limit=limit
+            )
+            actual = await repository._calculate_win_streaks(
+                start_date=start_date, end_date=end_date, limit=limit
+            )
+            assert actual == expected, (start_date, end_date, limit)
+
+    # Rebuilding one fighter leaves the other fighters' runs untouched.
+    session.add(
+        Fight(
+            id="charlie-late",
+            fighter_id="charlie",
+            opponent_name="Opponent",
+            event_name="Event",
+            event_date=date(2022, 1, 10),
+            result="W",
+        )
+    )
+    await session.flush()
+    await repository.refresh_streak_history(["charlie"])
+    streaks = await repository._calculate_win_streaks(start_date=None, end_date=None, limit=2)
+    assert [(entry.fighter_id, entry.streak) for entry in streaks] == [
+        ("delta", 9),
+        ("bravo", 6),
+    ]
+    assert streaks == await repository._calculate_win_streaks_from_fights(
+        start_date=None, end_date=None, limit=2
+    )